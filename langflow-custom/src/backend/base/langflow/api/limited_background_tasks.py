@@ -1,8 +1,229 @@
+"""Background tasks run by a bounded executor.
+
+Tasks are grouped by kind, the name of their function. Each kind has a limit on the tasks running at
+once, and on the tasks waiting or running: past it, new tasks are dropped or wait for room depending
+on ``background_task_overflow_policy``. Pending tasks are drained when the server shuts down.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict, deque
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Literal
+
 from fastapi import BackgroundTasks
 from lfx.graph.utils import log_vertex_build
+from lfx.log.logger import logger
+from starlette.background import BackgroundTask
 
 from langflow.services.deps import get_settings_service
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+OverflowPolicy = Literal["drop", "block"]
+
+
+@dataclass
+class BackgroundTaskStats:
+    """Counters of the background tasks of one kind."""
+
+    queued: int = 0
+    """Tasks waiting for a concurrency slot."""
+    running: int = 0
+    completed: int = 0
+    failed: int = 0
+    dropped: int = 0
+
+    @property
+    def depth(self) -> int:
+        """Tasks waiting or running."""
+        return self.queued + self.running
+
+
+def task_kind(task: BackgroundTask) -> str:
+    return getattr(task.func, "__name__", type(task.func).__name__)
+
+
+class BoundedBackgroundExecutor:
+    """Runs background tasks with per kind concurrency and queue limits.
+
+    Args:
+        max_concurrency: Tasks of one kind running at once.
+        max_queue_size: Tasks of one kind waiting or running, past which new tasks overflow.
+        overflow_policy: ``"drop"`` to discard overflowing tasks, ``"block"`` to make ``submit`` wait for room.
+        concurrency_limits: Overrides of ``max_concurrency`` keyed by kind.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 10,
+        max_queue_size: int = 1000,
+        overflow_policy: OverflowPolicy = "drop",
+        concurrency_limits: dict[str, int] | None = None,
+    ) -> None:
+        if overflow_policy not in {"drop", "block"}:
+            msg = f"Unknown background task overflow policy: {overflow_policy}"
+            raise ValueError(msg)
+        self.max_concurrency = max_concurrency
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.concurrency_limits = dict(concurrency_limits or {})
+        self._stats: dict[str, BackgroundTaskStats] = defaultdict(BackgroundTaskStats)
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._room: dict[str, asyncio.Event] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closed = False
+
+    @property
+    def queue_depth(self) -> int:
+        """Tasks of every kind waiting or running."""
+        return sum(stats.depth for stats in self._stats.values())
+
+    def stats(self) -> dict[str, BackgroundTaskStats]:
+        """A copy of the counters of each kind of task submitted so far."""
+        return {kind: replace(stats) for kind, stats in self._stats.items()}
+
+    def _bind_loop(self) -> None:
+        # asyncio primitives belong to the loop they are first used in, tasks of a previous loop are gone
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphores.clear()
+            self._room.clear()
+            self._tasks.clear()
+            for stats in self._stats.values():
+                stats.queued = stats.running = 0
+
+    async def submit(self, task: BackgroundTask, kind: str | None = None) -> asyncio.Task | None:
+        """Schedule ``task``, waiting for room first under the ``"block"`` policy.
+
+        Returns:
+            The asyncio task running it, or None if it was dropped.
+        """
+        kind = kind or task_kind(task)
+        self._bind_loop()
+        if self.overflow_policy == "block":
+            stats = self._stats[kind]
+            while not self._closed and stats.depth >= self.max_queue_size:
+                room = self._room.setdefault(kind, asyncio.Event())
+                room.clear()
+                await room.wait()
+        return self.submit_nowait(task, kind)
+
+    def submit_nowait(self, task: BackgroundTask, kind: str | None = None) -> asyncio.Task | None:
+        """Schedule ``task``, dropping it if its kind has no room whatever the policy.
+
+        Returns:
+            The asyncio task running it, or None if it was dropped.
+        """
+        kind = kind or task_kind(task)
+        self._bind_loop()
+        stats = self._stats[kind]
+        if self._closed or stats.depth >= self.max_queue_size:
+            stats.dropped += 1
+            logger.warning(
+                f"Dropped background task {kind}, {stats.depth} of this kind are pending "
+                f"and {stats.dropped} were dropped so far"
+            )
+            return None
+        stats.queued += 1
+        scheduled = asyncio.create_task(self._run(task, kind))
+        self._tasks.add(scheduled)
+        scheduled.add_done_callback(self._tasks.discard)
+        return scheduled
+
+    async def _run(self, task: BackgroundTask, kind: str) -> None:
+        stats = self._stats[kind]
+        semaphore = self._semaphores.get(kind)
+        if semaphore is None:
+            semaphore = self._semaphores[kind] = asyncio.Semaphore(
+                self.concurrency_limits.get(kind, self.max_concurrency)
+            )
+        started = False
+        try:
+            async with semaphore:
+                stats.queued -= 1
+                stats.running += 1
+                started = True
+                await task()
+            stats.completed += 1
+        except Exception:  # noqa: BLE001
+            stats.failed += 1
+            await logger.aexception(f"Background task {kind} failed")
+        finally:
+            if started:
+                stats.running -= 1
+            else:
+                stats.queued -= 1
+            if kind in self._room:
+                self._room[kind].set()
+
+    async def drain(self, timeout: float | None = None) -> None:
+        """Stop accepting tasks and wait for the pending ones, cancelling those left after ``timeout`` seconds."""
+        self._closed = True
+        for room in self._room.values():
+            room.set()
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+        if pending:
+            await logger.awarning(f"Cancelling {len(pending)} background tasks still pending after {timeout}s")
+            for scheduled in pending:
+                scheduled.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+_executor: BoundedBackgroundExecutor | None = None
+
+
+def get_background_executor() -> BoundedBackgroundExecutor:
+    """The process wide executor, configured from the settings on first use."""
+    global _executor  # noqa: PLW0603
+    if _executor is None:
+        settings = get_settings_service().settings
+        _executor = BoundedBackgroundExecutor(
+            max_concurrency=settings.background_task_max_concurrency,
+            max_queue_size=settings.background_task_queue_size,
+            overflow_policy=settings.background_task_overflow_policy,
+            concurrency_limits=settings.background_task_concurrency_limits,
+        )
+    return _executor
+
+
+async def drain_background_tasks() -> None:
+    """Wait for the pending background tasks on shutdown."""
+    global _executor
+    if _executor is None:
+        return
+    executor, _executor = _executor, None
+    await executor.drain(get_settings_service().settings.background_task_drain_timeout)
+
+
+async def _run_after(previous: asyncio.Task | None, task: BackgroundTask) -> None:
+    """Run ``task`` once ``previous`` is done, whatever its outcome."""
+    if previous is not None:
+        await asyncio.wait([previous])
+    await task()
+
+
+async def _run_in_order(tasks: Sequence[BackgroundTask]) -> None:
+    """Run ``tasks`` one after the other, raising the first error once they all ran."""
+    error: Exception | None = None
+    for task in tasks:
+        try:
+            await task()
+        except Exception as exc:  # noqa: BLE001
+            if error is None:
+                error = exc
+            else:
+                await logger.aexception(f"Background task {task_kind(task)} failed")
+    if error is not None:
+        raise error
+
 
 class LimitVertexBuildBackgroundTasks(BackgroundTasks):
     """A subclass of FastAPI BackgroundTasks that limits the number of tasks added per vertex_id.
@@ -10,20 +231,67 @@ class LimitVertexBuildBackgroundTasks(BackgroundTasks):
     If more than max_vertex_builds_per_vertex tasks are added for a given vertex_id,
     the oldest task is removed so that only the most recent remain.
     This only applies to log_vertex_build tasks.
+
+    Once the response is sent, the tasks are handed to the bounded background executor and awaited.
+    The log_vertex_build tasks of one vertex run one after the other, in the order they were added, so
+    that their writes and the pruning of older builds do not race. Tasks added after that, by a build
+    still running, are handed over right away, after the pending builds of their vertex.
     """
 
-    def add_task(self, func, *args, **kwargs):
+    def __init__(self, tasks: Sequence[BackgroundTask] | None = None) -> None:
+        super().__init__(tasks)
+        self._vertex_builds: dict[str, deque[BackgroundTask]] = defaultdict(deque)
+        self._superseded: set[BackgroundTask] = set()
+        self._handed_over = False
+        # Last scheduled log_vertex_build run of each vertex, once handed over
+        self._vertex_runs: dict[str, asyncio.Task] = {}
+
+    def add_task(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        task = BackgroundTask(func, *args, **kwargs)
         # Only apply limiting logic to log_vertex_build tasks
-        if func == log_vertex_build:
-            vertex_id = kwargs.get("vertex_id")
-            if vertex_id is not None:
-                # Filter tasks that are log_vertex_build calls with the same vertex_id
-                relevant_tasks = [
-                    t for t in self.tasks if t.func == log_vertex_build and t.kwargs.get("vertex_id") == vertex_id
-                ]
-                if len(relevant_tasks) >= get_settings_service().settings.max_vertex_builds_per_vertex:
-                    # Remove the oldest task for this vertex_id
-                    oldest_task = relevant_tasks[0]
-                    self.tasks.remove(oldest_task)
-
-        super().add_task(func, *args, **kwargs)
+        vertex_id = kwargs.get("vertex_id") if func == log_vertex_build else None
+        if self._handed_over:
+            if vertex_id is None:
+                get_background_executor().submit_nowait(task)
+                return
+            scheduled = get_background_executor().submit_nowait(
+                BackgroundTask(_run_after, self._vertex_runs.get(vertex_id), task), kind=task_kind(task)
+            )
+            if scheduled is not None:
+                self._vertex_runs[vertex_id] = scheduled
+            return
+        if vertex_id is not None:
+            builds = self._vertex_builds[vertex_id]
+            builds.append(task)
+            if len(builds) > get_settings_service().settings.max_vertex_builds_per_vertex:
+                # Skip the oldest task for this vertex_id, and only rebuild the list once half of it is skipped
+                self._superseded.add(builds.popleft())
+                if len(self._superseded) * 2 > len(self.tasks):
+                    self.tasks = [t for t in self.tasks if t not in self._superseded]
+                    self._superseded.clear()
+        self.tasks.append(task)
+
+    async def __call__(self) -> None:
+        self._handed_over = True
+        executor = get_background_executor()
+        # The builds of each vertex go in a single task, at the position of the first one
+        vertex_builds = dict(self._vertex_builds)
+        vertex_of = {id(task): vertex_id for vertex_id, builds in vertex_builds.items() for task in builds}
+        tasks = [task for task in self.tasks if task not in self._superseded]
+        self.tasks = []
+        self._vertex_builds.clear()
+        self._superseded.clear()
+        scheduled: list[asyncio.Task | None] = []
+        for task in tasks:
+            vertex_id = vertex_of.get(id(task))
+            if vertex_id is None:
+                scheduled.append(await executor.submit(task))
+                continue
+            pending = vertex_builds.pop(vertex_id, None)
+            if pending is None:
+                continue
+            run = await executor.submit(BackgroundTask(_run_in_order, list(pending)), kind=task_kind(task))
+            if run is not None:
+                self._vertex_runs[vertex_id] = run
+            scheduled.append(run)
+        await asyncio.gather(*(task for task in scheduled if task is not None), return_exceptions=True)
@@ -0,0 +1,135 @@
+"""Cache of the tool lists served by project MCP servers.
+
+Listing the tools of a project loads every flow of the project and builds the input schema of each
+one. Entries are dropped when a flow of the project is created, updated, moved or deleted: SQLAlchemy
+session events catch every write path, including bulk updates and deletes of flows, which clear the
+whole cache. Other workers do not see these events and pick up changes once their entries expire.
+
+The cached lists are shared by every request and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from lfx.services.deps import get_settings_service
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from langflow.services.database.models.flow.model import Flow
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+DEFAULT_PROJECT_TOOLS_CACHE_TTL = 300
+
+# Key of the project ids changed by a session in Session.info, None stands for every project
+_CHANGED_PROJECTS_KEY = "mcp_changed_projects"
+
+
+class ProjectToolsCache:
+    """Tool lists of project MCP servers keyed by project id and list kind."""
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str], tuple[float, Any]] = {}
+        # Bumped on every invalidation so a listing that raced with a change is not cached
+        self._generations: dict[str, int] = {}
+        self._global_generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> float:
+        settings_service = get_settings_service()
+        if settings_service is None:
+            return DEFAULT_PROJECT_TOOLS_CACHE_TTL
+        return getattr(settings_service.settings, "mcp_project_tools_cache_ttl", DEFAULT_PROJECT_TOOLS_CACHE_TTL)
+
+    def generation(self, project_id: UUID | str) -> tuple[int, int]:
+        """Return the state to pass to ``set`` after listing the tools of a project."""
+        with self._lock:
+            return self._global_generation, self._generations.get(str(project_id), 0)
+
+    def get(self, project_id: UUID | str, kind: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get((str(project_id), kind))
+        if entry is None or time.monotonic() >= entry[0]:
+            return None
+        return entry[1]
+
+    def set(self, project_id: UUID | str, kind: str, value: Any, generation: tuple[int, int]) -> None:
+        """Store a tool list unless the project changed since ``generation`` was taken."""
+        ttl = self.ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            if generation != (self._global_generation, self._generations.get(str(project_id), 0)):
+                return
+            self._entries[(str(project_id), kind)] = (time.monotonic() + ttl, value)
+
+    def invalidate(self, project_id: UUID | str) -> None:
+        project_key = str(project_id)
+        with self._lock:
+            self._generations[project_key] = self._generations.get(project_key, 0) + 1
+            for key in [key for key in self._entries if key[0] == project_key]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._global_generation += 1
+            self._entries.clear()
+
+
+project_tools_cache = ProjectToolsCache()
+
+
+def _invalidate_projects(project_ids: set[UUID] | None) -> None:
+    if project_ids is None:
+        project_tools_cache.clear()
+        return
+    for project_id in project_ids:
+        project_tools_cache.invalidate(project_id)
+
+
+def _mark_changed_projects(session: Session, project_ids: set[UUID] | None) -> None:
+    changed = session.info.get(_CHANGED_PROJECTS_KEY, set())
+    if changed is None or project_ids is None:
+        session.info[_CHANGED_PROJECTS_KEY] = None
+    else:
+        session.info[_CHANGED_PROJECTS_KEY] = changed | project_ids
+    _invalidate_projects(project_ids)
+
+
+@event.listens_for(Session, "after_flush")
+def _on_flush(session: Session, _flush_context) -> None:
+    project_ids: set[UUID] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(obj, Flow):
+            continue
+        if obj.folder_id is not None:
+            project_ids.add(obj.folder_id)
+        # The project a flow was moved out of
+        project_ids.update(value for value in inspect(obj).attrs.folder_id.history.deleted if value is not None)
+    if project_ids:
+        _mark_changed_projects(session, project_ids)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_orm_execute(orm_execute_state) -> None:
+    mapper = orm_execute_state.bind_mapper
+    if (orm_execute_state.is_update or orm_execute_state.is_delete) and mapper is not None and mapper.class_ is Flow:
+        _mark_changed_projects(orm_execute_state.session, None)
+
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session: Session) -> None:
+    # Readers may have cached the previous state between the flush and the commit
+    if _CHANGED_PROJECTS_KEY in session.info:
+        _invalidate_projects(session.info.pop(_CHANGED_PROJECTS_KEY))
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _on_rollback(session: Session, _previous_transaction) -> None:
+    if _CHANGED_PROJECTS_KEY in session.info:
+        _invalidate_projects(session.info.pop(_CHANGED_PROJECTS_KEY))
@@ -0,0 +1,67 @@
+"""Keeps the subflow graph cache of Run Flow components in step with the flows table.
+
+Run Flow components and flow tools serve the graph of a flow from ``lfx``'s process-wide subflow cache.
+Entries are dropped when a flow is updated or deleted: SQLAlchemy session events catch every write path,
+including bulk updates and deletes of flows, which clear the whole cache. Other workers do not see
+these events and keep serving a flow until the component selects a newer version of it.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from lfx.base.tools.subflow_cache import subflow_graph_cache
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from langflow.services.database.models.flow.model import Flow
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+# Key of the flow ids changed by a session in Session.info, None stands for every flow
+_CHANGED_FLOWS_KEY = "subflow_changed_flows"
+
+
+def _invalidate_flows(flow_ids: set[UUID] | None) -> None:
+    if flow_ids is None:
+        subflow_graph_cache.clear()
+        return
+    for flow_id in flow_ids:
+        subflow_graph_cache.delete(str(flow_id))
+
+
+def _mark_changed_flows(session: Session, flow_ids: set[UUID] | None) -> None:
+    changed = session.info.get(_CHANGED_FLOWS_KEY, set())
+    if changed is None or flow_ids is None:
+        session.info[_CHANGED_FLOWS_KEY] = None
+    else:
+        session.info[_CHANGED_FLOWS_KEY] = changed | flow_ids
+    _invalidate_flows(flow_ids)
+
+
+@event.listens_for(Session, "after_flush")
+def _on_flush(session: Session, _flush_context) -> None:
+    flow_ids = {obj.id for obj in (*session.dirty, *session.deleted) if isinstance(obj, Flow) and obj.id is not None}
+    if flow_ids:
+        _mark_changed_flows(session, flow_ids)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_orm_execute(orm_execute_state) -> None:
+    mapper = orm_execute_state.bind_mapper
+    if (orm_execute_state.is_update or orm_execute_state.is_delete) and mapper is not None and mapper.class_ is Flow:
+        _mark_changed_flows(orm_execute_state.session, None)
+
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session: Session) -> None:
+    # A Run Flow component may have cached the previous version between the flush and the commit
+    if _CHANGED_FLOWS_KEY in session.info:
+        _invalidate_flows(session.info.pop(_CHANGED_FLOWS_KEY))
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _on_rollback(session: Session, _previous_transaction) -> None:
+    if _CHANGED_FLOWS_KEY in session.info:
+        _invalidate_flows(session.info.pop(_CHANGED_FLOWS_KEY))
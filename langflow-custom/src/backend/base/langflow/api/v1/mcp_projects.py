@@ -43,6 +43,7 @@ from langflow.api.utils.mcp import (
     get_project_streamable_http_url,
     get_url_by_os,
 )
+from langflow.api.utils.mcp.project_tools_cache import project_tools_cache
 from langflow.api.v1.auth_helpers import handle_auth_settings_update
 from langflow.api.v1.mcp import ResponseNoOp
 from langflow.api.v1.mcp_utils import (
@@ -211,6 +212,47 @@ def get_project_sse(project_id: UUID | None) -> SseServerTransport:
     return project_sse_transports[project_id_str]
 
 
+async def _list_project_flow_settings(
+    session: AsyncSession, project_id: UUID, *, mcp_enabled: bool
+) -> list[MCPSettings]:
+    """Return the tool settings of the flows of a project."""
+    tools: list[MCPSettings] = []
+    flows_query = select(Flow).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
+
+    # Optionally filter for MCP-enabled flows only
+    if mcp_enabled:
+        flows_query = flows_query.where(Flow.mcp_enabled == True)  # noqa: E712
+
+    flows = (await session.exec(flows_query)).all()
+
+    for flow in flows:
+        if flow.user_id is None:
+            continue
+
+        # Format the flow name according to MCP conventions (snake_case)
+        flow_name = sanitize_mcp_name(flow.name)
+
+        # Use action_name and action_description if available, otherwise use defaults
+        name = sanitize_mcp_name(flow.action_name) if flow.action_name else flow_name
+        description = flow.action_description or flow.description or f"Tool generated from flow: {flow_name}"
+        try:
+            tool = MCPSettings(
+                id=flow.id,
+                action_name=name,
+                action_description=description,
+                mcp_enabled=flow.mcp_enabled,
+                # inputSchema=json_schema_from_flow(flow),
+                name=flow.name,
+                description=flow.description,
+            )
+            tools.append(tool)
+        except Exception as e:  # noqa: BLE001
+            msg = f"Error in listing project tools: {e!s} from flow: {name}"
+            await logger.awarning(msg)
+            continue
+    return tools
+
+
 async def _build_project_tools_response(
     project_id: UUID,
     current_user: CurrentActiveMCPUser,
@@ -219,56 +261,24 @@ async def _build_project_tools_response(
 ) -> MCPProjectResponse:
     """Return tool metadata for a project."""
     tools: list[MCPSettings] = []
+    cache_kind = f"settings:{mcp_enabled}"
     try:
         async with session_scope() as session:
             # Fetch the project first to verify it exists and belongs to the current user
             project = (
-                await session.exec(
-                    select(Folder)
-                    .options(selectinload(Folder.flows))
-                    .where(Folder.id == project_id, Folder.user_id == current_user.id)
-                )
+                await session.exec(select(Folder).where(Folder.id == project_id, Folder.user_id == current_user.id))
             ).first()
 
             if not project:
                 raise HTTPException(status_code=404, detail="Project not found")
 
-            # Query flows in the project
-            flows_query = select(Flow).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
-
-            # Optionally filter for MCP-enabled flows only
-            if mcp_enabled:
-                flows_query = flows_query.where(Flow.mcp_enabled == True)  # noqa: E712
-
-            flows = (await session.exec(flows_query)).all()
-
-            for flow in flows:
-                if flow.user_id is None:
-                    continue
-
-                # Format the flow name according to MCP conventions (snake_case)
-                flow_name = sanitize_mcp_name(flow.name)
-
-                # Use action_name and action_description if available, otherwise use defaults
-                name = sanitize_mcp_name(flow.action_name) if flow.action_name else flow_name
-                description = flow.action_description or (
-                    flow.description if flow.description else f"Tool generated from flow: {flow_name}"
-                )
-                try:
-                    tool = MCPSettings(
-                        id=flow.id,
-                        action_name=name,
-                        action_description=description,
-                        mcp_enabled=flow.mcp_enabled,
-                        # inputSchema=json_schema_from_flow(flow),
-                        name=flow.name,
-                        description=flow.description,
-                    )
-                    tools.append(tool)
-                except Exception as e:  # noqa: BLE001
-                    msg = f"Error in listing project tools: {e!s} from flow: {name}"
-                    await logger.awarning(msg)
-                    continue
+            cached_tools = project_tools_cache.get(project_id, cache_kind)
+            if cached_tools is not None:
+                tools = list(cached_tools)
+            else:
+                generation = project_tools_cache.generation(project_id)
+                tools = await _list_project_flow_settings(session, project_id, mcp_enabled=mcp_enabled)
+                project_tools_cache.set(project_id, cache_kind, tools, generation)
 
             # Get project-level auth settings but mask sensitive fields for security
             auth_settings = None
@@ -1424,7 +1434,11 @@ async def register_project_with_composer(project: Folder):
 
 
 async def init_mcp_servers():
-    """Initialize MCP servers for all projects."""
+    """Prepare the projects for their MCP servers.
+
+    The MCP server and SSE transport of a project are created on the first request to the project.
+    Startup only updates the auth settings of projects and starts MCP Composer for OAuth projects.
+    """
     try:
         settings_service = get_settings_service()
 
@@ -1471,10 +1485,6 @@ async def init_mcp_servers():
                             f"authentication because MCP Composer is disabled"
                         )
 
-                    get_project_sse(project.id)
-                    get_project_mcp_server(project.id)
-                    await logger.adebug(f"Initialized MCP server for project: {project.name} ({project.id})")
-
                     # Only register with MCP Composer if OAuth authentication is configured
                     if get_settings_service().settings.mcp_composer_enabled and project.auth_settings:
                         auth_type = project.auth_settings.get("auth_type")
@@ -1485,7 +1495,7 @@ async def init_mcp_servers():
                             await register_project_with_composer(project)
 
                 except Exception as e:  # noqa: BLE001
-                    msg = f"Failed to initialize MCP server for project {project.id}: {e}"
+                    msg = f"Failed to prepare MCP server for project {project.id}: {e}"
                     await logger.aexception(msg)
                     # Continue to next project even if this one fails
 
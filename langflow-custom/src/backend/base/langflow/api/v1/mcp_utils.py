@@ -20,6 +20,7 @@ from lfx.utils.helpers import build_content_type_from_extension
 from mcp import types
 from sqlmodel import select
 
+from langflow.api.utils.mcp.project_tools_cache import project_tools_cache
 from langflow.api.v1.endpoints import simple_run_flow
 from langflow.api.v1.schemas import SimplifiedAPIRequest
 from langflow.helpers.flow import json_schema_from_flow
@@ -326,6 +327,13 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
         project_id: Optional project ID to filter tools by project
         mcp_enabled_only: Whether to filter for MCP-enabled flows only
     """
+    if project_id:
+        cache_kind = f"tools:{mcp_enabled_only}"
+        cached_tools = project_tools_cache.get(project_id, cache_kind)
+        if cached_tools is not None:
+            return list(cached_tools)
+        generation = project_tools_cache.generation(project_id)
+
     tools = []
     try:
         async with session_scope() as session:
@@ -389,4 +397,7 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
         msg = f"Error in listing tools: {e!s}"
         await logger.aexception(msg)
         raise
+    if project_id:
+        project_tools_cache.set(project_id, cache_kind, tools, generation)
+        return list(tools)
     return tools
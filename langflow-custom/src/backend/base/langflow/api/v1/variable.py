@@ -1,10 +1,9 @@
-import asyncio
 import json
 import logging
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException
-from lfx.base.models.unified_models import get_model_provider_variable_mapping, validate_model_provider_key
+from lfx.base.models.unified_models import avalidate_model_provider_key, get_model_provider_variable_mapping
 from sqlalchemy.exc import NoResultFound
 
 from langflow.api.utils import CurrentActiveUser, DbSession
@@ -120,10 +119,9 @@ async def create_variable(
 
     # Check if the variable is a reserved model provider variable
     if variable.name in model_provider_variable_mapping.values():
-        # Validate that the key actually works using the Language Model Service
-        # Run validation off the event loop to avoid blocking
+        # Validate that the key actually works with a request to the provider
         try:
-            await asyncio.to_thread(validate_model_provider_key, variable.name, variable.value)
+            await avalidate_model_provider_key(variable.name, variable.value)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e)) from e
 
@@ -184,9 +182,8 @@ async def update_variable(
 
         # Validate API key if updating a model provider variable
         if existing_variable.name in model_provider_variable_mapping.values() and variable.value:
-            # Run validation off the event loop to avoid blocking
             try:
-                await asyncio.to_thread(validate_model_provider_key, existing_variable.name, variable.value)
+                await avalidate_model_provider_key(existing_variable.name, variable.value)
             except ValueError as e:
                 raise HTTPException(status_code=400, detail=str(e)) from e
 
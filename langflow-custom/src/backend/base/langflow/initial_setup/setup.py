@@ -1,11 +1,14 @@
 import asyncio
 import copy
+import hashlib
 import io
 import json
 import re
 import shutil
+import tempfile
 import zipfile
 from collections import defaultdict
+from collections.abc import Iterable
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
@@ -19,6 +22,7 @@ import orjson
 import sqlalchemy as sa
 from aiofile import async_open
 from emoji import demojize, purely_emoji
+from filelock import FileLock
 from lfx.base.constants import (
     FIELD_FORMAT_ATTRIBUTES,
     NODE_FORMAT_ATTRIBUTES,
@@ -31,7 +35,7 @@ from lfx.template.field.prompt import DEFAULT_PROMPT_INTUT_TYPES
 from lfx.utils.util import escape_json_dump
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import selectinload
-from sqlmodel import col, select
+from sqlmodel import col, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.initial_setup.constants import (
@@ -522,6 +526,45 @@ def log_node_changes(node_changes_log) -> None:
         logger.debug("\n".join(formatted_messages))
 
 
+STARTER_PROJECTS_HASH_FILENAME = "starter_projects.sha256"
+
+
+async def get_starter_projects_hash(all_types_dict: dict) -> tuple[str, int]:
+    """Hash the bundled starter project files together with the component templates they are reconciled against.
+
+    Returns:
+        tuple[str, int]: The hex digest and the number of starter project files.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(str(get_settings_service().settings.update_starter_projects).encode())
+    hasher.update(orjson.dumps(all_types_dict, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str))
+    folder = anyio.Path(__file__).parent / "starter_projects"
+    files = sorted([file async for file in folder.glob("*.json")])
+    for file in files:
+        hasher.update(file.name.encode())
+        hasher.update(await file.read_bytes())
+    return hasher.hexdigest(), len(files)
+
+
+def get_starter_projects_hash_path() -> anyio.Path:
+    return anyio.Path(get_settings_service().settings.config_dir) / STARTER_PROJECTS_HASH_FILENAME
+
+
+async def starter_projects_are_up_to_date(
+    session: AsyncSession, folder_id: UUID, projects_hash: str, num_projects: int
+) -> bool:
+    """Check whether the last reconciliation used the same starter projects and components.
+
+    The stored hash is only trusted if the database still holds one flow per starter project,
+    so a fresh or wiped database is always populated.
+    """
+    hash_path = get_starter_projects_hash_path()
+    if not await hash_path.exists() or (await hash_path.read_text()).strip() != projects_hash:
+        return False
+    stmt = select(func.count(Flow.id)).where(Flow.folder_id == folder_id)
+    return (await session.exec(stmt)).one() == num_projects
+
+
 async def load_starter_projects(retries=3, delay=1) -> list[tuple[anyio.Path, dict]]:
     starter_projects = []
     folder = anyio.Path(__file__).parent / "starter_projects"
@@ -1084,8 +1127,12 @@ async def create_or_update_starter_projects(all_types_dict: dict) -> None:
         # this is intended to be used to skip all startup project logic.
         return
 
+    projects_hash, num_projects = await get_starter_projects_hash(all_types_dict)
     async with session_scope() as session:
         new_folder = await get_or_create_starter_folder(session)
+        if await starter_projects_are_up_to_date(session, new_folder.id, projects_hash, num_projects):
+            await logger.adebug("Starter projects and components are unchanged, skipping starter projects update")
+            return
         starter_projects = await load_starter_projects()
 
         if get_settings_service().settings.update_starter_projects:
@@ -1175,6 +1222,15 @@ async def create_or_update_starter_projects(all_types_dict: dict) -> None:
                     successfully_created_projects += 1
                 await logger.adebug(f"Successfully created {successfully_created_projects} starter projects")
 
+    # Updating the projects may have rewritten their files, so hash them again before storing
+    projects_hash, _ = await get_starter_projects_hash(all_types_dict)
+    hash_path = get_starter_projects_hash_path()
+    try:
+        await hash_path.parent.mkdir(parents=True, exist_ok=True)
+        await hash_path.write_text(projects_hash)
+    except OSError as e:
+        await logger.awarning(f"Could not store starter projects hash: {e}")
+
 
 async def initialize_auto_login_default_superuser() -> None:
     settings_service = get_settings_service()
@@ -1271,58 +1327,149 @@ async def get_or_create_default_folder(session: AsyncSession, user_id: UUID) ->
     return FolderRead.model_validate(folder_obj, from_attributes=True)
 
 
+FLOW_SYNC_LOCK_FILE = "langflow_flow_sync.lock"
+
+
+async def get_fs_flow_paths() -> dict[str, UUID]:
+    """Map the absolute file path of every flow synced from the file system to the flow id.
+
+    Only the id, owner and path columns are selected, so the query stays cheap however
+    large the flows' data is.
+    """
+    data_dir = get_storage_service().data_dir
+    async with session_scope() as session:
+        stmt = select(Flow.id, Flow.user_id, Flow.fs_path).where(col(Flow.fs_path).is_not(None))
+        rows = (await session.exec(stmt)).all()
+    flow_paths = {}
+    for flow_id, user_id, fs_path in rows:
+        # Relative paths live in the user's flows directory
+        path = Path(fs_path) if Path(fs_path).is_absolute() else Path(data_dir) / "flows" / str(user_id) / fs_path
+        flow_paths[str(path.absolute())] = flow_id
+    return flow_paths
+
+
+async def sync_flow_from_fs(flow_id: UUID, path: str) -> None:
+    """Update a flow in the database from the contents of its file."""
+    update_data = orjson.loads(await anyio.Path(path).read_text(encoding="utf-8"))
+    async with session_scope() as session:
+        flow = await session.get(Flow, flow_id)
+        if flow is None:
+            return
+        try:
+            for field_name in ("name", "description", "data", "locked"):
+                if new_value := update_data.get(field_name):
+                    setattr(flow, field_name, new_value)
+            if folder_id := update_data.get("folder_id"):
+                flow.folder_id = UUID(folder_id)
+            await session.flush()
+        except Exception:  # noqa: BLE001
+            await logger.aexception(f"Couldn't update flow {flow_id} in database from path {path}")
+
+
+async def sync_changed_flow_files(flow_paths: dict[str, UUID], flow_mtimes: dict[str, float]) -> None:
+    """Sync the flows whose file was modified since it was last synced, comparing modification times only."""
+    for path, flow_id in flow_paths.items():
+        try:
+            mtime = (await anyio.Path(path).stat()).st_mtime
+            if mtime > flow_mtimes.get(path, 0):
+                await sync_flow_from_fs(flow_id, path)
+                flow_mtimes[path] = mtime
+        except FileNotFoundError:
+            continue
+        except Exception:  # noqa: BLE001
+            await logger.aexception(f"Error while handling flow file {path}")
+
+
+def get_existing_parent_dirs(paths: Iterable[str]) -> list[str]:
+    return sorted({str(parent) for parent in {Path(path).parent for path in paths} if parent.is_dir()})
+
+
+async def watch_flows_from_fs(polling_interval: float) -> None:
+    """Keep flows in sync with their files.
+
+    The paths of the flows are read from the database every `polling_interval` seconds.
+    With watchfiles installed, their directories are watched and only the files reported
+    as changed are synced; new flows, and every flow whenever the watched directories
+    change, are checked by modification time. Without watchfiles, every file is checked
+    by modification time on each interval.
+    """
+    try:
+        from watchfiles import awatch
+    except ImportError:
+        awatch = None
+        await logger.adebug("watchfiles is not installed, polling flow files for changes")
+
+    flow_mtimes: dict[str, float] = {}
+    watched_dirs: list[str] = []
+    watcher = None
+    try:
+        while True:
+            flow_paths = await get_fs_flow_paths()
+            for path in flow_mtimes.keys() - flow_paths.keys():
+                del flow_mtimes[path]
+
+            dirs = await asyncio.to_thread(get_existing_parent_dirs, flow_paths)
+            if awatch is None or not dirs:
+                await sync_changed_flow_files(flow_paths, flow_mtimes)
+                await asyncio.sleep(polling_interval)
+                continue
+
+            if dirs != watched_dirs:
+                # Changes are not seen while the watcher restarts, so check every file once
+                if watcher is not None:
+                    await watcher.aclose()
+                watcher = awatch(
+                    *dirs,
+                    recursive=False,
+                    debounce=min(1600, int(polling_interval * 1000)),
+                    rust_timeout=int(polling_interval * 1000),
+                    yield_on_timeout=True,
+                )
+                watched_dirs = dirs
+                await sync_changed_flow_files(flow_paths, flow_mtimes)
+            else:
+                new_paths = flow_paths.keys() - flow_mtimes.keys()
+                await sync_changed_flow_files({path: flow_paths[path] for path in new_paths}, flow_mtimes)
+
+            # Wait for changes, or for the timeout that makes the loop pick up new flows
+            changes = await anext(watcher)
+            # The watched directories are absolute, so watchfiles reports absolute paths
+            changed_paths = {path for _, path in changes}
+            await sync_changed_flow_files(
+                {path: flow_id for path, flow_id in flow_paths.items() if path in changed_paths}, flow_mtimes
+            )
+    finally:
+        if watcher is not None:
+            await watcher.aclose()
+
+
 async def sync_flows_from_fs():
-    flow_mtimes = {}
-    fs_flows_polling_interval = get_settings_service().settings.fs_flows_polling_interval / 1000
-    storage_service = get_storage_service()
+    """Sync flows from their files in a single worker per host.
+
+    Workers compete for a file lock and only the one holding it watches the files; the
+    others retry on every polling interval and take over if it stops.
+    """
+    polling_interval = get_settings_service().settings.fs_flows_polling_interval / 1000
+    lock = FileLock(Path(tempfile.gettempdir()) / FLOW_SYNC_LOCK_FILE, thread_local=False)
     try:
         while True:
             try:
-                async with session_scope() as session:
-                    stmt = select(Flow).where(col(Flow.fs_path).is_not(None))
-                    flows = (await session.exec(stmt)).all()
-                    for flow in flows:
-                        mtime = flow_mtimes.setdefault(flow.id, 0)
-                        # Resolve path: if relative, construct full path using user's flows directory
-                        fs_path_str = flow.fs_path
-                        if not Path(fs_path_str).is_absolute():
-                            # Relative path - construct full path
-                            path = storage_service.data_dir / "flows" / str(flow.user_id) / fs_path_str
-                        else:
-                            # Absolute path - use as-is
-                            path = anyio.Path(fs_path_str)
-                        try:
-                            if await path.exists():
-                                new_mtime = (await path.stat()).st_mtime
-                                if new_mtime > mtime:
-                                    update_data = orjson.loads(await path.read_text(encoding="utf-8"))
-                                    try:
-                                        for field_name in ("name", "description", "data", "locked"):
-                                            if new_value := update_data.get(field_name):
-                                                setattr(flow, field_name, new_value)
-                                        if folder_id := update_data.get("folder_id"):
-                                            flow.folder_id = UUID(folder_id)
-                                        await session.flush()
-                                        await session.refresh(flow)
-                                    except Exception:  # noqa: BLE001
-                                        await logger.aexception(
-                                            f"Couldn't update flow {flow.id} in database from path {path}"
-                                        )
-                                    flow_mtimes[flow.id] = new_mtime
-                        except Exception:  # noqa: BLE001
-                            await logger.aexception(f"Error while handling flow file {path}")
-            except asyncio.CancelledError:
-                await logger.adebug("Flow sync cancelled")
-                break
-            except (sa.exc.OperationalError, ValueError) as e:
-                if "no active connection" in str(e) or "connection is closed" in str(e):
-                    await logger.adebug("Database connection lost, assuming shutdown")
-                    break  # Exit gracefully, don't error
-                raise  # Re-raise if it's a real connection problem
-            except Exception:  # noqa: BLE001
-                await logger.aexception("Error while syncing flows from database")
+                lock.acquire(timeout=0)
                 break
+            except TimeoutError:
+                await asyncio.sleep(polling_interval)
 
-            await asyncio.sleep(fs_flows_polling_interval)
+        try:
+            await logger.adebug("Syncing flows from the file system in this worker")
+            await watch_flows_from_fs(polling_interval)
+        except (sa.exc.OperationalError, ValueError) as e:
+            if "no active connection" in str(e) or "connection is closed" in str(e):
+                await logger.adebug("Database connection lost, assuming shutdown")
+            else:
+                raise  # Re-raise if it's a real connection problem
+        except Exception:  # noqa: BLE001
+            await logger.aexception("Error while syncing flows from database")
+        finally:
+            lock.release()
     except asyncio.CancelledError:
         await logger.adebug("Flow sync task cancelled")
@@ -27,6 +27,7 @@ from pydantic_core import PydanticSerializationError
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 
 from langflow.api import health_check_router, log_router, router
+from langflow.api.limited_background_tasks import drain_background_tasks
 from langflow.api.v1.mcp_projects import init_mcp_servers
 from langflow.initial_setup.setup import (
     copy_profile_pictures,
@@ -36,7 +37,7 @@ from langflow.initial_setup.setup import (
     load_flows_from_directory,
     sync_flows_from_fs,
 )
-from langflow.middleware import ContentSizeLimitMiddleware
+from langflow.middleware import ContentSizeLimitMiddleware, TracingEndpointMiddleware
 from langflow.services.deps import (
     get_queue_service,
     get_service,
@@ -161,6 +162,7 @@ def get_lifespan(*, fix_migration=False, version=None):
         temp_dirs: list[TemporaryDirectory] = []
         sync_flows_from_fs_task = None
         mcp_init_task = None
+        deferred_startup_task = None
 
         try:
             start_time = asyncio.get_event_loop().time()
@@ -174,108 +176,88 @@ def get_lifespan(*, fix_migration=False, version=None):
             setup_llm_caching()
             await logger.adebug(f"LLM caching setup in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Copying profile pictures")
-            await copy_profile_pictures()
-            await logger.adebug(f"Profile pictures copied in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            if get_settings_service().auth_settings.AUTO_LOGIN:
-                current_time = asyncio.get_event_loop().time()
-                await logger.adebug("Initializing default super user")
-                await initialize_auto_login_default_superuser()
-                await logger.adebug(
-                    f"Default super user initialized in {asyncio.get_event_loop().time() - current_time:.2f}s"
-                )
-
-            await logger.adebug("Initializing super user")
-            await initialize_auto_login_default_superuser()
-            await logger.adebug(f"Super user initialized in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Loading bundles")
-            temp_dirs, bundles_components_paths = await load_bundles_with_error_handling()
-            get_settings_service().settings.components_path.extend(bundles_components_paths)
-            await logger.adebug(f"Bundles loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Caching types")
-            all_types_dict = await get_and_cache_all_types_dict(get_settings_service(), telemetry_service)
-            await logger.adebug(f"Types cached in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            # Use file-based lock to prevent multiple workers from creating duplicate starter projects concurrently.
-            # Note that it's still possible that one worker may complete this task, release the lock,
-            # then another worker pick it up, but the operation is idempotent so worst case it duplicates
-            # the initialization work.
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Creating/updating starter projects")
-
-            lock_file = Path(tempfile.gettempdir()) / "langflow_starter_projects.lock"
-            lock = FileLock(lock_file, timeout=1)
-            try:
-                with lock:
-                    await create_or_update_starter_projects(all_types_dict)
-                    await logger.adebug(
-                        f"Starter projects created/updated in {asyncio.get_event_loop().time() - current_time:.2f}s"
-                    )
-            except TimeoutError:
-                # Another process has the lock
-                await logger.adebug("Another worker is creating starter projects, skipping")
-            except Exception as e:  # noqa: BLE001
-                await logger.awarning(
-                    f"Failed to acquire lock for starter projects: {e}. Starter projects may not be created or updated."
+            # Independent steps run concurrently; each one logs its own timing so the
+            # slowest step on the critical path is easy to spot in debug logs.
+            async def timed(name: str, coro):
+                step_start = asyncio.get_event_loop().time()
+                await logger.adebug(f"{name}...")
+                result = await coro
+                await logger.adebug(f"{name} done in {asyncio.get_event_loop().time() - step_start:.2f}s")
+                return result
+
+            async def load_bundles_and_cache_types():
+                nonlocal temp_dirs
+                temp_dirs, bundles_components_paths = await timed("Loading bundles", load_bundles_with_error_handling())
+                get_settings_service().settings.components_path.extend(bundles_components_paths)
+                return await timed(
+                    "Caching types", get_and_cache_all_types_dict(get_settings_service(), telemetry_service)
                 )
 
-            # Initialize agentic global variables early (before MCP server and flows)
-            if get_settings_service().settings.agentic_experience:
-                from langflow.api.utils.mcp.agentic_mcp import initialize_agentic_global_variables
+            all_types_dict, _, _ = await asyncio.gather(
+                load_bundles_and_cache_types(),
+                timed("Initializing default super user", initialize_auto_login_default_superuser()),
+                timed("Copying profile pictures", copy_profile_pictures()),
+            )
 
-                current_time = asyncio.get_event_loop().time()
-                await logger.ainfo("Initializing agentic global variables...")
+            async def create_starter_projects():
+                # Use file-based lock to prevent multiple workers from creating duplicate starter projects
+                # concurrently. Note that it's still possible that one worker may complete this task, release the
+                # lock, then another worker pick it up, but the operation is idempotent and skipped when the
+                # starter projects and components are unchanged.
+                lock_file = Path(tempfile.gettempdir()) / "langflow_starter_projects.lock"
+                lock = FileLock(lock_file, timeout=1)
                 try:
-                    async with session_scope() as session:
-                        await initialize_agentic_global_variables(session)
-                    await logger.adebug(
-                        f"Agentic global variables initialized in {asyncio.get_event_loop().time() - current_time:.2f}s"
-                    )
+                    with lock:
+                        await timed(
+                            "Creating/updating starter projects", create_or_update_starter_projects(all_types_dict)
+                        )
+                except TimeoutError:
+                    # Another process has the lock
+                    await logger.adebug("Another worker is creating starter projects, skipping")
                 except Exception as e:  # noqa: BLE001
-                    await logger.awarning(f"Failed to initialize agentic global variables: {e}")
-
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Starting telemetry service")
-            telemetry_service.start()
-            await logger.adebug(f"started telemetry service in {asyncio.get_event_loop().time() - current_time:.2f}s")
+                    await logger.awarning(
+                        f"Failed to acquire lock for starter projects: {e}. "
+                        "Starter projects may not be created or updated."
+                    )
 
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Starting MCP Composer service")
-            mcp_composer_service = cast("MCPComposerService", get_service(ServiceType.MCP_COMPOSER_SERVICE))
-            await mcp_composer_service.start()
-            await logger.adebug(
-                f"started MCP Composer service in {asyncio.get_event_loop().time() - current_time:.2f}s"
-            )
+            async def initialize_agentic_variables_and_load_flows():
+                # Initialize agentic global variables before flows and the MCP server use them
+                if get_settings_service().settings.agentic_experience:
+                    from langflow.api.utils.mcp.agentic_mcp import initialize_agentic_global_variables
 
-            # Auto-configure Agentic MCP server if enabled (after variables are initialized)
-            if get_settings_service().settings.agentic_experience:
-                from langflow.api.utils.mcp.agentic_mcp import auto_configure_agentic_mcp_server
+                    try:
+                        async with session_scope() as session:
+                            await timed(
+                                "Initializing agentic global variables", initialize_agentic_global_variables(session)
+                            )
+                    except Exception as e:  # noqa: BLE001
+                        await logger.awarning(f"Failed to initialize agentic global variables: {e}")
+                await timed("Loading flows", load_flows_from_directory())
 
-                current_time = asyncio.get_event_loop().time()
-                await logger.ainfo("Configuring Agentic MCP server...")
-                try:
-                    async with session_scope() as session:
-                        await auto_configure_agentic_mcp_server(session)
-                    await logger.adebug(
-                        f"Agentic MCP server configured in {asyncio.get_event_loop().time() - current_time:.2f}s"
-                    )
-                except Exception as e:  # noqa: BLE001
-                    await logger.awarning(f"Failed to configure agentic MCP server: {e}")
+            await asyncio.gather(create_starter_projects(), initialize_agentic_variables_and_load_flows())
 
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Loading flows")
-            await load_flows_from_directory()
             sync_flows_from_fs_task = asyncio.create_task(sync_flows_from_fs())
             queue_service = get_queue_service()
             if not queue_service.is_started():  # Start if not already started
                 queue_service.start()
-            await logger.adebug(f"Flows loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
+            telemetry_service.start()
+
+            async def deferred_startup():
+                # Nothing below is needed to serve requests, so it runs after the server is ready
+                mcp_composer_service = cast("MCPComposerService", get_service(ServiceType.MCP_COMPOSER_SERVICE))
+                await timed("Starting MCP Composer service", mcp_composer_service.start())
+
+                # Auto-configure Agentic MCP server if enabled (after variables are initialized)
+                if get_settings_service().settings.agentic_experience:
+                    from langflow.api.utils.mcp.agentic_mcp import auto_configure_agentic_mcp_server
+
+                    try:
+                        async with session_scope() as session:
+                            await timed("Configuring Agentic MCP server", auto_configure_agentic_mcp_server(session))
+                    except Exception as e:  # noqa: BLE001
+                        await logger.awarning(f"Failed to configure agentic MCP server: {e}")
+
+            deferred_startup_task = asyncio.create_task(deferred_startup())
 
             total_time = asyncio.get_event_loop().time() - start_time
             await logger.adebug(f"Total initialization time: {total_time:.2f}s")
@@ -363,9 +345,10 @@ def get_lifespan(*, fix_migration=False, version=None):
                     if sync_flows_from_fs_task:
                         sync_flows_from_fs_task.cancel()
                         tasks_to_cancel.append(sync_flows_from_fs_task)
-                    if mcp_init_task and not mcp_init_task.done():
-                        mcp_init_task.cancel()
-                        tasks_to_cancel.append(mcp_init_task)
+                    for task in (mcp_init_task, deferred_startup_task):
+                        if task and not task.done():
+                            task.cancel()
+                            tasks_to_cancel.append(task)
                     if tasks_to_cancel:
                         # Wait for all tasks to complete, capturing exceptions
                         results = await asyncio.gather(*tasks_to_cancel, return_exceptions=True)
@@ -373,6 +356,11 @@ def get_lifespan(*, fix_migration=False, version=None):
                         for result in results:
                             if isinstance(result, Exception) and not isinstance(result, asyncio.CancelledError):
                                 await logger.aerror(f"Error during task cleanup: {result}", exc_info=result)
+                    # Let the response background tasks finish, up to background_task_drain_timeout
+                    try:
+                        await drain_background_tasks()
+                    except Exception as e:  # noqa: BLE001
+                        await logger.aerror(f"Failed to drain background tasks: {e}")
 
                 # Step 2: Cleaning Up Services
                 with shutdown_progress.step(2):
@@ -446,6 +434,8 @@ def create_app():
         allow_headers=settings.cors_allow_headers,
     )
     app.add_middleware(JavaScriptMIMETypeMiddleware)
+    if settings.tracing_endpoint_sample_rates:
+        app.add_middleware(TracingEndpointMiddleware)
 
     @app.middleware("http")
     async def check_boundary(request: Request, call_next):
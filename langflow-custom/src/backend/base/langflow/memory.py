@@ -7,7 +7,7 @@ from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import BaseMessage
 from lfx.log.logger import logger
 from lfx.utils.async_helpers import run_until_complete
-from sqlalchemy import delete
+from sqlalchemy import delete, insert
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -151,14 +151,33 @@ async def aadd_messages(messages: Message | list[Message], flow_id: str | UUID |
         raise
 
 
+def _to_message_id(message_id: str | UUID | None) -> UUID | None:
+    if message_id is None or isinstance(message_id, UUID):
+        return message_id
+    try:
+        return UUID(str(message_id))
+    except ValueError:
+        return None
+
+
+def _messagetable_row(message: MessageTable) -> dict:
+    """Returns the column values of a MessageTable, ready to be used as a bulk INSERT parameter set."""
+    return {column.name: getattr(message, column.name) for column in MessageTable.__table__.columns}
+
+
 async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
     if not isinstance(messages, list):
         messages = [messages]
 
     async with session_scope() as session:
+        # Fetch every target row with a single `WHERE id IN (...)` instead of one `session.get` per message
+        message_ids = [_to_message_id(message.id) for message in messages]
+        stmt = select(MessageTable).where(col(MessageTable.id).in_(message_ids))
+        existing_messages = {msg.id: msg for msg in await session.exec(stmt)}
+
         updated_messages: list[MessageTable] = []
-        for message in messages:
-            msg = await session.get(MessageTable, message.id)
+        for message, message_id in zip(messages, message_ids, strict=True):
+            msg = existing_messages.get(message_id)
             if msg:
                 msg = msg.sqlmodel_update(message.model_dump(exclude_unset=True, exclude_none=True))
                 # Convert flow_id to UUID if it's a string preventing error when saving to database
@@ -179,6 +198,10 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
 async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession, retry_count: int = 0):
     """Add messages to the database with retry logic for CancelledError.
 
+    With a database session, all messages are persisted with a single multi-row ``INSERT ... RETURNING``
+    statement inside one transaction, so the number of round-trips does not grow with the number of messages.
+    Other sessions, such as lfx's ``NoopSession``, get the messages through ``add``, ``commit`` and ``refresh``.
+
     Args:
         messages: List of MessageTable objects to add
         session: Database session
@@ -188,13 +211,23 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
     session.commit() when called from build_public_tmp but not from build_flow.
     The retry mechanism has a limit to prevent infinite recursion.
     """
+    if not messages:
+        return []
     max_retries = 3
     try:
         try:
-            for message in messages:
-                result = session.add(message)
-                if asyncio.iscoroutine(result):
-                    await result
+            if isinstance(session, AsyncSession):
+                # A single multi-row INSERT ... RETURNING replaces the per-message add/refresh round-trips.
+                # The returned rows are the persisted state, so no refresh is needed afterwards.
+                stmt = insert(MessageTable).returning(MessageTable, sort_by_parameter_order=True)
+                result = await session.execute(stmt, [_messagetable_row(message) for message in messages])
+                inserted_messages = list(result.scalars().all())
+            else:
+                for message in messages:
+                    result = session.add(message)
+                    if asyncio.iscoroutine(result):
+                        await result
+                inserted_messages = None
             await session.commit()
             # This is a hack.
             # We are doing this because build_public_tmp causes the CancelledError to be raised
@@ -208,8 +241,10 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
                 error_msg = "Add Message operation cancelled after multiple retries"
                 raise ValueError(error_msg) from None
             return await aadd_messagetables(messages, session, retry_count + 1)
-        for message in messages:
-            await session.refresh(message)
+        if inserted_messages is None:
+            for message in messages:
+                await session.refresh(message)
+            inserted_messages = messages
     except asyncio.CancelledError as e:
         await logger.aexception(e)
         error_msg = "Operation cancelled"
@@ -219,7 +254,7 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
         raise
 
     new_messages = []
-    for msg in messages:
+    for msg in inserted_messages:
         msg.properties = json.loads(msg.properties) if isinstance(msg.properties, str) else msg.properties  # type: ignore[arg-type]
         msg.content_blocks = [json.loads(j) if isinstance(j, str) else j for j in msg.content_blocks]  # type: ignore[arg-type]
         msg.category = msg.category or ""
@@ -2,6 +2,7 @@ from fastapi import HTTPException
 from lfx.log.logger import logger
 
 from langflow.services.deps import get_settings_service
+from langflow.services.tracing.service import trace_endpoint_var
 
 
 class MaxFileSizeException(HTTPException):
@@ -57,3 +58,24 @@ class ContentSizeLimitMiddleware:
 
         wrapper = self.receive_wrapper(receive)
         await self.app(scope, wrapper, send)
+
+
+class TracingEndpointMiddleware:
+    """Records the path of each HTTP request, so flow runs it starts can be sampled per endpoint.
+
+    Only installed when tracing_endpoint_sample_rates is set.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = trace_endpoint_var.set(scope["path"])
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            trace_endpoint_var.reset(token)
@@ -1,8 +1,11 @@
+import copy
 import json
 import os
 from pathlib import Path
+from typing import Any
 from uuid import UUID, uuid4
 
+import anyio
 from aiofile import async_open
 from lfx.graph import Graph
 from lfx.graph.vertex.param_handler import ParameterHandler
@@ -19,6 +22,9 @@ from langflow.services.database.models import Flow, User, Variable
 from langflow.services.database.utils import initialize_database
 from langflow.services.deps import get_cache_service, get_storage_service, session_scope
 
+# Parsed flow files keyed by resolved path, invalidated when the file's mtime or size changes
+_flow_file_cache: dict[str, tuple[int, int, dict]] = {}
+
 
 class LangflowRunnerExperimental:
     """LangflowRunnerExperimental orchestrates flow execution without a dedicated server.
@@ -35,6 +41,9 @@ class LangflowRunnerExperimental:
         runner = LangflowRunnerExperimental()
         result = await runner.run(flow="path/to/flow.json", input_value="Hello", session_id=str(uuid.uuid4()))
 
+    Each run builds its graph once. Flows given as a file path are parsed once per file version and
+    the processed flow is reused by later `run` calls with the same resolved tweaks. Set
+    `reuse_prepared_flows=False` to read and process the flow on every run.
     """
 
     def __init__(
@@ -45,8 +54,14 @@ class LangflowRunnerExperimental:
         log_file: str | None = None,
         log_rotation: str | None = None,
         disable_logs: bool = False,
+        reuse_prepared_flows: bool = True,
     ):
         self.should_initialize_db = should_initialize_db
+        self.reuse_prepared_flows = reuse_prepared_flows
+        # Processed flows keyed by flow file version and resolved tweaks
+        self._prepared_flows: dict[tuple, dict] = {}
+        # Fields loaded from the database for each flow file version, used to resolve tweaks before building
+        self._load_from_db_fields: dict[tuple, dict[str, dict[str, Any]]] = {}
         log_file_path = Path(log_file) if log_file else None
         configure(
             log_level=log_level,
@@ -78,12 +93,9 @@ class LangflowRunnerExperimental:
             if generate_user:
                 user = await self.generate_user()
                 user_id = str(user.id)
-            flow_dict = await self.prepare_flow_and_add_to_db(
-                flow=flow,
-                user_id=user_id,
-                session_id=session_id,
-                tweaks_values=tweaks_values,
-            )
+            flow_dict, graph = await self.prepare_flow_and_graph(flow=flow, tweaks_values=tweaks_values)
+            await self.clear_flow_state(flow_dict)
+            await self.add_flow_to_db(flow_dict, user_id=user_id)
             return await self.run_flow(
                 input_value=input_value,
                 session_id=session_id,
@@ -92,6 +104,7 @@ class LangflowRunnerExperimental:
                 output_type=output_type,
                 user_id=user_id,
                 stream=stream,
+                graph=graph,
             )
         finally:
             if cleanup and user_id:
@@ -107,8 +120,12 @@ class LangflowRunnerExperimental:
         output_type: str = "all",
         user_id: str | None = None,
         stream: bool = False,
+        graph: Graph | None = None,
     ):
-        graph = await self.create_graph_from_flow(session_id, flow_dict, user_id=user_id)
+        if graph is None:
+            graph = await self.create_graph_from_flow(session_id, flow_dict, user_id=user_id)
+        else:
+            await self.prepare_graph_for_run(graph, session_id, user_id=user_id)
         try:
             result = await self.run_graph(input_value, input_type, output_type, session_id, graph, stream=stream)
         finally:
@@ -134,19 +151,91 @@ class LangflowRunnerExperimental:
         await self.add_flow_to_db(flow_dict, user_id=user_id)
         return flow_dict
 
-    def process_tweaks(self, flow_dict: dict, tweaks_values: dict | None = None) -> dict:
-        tweaks: dict | None = None
+    async def prepare_flow_and_graph(
+        self,
+        *,
+        flow: Path | str | dict,
+        tweaks_values: dict | None = None,
+    ) -> tuple[dict, Graph]:
+        """Return the processed flow dict and the graph to run, building the graph only once.
+
+        For flows given as a file path, the processed flow is kept per file version and resolved
+        tweaks, so later runs skip reading, parsing and tweaking the flow again.
+        """
         tweaks_values = tweaks_values or os.environ.copy()
-        for vertex in Graph.from_payload(flow_dict).vertices:
+        source_key = await self._flow_source_key(flow) if self.reuse_prepared_flows else None
+        if source_key is not None and (load_from_db_fields := self._load_from_db_fields.get(source_key)) is not None:
+            flow_dict = self._prepared_flows.get(
+                self._prepared_flow_key(source_key, load_from_db_fields, tweaks_values)
+            )
+            if flow_dict is not None:
+                graph = Graph.from_payload(flow_dict, flow_id=flow_dict["id"], flow_name=flow_dict.get("name"))
+                return flow_dict, graph
+
+        flow_dict = await self.get_flow_dict(flow)
+        graph = Graph.from_payload(flow_dict, flow_id=flow_dict["id"], flow_name=flow_dict.get("name"))
+        load_from_db_fields = self._get_load_from_db_fields(graph)
+        flow_dict = self._apply_load_from_db_tweaks(flow_dict, load_from_db_fields, tweaks_values, graph=graph)
+        if source_key is not None:
+            # Drop flows prepared from older versions of the same file
+            path = source_key[0]
+            for stale_key in [key for key in self._load_from_db_fields if key[0] == path and key != source_key]:
+                del self._load_from_db_fields[stale_key]
+            for stale_key in [key for key in self._prepared_flows if key[0][0] == path and key[0] != source_key]:
+                del self._prepared_flows[stale_key]
+            self._load_from_db_fields[source_key] = load_from_db_fields
+            self._prepared_flows[self._prepared_flow_key(source_key, load_from_db_fields, tweaks_values)] = flow_dict
+        return flow_dict, graph
+
+    @staticmethod
+    async def _flow_source_key(flow: Path | str | dict) -> tuple | None:
+        # Only files have a version we can check; dicts belong to the caller and may change between runs
+        if not isinstance(flow, str | Path):
+            return None
+        path = await anyio.Path(flow).resolve()
+        stat = await path.stat()
+        return (str(path), stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _prepared_flow_key(
+        source_key: tuple, load_from_db_fields: dict[str, dict[str, Any]], tweaks_values: dict
+    ) -> tuple:
+        # A prepared flow can only be shared by runs that resolve the database fields to the same values
+        tweaks = replace_tweaks_with_env(tweaks=copy.deepcopy(load_from_db_fields), env_vars=tweaks_values)
+        return (source_key, json.dumps(tweaks, sort_keys=True, default=str))
+
+    @staticmethod
+    def _get_load_from_db_fields(graph: Graph) -> dict[str, dict[str, Any]]:
+        load_from_db_fields: dict[str, dict[str, Any]] = {}
+        for vertex in graph.vertices:
             param_handler = ParameterHandler(vertex, get_storage_service())
-            field_params, load_from_db_fields = param_handler.process_field_parameters()
-            for db_field in load_from_db_fields:
+            field_params, vertex_load_from_db_fields = param_handler.process_field_parameters()
+            for db_field in vertex_load_from_db_fields:
                 if field_params[db_field]:
-                    tweaks = tweaks or {}
-                    tweaks[vertex.id] = tweaks.get(vertex.id, {})
-                    tweaks[vertex.id][db_field] = field_params[db_field]
-        if tweaks is not None:
-            tweaks = replace_tweaks_with_env(tweaks=tweaks, env_vars=tweaks_values)
+                    load_from_db_fields.setdefault(vertex.id, {})[db_field] = field_params[db_field]
+        return load_from_db_fields
+
+    def process_tweaks(self, flow_dict: dict, tweaks_values: dict | None = None, graph: Graph | None = None) -> dict:
+        """Replace fields loaded from the database with values from `tweaks_values`.
+
+        When a graph built from `flow_dict` is given, it is used to find those fields and the same
+        tweaks are applied to its vertices, so it can run without being rebuilt.
+        """
+        load_from_db_fields = self._get_load_from_db_fields(graph or Graph.from_payload(flow_dict))
+        return self._apply_load_from_db_tweaks(
+            flow_dict, load_from_db_fields, tweaks_values or os.environ.copy(), graph=graph
+        )
+
+    @staticmethod
+    def _apply_load_from_db_tweaks(
+        flow_dict: dict,
+        load_from_db_fields: dict[str, dict[str, Any]],
+        tweaks_values: dict,
+        graph: Graph | None = None,
+    ) -> dict:
+        tweaks: dict | None = None
+        if load_from_db_fields:
+            tweaks = replace_tweaks_with_env(tweaks=copy.deepcopy(load_from_db_fields), env_vars=tweaks_values)
             flow_dict = process_tweaks(flow_dict, tweaks)
 
         # Recursively update load_from_db fields
@@ -162,6 +251,15 @@ class LangflowRunnerExperimental:
                     update_load_from_db(item)
 
         update_load_from_db(flow_dict)
+
+        if graph is not None:
+            # Vertices hold their own copy of the node data, so it is tweaked the same way
+            vertices_data = {"data": {"nodes": [{"id": vertex.id, "data": vertex.data} for vertex in graph.vertices]}}
+            if tweaks is not None:
+                process_tweaks(vertices_data, tweaks)
+            update_load_from_db(vertices_data)
+            for vertex in graph.vertices:
+                vertex.build_params()
         return flow_dict
 
     async def generate_user(self) -> User:
@@ -206,11 +304,15 @@ class LangflowRunnerExperimental:
         graph = Graph.from_payload(
             payload=flow_dict, flow_id=flow_dict["id"], flow_name=flow_dict.get("name"), user_id=user_id
         )
+        await LangflowRunnerExperimental.prepare_graph_for_run(graph, session_id, user_id=user_id)
+        return graph
+
+    @staticmethod
+    async def prepare_graph_for_run(graph: Graph, session_id: str, user_id: str | None = None):
         graph.session_id = session_id
         graph.set_run_id(session_id)
         graph.user_id = user_id
         await graph.initialize_run()
-        return graph
 
     @staticmethod
     async def clear_flow_state(flow_dict: dict):
@@ -254,11 +356,18 @@ class LangflowRunnerExperimental:
     @staticmethod
     async def get_flow_dict(flow: Path | str | dict) -> dict:
         if isinstance(flow, str | Path):
-            async with async_open(Path(flow), encoding="utf-8") as f:
-                content = await f.read()
-                return json.loads(content)
+            path = await anyio.Path(flow).resolve()
+            stat = await path.stat()
+            cached = _flow_file_cache.get(str(path))
+            if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+                async with async_open(Path(path), encoding="utf-8") as f:
+                    content = await f.read()
+                cached = (stat.st_mtime_ns, stat.st_size, json.loads(content))
+                _flow_file_cache[str(path)] = cached
+            # Tweaks are applied in place, so every caller gets its own copy
+            return copy.deepcopy(cached[2])
         # If input is a dictionary, assume it's a JSON object
-        elif isinstance(flow, dict):
+        if isinstance(flow, dict):
             return flow
         error_msg = "Input must be a file path (str or Path object) or a JSON object (dict)."
         raise TypeError(error_msg)
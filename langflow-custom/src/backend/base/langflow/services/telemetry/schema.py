@@ -6,6 +6,9 @@ from pydantic import BaseModel, EmailStr, Field
 # Scarf supports up to 2KB (2048 bytes) for query parameters
 MAX_TELEMETRY_URL_SIZE = 2048
 
+# Maximum number of telemetry events waiting to be sent, newer events are dropped past it
+MAX_TELEMETRY_QUEUE_SIZE = 1000
+
 
 class BasePayload(BaseModel):
     client_type: str | None = Field(default=None, serialization_alias="clientType")
@@ -14,6 +14,7 @@ from lfx.log.logger import logger
 from langflow.services.base import Service
 from langflow.services.telemetry.opentelemetry import OpenTelemetry
 from langflow.services.telemetry.schema import (
+    MAX_TELEMETRY_QUEUE_SIZE,
     MAX_TELEMETRY_URL_SIZE,
     ComponentIndexPayload,
     ComponentInputsPayload,
@@ -39,7 +40,7 @@ class TelemetryService(Service):
         super().__init__()
         self.settings_service = settings_service
         self.base_url = settings_service.settings.telemetry_base_url
-        self.telemetry_queue: asyncio.Queue = asyncio.Queue()
+        self.telemetry_queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_TELEMETRY_QUEUE_SIZE)
         self.client = httpx.AsyncClient(timeout=10.0)  # Set a reasonable timeout
         self.running = False
         self._stopping = False
@@ -117,7 +118,10 @@ class TelemetryService(Service):
     async def _queue_event(self, payload) -> None:
         if self.do_not_track or self._stopping:
             return
-        await self.telemetry_queue.put(payload)
+        try:
+            self.telemetry_queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            await logger.adebug("Telemetry queue is full, dropping event")
 
     def _get_langflow_desktop(self) -> bool:
         # Coerce to bool, could be 1, 0, True, False, "1", "0", "True", "False"
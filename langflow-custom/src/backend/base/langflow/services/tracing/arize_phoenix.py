@@ -121,6 +121,20 @@ class ArizePhoenixTracer(BaseTracer):
         """Indicates if the tracer is ready for usage."""
         return self._ready
 
+    @staticmethod
+    def _is_arize_configured() -> bool:
+        return bool(os.getenv("ARIZE_API_KEY") and os.getenv("ARIZE_SPACE_ID"))
+
+    @staticmethod
+    def _is_phoenix_configured() -> bool:
+        phoenix_collector_endpoint = os.getenv("PHOENIX_COLLECTOR_ENDPOINT", "https://app.phoenix.arize.com")
+        phoenix_auth_disabled = "localhost" in phoenix_collector_endpoint or "127.0.0.1" in phoenix_collector_endpoint
+        return bool(os.getenv("PHOENIX_API_KEY")) or phoenix_auth_disabled
+
+    @classmethod
+    def is_configured(cls) -> bool:
+        return cls._is_arize_configured() or cls._is_phoenix_configured()
+
     def setup_arize_phoenix(self) -> bool:
         """Configures Arize/Phoenix specific environment variables and registers the tracer provider."""
         arize_phoenix_batch = os.getenv("ARIZE_PHOENIX_BATCH", "False").lower() in {
@@ -135,7 +149,7 @@ class ArizePhoenixTracer(BaseTracer):
         arize_api_key = os.getenv("ARIZE_API_KEY", None)
         arize_space_id = os.getenv("ARIZE_SPACE_ID", None)
         arize_collector_endpoint = os.getenv("ARIZE_COLLECTOR_ENDPOINT", "https://otlp.arize.com")
-        enable_arize_tracing = bool(arize_api_key and arize_space_id)
+        enable_arize_tracing = self._is_arize_configured()
         arize_endpoint = f"{arize_collector_endpoint}/v1"
         arize_headers = {
             "api_key": arize_api_key,
@@ -146,8 +160,7 @@ class ArizePhoenixTracer(BaseTracer):
         # Phoenix Config
         phoenix_api_key = os.getenv("PHOENIX_API_KEY", None)
         phoenix_collector_endpoint = os.getenv("PHOENIX_COLLECTOR_ENDPOINT", "https://app.phoenix.arize.com")
-        phoenix_auth_disabled = "localhost" in phoenix_collector_endpoint or "127.0.0.1" in phoenix_collector_endpoint
-        enable_phoenix_tracing = bool(phoenix_api_key) or phoenix_auth_disabled
+        enable_phoenix_tracing = self._is_phoenix_configured()
         phoenix_endpoint = f"{phoenix_collector_endpoint}/v1/traces"
         phoenix_headers = (
             {
@@ -28,6 +28,14 @@ class BaseTracer(ABC):
     ) -> None:
         raise NotImplementedError
 
+    @classmethod
+    def is_configured(cls) -> bool:
+        """Whether the environment holds the configuration this tracer needs to be set up.
+
+        The tracing service checks it once at startup, and tracers whose check fails are never created.
+        """
+        return True
+
     @property
     @abstractmethod
     def ready(self) -> bool:
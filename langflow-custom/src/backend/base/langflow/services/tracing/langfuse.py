@@ -49,6 +49,10 @@ class LangFuseTracer(BaseTracer):
     def ready(self):
         return self._ready
 
+    @classmethod
+    def is_configured(cls) -> bool:
+        return bool(cls._get_config())
+
     def setup_langfuse(self, config) -> bool:
         try:
             from langfuse import Langfuse
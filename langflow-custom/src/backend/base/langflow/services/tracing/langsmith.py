@@ -75,8 +75,12 @@ class LangSmithTracer(BaseTracer):
             return "chain"
         return run_type
 
+    @classmethod
+    def is_configured(cls) -> bool:
+        return os.getenv("LANGCHAIN_API_KEY") is not None
+
     def setup_langsmith(self) -> bool:
-        if os.getenv("LANGCHAIN_API_KEY") is None:
+        if not self.is_configured():
             return False
         try:
             from langsmith import Client
@@ -61,8 +61,12 @@ class LangWatchTracer(BaseTracer):
     def ready(self):
         return self._ready
 
+    @classmethod
+    def is_configured(cls) -> bool:
+        return "LANGWATCH_API_KEY" in os.environ
+
     def setup_langwatch(self) -> bool:
-        if "LANGWATCH_API_KEY" not in os.environ:
+        if not self.is_configured():
             return False
         try:
             import langwatch
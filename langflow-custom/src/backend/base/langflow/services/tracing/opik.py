@@ -57,6 +57,10 @@ class OpikTracer(BaseTracer):
     def ready(self):
         return self._ready
 
+    @classmethod
+    def is_configured(cls) -> bool:
+        return bool(cls._get_config())
+
     def _setup_opik(self, config: dict, trace_id: UUID) -> bool:
         try:
             from opik import Opik
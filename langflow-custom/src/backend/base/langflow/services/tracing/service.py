@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import os
+import zlib
 from collections import defaultdict
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
@@ -59,8 +60,39 @@ def _get_traceloop_tracer():
     return TraceloopTracer
 
 
+# Initialization order of the tracers
+TRACER_NAMES = ("langsmith", "langwatch", "langfuse", "arize_phoenix", "opik", "traceloop")
+
+
+def resolve_enabled_tracers() -> tuple[str, ...]:
+    """Return the names of the tracers whose configuration is present in the environment.
+
+    Each tracer class tells whether it is configured, so this stays in step with the tracers' own setup.
+    """
+    tracer_getters = {
+        "langsmith": _get_langsmith_tracer,
+        "langwatch": _get_langwatch_tracer,
+        "langfuse": _get_langfuse_tracer,
+        "arize_phoenix": _get_arize_phoenix_tracer,
+        "opik": _get_opik_tracer,
+        "traceloop": _get_traceloop_tracer,
+    }
+    enabled_tracers = []
+    for tracer_name in TRACER_NAMES:
+        try:
+            tracer_cls = tracer_getters[tracer_name]()
+        except ImportError as e:
+            logger.debug(f"Tracer {tracer_name} is not available: {e}")
+            continue
+        if tracer_cls.is_configured():
+            enabled_tracers.append(tracer_name)
+    return tuple(enabled_tracers)
+
+
 trace_context_var: ContextVar[TraceContext | None] = ContextVar("trace_context", default=None)
 component_context_var: ContextVar[ComponentTraceContext | None] = ContextVar("component_trace_context", default=None)
+# Path of the request a run was started from, set by TracingEndpointMiddleware for per endpoint sampling
+trace_endpoint_var: ContextVar[str | None] = ContextVar("trace_endpoint", default=None)
 
 
 class TraceContext:
@@ -126,6 +158,39 @@ class TracingService(Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
         self.deactivated = self.settings_service.settings.deactivate_tracing
+        # Resolved once at startup: runs pay nothing for tracers that are not configured
+        self.enabled_tracers: tuple[str, ...] = () if self.deactivated else resolve_enabled_tracers()
+        if not self.enabled_tracers:
+            self.deactivated = True
+        self.sample_rate = self.settings_service.settings.tracing_sample_rate
+        self.sample_rates = self.settings_service.settings.tracing_sample_rates
+        self.endpoint_sample_rates = self.settings_service.settings.tracing_endpoint_sample_rates
+
+    def _get_sample_rate(self, flow_id: str | None, flow_name: str | None) -> float:
+        for key in (flow_id, flow_name):
+            if key is not None and str(key) in self.sample_rates:
+                return self.sample_rates[str(key)]
+        endpoint = trace_endpoint_var.get()
+        if endpoint is not None and self.endpoint_sample_rates:
+            # The longest matching path prefix wins
+            prefixes = [prefix for prefix in self.endpoint_sample_rates if endpoint.startswith(prefix)]
+            if prefixes:
+                return self.endpoint_sample_rates[max(prefixes, key=len)]
+        return self.sample_rate
+
+    def should_sample(self, run_id: UUID | str, flow_id: str | None = None, flow_name: str | None = None) -> bool:
+        """Head-based sampling decision for a run.
+
+        The rate is the flow's entry in tracing_sample_rates, else the entry of the longest path prefix in
+        tracing_endpoint_sample_rates matching the request the run started from, else tracing_sample_rate.
+        The decision is derived from the run id, so it is stable for a given run across workers.
+        """
+        sample_rate = self._get_sample_rate(flow_id, flow_name)
+        if sample_rate >= 1:
+            return True
+        if sample_rate <= 0:
+            return False
+        return zlib.crc32(str(run_id).encode()) / 0xFFFFFFFF < sample_rate
 
     async def _trace_worker(self, trace_context: TraceContext) -> None:
         while trace_context.running or not trace_context.traces_queue.empty():
@@ -227,26 +292,29 @@ class TracingService(Service):
         user_id: str | None,
         session_id: str | None,
         project_name: str | None = None,
+        flow_id: str | None = None,
+        flow_name: str | None = None,
     ) -> None:
         """Start a trace for a graph run.
 
+        - decide whether the run is sampled
         - create a trace context
         - start a worker for this trace context
-        - initialize the tracers
+        - initialize the enabled tracers
         """
         if self.deactivated:
             return
+        if not self.should_sample(run_id, flow_id, flow_name):
+            # Unsampled runs take the same no-op path as a deactivated service
+            trace_context_var.set(None)
+            return
         try:
             project_name = project_name or os.getenv("LANGCHAIN_PROJECT", "Langflow")
             trace_context = TraceContext(run_id, run_name, project_name, user_id, session_id)
             trace_context_var.set(trace_context)
             await self._start(trace_context)
-            self._initialize_langsmith_tracer(trace_context)
-            self._initialize_langwatch_tracer(trace_context)
-            self._initialize_langfuse_tracer(trace_context)
-            self._initialize_arize_phoenix_tracer(trace_context)
-            self._initialize_opik_tracer(trace_context)
-            self._initialize_traceloop_tracer(trace_context)
+            for tracer_name in self.enabled_tracers:
+                getattr(self, f"_initialize_{tracer_name}_tracer")(trace_context)
         except Exception as e:  # noqa: BLE001
             await logger.adebug(f"Error initializing tracers: {e}")
 
@@ -365,7 +433,9 @@ class TracingService(Service):
         @param inputs: the inputs to the component
         @param metadata: the metadata to the component
         """
-        if self.deactivated:
+        trace_context = trace_context_var.get()
+        if self.deactivated or trace_context is None:
+            # Fast path: no tracer configured or the run was not sampled
             yield self
             return
         trace_id = trace_name
@@ -376,12 +446,6 @@ class TracingService(Service):
         inputs = self._cleanup_inputs(inputs)
         component_trace_context = ComponentTraceContext(trace_id, trace_name, trace_type, vertex, inputs, metadata)
         component_context_var.set(component_trace_context)
-        trace_context = trace_context_var.get()
-        if trace_context is None:
-            msg = "called trace_component but no trace context found"
-            logger.warning(msg)
-            yield self
-            return
         trace_context.all_inputs[trace_name] |= inputs or {}
         await trace_context.traces_queue.put((self._start_component_traces, (component_trace_context, trace_context)))
         try:
@@ -398,18 +462,14 @@ class TracingService(Service):
 
     @property
     def project_name(self):
-        if self.deactivated:
-            return os.getenv("LANGCHAIN_PROJECT", "Langflow")
         trace_context = trace_context_var.get()
-        if trace_context is None:
-            msg = "called project_name but no trace context found"
-            logger.warning(msg)
-            return None
+        if self.deactivated or trace_context is None:
+            return os.getenv("LANGCHAIN_PROJECT", "Langflow")
         return trace_context.project_name
 
     def add_log(self, trace_name: str, log: Log) -> None:
         """Add a log to the current component trace context."""
-        if self.deactivated:
+        if self.deactivated or trace_context_var.get() is None:
             return
         component_context = component_context_var.get()
         if component_context is None:
@@ -424,7 +484,8 @@ class TracingService(Service):
         output_metadata: dict[str, Any] | None = None,
     ) -> None:
         """Set the outputs for the current component trace context."""
-        if self.deactivated:
+        trace_context = trace_context_var.get()
+        if self.deactivated or trace_context is None:
             return
         component_context = component_context_var.get()
         if component_context is None:
@@ -432,30 +493,19 @@ class TracingService(Service):
             raise RuntimeError(msg)
         component_context.outputs[trace_name] |= outputs or {}
         component_context.outputs_metadata[trace_name] |= output_metadata or {}
-        trace_context = trace_context_var.get()
-        if trace_context is None:
-            msg = "called set_outputs but no trace context found"
-            logger.warning(msg)
-            return
         trace_context.all_outputs[trace_name] |= outputs or {}
 
     def get_tracer(self, tracer_name: str) -> BaseTracer | None:
         trace_context = trace_context_var.get()
         if trace_context is None:
-            msg = "called get_tracer but no trace context found"
-            logger.warning(msg)
             return None
         return trace_context.tracers.get(tracer_name)
 
     def get_langchain_callbacks(self) -> list[BaseCallbackHandler]:
-        if self.deactivated:
-            return []
-        callbacks = []
         trace_context = trace_context_var.get()
-        if trace_context is None:
-            msg = "called get_langchain_callbacks but no trace context found"
-            logger.warning(msg)
+        if self.deactivated or trace_context is None:
             return []
+        callbacks = []
         for tracer in trace_context.tracers.values():
             if not tracer.ready:  # type: ignore[truthy-function]
                 continue
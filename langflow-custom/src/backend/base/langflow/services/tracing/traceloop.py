@@ -50,7 +50,7 @@ class TraceloopTracer(BaseTracer):
         self.session_id = session_id
         self.child_spans: dict[str, Span] = {}
 
-        if not self._validate_configuration():
+        if not self.is_configured():
             self._ready = False
             return
 
@@ -84,7 +84,8 @@ class TraceloopTracer(BaseTracer):
     def ready(self) -> bool:
         return self._ready
 
-    def _validate_configuration(self) -> bool:
+    @classmethod
+    def is_configured(cls) -> bool:
         api_key = os.getenv("TRACELOOP_API_KEY", "").strip()
         if not api_key:
             return False
@@ -4,6 +4,7 @@ import os
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
+from lfx.base.models.unified_models import clear_model_options_cache
 from lfx.log.logger import logger
 from sqlmodel import select
 
@@ -238,6 +239,7 @@ class DatabaseVariableService(VariableService, Service):
         session.add(variable)
         await session.flush()
         await session.refresh(variable)
+        clear_model_options_cache(user_id)
         return variable
 
     async def update_variable_fields(
@@ -269,6 +271,7 @@ class DatabaseVariableService(VariableService, Service):
         session.add(db_variable)
         await session.flush()
         await session.refresh(db_variable)
+        clear_model_options_cache(user_id)
         return db_variable
 
     async def delete_variable(
@@ -283,6 +286,7 @@ class DatabaseVariableService(VariableService, Service):
             msg = f"{name} variable not found."
             raise ValueError(msg)
         await session.delete(variable)
+        clear_model_options_cache(user_id)
 
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
         stmt = select(Variable).where(Variable.user_id == user_id, Variable.id == variable_id)
@@ -291,6 +295,7 @@ class DatabaseVariableService(VariableService, Service):
             msg = f"{variable_id} variable not found."
             raise ValueError(msg)
         await session.delete(variable)
+        clear_model_options_cache(user_id)
 
     async def create_variable(
         self,
@@ -318,4 +323,5 @@ class DatabaseVariableService(VariableService, Service):
         session.add(variable)
         await session.flush()
         await session.refresh(variable)
+        clear_model_options_cache(user_id)
         return variable
@@ -16,6 +16,8 @@ import pytest
 from lfx.base.mcp.util import MCPSessionManager
 from lfx.log.logger import logger
 from mcp import StdioServerParameters
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, METHOD_NOT_FOUND, ErrorData
 
 pytestmark = [
     pytest.mark.timeout(300, method="thread"),
@@ -326,22 +328,16 @@ async def test_session_manager_connectivity_validation():
     """Test session connectivity validation."""
     session_manager = MCPSessionManager()
 
-    # Mock a session that responds to list_tools
+    # Mock a session that responds to pings
     class MockSession:
         def __init__(self, should_fail=False):  # noqa: FBT002
             self.should_fail = should_fail
 
-        async def list_tools(self):
+        async def send_ping(self):
             if self.should_fail:
                 msg = "Connection failed"
                 raise Exception(msg)  # noqa: TRY002
 
-            class MockResponse:
-                def __init__(self):
-                    self.tools = ["tool1", "tool2"]
-
-            return MockResponse()
-
     # Test healthy session
     healthy_session = MockSession(should_fail=False)
     is_healthy = await session_manager._validate_session_connectivity(healthy_session)
@@ -352,13 +348,18 @@ async def test_session_manager_connectivity_validation():
     is_healthy = await session_manager._validate_session_connectivity(unhealthy_session)
     assert is_healthy is False
 
-    # Test session that returns None
-    class MockNoneSession:
-        async def list_tools(self):
-            return None
+    # Test sessions answering with an error, which only proves liveness if the connection is open
+    class MockErrorSession:
+        def __init__(self, code):
+            self.code = code
+
+        async def send_ping(self):
+            raise McpError(ErrorData(code=self.code, message="error"))
+
+    is_healthy = await session_manager._validate_session_connectivity(MockErrorSession(METHOD_NOT_FOUND))
+    assert is_healthy is True
 
-    none_session = MockNoneSession()
-    is_healthy = await session_manager._validate_session_connectivity(none_session)
+    is_healthy = await session_manager._validate_session_connectivity(MockErrorSession(CONNECTION_CLOSED))
     assert is_healthy is False
 
 
@@ -1,4 +1,5 @@
 import os
+import sys
 
 import pytest
 from langflow.services.deps import get_settings_service
@@ -82,3 +83,102 @@ async def test_load_flows():
     await load_flows_from_directory()
     settings_service = get_settings_service()
     assert "test_performance.db" in settings_service.settings.database_url
+
+
+@pytest.mark.benchmark
+async def test_create_starter_projects_warm_start_skips_update(tmp_path, monkeypatch):
+    """A second startup with unchanged starter projects and components skips the update."""
+    import time
+    from unittest.mock import patch
+
+    from langflow.initial_setup import setup
+    from langflow.services.utils import initialize_services
+    from lfx.interface.components import get_and_cache_all_types_dict
+
+    await initialize_services(fix_migration=False)
+    settings_service = get_settings_service()
+    monkeypatch.setattr(settings_service.settings, "config_dir", str(tmp_path))
+    types_dict = await get_and_cache_all_types_dict(settings_service)
+
+    start = time.perf_counter()
+    await setup.create_or_update_starter_projects(types_dict)
+    cold = time.perf_counter() - start
+    assert (tmp_path / setup.STARTER_PROJECTS_HASH_FILENAME).exists()
+
+    with patch.object(setup, "load_starter_projects", wraps=setup.load_starter_projects) as load_starter_projects:
+        start = time.perf_counter()
+        await setup.create_or_update_starter_projects(types_dict)
+        warm = time.perf_counter() - start
+    load_starter_projects.assert_not_called()
+
+    print(f"\nStarter projects cold: {cold * 1000:.0f}ms, warm: {warm * 1000:.0f}ms")  # noqa: T201
+    assert warm < cold
+
+    # A changed component template invalidates the stored hash
+    changed_types = {**types_dict, "custom_category": {"NewComponent": {"template": {}}}}
+    with patch.object(setup, "load_starter_projects", wraps=setup.load_starter_projects) as load_starter_projects:
+        await setup.create_or_update_starter_projects(changed_types)
+    load_starter_projects.assert_called_once()
+
+
+TYPES_WORKER_SCRIPT = """
+import asyncio, json, pathlib, time
+start = time.perf_counter()
+from lfx.interface.components import get_and_cache_all_types_dict
+from lfx.services.deps import get_settings_service
+types = asyncio.run(get_and_cache_all_types_dict(get_settings_service()))
+# ru_maxrss survives exec on Linux and would report the parent's peak, VmHWM does not
+status = pathlib.Path("/proc/self/status").read_text()
+peak_kb = next(int(line.split()[1]) for line in status.splitlines() if line.startswith("VmHWM"))
+print(json.dumps({
+    "seconds": time.perf_counter() - start,
+    "rss_mb": peak_kb / 1024,
+    "components": sum(len(components) for components in types.values()),
+}))
+"""
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+# Starts 12 workers that each load every component, which takes over two minutes
+@pytest.mark.timeout(600)
+@pytest.mark.skipif(not os.getenv("LANGFLOW_RUN_SLOW_TESTS"), reason="LANGFLOW_RUN_SLOW_TESTS not set")
+@pytest.mark.skipif(sys.platform != "linux", reason="Reads peak RSS from /proc")
+async def test_component_types_cache_four_workers(tmp_path):
+    """Compare startup time and peak RSS of 4 workers loading component types with and without the shared cache."""
+    import asyncio
+    import json
+
+    async def start_workers(**env):
+        async def start_worker():
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-c",
+                TYPES_WORKER_SCRIPT,
+                env={**os.environ, "LFX_DEV": "", **env},
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await process.communicate()
+            return json.loads(stdout.decode().strip().splitlines()[-1])
+
+        return await asyncio.gather(*(start_worker() for _ in range(4)))
+
+    shared_cache = {
+        "LANGFLOW_COMPONENT_TYPES_CACHE": "true",
+        "LANGFLOW_COMPONENT_TYPES_CACHE_DIR": str(tmp_path),
+    }
+    results = {
+        "no cache": await start_workers(LANGFLOW_COMPONENT_TYPES_CACHE="false"),
+        "shared cache, cold": await start_workers(**shared_cache),
+        "shared cache, warm": await start_workers(**shared_cache),
+    }
+
+    for name, workers in results.items():
+        print(  # noqa: T201
+            f"\n{name}: max startup {max(w['seconds'] for w in workers):.2f}s, "
+            f"total RSS {sum(w['rss_mb'] for w in workers):.0f}MB"
+        )
+    component_counts = {w["components"] for workers in results.values() for w in workers}
+    assert len(component_counts) == 1
+    assert max(w["seconds"] for w in results["shared cache, warm"]) < max(w["seconds"] for w in results["no cache"])
@@ -1,3 +1,5 @@
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
@@ -21,8 +23,10 @@ from langflow.schema.properties import Properties, Source
 # Assuming you have these imports available
 from langflow.services.database.models.message import MessageCreate, MessageRead
 from langflow.services.database.models.message.model import MessageTable
-from langflow.services.deps import session_scope
+from langflow.services.deps import get_db_service, session_scope
 from langflow.services.tracing.utils import convert_to_langchain_type
+from lfx.services.session import NoopSession
+from sqlalchemy import event
 
 
 @pytest.fixture
@@ -101,6 +105,26 @@ async def test_aadd_messagetables(async_session):
     assert added_messages[0].text == "New Test message"
 
 
+@pytest.fixture(params=["database", "noop"])
+def any_session(request, async_session):
+    return async_session if request.param == "database" else NoopSession()
+
+
+@pytest.mark.usefixtures("client")
+async def test_aadd_messagetables_with_each_session_type(any_session):
+    """The bulk INSERT ... RETURNING is only used on a database session, other sessions go through add/refresh."""
+    messages = [
+        MessageTable(text=f"Message {i}", sender="User", sender_name="User", session_id="typed_session")
+        for i in range(3)
+    ]
+
+    added_messages = await aadd_messagetables(messages, any_session)
+
+    assert [message.text for message in added_messages] == ["Message 0", "Message 1", "Message 2"]
+    assert [message.id for message in added_messages] == [message.id for message in messages]
+    assert all(isinstance(message, MessageRead) for message in added_messages)
+
+
 @pytest.mark.usefixtures("client")
 def test_delete_messages():
     session_id = "new_session_id"
@@ -369,6 +393,61 @@ async def test_aupdate_message_with_nested_properties(created_message):
 # =============================================================================
 
 
+@contextmanager
+def _capture_statements():
+    statements: list[str] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+        # Background tasks of the app share the engine, only keep statements touching the message table
+        if "message" in statement:
+            statements.append(statement)
+
+    engine = get_db_service().engine.sync_engine
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("client")
+async def test_persist_100_messages_statements_and_latency():
+    """Benchmark DB statements and latency of persisting and then updating 100 messages."""
+    num_messages = 100
+    messagetables = [
+        MessageTable(text=f"Message {i}", sender="AI", sender_name="AI", session_id="bulk_session")
+        for i in range(num_messages)
+    ]
+
+    with _capture_statements() as statements:
+        start_time = time.perf_counter()
+        async with session_scope() as session:
+            created = await aadd_messagetables(messagetables, session)
+        insert_duration = time.perf_counter() - start_time
+    insert_statements = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+
+    assert len(created) == num_messages
+    assert [message.text for message in created] == [f"Message {i}" for i in range(num_messages)]
+    assert [message.id for message in created] == [message.id for message in messagetables]
+    assert len(insert_statements) == 1
+    assert not [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+    for i, message in enumerate(created):
+        message.text = f"Updated {i}"
+    with _capture_statements() as statements:
+        start_time = time.perf_counter()
+        updated = await aupdate_messages(created)
+        update_duration = time.perf_counter() - start_time
+    select_statements = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+    assert [message.text for message in updated] == [f"Updated {i}" for i in range(num_messages)]
+    assert len(select_statements) == 1
+
+    print(f"\nPersisted {num_messages} messages: {len(insert_statements)} INSERT in {insert_duration:.4f}s")  # noqa: T201
+    print(f"Updated {num_messages} messages: {len(statements)} statements in {update_duration:.4f}s")  # noqa: T201
+
+
 class TestMessageBaseFromMessageFilePaths:
     """Tests for the file path handling in MessageBase.from_message."""
 
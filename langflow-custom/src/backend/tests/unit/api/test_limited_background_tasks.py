@@ -0,0 +1,255 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from langflow.api import limited_background_tasks
+from langflow.api.limited_background_tasks import (
+    BoundedBackgroundExecutor,
+    LimitVertexBuildBackgroundTasks,
+    drain_background_tasks,
+)
+from lfx.graph.utils import log_vertex_build
+from starlette.background import BackgroundTask
+
+
+async def record(calls, name):
+    calls.append(name)
+
+
+async def wait_on(event):
+    await event.wait()
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    settings = SimpleNamespace(
+        max_vertex_builds_per_vertex=2,
+        background_task_max_concurrency=10,
+        background_task_concurrency_limits={},
+        background_task_queue_size=1000,
+        background_task_overflow_policy="drop",
+        background_task_drain_timeout=1.0,
+    )
+    monkeypatch.setattr(limited_background_tasks, "get_settings_service", lambda: SimpleNamespace(settings=settings))
+    monkeypatch.setattr(limited_background_tasks, "_executor", None)
+    return settings
+
+
+def test_executor_rejects_unknown_overflow_policy():
+    with pytest.raises(ValueError, match="overflow policy"):
+        BoundedBackgroundExecutor(overflow_policy="wait")
+
+
+async def test_executor_drops_tasks_past_the_queue_size():
+    executor = BoundedBackgroundExecutor(max_concurrency=1, max_queue_size=2)
+    release = asyncio.Event()
+
+    scheduled = [executor.submit_nowait(BackgroundTask(wait_on, release)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    assert scheduled[2] is None
+    stats = executor.stats()["wait_on"]
+    assert (stats.running, stats.queued, stats.dropped) == (1, 1, 1)
+    assert executor.queue_depth == 2
+
+    release.set()
+    await asyncio.gather(*scheduled[:2])
+    stats = executor.stats()["wait_on"]
+    assert (stats.depth, stats.completed) == (0, 2)
+    assert executor.submit_nowait(BackgroundTask(wait_on, release)) is not None
+
+
+async def test_executor_blocks_until_there_is_room():
+    executor = BoundedBackgroundExecutor(max_queue_size=1, overflow_policy="block")
+    release = asyncio.Event()
+    calls = []
+    await executor.submit(BackgroundTask(wait_on, release))
+
+    submitting = asyncio.create_task(executor.submit(BackgroundTask(record, calls, "second"), kind="wait_on"))
+    await asyncio.sleep(0.01)
+    assert not submitting.done()
+
+    release.set()
+    await (await submitting)
+    assert calls == ["second"]
+    assert executor.stats()["wait_on"].dropped == 0
+
+
+async def test_executor_limits_concurrency_per_kind():
+    executor = BoundedBackgroundExecutor(max_concurrency=3, concurrency_limits={"slow": 1})
+    running = peak = 0
+
+    async def slow():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+
+    other_calls = []
+    scheduled = [executor.submit_nowait(BackgroundTask(slow)) for _ in range(5)]
+    scheduled += [executor.submit_nowait(BackgroundTask(record, other_calls, i)) for i in range(5)]
+    await asyncio.gather(*scheduled)
+
+    assert peak == 1
+    assert other_calls == list(range(5))
+    assert executor.stats()["slow"].completed == 5
+
+
+async def test_executor_counts_failures():
+    executor = BoundedBackgroundExecutor()
+
+    def fail():
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    await executor.submit_nowait(BackgroundTask(fail))
+
+    stats = executor.stats()["fail"]
+    assert (stats.failed, stats.completed, stats.depth) == (1, 0, 0)
+
+
+async def test_drain_waits_for_pending_tasks_and_rejects_new_ones():
+    executor = BoundedBackgroundExecutor(max_concurrency=1)
+    calls = []
+    for i in range(3):
+        executor.submit_nowait(BackgroundTask(record, calls, i))
+
+    await executor.drain(timeout=1)
+
+    assert calls == [0, 1, 2]
+    assert executor.submit_nowait(BackgroundTask(record, calls, 3)) is None
+    assert executor.stats()["record"].dropped == 1
+
+
+async def test_drain_cancels_tasks_left_after_the_timeout():
+    executor = BoundedBackgroundExecutor()
+    scheduled = executor.submit_nowait(BackgroundTask(wait_on, asyncio.Event()))
+
+    await executor.drain(timeout=0.01)
+
+    assert scheduled.cancelled()
+    assert executor.queue_depth == 0
+
+
+async def test_drain_wakes_blocked_submitters():
+    executor = BoundedBackgroundExecutor(max_queue_size=1, overflow_policy="block")
+    release = asyncio.Event()
+    await executor.submit(BackgroundTask(wait_on, release))
+    submitting = asyncio.create_task(executor.submit(BackgroundTask(wait_on, release)))
+    await asyncio.sleep(0)
+
+    await executor.drain(timeout=0.01)
+
+    assert await submitting is None
+
+
+@pytest.mark.usefixtures("settings")
+async def test_vertex_builds_keep_the_most_recent_per_vertex(monkeypatch):
+    calls = []
+
+    async def fake_log_vertex_build(**kwargs):
+        calls.append((kwargs["vertex_id"], kwargs["build"]))
+
+    monkeypatch.setattr(limited_background_tasks, "log_vertex_build", fake_log_vertex_build)
+    tasks = LimitVertexBuildBackgroundTasks()
+    for build in range(4):
+        for vertex_id in ("a", "b"):
+            tasks.add_task(fake_log_vertex_build, vertex_id=vertex_id, build=build)
+    tasks.add_task(record, calls, "other")
+
+    await tasks()
+
+    assert [call for call in calls if call[0] == "a"] == [("a", 2), ("a", 3)]
+    assert [call for call in calls if call[0] == "b"] == [("b", 2), ("b", 3)]
+    assert calls[-1] == "other"
+
+
+@pytest.mark.usefixtures("settings")
+async def test_vertex_builds_of_one_vertex_run_one_after_the_other(monkeypatch):
+    running: dict[str, int] = {}
+    overlaps = []
+    calls = []
+
+    async def fake_log_vertex_build(**kwargs):
+        vertex_id = kwargs["vertex_id"]
+        running[vertex_id] = running.get(vertex_id, 0) + 1
+        overlaps.append(running[vertex_id] > 1)
+        await asyncio.sleep(0.001)
+        calls.append((vertex_id, kwargs["build"]))
+        running[vertex_id] -= 1
+
+    monkeypatch.setattr(limited_background_tasks, "log_vertex_build", fake_log_vertex_build)
+    tasks = LimitVertexBuildBackgroundTasks()
+    for build in range(2):
+        for vertex_id in ("a", "b"):
+            tasks.add_task(fake_log_vertex_build, vertex_id=vertex_id, build=build)
+
+    await tasks()
+    tasks.add_task(fake_log_vertex_build, vertex_id="a", build=2)
+    await drain_background_tasks()
+
+    assert not any(overlaps)
+    assert [call for call in calls if call[0] == "a"] == [("a", 0), ("a", 1), ("a", 2)]
+    assert max(running.values()) == 0
+
+
+async def test_executor_logs_dropped_tasks_as_warnings(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(limited_background_tasks.logger, "warning", warnings.append)
+    executor = BoundedBackgroundExecutor(max_queue_size=0)
+
+    assert executor.submit_nowait(BackgroundTask(record, [], "dropped")) is None
+
+    assert executor.stats()["record"].dropped == 1
+    assert len(warnings) == 1
+    assert "Dropped background task record" in warnings[0]
+
+
+@pytest.mark.usefixtures("settings")
+async def test_tasks_added_after_the_response_still_run():
+    calls = []
+    tasks = LimitVertexBuildBackgroundTasks()
+    tasks.add_task(record, calls, "before")
+    await tasks()
+
+    tasks.add_task(record, calls, "after")
+    await drain_background_tasks()
+
+    assert calls == ["before", "after"]
+
+
+async def test_vertex_builds_use_the_configured_executor(settings):
+    settings.background_task_queue_size = 1
+    release = asyncio.Event()
+    tasks = LimitVertexBuildBackgroundTasks()
+    tasks.add_task(wait_on, release)
+    tasks.add_task(wait_on, release)
+
+    running = asyncio.create_task(tasks())
+    await asyncio.sleep(0)
+    executor = limited_background_tasks.get_background_executor()
+    assert executor.stats()["wait_on"].dropped == 1
+
+    release.set()
+    await running
+    assert executor.stats()["wait_on"].completed == 1
+
+
+@pytest.mark.benchmark
+async def test_limit_vertex_build_background_tasks_benchmark(settings):
+    """Adding log_vertex_build tasks for many builds of many vertices, which used to scan every pending task."""
+    settings.max_vertex_builds_per_vertex = 3
+    tasks = LimitVertexBuildBackgroundTasks()
+
+    start = time.perf_counter()
+    for build in range(20):
+        for vertex in range(1000):
+            tasks.add_task(log_vertex_build, vertex_id=f"vertex-{vertex}", build=build)
+    elapsed = time.perf_counter() - start
+
+    pending = {id(task) for task in tasks.tasks} - {id(task) for task in tasks._superseded}
+    assert len(pending) == 3000
+    print(f"add_task for 20 builds of 1000 vertices: {elapsed * 1e3:.1f}ms")  # noqa: T201
+    assert elapsed < 5
@@ -11,12 +11,14 @@ from httpx import AsyncClient
 from langflow.api.v1.mcp_projects import (
     ProjectMCPServer,
     _args_reference_urls,
+    _list_project_flow_settings,
     get_project_mcp_server,
     get_project_sse,
     init_mcp_servers,
     project_mcp_servers,
     project_sse_transports,
 )
+from langflow.api.v1.mcp_utils import handle_list_tools
 from langflow.services.auth.utils import create_user_longterm_token, get_password_hash
 from langflow.services.database.models.flow import Flow
 from langflow.services.database.models.folder import Folder
@@ -24,7 +26,7 @@ from langflow.services.database.models.user.model import User
 from langflow.services.deps import get_settings_service
 from lfx.services.deps import session_scope
 from mcp.server.sse import SseServerTransport
-from sqlmodel import select
+from sqlmodel import select, update
 
 from tests.unit.utils.mcp import project_session_manager_lifespan
 
@@ -773,7 +775,7 @@ async def test_install_mcp_config_streamable_transport(
 
 
 async def test_init_mcp_servers(user_test_project, other_test_project):
-    """Test the initialization of MCP servers for all projects."""
+    """Test that project MCP servers are created on first access rather than at startup."""
     # Clear existing caches
     project_sse_transports.clear()
     project_mcp_servers.clear()
@@ -781,26 +783,19 @@ async def test_init_mcp_servers(user_test_project, other_test_project):
     # Test the initialization function
     await init_mcp_servers()
 
-    # Verify that both test projects have SSE transports and MCP servers initialized
     project1_id = str(user_test_project.id)
     project2_id = str(other_test_project.id)
 
-    # Both projects should have SSE transports created
-    assert project1_id in project_sse_transports
-    assert project2_id in project_sse_transports
-
-    # Both projects should have MCP servers created
-    assert project1_id in project_mcp_servers
-    assert project2_id in project_mcp_servers
-
-    # Verify the correct configuration
-    assert isinstance(project_sse_transports[project1_id], SseServerTransport)
-    assert isinstance(project_sse_transports[project2_id], SseServerTransport)
-    assert isinstance(project_mcp_servers[project1_id], ProjectMCPServer)
-    assert isinstance(project_mcp_servers[project2_id], ProjectMCPServer)
+    # Startup does not create any transport or server
+    assert project1_id not in project_sse_transports
+    assert project1_id not in project_mcp_servers
+    assert project2_id not in project_mcp_servers
 
+    # The first access creates them for the requested project only
+    assert isinstance(get_project_sse(user_test_project.id), SseServerTransport)
+    assert isinstance(get_project_mcp_server(user_test_project.id), ProjectMCPServer)
     assert project_mcp_servers[project1_id].project_id == user_test_project.id
-    assert project_mcp_servers[project2_id].project_id == other_test_project.id
+    assert project2_id not in project_mcp_servers
 
 
 async def test_init_mcp_servers_error_handling():
@@ -957,6 +952,85 @@ async def test_list_project_tools_response_structure(client: AsyncClient, user_t
         assert "mcp_enabled" in tool
 
 
+async def test_list_project_tools_is_cached_until_a_flow_changes(
+    client: AsyncClient, user_test_project, other_test_project, active_user, logged_in_headers
+):
+    """The tool list of a project is built once and rebuilt after a flow is updated, moved or deleted."""
+    flow_id = uuid4()
+    async with session_scope() as session:
+        session.add(
+            Flow(
+                id=flow_id,
+                name="Cached Flow",
+                mcp_enabled=True,
+                action_name="cached_action",
+                folder_id=user_test_project.id,
+                user_id=active_user.id,
+            )
+        )
+
+    async def list_tools():
+        response = await client.get(f"/api/v1/mcp/project/{user_test_project.id}", headers=logged_in_headers)
+        assert response.status_code == 200
+        return [tool["action_name"] for tool in response.json()["tools"]]
+
+    with patch(
+        "langflow.api.v1.mcp_projects._list_project_flow_settings", wraps=_list_project_flow_settings
+    ) as list_flow_settings:
+        assert await list_tools() == ["cached_action"]
+        assert await list_tools() == ["cached_action"]
+        assert list_flow_settings.await_count == 1
+
+        async with session_scope() as session:
+            flow = await session.get(Flow, flow_id)
+            flow.action_name = "renamed_action"
+            session.add(flow)
+        assert await list_tools() == ["renamed_action"]
+
+        # Moving the flow to another project
+        async with session_scope() as session:
+            flow = await session.get(Flow, flow_id)
+            flow.folder_id = other_test_project.id
+            session.add(flow)
+        assert await list_tools() == []
+
+        async with session_scope() as session:
+            await session.exec(update(Flow).where(Flow.id == flow_id).values(folder_id=user_test_project.id))
+        assert await list_tools() == ["renamed_action"]
+
+        response = await client.delete(f"api/v1/flows/{flow_id}", headers=logged_in_headers)
+        assert response.status_code == 200
+        assert await list_tools() == []
+        assert list_flow_settings.await_count == 5
+
+
+async def test_project_mcp_tools_list_is_cached(user_test_project, active_user):
+    """The tools/list handler of a project server builds the input schemas once per change."""
+    flow_id = uuid4()
+    async with session_scope() as session:
+        session.add(
+            Flow(
+                id=flow_id,
+                name="Schema Flow",
+                mcp_enabled=True,
+                data={"nodes": [], "edges": []},
+                folder_id=user_test_project.id,
+                user_id=active_user.id,
+            )
+        )
+
+    with patch("langflow.api.v1.mcp_utils.json_schema_from_flow", return_value={"type": "object"}) as build_schema:
+        first = await handle_list_tools(project_id=user_test_project.id, mcp_enabled_only=True)
+        second = await handle_list_tools(project_id=user_test_project.id, mcp_enabled_only=True)
+        assert [tool.name for tool in first] == [tool.name for tool in second] == ["schema_flow"]
+        assert build_schema.call_count == 1
+
+        async with session_scope() as session:
+            flow = await session.get(Flow, flow_id)
+            await session.delete(flow)
+        assert await handle_list_tools(project_id=user_test_project.id, mcp_enabled_only=True) == []
+
+
 @pytest.mark.asyncio
 async def test_mcp_longterm_token_fails_without_superuser():
     """When AUTO_LOGIN is false and no superuser exists, creating a long-term token should raise 400.
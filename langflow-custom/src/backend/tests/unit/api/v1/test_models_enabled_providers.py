@@ -92,8 +92,8 @@ async def test_enabled_providers_after_credential_creation(client: AsyncClient,
     # Create OpenAI credential using variables endpoint
     variable_payload = _create_variable_payload(openai_credential["provider"], openai_credential["value"])
     # Mock API validation - mock where it's used (in the variable endpoint)
-    with mock.patch("langflow.api.v1.variable.validate_model_provider_key") as mock_validate:
-        mock_validate.return_value = None  # validate_model_provider_key returns None on success
+    with mock.patch("langflow.api.v1.variable.avalidate_model_provider_key") as mock_validate:
+        mock_validate.return_value = None  # avalidate_model_provider_key returns None on success
         create_response = await client.post("api/v1/variables/", json=variable_payload, headers=logged_in_headers)
     assert create_response.status_code == status.HTTP_201_CREATED
 
@@ -131,7 +131,7 @@ async def test_enabled_providers_multiple_credentials(
     google_var = _create_variable_payload(google_credential["provider"], google_credential["value"])
 
     # Mock API validations
-    with mock.patch("langflow.api.v1.variable.validate_model_provider_key") as mock_validate:
+    with mock.patch("langflow.api.v1.variable.avalidate_model_provider_key") as mock_validate:
         mock_validate.return_value = None
         await client.post("api/v1/variables/", json=openai_var, headers=logged_in_headers)
         await client.post("api/v1/variables/", json=anthropic_var, headers=logged_in_headers)
@@ -164,7 +164,7 @@ async def test_enabled_providers_after_credential_deletion(client: AsyncClient,
     # Create credential using variables endpoint
     variable_payload = _create_variable_payload(openai_credential["provider"], openai_credential["value"])
     # Mock API validation
-    with mock.patch("langflow.api.v1.variable.validate_model_provider_key") as mock_validate:
+    with mock.patch("langflow.api.v1.variable.avalidate_model_provider_key") as mock_validate:
         mock_validate.return_value = None
         create_response = await client.post("api/v1/variables/", json=variable_payload, headers=logged_in_headers)
     created_credential = create_response.json()
@@ -208,7 +208,7 @@ async def test_enabled_providers_filter_by_specific_providers(
     anthropic_var = _create_variable_payload(anthropic_credential["provider"], anthropic_credential["value"])
 
     # Mock API validations
-    with mock.patch("langflow.api.v1.variable.validate_model_provider_key") as mock_validate:
+    with mock.patch("langflow.api.v1.variable.avalidate_model_provider_key") as mock_validate:
         mock_validate.return_value = None
         await client.post("api/v1/variables/", json=openai_var, headers=logged_in_headers)
         await client.post("api/v1/variables/", json=anthropic_var, headers=logged_in_headers)
@@ -251,7 +251,7 @@ async def test_variables_credential_redaction(client: AsyncClient, openai_creden
     # Create a credential using variables endpoint
     variable_payload = _create_variable_payload(openai_credential["provider"], openai_credential["value"])
     # Mock API validation
-    with mock.patch("langflow.api.v1.variable.validate_model_provider_key") as mock_validate:
+    with mock.patch("langflow.api.v1.variable.avalidate_model_provider_key") as mock_validate:
         mock_validate.return_value = None
         create_response = await client.post("api/v1/variables/", json=variable_payload, headers=logged_in_headers)
     assert create_response.status_code == status.HTTP_201_CREATED
@@ -295,7 +295,7 @@ async def test_variables_multiple_credentials_all_redacted(
     anthropic_var = _create_variable_payload(anthropic_credential["provider"], anthropic_credential["value"])
 
     # Mock API validations
-    with mock.patch("langflow.api.v1.variable.validate_model_provider_key") as mock_validate:
+    with mock.patch("langflow.api.v1.variable.avalidate_model_provider_key") as mock_validate:
         mock_validate.return_value = None
         create_response1 = await client.post("api/v1/variables/", json=openai_var, headers=logged_in_headers)
         create_response2 = await client.post("api/v1/variables/", json=anthropic_var, headers=logged_in_headers)
@@ -329,7 +329,7 @@ async def test_enabled_providers_reflects_models_endpoint(client: AsyncClient, o
     # Create credential using variables endpoint
     variable_payload = _create_variable_payload(openai_credential["provider"], openai_credential["value"])
     # Mock API validation
-    with mock.patch("langflow.api.v1.variable.validate_model_provider_key") as mock_validate:
+    with mock.patch("langflow.api.v1.variable.avalidate_model_provider_key") as mock_validate:
         mock_validate.return_value = None
         await client.post("api/v1/variables/", json=variable_payload, headers=logged_in_headers)
 
@@ -370,7 +370,7 @@ async def test_security_credential_value_never_exposed_in_variables_endpoint(
     # Create credential using variables endpoint
     variable_payload = _create_variable_payload(openai_credential["provider"], openai_credential["value"])
     # Mock API validation
-    with mock.patch("langflow.api.v1.variable.validate_model_provider_key") as mock_validate:
+    with mock.patch("langflow.api.v1.variable.avalidate_model_provider_key") as mock_validate:
         mock_validate.return_value = None
         create_response = await client.post("api/v1/variables/", json=variable_payload, headers=logged_in_headers)
     assert create_response.status_code == status.HTTP_201_CREATED
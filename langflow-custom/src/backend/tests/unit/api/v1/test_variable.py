@@ -1,10 +1,32 @@
+import functools
 from unittest import mock
 from uuid import uuid4
 
+import httpx
 import pytest
 from fastapi import HTTPException, status
 from httpx import AsyncClient
 from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
+from lfx.base.models.unified_models import clear_key_validation_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_key_validation_cache():
+    clear_key_validation_cache()
+    yield
+    clear_key_validation_cache()
+
+
+def mock_provider(handler):
+    """Answer the requests made to validate model provider keys with ``handler``."""
+    requests = []
+
+    def record(request):
+        requests.append(request)
+        return handler(request)
+
+    client = functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(record))
+    return mock.patch("lfx.base.models.unified_models._key_validation_client", client), requests
 
 
 @pytest.fixture
@@ -239,14 +261,14 @@ async def test_create_variable__openai_api_key_validation_success(client: AsyncC
     }
 
     # Mock successful OpenAI API call
-    with mock.patch("langchain_openai.ChatOpenAI.invoke") as mock_invoke:
-        mock_invoke.return_value = "test response"
+    provider, requests = mock_provider(lambda _: httpx.Response(200, json={"data": []}))
+    with provider:
         response = await client.post("api/v1/variables/", json=openai_variable, headers=logged_in_headers)
         result = response.json()
 
         assert response.status_code == status.HTTP_201_CREATED
         assert result["name"] == "OPENAI_API_KEY"
-        assert mock_invoke.called
+        assert requests[0].headers["Authorization"] == "Bearer sk-test-key"
 
 
 @pytest.mark.usefixtures("active_user")
@@ -266,8 +288,8 @@ async def test_create_variable__openai_api_key_validation_failure(client: AsyncC
     }
 
     # Mock failed OpenAI API call with authentication error
-    with mock.patch("langchain_openai.ChatOpenAI.invoke") as mock_invoke:
-        mock_invoke.side_effect = Exception("401 authentication failed")
+    provider, _ = mock_provider(lambda _: httpx.Response(401))
+    with provider:
         response = await client.post("api/v1/variables/", json=openai_variable, headers=logged_in_headers)
         result = response.json()
 
@@ -292,14 +314,14 @@ async def test_create_variable__anthropic_api_key_validation_success(client: Asy
     }
 
     # Mock successful Anthropic API call
-    with mock.patch("langchain_anthropic.ChatAnthropic.invoke") as mock_invoke:
-        mock_invoke.return_value = "test response"
+    provider, requests = mock_provider(lambda _: httpx.Response(200, json={"data": []}))
+    with provider:
         response = await client.post("api/v1/variables/", json=anthropic_variable, headers=logged_in_headers)
         result = response.json()
 
         assert response.status_code == status.HTTP_201_CREATED
         assert result["name"] == "ANTHROPIC_API_KEY"
-        assert mock_invoke.called
+        assert requests[0].headers["x-api-key"] == "sk-ant-test-key"
 
 
 @pytest.mark.usefixtures("active_user")
@@ -319,8 +341,8 @@ async def test_create_variable__anthropic_api_key_validation_failure(client: Asy
     }
 
     # Mock failed Anthropic API call with authentication error
-    with mock.patch("langchain_anthropic.ChatAnthropic.invoke") as mock_invoke:
-        mock_invoke.side_effect = Exception("Invalid API key provided")
+    provider, _ = mock_provider(lambda _: httpx.Response(401))
+    with provider:
         response = await client.post("api/v1/variables/", json=anthropic_variable, headers=logged_in_headers)
         result = response.json()
 
@@ -345,14 +367,14 @@ async def test_create_variable__google_api_key_validation_success(client: AsyncC
     }
 
     # Mock successful Google API call
-    with mock.patch("langchain_google_genai.ChatGoogleGenerativeAI.invoke") as mock_invoke:
-        mock_invoke.return_value = "test response"
+    provider, requests = mock_provider(lambda _: httpx.Response(200, json={"models": []}))
+    with provider:
         response = await client.post("api/v1/variables/", json=google_variable, headers=logged_in_headers)
         result = response.json()
 
         assert response.status_code == status.HTTP_201_CREATED
         assert result["name"] == "GOOGLE_API_KEY"
-        assert mock_invoke.called
+        assert requests[0].headers["x-goog-api-key"] == "test-google-key"
 
 
 @pytest.mark.usefixtures("active_user")
@@ -372,14 +394,14 @@ async def test_create_variable__ollama_base_url_validation_success(client: Async
     }
 
     # Mock successful Ollama API call
-    with mock.patch("requests.get") as mock_get:
-        mock_get.return_value.status_code = 200
+    provider, requests = mock_provider(lambda _: httpx.Response(200, json={"models": []}))
+    with provider:
         response = await client.post("api/v1/variables/", json=ollama_variable, headers=logged_in_headers)
         result = response.json()
 
         assert response.status_code == status.HTTP_201_CREATED
         assert result["name"] == "OLLAMA_BASE_URL"
-        assert mock_get.called
+        assert str(requests[0].url) == "http://localhost:11434/api/tags"
 
 
 @pytest.mark.usefixtures("active_user")
@@ -399,8 +421,8 @@ async def test_create_variable__ollama_base_url_validation_failure(client: Async
     }
 
     # Mock failed Ollama API call
-    with mock.patch("requests.get") as mock_get:
-        mock_get.return_value.status_code = 404
+    provider, _ = mock_provider(lambda _: httpx.Response(404))
+    with provider:
         response = await client.post("api/v1/variables/", json=ollama_variable, headers=logged_in_headers)
         result = response.json()
 
@@ -425,8 +447,12 @@ async def test_create_variable__model_provider_network_error_allows_creation(cli
     }
 
     # Mock network error (not an auth error)
-    with mock.patch("langchain_openai.ChatOpenAI.invoke") as mock_invoke:
-        mock_invoke.side_effect = Exception("Network timeout")
+    def timeout(request):
+        msg = "Network timeout"
+        raise httpx.ReadTimeout(msg, request=request)
+
+    provider, _ = mock_provider(timeout)
+    with provider:
         response = await client.post("api/v1/variables/", json=openai_variable, headers=logged_in_headers)
 
         # Should succeed despite network error
@@ -6,6 +6,8 @@ This test suite validates the MCP utility functions including:
 - Utility functions for name sanitization and schema conversion
 """
 
+import asyncio
+import contextlib
 import re
 import shutil
 import sys
@@ -121,6 +123,147 @@ class TestMCPSessionManager:
             assert session1 != session2
             assert mock_create.call_count == 2
 
+    @pytest.mark.parametrize(("list_changed", "expected_listings"), [(True, 1), (False, 2), (None, 2)])
+    async def test_tool_list_is_cached_until_expiry_unless_changes_are_notified(
+        self, session_manager, monkeypatch, list_changed, expected_listings
+    ):
+        """Tools of servers without tools.listChanged are only cached for mcp_tool_list_cache_ttl."""
+        monkeypatch.setattr(util, "get_tool_list_cache_ttl", lambda: 0.05)
+        tools_capability = None if list_changed is None else util.types.ToolsCapability(listChanged=list_changed)
+        session = AsyncMock()
+        session.get_server_capabilities = MagicMock(return_value=util.types.ServerCapabilities(tools=tools_capability))
+        session.list_tools.return_value = util.types.ListToolsResult(tools=[])
+        session_manager.sessions_by_server["server"] = {
+            "sessions": {"session": {"session": session, "task": MagicMock(), "type": "stdio", "last_used": 0}},
+            "last_cleanup": 0,
+        }
+        session_manager._context_to_session["context"] = ("server", "session")
+
+        await session_manager.list_tools("context", session)
+        await session_manager.list_tools("context", session)
+        await asyncio.sleep(0.06)
+        await session_manager.list_tools("context", session)
+
+        assert session.list_tools.await_count == expected_listings
+
+    async def test_tool_list_is_not_cached_with_a_zero_ttl(self, session_manager, monkeypatch):
+        monkeypatch.setattr(util, "get_tool_list_cache_ttl", lambda: 0)
+        session = AsyncMock()
+        session.get_server_capabilities = MagicMock(return_value=None)
+        session.list_tools.return_value = util.types.ListToolsResult(tools=[])
+        session_manager.sessions_by_server["server"] = {
+            "sessions": {"session": {"session": session, "task": MagicMock(), "type": "stdio", "last_used": 0}},
+            "last_cleanup": 0,
+        }
+        session_manager._context_to_session["context"] = ("server", "session")
+
+        await session_manager.list_tools("context", session)
+        await session_manager.list_tools("context", session)
+
+        assert session.list_tools.await_count == 2
+        assert not session_manager._tool_lists
+
+
+STDIO_SERVER_SCRIPT = """
+from mcp.server.fastmcp import Context, FastMCP
+
+server = FastMCP("stand-in")
+
+
+@server.tool()
+def echo(message: str) -> str:
+    return message
+
+
+@server.tool()
+async def register_tool(name: str, ctx: Context) -> str:
+    server.add_tool(lambda: name, name=name)
+    await ctx.session.send_tool_list_changed()
+    return name
+
+
+server.run()
+"""
+
+
+class TestMCPSessionManagerWithStdioServer:
+    """Session reuse, probes and tool list caching against a local stdio MCP server."""
+
+    @pytest.fixture
+    async def stdio_client(self, tmp_path):
+        script = tmp_path / "server.py"
+        script.write_text(STDIO_SERVER_SCRIPT)
+        client = MCPStdioClient()
+        client.set_session_context("stand_in")
+        client.command = f"{sys.executable} {script}"
+        yield client
+        await client._get_session_manager().cleanup_all()
+
+    async def test_reused_session_is_not_probed_and_tools_are_cached(self, stdio_client):
+        with patch.object(
+            MCPSessionManager,
+            "_validate_session_connectivity",
+            autospec=True,
+            side_effect=MCPSessionManager._validate_session_connectivity,
+        ) as probe:
+            tools = await stdio_client.connect_to_server(stdio_client.command)
+            assert await stdio_client.connect_to_server(stdio_client.command) == tools
+            result = await stdio_client.run_tool("echo", {"message": "hello"})
+
+        assert result.content[0].text == "hello"
+        assert {tool.name for tool in tools} == {"echo", "register_tool"}
+        probe.assert_not_called()
+        [metrics] = stdio_client._get_session_manager().get_metrics().values()
+        assert metrics["sessions_created"] == 1
+        assert metrics["sessions_reused"] == 2
+        assert metrics["reuse_rate"] == pytest.approx(2 / 3)
+        assert metrics["tool_list_misses"] == 1
+        assert metrics["tool_list_hits"] == 1
+
+    async def test_idle_session_is_probed(self, stdio_client, monkeypatch):
+        await stdio_client.connect_to_server(stdio_client.command)
+        monkeypatch.setattr(util, "get_session_probe_idle_threshold", lambda: 0)
+
+        await stdio_client.connect_to_server(stdio_client.command)
+
+        [metrics] = stdio_client._get_session_manager().get_metrics().values()
+        assert metrics["probes"] == 1
+        assert "probe_failures" not in metrics
+        assert metrics["sessions_created"] == 1
+
+    async def test_tool_list_changed_notification_invalidates_cache(self, stdio_client):
+        await stdio_client.connect_to_server(stdio_client.command)
+        session_manager = stdio_client._get_session_manager()
+
+        await stdio_client.run_tool("register_tool", {"name": "added"})
+        for _ in range(50):
+            if not session_manager._tool_lists:
+                break
+            await asyncio.sleep(0.05)
+
+        tools = await stdio_client.connect_to_server(stdio_client.command)
+        assert "added" in {tool.name for tool in tools}
+        [metrics] = session_manager.get_metrics().values()
+        assert metrics["tool_list_invalidations"] == 1
+        assert metrics["tool_list_misses"] == 2
+
+    async def test_dead_session_is_replaced(self, stdio_client):
+        await stdio_client.connect_to_server(stdio_client.command)
+        session_manager = stdio_client._get_session_manager()
+        [server_data] = session_manager.sessions_by_server.values()
+        [session_info] = server_data["sessions"].values()
+        session_info["task"].cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await session_info["task"]
+
+        tools = await stdio_client.connect_to_server(stdio_client.command)
+
+        assert tools
+        [metrics] = session_manager.get_metrics().values()
+        assert metrics["sessions_created"] == 2
+        # The cached tools were dropped with the last session of the server
+        assert metrics["tool_list_misses"] == 2
+
 
 class TestHeaderValidation:
     """Test the header validation functionality."""
@@ -122,6 +122,47 @@ def test_component_tool():
     assert result[0]["data"]["result"] == "2"
 
 
+def test_component_tool_schemas_are_reused():
+    first_tool = ComponentToolkit(component=CalculatorToolComponent()).get_tools()[0]
+    second_tool = ComponentToolkit(component=CalculatorToolComponent()).get_tools()[0]
+    assert first_tool.args_schema is second_tool.args_schema
+    # Each toolkit still gets its own tool bound to its own component
+    assert first_tool is not second_tool
+
+    # A different default value produces a different schema
+    component = CalculatorToolComponent()
+    component.inputs[0].required = False
+    component.inputs[0].value = "2*3"
+    changed_tool = ComponentToolkit(component=component).get_tools()[0]
+    assert changed_tool.args_schema is not first_tool.args_schema
+    assert changed_tool.args_schema.model_fields["expression"].default == "2*3"
+
+
+@pytest.mark.benchmark
+def test_component_tool_schema_cache_benchmark():
+    """Time building an agent's 20 tools with and without cached schemas."""
+    import time
+
+    from lfx.base.tools import component_tool
+
+    components = [CalculatorToolComponent() for _ in range(20)]
+
+    component_tool._input_schema_cache.clear()
+    start = time.perf_counter()
+    for component in components:
+        component_tool._input_schema_cache.clear()
+        ComponentToolkit(component=component).get_tools()
+    uncached = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for component in components:
+        ComponentToolkit(component=component).get_tools()
+    cached = time.perf_counter() - start
+
+    print(f"\n20 tools: uncached {uncached * 1000:.2f}ms, cached {cached * 1000:.2f}ms")  # noqa: T201
+    assert cached < uncached
+
+
 @pytest.mark.api_key_required
 @pytest.mark.usefixtures("client")
 async def test_component_tool_with_api_key():
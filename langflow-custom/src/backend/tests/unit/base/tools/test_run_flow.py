@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, Mock, PropertyMock, patch
 from uuid import uuid4
 
@@ -670,3 +671,250 @@ class TestRunFlowBaseComponentToolGeneration:
                 assert description == "Test flow description"
                 assert len(fields) == 1
                 assert fields[0]["name"] == "input1"
+
+
+@pytest.fixture
+def subflow_cache():
+    from lfx.base.tools.subflow_cache import subflow_graph_cache
+
+    subflow_graph_cache.clear()
+    yield subflow_graph_cache
+    subflow_graph_cache.clear()
+
+
+def _chat_flow_data(flow_id: str, updated_at: str) -> Data:
+    from lfx.components.input_output import ChatInput, ChatOutput
+
+    chat_input = ChatInput(_id="ChatInput-abc")
+    chat_output = ChatOutput(_id="ChatOutput-def").set(input_value=chat_input.message_response)
+    graph = Graph(start=chat_input, end=chat_output)
+    return Data(
+        data={
+            "id": flow_id,
+            "data": graph.dump()["data"],
+            "description": "Subflow",
+            "updated_at": updated_at,
+        }
+    )
+
+
+class TestRunFlowBaseComponentSubflowCache:
+    """Test the process-wide subflow graph cache and tool call isolation."""
+
+    @pytest.mark.asyncio
+    async def test_get_graph_fetches_each_version_once_and_isolates_graphs(self, subflow_cache):  # noqa: ARG002
+        component = RunFlowBaseComponent()
+        component._user_id = str(uuid4())
+        component.cache_flow = False
+        flow_id = str(uuid4())
+        updated_at = "2024-01-01T00:00:00+00:00"
+
+        with patch.object(component, "get_flow", new_callable=AsyncMock) as mock_get_flow:
+            mock_get_flow.return_value = _chat_flow_data(flow_id, updated_at)
+            first = await component.get_graph(flow_id_selected=flow_id, updated_at=updated_at)
+            second = await component.get_graph(flow_id_selected=flow_id, updated_at=updated_at)
+            other_component = RunFlowBaseComponent()
+            other_component._user_id = component.user_id
+            other_component.cache_flow = False
+            third = await other_component.get_graph(flow_id_selected=flow_id, updated_at=updated_at)
+
+            mock_get_flow.assert_awaited_once()
+            assert first is not second
+            assert second is not third
+            assert second.get_vertex("ChatInput-abc") is not third.get_vertex("ChatInput-abc")
+            assert third.updated_at == updated_at
+            assert second.user_id == third.user_id == component.user_id
+
+            # A newer version of the flow is fetched again
+            newer = "2024-01-02T00:00:00+00:00"
+            mock_get_flow.return_value = _chat_flow_data(flow_id, newer)
+            graph = await component.get_graph(flow_id_selected=flow_id, updated_at=newer)
+            assert mock_get_flow.await_count == 2
+            assert graph.updated_at == newer
+
+    @pytest.mark.asyncio
+    async def test_cache_is_scoped_to_the_user(self, subflow_cache):  # noqa: ARG002
+        flow_id = str(uuid4())
+        updated_at = "2024-01-01T00:00:00+00:00"
+
+        for _ in range(2):
+            component = RunFlowBaseComponent()
+            component._user_id = str(uuid4())
+            component.cache_flow = False
+            with patch.object(component, "get_flow", new_callable=AsyncMock) as mock_get_flow:
+                mock_get_flow.return_value = _chat_flow_data(flow_id, updated_at)
+                await component.get_graph(flow_id_selected=flow_id, updated_at=updated_at)
+                mock_get_flow.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_flow_fetched_before_an_invalidation_is_not_cached(self, subflow_cache):
+        component = RunFlowBaseComponent()
+        component._user_id = str(uuid4())
+        component.cache_flow = False
+        flow_id = str(uuid4())
+        updated_at = "2024-01-01T00:00:00+00:00"
+
+        async def get_flow_saved_meanwhile(**kwargs):  # noqa: ARG001
+            # The flow is saved while it is being fetched
+            subflow_cache.delete(flow_id)
+            return _chat_flow_data(flow_id, updated_at)
+
+        with patch.object(component, "get_flow", side_effect=get_flow_saved_meanwhile):
+            await component.get_graph(flow_id_selected=flow_id, updated_at=updated_at)
+
+        assert subflow_cache.get(component.user_id, flow_id) is None
+
+    @pytest.mark.asyncio
+    async def test_run_slots_are_bounded(self):
+        from lfx.base.tools.subflow_cache import SubflowGraphCache
+
+        cache = SubflowGraphCache(maxsize=2)
+        slots = [cache.run_slot(f"flow-{i}") for i in range(5)]
+
+        assert len(cache._semaphores) == 2
+        assert cache.run_slot("flow-4") is slots[4]
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_run_with_their_own_arguments(self):
+        component = RunFlowBaseComponent()
+        component._user_id = str(uuid4())
+        component.flow_tweak_data = {"ChatInput-abc": {"should_store_message": False}}
+        component._last_run_outputs = [MagicMock()]  # outputs of the component build
+
+        calls = []
+
+        async def run_flow_with_cached_graph(**kwargs):
+            calls.append(kwargs)
+            result = MagicMock(component_id="ChatOutput-def", results={"message": kwargs["inputs"][0]["input_value"]})
+            return [MagicMock(outputs=[result])]
+
+        async def tool_call(value):
+            component.set(flow_tweak_data={"ChatInput-abc~input_value": value})
+            return await component._resolve_flow_output(vertex_id="ChatOutput-def", output_name="message")
+
+        with patch.object(component, "_run_flow_with_cached_graph", side_effect=run_flow_with_cached_graph):
+            results = await asyncio.gather(tool_call("first"), tool_call("second"))
+
+        assert results == ["first", "second"]
+        assert calls[0]["tweaks"] == {"ChatInput-abc": {"should_store_message": False, "input_value": "first"}}
+        assert calls[1]["inputs"] == [{"components": ["ChatInput-abc"], "input_value": "second"}]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_of_a_subflow_are_bounded(self, subflow_cache):
+        component = RunFlowBaseComponent()
+        component._user_id = str(uuid4())
+        component.flow_id_selected = str(uuid4())
+        component.flow_name_selected = "subflow"
+        component.session_id = None
+        component.cache_flow = False
+        component._cached_flow_updated_at = "2024-01-01T00:00:00+00:00"
+        subflow_cache.set(
+            component.user_id,
+            component.flow_id_selected,
+            data=_chat_flow_data(component.flow_id_selected, "").data["data"],
+            updated_at=component._cached_flow_updated_at,
+        )
+
+        running = 0
+        max_running = 0
+
+        async def run_flow(**kwargs):  # noqa: ARG001
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return []
+
+        settings = MagicMock()
+        settings.settings.subflow_max_concurrency = 2
+        with (
+            patch("lfx.base.tools.run_flow.run_flow", side_effect=run_flow),
+            patch("lfx.services.deps.get_settings_service", return_value=settings),
+        ):
+            await asyncio.gather(*(component._run_flow_with_cached_graph(user_id=component.user_id) for _ in range(8)))
+
+        assert max_running == 2
+
+
+async def test_saving_or_deleting_a_flow_drops_it_from_the_subflow_cache(client, logged_in_headers, subflow_cache):
+    response = await client.post("api/v1/flows/", json={"name": "subflow", "data": {}}, headers=logged_in_headers)
+    flow = response.json()
+
+    def cache_flow():
+        subflow_cache.set(flow["user_id"], flow["id"], data={}, updated_at=flow["updated_at"])
+        assert subflow_cache.get(flow["user_id"], flow["id"]) is not None
+
+    cache_flow()
+    response = await client.patch(
+        f"api/v1/flows/{flow['id']}", json={"description": "edited"}, headers=logged_in_headers
+    )
+    assert response.status_code == 200
+    assert subflow_cache.get(flow["user_id"], flow["id"]) is None
+
+    cache_flow()
+    response = await client.delete(f"api/v1/flows/{flow['id']}", headers=logged_in_headers)
+    assert response.status_code == 200
+    assert subflow_cache.get(flow["user_id"], flow["id"]) is None
+
+
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("client")
+async def test_agent_subflow_calls_benchmark(active_user, subflow_cache):
+    """Compare 50 tool calls into a subflow with and without the subflow graph cache."""
+    import time
+
+    from langflow.services.database.models.flow.model import Flow
+    from langflow.services.deps import session_scope
+    from lfx.base.tools import run_flow as run_flow_module
+
+    flow_id = uuid4()
+    flow_data = _chat_flow_data(str(flow_id), "")
+    async with session_scope() as session:
+        flow = Flow(id=flow_id, name=f"subflow-{flow_id}", data=flow_data.data["data"], user_id=active_user.id)
+        session.add(flow)
+        await session.flush()
+        await session.refresh(flow)
+        updated_at = flow.updated_at.isoformat()
+
+    component = RunFlowBaseComponent()
+    component._user_id = str(active_user.id)
+    component.flow_id_selected = str(flow_id)
+    component.flow_name_selected = flow.name
+    component.session_id = "subflow-benchmark"
+    component.cache_flow = False
+    component._cached_flow_updated_at = updated_at
+    component.flow_tweak_data = {}
+
+    async def tool_call(index: int):
+        component.set(flow_tweak_data={"ChatInput-abc~input_value": f"call {index}"})
+        return await component._resolve_flow_output(vertex_id="ChatOutput-def", output_name="message")
+
+    fetch = AsyncMock(wraps=run_flow_module.get_flow_by_id_or_name)
+    with patch.object(run_flow_module, "get_flow_by_id_or_name", fetch):
+        start = time.perf_counter()
+        for index in range(50):
+            subflow_cache.clear()
+            await tool_call(index)
+        uncached = time.perf_counter() - start
+        assert fetch.await_count == 50
+
+        fetch.reset_mock()
+        subflow_cache.clear()
+        start = time.perf_counter()
+        for index in range(50):
+            await tool_call(index)
+        cached = time.perf_counter() - start
+        assert fetch.await_count == 1
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(tool_call(index) for index in range(50)))
+        parallel = time.perf_counter() - start
+        assert fetch.await_count == 1
+
+    assert [result.text for result in results] == [f"call {index}" for index in range(50)]
+    print(  # noqa: T201
+        f"\n50 subflow calls: uncached {uncached * 1000:.0f}ms, cached {cached * 1000:.0f}ms, "
+        f"cached in parallel {parallel * 1000:.0f}ms"
+    )
+    assert cached < uncached
@@ -1,5 +1,6 @@
 """Unit tests for Composio components cloud validation."""
 
+import copy
 import os
 from unittest.mock import patch
 
@@ -34,3 +35,115 @@ class TestComposioCloudValidation:
 
             error_msg = str(exc_info.value).lower()
             assert "astra" in error_msg or "cloud" in error_msg
+
+
+CREATE_LABEL_TOOL = {
+    "slug": "GMAIL_CREATE_LABEL",
+    "name": "Create Label",
+    "version": "1",
+    "available_versions": ["1"],
+    "input_parameters": {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "description": "Label name"},
+            "color": {"type": "string"},
+        },
+        "required": ["name"],
+    },
+}
+
+
+class StubComposioTools:
+    def __init__(self, extra_tools=()):
+        self.calls = 0
+        self.extra_tools = list(extra_tools)
+
+    def get_raw_composio_tools(self, toolkits, limit):  # noqa: ARG002
+        self.calls += 1
+        return [
+            *copy.deepcopy(self.extra_tools),
+            {
+                "slug": "GMAIL_SEND_EMAIL",
+                "name": "Send Email",
+                "version": "1",
+                "available_versions": ["1"],
+                "input_parameters": {
+                    "type": "object",
+                    "properties": {
+                        "recipient_email": {"type": "string", "description": "Recipient"},
+                        "is_html": {"type": "boolean", "description": "Send as HTML"},
+                    },
+                    "required": ["recipient_email"],
+                },
+            },
+        ]
+
+
+class StubComposio:
+    def __init__(self, extra_tools=()):
+        self.tools = StubComposioTools(extra_tools)
+
+
+@pytest.mark.unit
+class TestComposioActionsCache:
+    """Test that toolkit actions are fetched once and shared through the actions cache."""
+
+    @pytest.fixture
+    def actions_cache(self, tmp_path):
+        from lfx.base.composio.actions_cache import ComposioActionsCache
+
+        cache = ComposioActionsCache(tmp_path)
+        with patch("lfx.base.composio.composio_base.composio_actions_cache", cache):
+            yield cache
+
+    @staticmethod
+    def make_component(client):
+        component = ComposioBaseComponent(api_key="test-key")
+        component.app_name = "gmail"
+        component._build_wrapper = lambda: client
+        return component
+
+    def test_actions_are_fetched_once_and_shared(self, actions_cache):
+        client = StubComposio()
+        first = self.make_component(client)
+        first._populate_actions_data()
+        second = self.make_component(client)
+        second._populate_actions_data()
+
+        assert client.tools.calls == 1
+        assert second._actions_data is first._actions_data
+        assert second._action_schemas is first._action_schemas
+        assert second._actions_data["GMAIL_SEND_EMAIL"]["action_fields"] == ["recipient_email", "is_html"]
+        assert second._all_fields == {"recipient_email", "is_html"}
+        assert second._bool_variables == {"is_html"}
+        assert actions_cache.get("gmail") is not None
+
+    def test_actions_survive_a_restart(self, actions_cache):
+        self.make_component(StubComposio())._populate_actions_data()
+        actions_cache.clear()
+
+        client = StubComposio()
+        component = self.make_component(client)
+        component._populate_actions_data()
+
+        assert client.tools.calls == 0
+        assert component.desanitize_action_name("Send Email") == "GMAIL_SEND_EMAIL"
+
+    def test_cached_schemas_are_not_changed_by_components(self, actions_cache):
+        client = StubComposio(extra_tools=[CREATE_LABEL_TOOL])
+        self.make_component(client)._populate_actions_data()
+        snapshot = copy.deepcopy(actions_cache.get("gmail").action_schemas)
+
+        component = self.make_component(client)
+        component._populate_actions_data()
+        inputs = component._validate_schema_inputs("GMAIL_CREATE_LABEL")
+
+        # Reserved names are renamed in the inputs of the component, not in the cached schema
+        assert "gmail_name" in {field.name for field in inputs}
+        assert component._validate_schema_inputs("GMAIL_SEND_EMAIL")
+        assert actions_cache.get("gmail").action_schemas == snapshot
+        other = self.make_component(client)
+        other._populate_actions_data()
+        assert [field.name for field in other._validate_schema_inputs("GMAIL_CREATE_LABEL")] == [
+            field.name for field in inputs
+        ]
@@ -2,6 +2,7 @@ import sqlite3
 from pathlib import Path
 
 import pytest
+from lfx.base.data.sql_engines import run_query, sql_engine_pool
 from lfx.components.data_source.sql_executor import SQLComponent
 from lfx.schema import DataFrame, Message
 
@@ -89,11 +90,11 @@ class TestSQLComponent(ComponentTestBaseWithoutClient):
         assert "Error:" in result.text
         assert "Query: SELECT * FROM non_existent_table" in result.text
 
-    def test_run_sql_query(self, component_class: type[SQLComponent], default_kwargs):
+    async def test_run_sql_query(self, component_class: type[SQLComponent], default_kwargs):
         """Test building a DataFrame from a SQL query."""
         component = component_class(**default_kwargs)
 
-        result = component.run_sql_query()
+        result = await component.run_sql_query()
 
         assert isinstance(result, DataFrame)
         assert len(result) == 1
@@ -101,3 +102,80 @@ class TestSQLComponent(ComponentTestBaseWithoutClient):
         assert "name" in result.columns
         assert result.iloc[0]["id"] == 1
         assert result.iloc[0]["name"] == "name_test"
+
+    async def test_run_sql_query_limits_rows(self, component_class: type[SQLComponent], default_kwargs):
+        """Test that only the first max_rows rows are returned."""
+        default_kwargs["query"] = (
+            "WITH RECURSIVE numbers(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM numbers WHERE n < 2500) "
+            "SELECT n FROM numbers"
+        )
+        default_kwargs["max_rows"] = 1200
+        component = component_class(**default_kwargs)
+
+        result = await component.run_sql_query()
+
+        assert result["n"].tolist() == list(range(1, 1201))
+        assert component.status == "The query returned more than 1200 rows, only the first 1200 are kept."
+
+    async def test_run_sql_query_returns_every_row_by_default(
+        self, component_class: type[SQLComponent], default_kwargs
+    ):
+        """Test that rows are not limited unless max_rows is set."""
+        default_kwargs["query"] = (
+            "WITH RECURSIVE numbers(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM numbers WHERE n < 12000) "
+            "SELECT n FROM numbers"
+        )
+        component = component_class(**default_kwargs)
+
+        result = await component.run_sql_query()
+
+        assert len(result) == 12000
+        assert component.status is result
+
+    async def test_run_sql_query_timeout(self, component_class: type[SQLComponent], default_kwargs):
+        """Test that a query running longer than the timeout is interrupted."""
+        default_kwargs["query"] = (
+            "WITH RECURSIVE numbers(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM numbers) SELECT count(*) FROM numbers"
+        )
+        default_kwargs["query_timeout"] = 1
+        component = component_class(**default_kwargs)
+
+        with pytest.raises(TimeoutError, match="interrupted after 1 seconds"):
+            await component.run_sql_query()
+
+    async def test_run_sql_query_without_rows(self, component_class: type[SQLComponent], default_kwargs):
+        """Test that statements returning no rows give an empty DataFrame."""
+        default_kwargs["query"] = "UPDATE test SET name = 'renamed' WHERE id = 1"
+        component = component_class(**default_kwargs)
+
+        result = await component.run_sql_query()
+
+        assert result.empty
+        assert component_class(**default_kwargs).build_component().text == ""
+
+    def test_engines_are_shared_by_url(self, component_class: type[SQLComponent], default_kwargs):
+        """Test that components connecting to the same database share its engine."""
+        first = component_class(**default_kwargs)
+        second = component_class(**default_kwargs)
+
+        first.maybe_create_db()
+        second.maybe_create_db()
+
+        assert first.db is second.db
+        assert sql_engine_pool.get_engine(default_kwargs["database_url"]) is first.db._engine
+
+
+def test_run_query_fetches_in_chunks():
+    """Test that rows are fetched chunk by chunk and concatenated in order."""
+    engine = sql_engine_pool.get_engine("sqlite://")
+    query = (
+        "WITH RECURSIVE numbers(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM numbers WHERE n < 25) SELECT n FROM numbers"
+    )
+
+    result, truncated = run_query(engine, query, chunk_size=10)
+    limited, limited_truncated = run_query(engine, query, max_rows=25, chunk_size=10)
+
+    assert result["n"].tolist() == list(range(1, 26))
+    assert not truncated
+    assert limited["n"].tolist() == list(range(1, 26))
+    assert not limited_truncated
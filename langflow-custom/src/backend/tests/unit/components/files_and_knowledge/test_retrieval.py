@@ -1,10 +1,16 @@
 import contextlib
 import json
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from langchain_chroma import Chroma
+from langchain_core.embeddings import DeterministicFakeEmbedding
 from langflow.base.knowledge_bases.knowledge_base_utils import get_knowledge_bases
+from lfx.base.knowledge_bases.store_cache import knowledge_base_store_cache
+from lfx.components.knowledge_bases import retrieval
 from lfx.components.knowledge_bases.retrieval import KnowledgeRetrievalComponent
 from pydantic import SecretStr
 
@@ -372,3 +378,116 @@ class TestKnowledgeRetrievalComponent(ComponentTestBaseWithClient):
         default_kwargs["include_embeddings"] = False
         component = component_class(**default_kwargs)
         assert component.include_embeddings is False
+
+
+class TestKnowledgeRetrievalStoreCache:
+    """Retrievals on a real Chroma knowledge base reuse the opened store and embedder."""
+
+    TEXTS = [f"document number {i} about {'cats' if i % 2 else 'dogs'}" for i in range(20)]
+
+    @pytest.fixture(autouse=True)
+    def clear_store_cache(self):
+        knowledge_base_store_cache.clear()
+        yield
+        knowledge_base_store_cache.clear()
+
+    @pytest.fixture
+    def knowledge_base(self, tmp_path, active_user):
+        kb_name = "cached_kb"
+        kb_path = tmp_path / active_user.username / kb_name
+        kb_path.mkdir(parents=True)
+        (kb_path / "embedding_metadata.json").write_text(
+            json.dumps({"embedding_provider": "HuggingFace", "embedding_model": "fake-model", "chunk_size": 1000})
+        )
+        Chroma(
+            persist_directory=str(kb_path),
+            embedding_function=DeterministicFakeEmbedding(size=16),
+            collection_name=kb_name,
+        ).add_texts(
+            self.TEXTS,
+            metadatas=[{"_id": str(i), "topic": "cats" if i % 2 else "dogs"} for i in range(len(self.TEXTS))],
+        )
+        with (
+            patch.object(retrieval, "_KNOWLEDGE_BASES_ROOT_PATH", tmp_path),
+            patch.object(
+                KnowledgeRetrievalComponent,
+                "_build_embeddings",
+                side_effect=lambda _metadata: DeterministicFakeEmbedding(size=16),
+                autospec=False,
+            ) as build_embeddings,
+        ):
+            yield kb_name, build_embeddings
+
+    def make_component(self, knowledge_base, active_user, **kwargs):
+        kb_name, _ = knowledge_base
+        return KnowledgeRetrievalComponent(
+            **{"knowledge_base": kb_name, "top_k": 3, "include_embeddings": False, "_user_id": active_user.id, **kwargs}
+        )
+
+    async def test_store_and_embedder_are_opened_once(self, knowledge_base, active_user):
+        _, build_embeddings = knowledge_base
+        with patch.object(retrieval, "Chroma", wraps=Chroma) as open_store:
+            for query in ("cats", "dogs", ""):
+                results = await self.make_component(knowledge_base, active_user, search_query=query).retrieve_data()
+                assert len(results) == 3
+
+        build_embeddings.assert_called_once()
+        open_store.assert_called_once()
+
+    @pytest.mark.parametrize("search_query", ["document", ""])
+    async def test_metadata_filter_is_applied_by_the_store(self, knowledge_base, active_user, search_query):
+        component = self.make_component(
+            knowledge_base, active_user, search_query=search_query, search_filter={"topic": "cats"}, top_k=20
+        )
+
+        results = await component.retrieve_data()
+
+        assert len(results) == len(self.TEXTS) // 2
+        assert set(results["topic"]) == {"cats"}
+
+    async def test_embeddings_are_returned_without_a_query(self, knowledge_base, active_user):
+        component = self.make_component(knowledge_base, active_user, search_query="", include_embeddings=True)
+
+        results = await component.retrieve_data()
+
+        assert all(len(embedding) == 16 for embedding in results["_embeddings"])
+
+    async def test_search_runs_off_the_event_loop(self, knowledge_base, active_user):
+        component = self.make_component(knowledge_base, active_user, search_query="cats")
+        threads = []
+        original_query_store = component._query_store
+
+        def record_thread(*args):
+            threads.append(threading.get_ident())
+            return original_query_store(*args)
+
+        with patch.object(component, "_query_store", side_effect=record_thread):
+            await component.retrieve_data()
+
+        assert threads
+        assert threads[0] != threading.get_ident()
+
+    @pytest.mark.benchmark
+    async def test_sequential_retrievals_benchmark(self, knowledge_base, active_user):
+        """Latency of 100 sequential retrievals on the same knowledge base, with and without the cache."""
+
+        async def retrieve_100(*, cached: bool) -> list[float]:
+            latencies = []
+            for i in range(100):
+                if not cached:
+                    knowledge_base_store_cache.clear()
+                component = self.make_component(knowledge_base, active_user, search_query=f"document {i}")
+                start = time.perf_counter()
+                await component.retrieve_data()
+                latencies.append(time.perf_counter() - start)
+            return sorted(latencies)
+
+        uncached = await retrieve_100(cached=False)
+        cached = await retrieve_100(cached=True)
+
+        for name, latencies in (("uncached", uncached), ("cached", cached)):
+            print(  # noqa: T201
+                f"\n{name}: total {sum(latencies) * 1000:.0f}ms, "
+                f"p50 {latencies[49] * 1000:.1f}ms, p95 {latencies[94] * 1000:.1f}ms"
+            )
+        assert sum(cached) < sum(uncached)
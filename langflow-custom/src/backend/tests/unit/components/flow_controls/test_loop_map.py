@@ -0,0 +1,165 @@
+"""Tests for the Parallel Map execution mode of the Loop component."""
+
+import asyncio
+import time
+
+import pytest
+from lfx.components.flow_controls import LoopComponent
+from lfx.components.flow_controls.loop import MAP_MODE, SEQUENTIAL_MODE
+from lfx.custom.custom_component.component import Component
+from lfx.exceptions.component import ComponentBuildError
+from lfx.graph import Graph
+from lfx.io import FloatInput, HandleInput, IntInput, MessageTextInput, Output
+from lfx.schema.data import Data
+from lfx.schema.dataframe import DataFrame
+from lfx.schema.message import Message
+
+
+class RowsComponent(Component):
+    display_name = "Rows"
+    inputs = [IntInput(name="count", display_name="Count", value=3)]
+    outputs = [Output(display_name="Rows", name="rows", method="build_rows")]
+
+    def build_rows(self) -> DataFrame:
+        return DataFrame([{"text": f"item {index}", "index": index} for index in range(self.count)])
+
+
+class PrefixComponent(Component):
+    display_name = "Prefix"
+    builds = 0
+    inputs = [MessageTextInput(name="prefix", display_name="Prefix", value="processed ")]
+    outputs = [Output(display_name="Prefix", name="prefix_message", method="build_prefix")]
+
+    def build_prefix(self) -> Message:
+        type(self).builds += 1
+        return Message(text=self.prefix)
+
+
+class SlowEchoComponent(Component):
+    """Stands in for an LLM call: waits, then echoes the item. Earlier items wait longer."""
+
+    display_name = "Slow Echo"
+    in_flight = 0
+    max_in_flight = 0
+    inputs = [
+        HandleInput(name="item", display_name="Item", input_types=["Data"]),
+        MessageTextInput(name="prefix", display_name="Prefix", value=""),
+        FloatInput(name="latency", display_name="Latency", value=0.01),
+        MessageTextInput(name="fail_on", display_name="Fail On", value=""),
+    ]
+    outputs = [Output(display_name="Result", name="result", method="echo")]
+
+    async def echo(self) -> Data:
+        cls = type(self)
+        cls.in_flight += 1
+        cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            index = self.item.data.get("index", 0)
+            await asyncio.sleep(self.latency * (1 + 1 / (index + 1)))
+            if self.fail_on and self.item.text == self.fail_on:
+                msg = f"boom on {self.item.text}"
+                raise ValueError(msg)
+            return Data(text=f"{self.prefix}{self.item.text}")
+        finally:
+            cls.in_flight -= 1
+
+
+class CollectComponent(Component):
+    display_name = "Collect"
+    inputs = [HandleInput(name="results", display_name="Results", input_types=["DataFrame"])]
+    outputs = [Output(display_name="Results", name="collected", method="collect")]
+
+    def collect(self) -> DataFrame:
+        return self.results
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    PrefixComponent.builds = 0
+    SlowEchoComponent.in_flight = 0
+    SlowEchoComponent.max_in_flight = 0
+
+
+def build_loop_graph(
+    count: int,
+    execution_mode: str,
+    *,
+    max_concurrency: int = 4,
+    latency: float = 0.01,
+    fail_on: str = "",
+    with_prefix: bool = False,
+) -> Graph:
+    rows = RowsComponent(_id="rows")
+    rows.set(count=count)
+    loop = LoopComponent(_id="loop")
+    loop.set(data=rows.build_rows, execution_mode=execution_mode, max_concurrency=max_concurrency)
+    echo = SlowEchoComponent(_id="echo")
+    echo.set(item=loop.item_output, latency=latency, fail_on=fail_on)
+    if with_prefix:
+        prefix = PrefixComponent(_id="prefix")
+        echo.set(prefix=prefix.build_prefix)
+    loop.set(item=echo.echo)
+    collect = CollectComponent(_id="collect")
+    collect.set(results=loop.done_output)
+    return Graph(rows, collect)
+
+
+async def run_graph(graph: Graph) -> tuple[list[str], DataFrame]:
+    results = [result async for result in graph.async_start(max_iterations=1000)]
+    built_ids = [result.vertex.id for result in results if hasattr(result, "vertex")]
+    return built_ids, graph.get_vertex("collect").built_object["collected"]
+
+
+async def test_map_mode_aggregates_results_in_input_order():
+    sequential_ids, sequential = await run_graph(build_loop_graph(6, SEQUENTIAL_MODE))
+    map_ids, mapped = await run_graph(build_loop_graph(6, MAP_MODE, max_concurrency=6))
+
+    expected = [f"item {index}" for index in range(6)]
+    assert list(sequential["text"]) == expected
+    assert list(mapped["text"]) == expected
+    # The body runs inside the loop instead of through the cycle of the flow
+    assert sequential_ids.count("echo") == 6
+    assert map_ids == ["rows", "loop", "collect"]
+
+
+async def test_map_mode_respects_max_concurrency():
+    _, mapped = await run_graph(build_loop_graph(12, MAP_MODE, max_concurrency=3))
+
+    assert len(mapped) == 12
+    assert SlowEchoComponent.max_in_flight == 3
+
+
+async def test_map_mode_reuses_components_outside_the_loop():
+    _, mapped = await run_graph(build_loop_graph(5, MAP_MODE, with_prefix=True))
+
+    assert list(mapped["text"]) == [f"processed item {index}" for index in range(5)]
+    assert PrefixComponent.builds == 1
+
+
+async def test_map_mode_raises_body_errors():
+    graph = build_loop_graph(4, MAP_MODE, fail_on="item 2")
+
+    with pytest.raises(ComponentBuildError, match="boom on item 2"):
+        await run_graph(graph)
+
+
+@pytest.mark.benchmark
+async def test_map_mode_benchmark():
+    """Compare looping a 20ms body over 40 items sequentially and in Parallel Map mode."""
+    items = 40
+    start = time.perf_counter()
+    _, sequential = await run_graph(build_loop_graph(items, SEQUENTIAL_MODE, latency=0.02))
+    sequential_time = time.perf_counter() - start
+
+    timings = {}
+    for max_concurrency in (4, 16):
+        start = time.perf_counter()
+        _, mapped = await run_graph(build_loop_graph(items, MAP_MODE, max_concurrency=max_concurrency, latency=0.02))
+        timings[max_concurrency] = time.perf_counter() - start
+        assert list(mapped["text"]) == list(sequential["text"])
+
+    print(  # noqa: T201
+        f"\n{items} items with a 20ms body: sequential {sequential_time * 1000:.0f}ms, "
+        + ", ".join(f"map x{key} {value * 1000:.0f}ms" for key, value in timings.items())
+    )
+    assert timings[16] < timings[4] < sequential_time
@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -462,3 +463,46 @@ class TestSaveToFileComponent(ComponentTestBaseWithoutClient):
         assert result["append_mode"]["show"] is False, "append_mode should be hidden for Google Drive storage"
         assert result["file_name"]["show"] is True
         assert result["gdrive_format"]["show"] is True
+
+    def test_append_dataframe_to_json_array(self, component_class, tmp_path, monkeypatch):
+        """Test that JSON appends extend the existing array written in chunks."""
+        monkeypatch.setattr(component_class, "WRITE_CHUNK_ROWS", 2)
+        component = component_class()
+        path = tmp_path / "rows.json"
+
+        component._save_dataframe(DataFrame([{"n": n} for n in range(3)]), path, "json")
+        component.append_mode = True
+        result = component._save_dataframe(DataFrame([{"n": 3}, {"n": 4}]), path, "json")
+
+        assert "appended to" in result
+        assert json.loads(path.read_text(encoding="utf-8")) == [{"n": n} for n in range(5)]
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_save_jsonl(self, component_class, tmp_path, monkeypatch):
+        """Test writing and appending JSON Lines for DataFrame, Data and Message inputs."""
+        monkeypatch.setattr(component_class, "WRITE_CHUNK_ROWS", 2)
+        component = component_class()
+        path = tmp_path / "rows.jsonl"
+
+        component._save_dataframe(DataFrame([{"n": n} for n in range(3)]), path, "jsonl")
+        component.append_mode = True
+        component._save_data(Data(data={"n": 3}), path, "jsonl")
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [{"n": n} for n in range(4)]
+
+    async def test_append_message_to_json_object(self, component_class, tmp_path):
+        """Test that appending to a file holding a single object turns it into an array."""
+        component = component_class()
+        path = tmp_path / "messages.json"
+
+        await component._save_message(Message(text="first"), path, "json")
+        component.append_mode = True
+        await component._save_message(Message(text="second"), path, "json")
+        await component._save_message(Message(text="third"), path, "json")
+
+        assert json.loads(path.read_text(encoding="utf-8")) == [
+            {"message": "first"},
+            {"message": "second"},
+            {"message": "third"},
+        ]
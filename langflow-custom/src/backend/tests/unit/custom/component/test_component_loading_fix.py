@@ -28,6 +28,7 @@ class TestComponentLoadingFix:
         settings_service.settings = MagicMock()
         settings_service.settings.lazy_load_components = False
         settings_service.settings.components_path = []
+        settings_service.settings.component_types_cache = False
         return settings_service
 
     @pytest.fixture
@@ -1,7 +1,15 @@
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
 from uuid import uuid4
 
+import langflow
 import pytest
+from aiofile import async_open
 from langflow.services.flow.flow_runner import LangflowRunnerExperimental
+from lfx.graph import Graph
 
 
 @pytest.fixture
@@ -84,3 +92,98 @@ async def test_initialize_database(flow_runner):
     flow_runner.should_initialize_db = True
     await flow_runner.init_db_if_needed()
     assert not flow_runner.should_initialize_db
+
+
+@pytest.fixture
+def starter_project_path():
+    return Path(langflow.__file__).parent / "initial_setup" / "starter_projects" / "Basic Prompt Chaining.json"
+
+
+def get_output_text(result) -> str:
+    return result[0].outputs[0].results["message"].text
+
+
+@pytest.mark.asyncio
+async def test_get_flow_dict_from_file_is_cached_per_version(flow_runner, sample_flow_dict, tmp_path):
+    """Test that a flow file is parsed once per version and callers get independent copies."""
+    flow_path = tmp_path / "flow.json"
+    flow_path.write_text(json.dumps(sample_flow_dict), encoding="utf-8")
+
+    with patch("langflow.services.flow.flow_runner.async_open", wraps=async_open) as mock_open:
+        first = await flow_runner.get_flow_dict(flow_path)
+        second = await flow_runner.get_flow_dict(str(flow_path))
+        assert mock_open.call_count == 1
+        assert first == second == sample_flow_dict
+        assert first is not second
+
+        sample_flow_dict["name"] = "renamed_flow"
+        flow_path.write_text(json.dumps(sample_flow_dict), encoding="utf-8")
+        stat = flow_path.stat()
+        os.utime(flow_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        updated = await flow_runner.get_flow_dict(flow_path)
+        assert mock_open.call_count == 2
+        assert updated["name"] == "renamed_flow"
+
+
+@pytest.mark.usefixtures("client")
+@pytest.mark.asyncio
+async def test_run_builds_graph_once_per_run(flow_runner, starter_project_path):
+    """Test that each run builds a single graph and later runs reuse the prepared flow."""
+    with (
+        patch("langflow.services.flow.flow_runner.Graph.from_payload", wraps=Graph.from_payload) as mock_from_payload,
+        patch.object(flow_runner, "get_flow_dict", wraps=flow_runner.get_flow_dict) as mock_get_flow_dict,
+    ):
+        for i in range(3):
+            result = await flow_runner.run(session_id=str(uuid4()), flow=starter_project_path, input_value=f"run {i}")
+            assert get_output_text(result)
+
+    assert mock_from_payload.call_count == 3
+    assert mock_get_flow_dict.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_prepared_flow_depends_on_tweaks_values(flow_runner, starter_project_path, tmp_path):
+    """Test that runs resolving database fields to different values do not share a prepared flow."""
+    flow_path = tmp_path / "flow.json"
+    flow_path.write_text(starter_project_path.read_text(encoding="utf-8"), encoding="utf-8")
+
+    with patch.object(flow_runner, "_get_load_from_db_fields", return_value={"Prompt-1": {"api_key": "MY_API_KEY"}}):
+        await flow_runner.prepare_flow_and_graph(flow=flow_path, tweaks_values={"MY_API_KEY": "first"})
+        await flow_runner.prepare_flow_and_graph(flow=flow_path, tweaks_values={"MY_API_KEY": "first"})
+        assert len(flow_runner._prepared_flows) == 1
+        await flow_runner.prepare_flow_and_graph(flow=flow_path, tweaks_values={"MY_API_KEY": "second"})
+        assert len(flow_runner._prepared_flows) == 2
+
+
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("client")
+@pytest.mark.asyncio
+async def test_sequential_runs_of_starter_project(starter_project_path):
+    """Benchmark 100 sequential runs of a starter project.
+
+    The first mode runs the flow the way `run` used to, processing tweaks on one graph and running another.
+    """
+    num_runs = 100
+    durations = {}
+
+    runner = LangflowRunnerExperimental()
+    start_time = time.perf_counter()
+    for i in range(num_runs):
+        session_id = str(uuid4())
+        flow_dict = await runner.prepare_flow_and_add_to_db(flow=starter_project_path, session_id=session_id)
+        result = await runner.run_flow(input_value=f"run {i}", session_id=session_id, flow_dict=flow_dict)
+        assert get_output_text(result)
+    durations["two graph builds per run"] = time.perf_counter() - start_time
+
+    for reuse_prepared_flows in (False, True):
+        runner = LangflowRunnerExperimental(reuse_prepared_flows=reuse_prepared_flows)
+        start_time = time.perf_counter()
+        for i in range(num_runs):
+            result = await runner.run(session_id=str(uuid4()), flow=starter_project_path, input_value=f"run {i}")
+            assert get_output_text(result)
+        label = "single build, prepared flow reused" if reuse_prepared_flows else "single build"
+        durations[label] = time.perf_counter() - start_time
+
+    print(f"\n{num_runs} sequential runs of {starter_project_path.name}:")  # noqa: T201
+    for label, duration in durations.items():
+        print(f"  {label}: {duration:.2f}s total, {duration / num_runs * 1000:.1f}ms per run")  # noqa: T201
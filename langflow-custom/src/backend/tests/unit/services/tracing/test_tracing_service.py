@@ -1,13 +1,17 @@
 import asyncio
+import time
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from langflow.services.tracing.base import BaseTracer
 from langflow.services.tracing.service import (
+    TRACER_NAMES,
     TracingService,
     component_context_var,
+    resolve_enabled_tracers,
     trace_context_var,
+    trace_endpoint_var,
 )
 from lfx.services.settings.base import Settings
 from lfx.services.settings.service import SettingsService
@@ -104,7 +108,12 @@ def mock_settings_service():
 
 @pytest.fixture
 def tracing_service(mock_settings_service):
-    return TracingService(mock_settings_service)
+    # Behave as if every tracer was configured in the environment
+    with patch(
+        "langflow.services.tracing.service.resolve_enabled_tracers",
+        return_value=TRACER_NAMES,
+    ):
+        return TracingService(mock_settings_service)
 
 
 @pytest.fixture
@@ -531,3 +540,178 @@ async def test_concurrent_tracing(tracing_service, mock_component):
     assert tracer2.session_id == "session_id2"
     assert dict(tracer2.outputs_param.get("run_id2 trace_name1")) == {"output_key": "task2_run_id2 component1_output"}
     assert dict(tracer2.outputs_param.get("run_id2 trace_name2")) == {"output_key": "task2_run_id2 component2_output"}
+
+
+def test_resolve_enabled_tracers(monkeypatch):
+    """Only tracers whose configuration is present in the environment are enabled."""
+    for env_var in (
+        "LANGCHAIN_API_KEY",
+        "LANGWATCH_API_KEY",
+        "LANGFUSE_SECRET_KEY",
+        "ARIZE_API_KEY",
+        "PHOENIX_API_KEY",
+        "PHOENIX_COLLECTOR_ENDPOINT",
+        "OPIK_URL_OVERRIDE",
+        "OPIK_API_KEY",
+        "TRACELOOP_API_KEY",
+    ):
+        monkeypatch.delenv(env_var, raising=False)
+    assert resolve_enabled_tracers() == ()
+
+    monkeypatch.setenv("LANGCHAIN_API_KEY", "key")
+    monkeypatch.setenv("OPIK_API_KEY", "key")
+    assert resolve_enabled_tracers() == ("langsmith", "opik")
+
+
+def test_resolve_enabled_tracers_asks_the_tracer_classes():
+    class ConfiguredTracer(MockTracer):
+        @classmethod
+        def is_configured(cls) -> bool:
+            return True
+
+    class UnconfiguredTracer(MockTracer):
+        @classmethod
+        def is_configured(cls) -> bool:
+            return False
+
+    def missing_tracer():
+        msg = "No module named 'traceloop'"
+        raise ImportError(msg)
+
+    with (
+        patch("langflow.services.tracing.service._get_langsmith_tracer", return_value=UnconfiguredTracer),
+        patch("langflow.services.tracing.service._get_langwatch_tracer", return_value=ConfiguredTracer),
+        patch("langflow.services.tracing.service._get_langfuse_tracer", return_value=UnconfiguredTracer),
+        patch("langflow.services.tracing.service._get_arize_phoenix_tracer", return_value=UnconfiguredTracer),
+        patch("langflow.services.tracing.service._get_opik_tracer", return_value=ConfiguredTracer),
+        patch("langflow.services.tracing.service._get_traceloop_tracer", side_effect=missing_tracer),
+    ):
+        assert resolve_enabled_tracers() == ("langwatch", "opik")
+
+
+@pytest.mark.asyncio
+async def test_no_configured_tracer_takes_noop_path(mock_settings_service, mock_component):
+    """Without configured tracers, runs and components skip all tracing bookkeeping."""
+    with patch("langflow.services.tracing.service.resolve_enabled_tracers", return_value=()):
+        tracing_service = TracingService(mock_settings_service)
+    assert tracing_service.deactivated
+
+    trace_context_var.set(None)
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session")
+    assert trace_context_var.get() is None
+
+    async with tracing_service.trace_component(mock_component, "test_component_trace", {"input_key": "value"}) as ts:
+        ts.add_log("test_component_trace", {"message": "test log"})
+        ts.set_outputs("test_component_trace", {"output_key": "output_value"})
+        assert tracing_service.get_langchain_callbacks() == []
+    mock_component.get_vertex.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_only_enabled_tracers_are_initialized(mock_settings_service):
+    with patch("langflow.services.tracing.service.resolve_enabled_tracers", return_value=("langfuse",)):
+        tracing_service = TracingService(mock_settings_service)
+
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+    assert list(trace_context_var.get().tracers) == ["langfuse"]
+    await tracing_service.end_tracers({})
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_head_based_sampling(tracing_service, mock_component):
+    """Unsampled runs are not traced, and per flow rates override the global rate."""
+    tracing_service.sample_rate = 0.0
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", flow_id="flow-1")
+    assert trace_context_var.get() is None
+    async with tracing_service.trace_component(mock_component, "test_component_trace", {}) as ts:
+        ts.add_log("test_component_trace", {"message": "test log"})
+
+    tracing_service.sample_rates = {"flow-1": 1.0}
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", flow_id="flow-1")
+    assert trace_context_var.get() is not None
+    await tracing_service.end_tracers({})
+
+    tracing_service.sample_rate = 0.25
+    tracing_service.sample_rates = {}
+    run_ids = [uuid.uuid4() for _ in range(2000)]
+    sampled = [tracing_service.should_sample(run_id) for run_id in run_ids]
+    assert 0.15 < sum(sampled) / len(sampled) < 0.35
+    # The decision is stable for a given run
+    assert sampled == [tracing_service.should_sample(run_id) for run_id in run_ids]
+
+
+def test_endpoint_sampling(tracing_service):
+    """Runs started from a request use the rate of the longest matching path prefix, unless their flow has one."""
+    tracing_service.sample_rate = 1.0
+    tracing_service.endpoint_sample_rates = {"/api/v1/run": 0.0, "/api/v1/run/advanced": 1.0}
+    run_id = uuid.uuid4()
+
+    assert tracing_service.should_sample(run_id)
+    token = trace_endpoint_var.set("/api/v1/run/flow-1")
+    try:
+        assert not tracing_service.should_sample(run_id)
+        trace_endpoint_var.set("/api/v1/run/advanced/flow-1")
+        assert tracing_service.should_sample(run_id)
+        trace_endpoint_var.set("/api/v1/build/flow-1/flow")
+        assert tracing_service.should_sample(run_id)
+        trace_endpoint_var.set("/api/v1/run/flow-1")
+        tracing_service.sample_rates = {"flow-1": 1.0}
+        assert tracing_service.should_sample(run_id, flow_id="flow-1")
+    finally:
+        trace_endpoint_var.reset(token)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_per_vertex_tracing_overhead(mock_settings_service, mock_component):
+    """Benchmark the per-vertex overhead of trace_component with and without active tracers."""
+    num_vertices = 2000
+
+    async def trace_vertices(tracing_service: TracingService) -> float:
+        await tracing_service.start_tracers(uuid.uuid4(), "bench_run", "user", "session", "project")
+        start_time = time.perf_counter()
+        for i in range(num_vertices):
+            trace_name = f"component {i}"
+            async with tracing_service.trace_component(mock_component, trace_name, {"input": i}) as ts:
+                ts.set_outputs(trace_name, {"output": i})
+        duration = time.perf_counter() - start_time
+        await tracing_service.end_tracers({})
+        return duration / num_vertices
+
+    with patch("langflow.services.tracing.service.resolve_enabled_tracers", return_value=()):
+        noop_service = TracingService(mock_settings_service)
+    with patch("langflow.services.tracing.service.resolve_enabled_tracers", return_value=("langsmith",)):
+        active_service = TracingService(mock_settings_service)
+
+    noop_overhead = await trace_vertices(noop_service)
+    active_overhead = await trace_vertices(active_service)
+    active_service.sample_rate = 0.0
+    unsampled_overhead = await trace_vertices(active_service)
+
+    print(f"\nPer-vertex tracing overhead over {num_vertices} vertices:")  # noqa: T201
+    print(f"  no tracer configured: {noop_overhead * 1e6:.2f}us")  # noqa: T201
+    print(f"  run not sampled:      {unsampled_overhead * 1e6:.2f}us")  # noqa: T201
+    print(f"  one tracer active:    {active_overhead * 1e6:.2f}us")  # noqa: T201
+
+    assert noop_overhead < active_overhead
+    assert unsampled_overhead < active_overhead
+
+
+@pytest.mark.asyncio
+async def test_tracing_endpoint_middleware_records_the_request_path():
+    from langflow.middleware import TracingEndpointMiddleware
+
+    seen = []
+
+    async def app(scope, receive, send):  # noqa: ARG001
+        seen.append(trace_endpoint_var.get())
+
+    middleware = TracingEndpointMiddleware(app)
+    await middleware({"type": "http", "path": "/api/v1/run/flow-1"}, None, None)
+    await middleware({"type": "lifespan"}, None, None)
+
+    assert seen == ["/api/v1/run/flow-1", None]
+    assert trace_endpoint_var.get() is None
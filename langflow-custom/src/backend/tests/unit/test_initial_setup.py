@@ -1,6 +1,7 @@
 import asyncio
 import os
 import shutil
+import sys
 import tempfile
 import uuid
 from copy import deepcopy
@@ -281,7 +282,15 @@ def set_fs_flows_polling_interval():
     os.unsetenv("LANGFLOW_FS_FLOWS_POLLING_INTERVAL")
 
 
-@pytest.mark.usefixtures("set_fs_flows_polling_interval")
+@pytest.fixture(params=["watchfiles", "polling"])
+def flow_sync_mode(request, monkeypatch):
+    if request.param == "polling":
+        # Makes `from watchfiles import awatch` raise ImportError
+        monkeypatch.setitem(sys.modules, "watchfiles", None)
+    return request.param
+
+
+@pytest.mark.usefixtures("set_fs_flows_polling_interval", "flow_sync_mode")
 async def test_sync_flows_from_fs(client: AsyncClient, logged_in_headers):
     # Use a relative path which will be placed in the user's flows directory
     # The path validation requires paths to be within the user's flows directory for security
@@ -334,6 +343,59 @@ async def test_sync_flows_from_fs(client: AsyncClient, logged_in_headers):
             await flow_file.unlink(missing_ok=True)
 
 
+async def test_sync_flows_from_fs_runs_in_a_single_worker(tmp_path, monkeypatch):
+    from langflow.initial_setup import setup
+
+    monkeypatch.setattr(setup.tempfile, "gettempdir", lambda: str(tmp_path))
+    monkeypatch.setattr(get_settings_service().settings, "fs_flows_polling_interval", 10)
+    watching = []
+
+    async def watch_flows_from_fs(_polling_interval):
+        watching.append(asyncio.current_task())
+        await asyncio.Event().wait()
+
+    with patch.object(setup, "watch_flows_from_fs", watch_flows_from_fs):
+        first = asyncio.create_task(setup.sync_flows_from_fs())
+        second = asyncio.create_task(setup.sync_flows_from_fs())
+        await asyncio.sleep(0.1)
+        assert watching == [first]
+
+        # The other worker takes over once the elected one stops
+        first.cancel()
+        await first
+        await asyncio.sleep(0.1)
+        assert watching == [first, second]
+        second.cancel()
+        await second
+
+
+async def test_fs_flow_paths_query_skips_flow_data(active_user):
+    from langflow.initial_setup.setup import get_fs_flow_paths
+    from langflow.services.deps import get_db_service, get_storage_service
+    from sqlalchemy import event
+
+    async with session_scope() as session:
+        flow = Flow(name=f"fs-{uuid.uuid4()}", data={"nodes": [], "edges": []}, user_id=active_user.id)
+        flow.fs_path = "flow.json"
+        session.add(flow)
+
+    statements = []
+
+    def record_statement(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = get_db_service().engine.sync_engine
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        flow_paths = await get_fs_flow_paths()
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+    expected_path = SyncPath(get_storage_service().data_dir) / "flows" / str(active_user.id) / "flow.json"
+    assert flow_paths[str(expected_path.absolute())] == flow.id
+    assert all("flow.data" not in statement for statement in statements)
+
+
 # ==================== Profile Pictures Tests ====================
 
 
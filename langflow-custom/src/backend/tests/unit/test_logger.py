@@ -9,6 +9,7 @@ This test suite covers all aspects of the logger module including:
 - The specific CRITICAL + 1 bug that was fixed
 """
 
+import asyncio
 import builtins
 import contextlib
 import json
@@ -961,6 +962,78 @@ def test_max_size(sized_log_buffer):
     assert sized_log_buffer.max_size() == 100
 
 
+def test_read_from_cursor(sized_log_buffer):
+    sized_log_buffer.max = 5
+    cursor = sized_log_buffer.cursor()
+    for i in range(3):
+        sized_log_buffer.append(1625097600000 + i, f"Log {i}")
+
+    frames, cursor = sized_log_buffer.read_from(cursor)
+    assert [json.loads(frame) for frame in frames] == [{str(1625097600000 + i): f"Log {i}"} for i in range(3)]
+    assert all(frame.endswith(b"\n\n") for frame in frames)
+
+    # Nothing new since the last read
+    assert sized_log_buffer.read_from(cursor) == ([], cursor)
+
+    sized_log_buffer.append(1625097600003, "Log 3")
+    frames, _ = sized_log_buffer.read_from(cursor)
+    assert [json.loads(frame) for frame in frames] == [{"1625097600003": "Log 3"}]
+
+
+def test_read_from_evicted_cursor_resumes_at_oldest_entry(sized_log_buffer):
+    sized_log_buffer.max = 2
+    cursor = sized_log_buffer.cursor()
+    sequences = [sized_log_buffer.append(1625097600000 + i, f"Log {i}") for i in range(5)]
+    assert sequences == list(range(5))
+
+    frames, cursor = sized_log_buffer.read_from(cursor)
+    assert [json.loads(frame) for frame in frames] == [{"1625097600003": "Log 3"}, {"1625097600004": "Log 4"}]
+    assert cursor == sized_log_buffer.cursor() == 5
+
+
+def test_buffer_compaction_keeps_sequence_numbers(sized_log_buffer):
+    sized_log_buffer.max = 10
+    for i in range(5000):
+        sized_log_buffer.append(i, f"Log {i}")
+
+    assert len(sized_log_buffer) == 10
+    assert len(sized_log_buffer._entries) < 5000
+    frames, cursor = sized_log_buffer.read_from(4995)
+    assert [json.loads(frame) for frame in frames] == [{str(i): f"Log {i}"} for i in range(4995, 5000)]
+    assert cursor == 5000
+    assert sized_log_buffer.get_before_timestamp(4992, lines=2) == {4990: "Log 4990", 4991: "Log 4991"}
+
+
+def test_write_with_decoded_record_does_not_parse_message(sized_log_buffer):
+    sized_log_buffer.max = 5
+    with patch("lfx.log.logger.orjson.loads") as mock_loads:
+        sized_log_buffer.write(b"not json", record={"event": "Test event", "timestamp": "2021-07-01T12:00:00Z"})
+
+    mock_loads.assert_not_called()
+    assert list(sized_log_buffer.get_last_n(1).values()) == ["Test event"]
+
+
+async def test_wait_for_entries_is_woken_by_writer(sized_log_buffer):
+    sized_log_buffer.max = 5
+    cursor = sized_log_buffer.cursor()
+
+    waiter = asyncio.create_task(sized_log_buffer.wait_for_entries(cursor, timeout=5))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    sized_log_buffer.append(1625097600000, "Log 0")
+    assert await asyncio.wait_for(waiter, timeout=1) is True
+
+
+async def test_wait_for_entries_times_out_without_writes(sized_log_buffer):
+    sized_log_buffer.max = 5
+    assert await sized_log_buffer.wait_for_entries(sized_log_buffer.cursor(), timeout=0.01) is False
+
+    sized_log_buffer.append(1625097600000, "Log 0")
+    # Returns immediately when there is already something to read
+    assert await sized_log_buffer.wait_for_entries(0, timeout=0) is True
+
+
 class TestBufferWriterBytesSerializationFix:
     """Test suite for the buffer_writer bytes serialization bug fix.
 
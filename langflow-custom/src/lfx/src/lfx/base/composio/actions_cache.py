@@ -0,0 +1,147 @@
+"""Cache of Composio toolkit actions shared by components and processes.
+
+Fetching the actions of a toolkit returns the JSON schema of every action, which is the same for
+every user and rarely changes. Entries are kept in memory and in a versioned directory of the user
+cache directory, so other processes and restarts reuse them until they are older than the TTL.
+
+The cached dictionaries are shared by every component reading them and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import orjson
+
+from lfx.log.logger import logger
+
+ACTIONS_CACHE_FORMAT_VERSION = 1
+DEFAULT_ACTIONS_CACHE_TTL = 24 * 3600
+
+
+class ToolkitActions(NamedTuple):
+    actions_data: dict[str, dict[str, Any]]
+    action_schemas: dict[str, Any]
+    bool_variables: frozenset[str]
+    fetched_at: float
+
+
+def _get_composio_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("composio")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _serialize_set(value: Any) -> list:
+    # Sets such as file_upload_fields are stored as lists and restored on read
+    if isinstance(value, set | frozenset):
+        return sorted(value, key=str)
+    msg = f"Type is not JSON serializable: {type(value).__name__}"
+    raise TypeError(msg)
+
+
+def _get_default_cache_dir() -> Path:
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("lfx", "langflow")) / "composio"
+
+
+class ComposioActionsCache:
+    """In-memory and on-disk cache of the parsed actions of Composio toolkits."""
+
+    def __init__(self, cache_dir: str | Path | None = None, ttl: float = DEFAULT_ACTIONS_CACHE_TTL) -> None:
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self.ttl = ttl
+        self._entries: dict[str, ToolkitActions] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache_dir(self) -> Path:
+        """Directory of the entries, versioned by the cache format and the Composio SDK version."""
+        base_dir = self._cache_dir or _get_default_cache_dir()
+        return base_dir / f"v{ACTIONS_CACHE_FORMAT_VERSION}-composio-{_get_composio_version()}"
+
+    def _path(self, toolkit_slug: str) -> Path:
+        return self.cache_dir / f"{toolkit_slug}.json"
+
+    def _is_fresh(self, entry: ToolkitActions) -> bool:
+        return time.time() - entry.fetched_at < self.ttl
+
+    def get(self, toolkit_slug: str) -> ToolkitActions | None:
+        """Return the cached actions of a toolkit, or None if they are missing or expired."""
+        with self._lock:
+            entry = self._entries.get(toolkit_slug)
+        if entry is not None and self._is_fresh(entry):
+            return entry
+
+        entry = self._read(toolkit_slug)
+        if entry is None or not self._is_fresh(entry):
+            return None
+        with self._lock:
+            self._entries[toolkit_slug] = entry
+        return entry
+
+    def set(
+        self,
+        toolkit_slug: str,
+        actions_data: dict[str, dict[str, Any]],
+        action_schemas: dict[str, Any],
+        bool_variables: set[str] | frozenset[str],
+    ) -> ToolkitActions:
+        """Store the actions of a toolkit in memory and on disk and return the shared entry."""
+        entry = ToolkitActions(actions_data, action_schemas, frozenset(bool_variables), time.time())
+        with self._lock:
+            self._entries[toolkit_slug] = entry
+        self._write(toolkit_slug, entry)
+        return entry
+
+    def clear(self) -> None:
+        """Forget the in-memory entries. Entries on disk are kept until they expire."""
+        with self._lock:
+            self._entries.clear()
+
+    def _read(self, toolkit_slug: str) -> ToolkitActions | None:
+        try:
+            payload = orjson.loads(self._path(toolkit_slug).read_bytes())
+            actions_data = {
+                key: {**data, "file_upload_fields": set(data.get("file_upload_fields", []))}
+                for key, data in payload["actions_data"].items()
+            }
+            return ToolkitActions(
+                actions_data,
+                payload["action_schemas"],
+                frozenset(payload["bool_variables"]),
+                payload["fetched_at"],
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable Composio actions cache for {toolkit_slug}: {e}")
+            return None
+
+    def _write(self, toolkit_slug: str, entry: ToolkitActions) -> None:
+        path = self._path(toolkit_slug)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {
+                "actions_data": entry.actions_data,
+                "action_schemas": entry.action_schemas,
+                "bool_variables": sorted(entry.bool_variables),
+                "fetched_at": entry.fetched_at,
+            }
+            tmp_path.write_bytes(orjson.dumps(payload, default=_serialize_set))
+            tmp_path.replace(path)
+        except (OSError, TypeError) as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.debug(f"Could not write Composio actions cache for {toolkit_slug}: {e}")
+
+
+composio_actions_cache = ComposioActionsCache()
@@ -8,6 +8,7 @@ from composio import Composio
 from composio_langchain import LangchainProvider
 from langchain_core.tools import Tool
 
+from lfx.base.composio.actions_cache import ToolkitActions, composio_actions_cache
 from lfx.base.mcp.util import create_input_schema_from_json_schema
 from lfx.custom.custom_component.component import Component
 from lfx.inputs.inputs import (
@@ -336,22 +337,9 @@ class ComposioBaseComponent(Component):
 
     _name_sanitizer = re.compile(r"[^a-zA-Z0-9_-]")
 
-    # Class-level caches
-    _actions_cache: dict[str, dict[str, Any]] = {}
-    _action_schema_cache: dict[str, dict[str, Any]] = {}
     # Track all auth field names discovered across all toolkits
     _all_auth_field_names: set[str] = set()
 
-    @classmethod
-    def get_actions_cache(cls) -> dict[str, dict[str, Any]]:
-        """Get the class-level actions cache."""
-        return cls._actions_cache
-
-    @classmethod
-    def get_action_schema_cache(cls) -> dict[str, dict[str, Any]]:
-        """Get the class-level action schema cache."""
-        return cls._action_schema_cache
-
     @classmethod
     def get_all_auth_field_names(cls) -> set[str]:
         """Get all auth field names discovered across toolkits."""
@@ -478,14 +466,11 @@ class ComposioBaseComponent(Component):
         if self._actions_data:
             return
 
-        # Try to load from the class-level cache
+        # Try to load from the shared cache
         toolkit_slug = self.app_name.lower()
-        if toolkit_slug in self.__class__.get_actions_cache():
-            # Deep-copy so that any mutation on this instance does not affect the
-            # cached master copy.
-            self._actions_data = copy.deepcopy(self.__class__.get_actions_cache()[toolkit_slug])
-            self._action_schemas = copy.deepcopy(self.__class__.get_action_schema_cache().get(toolkit_slug, {}))
-            logger.debug(f"Loaded actions for {toolkit_slug} from in-process cache")
+        if cached_actions := composio_actions_cache.get(toolkit_slug):
+            self._use_cached_actions(cached_actions)
+            logger.debug(f"Loaded actions for {toolkit_slug} from cache")
             return
 
         api_key = getattr(self, "api_key", None)
@@ -733,18 +718,31 @@ class ComposioBaseComponent(Component):
                 except ValueError as e:
                     logger.warning(f"Failed processing Composio tool for action {raw_tool}: {e}")
 
-            # Helper look-ups used elsewhere
-            self._all_fields = {f for d in self._actions_data.values() for f in d["action_fields"]}
-            self._build_action_maps()
-
-            # Cache actions for this toolkit so subsequent component instances
-            # can reuse them without hitting the Composio API again.
-            self.__class__.get_actions_cache()[toolkit_slug] = copy.deepcopy(self._actions_data)
-            self.__class__.get_action_schema_cache()[toolkit_slug] = copy.deepcopy(self._action_schemas)
+            # Cache actions for this toolkit so subsequent component instances and other
+            # processes can reuse them without hitting the Composio API again.
+            cached_actions = composio_actions_cache.set(
+                toolkit_slug,
+                self._actions_data,
+                self._to_plain_dict(self._action_schemas),
+                self._bool_variables,
+            )
+            self._use_cached_actions(cached_actions)
 
         except ValueError as e:
             logger.debug(f"Could not populate Composio actions for {self.app_name}: {e}")
 
+    def _use_cached_actions(self, cached_actions: ToolkitActions) -> None:
+        """Point this instance at the shared actions of its toolkit and build the helper look-ups.
+
+        The actions and schemas are shared with every other instance of the toolkit and are only read,
+        so they are not copied.
+        """
+        self._actions_data = cached_actions.actions_data
+        self._action_schemas = cached_actions.action_schemas
+        self._bool_variables = set(cached_actions.bool_variables)
+        self._all_fields = {f for d in self._actions_data.values() for f in d["action_fields"]}
+        self._build_action_maps()
+
     def _validate_schema_inputs(self, action_key: str) -> list[InputTypes]:
         """Convert the JSON schema for *action_key* into Langflow input objects."""
         # Skip validation for default/placeholder values
@@ -770,6 +768,10 @@ class ComposioBaseComponent(Component):
                 )
                 return []
 
+            # The schema is shared through the actions cache, and flattening and cleaning it below
+            # changes it in place
+            parameters_schema = copy.deepcopy(parameters_schema)
+
             # Validate parameters_schema has required structure before flattening
             if not parameters_schema.get("properties") and not parameters_schema.get("$defs"):
                 # Create a minimal valid schema to avoid errors
@@ -778,7 +780,6 @@ class ComposioBaseComponent(Component):
             # Sanitize the schema before passing to flatten_schema
             # Handle case where 'required' is explicitly None (causes "'NoneType' object is not iterable")
             if parameters_schema.get("required") is None:
-                parameters_schema = parameters_schema.copy()  # Don't modify the original
                 parameters_schema["required"] = []
 
             # Also get top-level required fields from original schema
@@ -1526,7 +1527,7 @@ class ComposioBaseComponent(Component):
         # Check if we need to populate actions - but also check cache availability
         actions_available = bool(self._actions_data)
         toolkit_slug = getattr(self, "app_name", "").lower()
-        cached_actions_available = toolkit_slug in self.__class__.get_actions_cache()
+        cached_actions_available = composio_actions_cache.get(toolkit_slug) is not None
 
         should_populate = False
 
@@ -0,0 +1,190 @@
+"""Process-wide pool running Docling conversions, with a cache of converted documents.
+
+Every Docling component used to start its own worker thread, so concurrent flows loaded the models
+and converted documents all at once until the machine ran out of memory. Conversions now go through a
+single bounded pool: at most ``docling_max_workers`` run at once, at most ``docling_max_queued_jobs``
+wait for a worker and further conversions are rejected instead of piling up.
+
+Workers are threads by default, so the converters cached by ``docling_worker`` are shared by every
+job. Setting ``docling_use_processes`` runs them in worker processes instead, each one keeping its own
+converters, which isolates the conversions from the server at the cost of loading the models once per
+process.
+
+Converted documents are cached by the content of the file and the options of the pipeline, so the
+same file is only converted once. Cached documents are shared between runs and must not be mutated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+from cachetools import LRUCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+DEFAULT_MAX_WORKERS = 1
+DEFAULT_MAX_QUEUED_JOBS = 8
+DEFAULT_CONVERSION_TIMEOUT = 300
+DEFAULT_RESULT_CACHE_SIZE = 32
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+CacheKey = tuple[Any, ...]
+
+
+def _get_setting(name: str, default: Any) -> Any:
+    from lfx.services.deps import get_settings_service
+
+    settings_service = get_settings_service()
+    if settings_service is None:
+        return default
+    return getattr(settings_service.settings, name, default)
+
+
+def run_docling_job(*, cancel_event: Any = None, **kwargs: Any) -> Any:
+    """Run ``docling_worker`` and return what it reported: a list of results or an error dict."""
+    from lfx.base.data.docling_utils import docling_worker
+
+    result_queue: queue.Queue = queue.Queue()
+    # The worker exits when it is cancelled, after reporting it
+    with suppress(SystemExit):
+        docling_worker(queue=result_queue, cancel_event=cancel_event, **kwargs)
+    try:
+        return result_queue.get_nowait()
+    except queue.Empty:
+        return {"error": "Docling worker finished without producing a result."}
+
+
+class DoclingJob:
+    """A conversion submitted to the pool."""
+
+    def __init__(self, future: Future, cancel_event: Any) -> None:
+        self.future = future
+        self.cancel_event = cancel_event
+
+    def result(self, timeout: float | None = None) -> Any:
+        return self.future.result(timeout=timeout)
+
+    def cancel(self) -> None:
+        """Drop the job if it is still waiting, or ask the worker to stop at its next checkpoint."""
+        if not self.future.cancel():
+            self.cancel_event.set()
+
+
+class DoclingConversionPool:
+    """Bounded executor running Docling conversions, with an LRU cache of the converted documents."""
+
+    def __init__(self, cache_size: int | None = None) -> None:
+        self._cache_size = cache_size
+        self._results: LRUCache[CacheKey, Any] | None = None
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | ProcessPoolExecutor | None = None
+        self._manager: Any = None
+        self._max_jobs = 0
+        self._jobs = 0
+
+    @property
+    def conversion_timeout(self) -> int:
+        return _get_setting("docling_conversion_timeout", DEFAULT_CONVERSION_TIMEOUT)
+
+    @staticmethod
+    def cache_key(
+        file_path: str | Path,
+        *,
+        pipeline: str,
+        ocr_engine: str,
+        do_picture_classification: bool,
+        pic_desc_config: dict | None,
+        pic_desc_prompt: str,
+    ) -> CacheKey:
+        """Return the key of a file converted with the given options, hashing the content of the file."""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as file:  # noqa: PTH123
+            while chunk := file.read(_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        pic_desc_hash = None
+        if pic_desc_config:
+            pic_desc = json.dumps(pic_desc_config, sort_keys=True, default=str) + pic_desc_prompt
+            pic_desc_hash = hashlib.sha256(pic_desc.encode()).hexdigest()
+        return (digest.hexdigest(), pipeline, ocr_engine, do_picture_classification, pic_desc_hash)
+
+    def _get_results(self) -> LRUCache[CacheKey, Any]:
+        if self._results is None:
+            maxsize = self._cache_size
+            if maxsize is None:
+                maxsize = _get_setting("docling_result_cache_size", DEFAULT_RESULT_CACHE_SIZE)
+            self._results = LRUCache(maxsize=max(1, maxsize))
+        return self._results
+
+    def get_cached(self, key: CacheKey) -> Any | None:
+        """Return the cached document of a file, or None."""
+        with self._lock:
+            return self._get_results().get(key)
+
+    def cache_result(self, key: CacheKey, document: Any) -> None:
+        with self._lock:
+            self._get_results()[key] = document
+
+    def _get_executor(self) -> ThreadPoolExecutor | ProcessPoolExecutor:
+        if self._executor is None:
+            max_workers = max(1, _get_setting("docling_max_workers", DEFAULT_MAX_WORKERS))
+            max_queued_jobs = max(0, _get_setting("docling_max_queued_jobs", DEFAULT_MAX_QUEUED_JOBS))
+            self._max_jobs = max_workers + max_queued_jobs
+            if _get_setting("docling_use_processes", False):  # noqa: FBT003
+                self._executor = ProcessPoolExecutor(max_workers=max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="docling")
+        return self._executor
+
+    def _new_cancel_event(self) -> Any:
+        if isinstance(self._executor, ProcessPoolExecutor):
+            if self._manager is None:
+                import multiprocessing
+
+                self._manager = multiprocessing.Manager()
+            return self._manager.Event()
+        return threading.Event()
+
+    def _job_done(self, _future: Future) -> None:
+        with self._lock:
+            self._jobs -= 1
+
+    def submit(self, file_paths: list[str], **options: Any) -> DoclingJob:
+        """Queue the conversion of ``file_paths``.
+
+        Raises:
+            RuntimeError: If the pool already holds as many jobs as it can queue.
+        """
+        with self._lock:
+            executor = self._get_executor()
+            if self._jobs >= self._max_jobs:
+                msg = (
+                    f"Too many Docling conversions in progress ({self._jobs}). "
+                    "Try again later or increase LANGFLOW_DOCLING_MAX_QUEUED_JOBS."
+                )
+                raise RuntimeError(msg)
+            cancel_event = self._new_cancel_event()
+            future = executor.submit(run_docling_job, file_paths=file_paths, cancel_event=cancel_event, **options)
+            self._jobs += 1
+        future.add_done_callback(self._job_done)
+        return DoclingJob(future, cancel_event)
+
+    def shutdown(self) -> None:
+        """Stop the workers, cancelling the jobs still waiting, and forget the cached documents."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            manager, self._manager = self._manager, None
+            self._results = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if manager is not None:
+            manager.shutdown()
+
+
+docling_conversion_pool = DoclingConversionPool()
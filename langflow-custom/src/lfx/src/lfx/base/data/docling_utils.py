@@ -233,12 +233,13 @@ def docling_worker(
     do_picture_classification: bool,
     pic_desc_config: dict | None,
     pic_desc_prompt: str,
+    cancel_event=None,
 ):
     """Worker function for processing files with Docling using threading.
 
     This function now uses a globally cached DocumentConverter instance,
     significantly reducing processing time on subsequent runs from 15-20 minutes
-    to just seconds.
+    to just seconds. Setting ``cancel_event`` stops the worker at its next shutdown check.
     """
     # Signal handling for graceful shutdown
     shutdown_requested = False
@@ -261,7 +262,7 @@ def docling_worker(
 
     def check_shutdown() -> None:
         """Check if shutdown was requested and exit if so."""
-        if shutdown_requested:
+        if shutdown_requested or (cancel_event is not None and cancel_event.is_set()):
             logger.info("Shutdown requested, exiting worker...")
 
             with suppress(Exception):
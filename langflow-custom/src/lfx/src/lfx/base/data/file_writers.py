@@ -0,0 +1,146 @@
+"""Atomic and append-friendly file writers for components saving data to local files.
+
+Full writes go to a temporary file next to the target that is moved over it once complete, so a
+crash mid-write leaves the previous file intact. Appends only write the new records: JSON Lines
+files are opened in append mode, and JSON arrays are extended by rewriting their closing bracket
+instead of parsing and rewriting the whole file.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+from contextlib import contextmanager, suppress
+from typing import IO, TYPE_CHECKING, Any
+from uuid import uuid4
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+_TAIL_BLOCK_SIZE = 4096
+_WHITESPACE = b" \t\r\n"
+
+
+@contextmanager
+def atomic_write(path: Path, mode: str = "w", encoding: str | None = "utf-8") -> Iterator[IO[Any]]:
+    """Open a temporary file next to ``path``, moved over ``path`` once the block completes.
+
+    Args:
+        path: The file to write.
+        mode: ``"w"`` for text or ``"wb"`` for binary content.
+        encoding: Encoding of text content.
+    """
+    temp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        with temp_path.open(mode.replace("w", "x"), encoding=None if "b" in mode else encoding) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        temp_path.replace(path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            temp_path.unlink()
+        raise
+
+
+def json_array_items(array: str) -> str:
+    """Return the items of a JSON array serialized with ``indent=2``, without the enclosing brackets."""
+    return array.strip()[1:-1].strip("\n")
+
+
+def write_json_array(file: IO[str], chunks: Iterable[str], *, leading_comma: bool = False) -> None:
+    """Write chunks of array items, as returned by ``json_array_items``, followed by the closing bracket."""
+    separator = ",\n" if leading_comma else "\n"
+    for chunk in chunks:
+        if chunk:
+            file.write(separator + chunk)
+            separator = ",\n"
+    file.write("\n]" if separator == ",\n" else "]")
+
+
+def _find_array_end(file: IO[bytes]) -> tuple[int, bool] | None:
+    """Return where the content of the JSON array ending ``file`` stops and whether the array has items.
+
+    The offset is right after the last item, or after the opening bracket of an empty array. Only the
+    end of the file is read. Returns None when the file does not end with an array.
+    """
+    position = file.seek(0, os.SEEK_END)
+    closing = False
+    while position > 0:
+        start = max(0, position - _TAIL_BLOCK_SIZE)
+        file.seek(start)
+        block = file.read(position - start)
+        for index in range(len(block) - 1, -1, -1):
+            byte = block[index : index + 1]
+            if byte in _WHITESPACE:
+                continue
+            if not closing:
+                if byte != b"]":
+                    return None
+                closing = True
+                continue
+            return start + index + 1, byte != b"["
+        position = start
+    return None
+
+
+def append_json_array(path: Path, chunks: Iterable[str]) -> bool:
+    """Append items to the JSON array stored in ``path``, rewriting only its closing bracket.
+
+    Returns:
+        False, leaving the file untouched, if it does not end with a JSON array.
+    """
+    with path.open("r+b") as binary_file:
+        array_end = _find_array_end(binary_file)
+        if array_end is None:
+            return False
+        offset, has_items = array_end
+        # The new items overwrite the closing bracket, then whatever followed it is cut
+        binary_file.seek(offset)
+        file = io.TextIOWrapper(binary_file, encoding="utf-8")
+        write_json_array(file, chunks, leading_comma=has_items)
+        file.flush()
+        file.detach()
+        binary_file.truncate()
+    return True
+
+
+def write_json_records(path: Path, chunks: Iterable[str], *, append: bool = False) -> None:
+    """Write a JSON array from chunks of items, appending them to the array already in ``path`` if asked.
+
+    A file holding a single JSON object, or content that cannot be extended in place, is read and
+    rewritten as an array. Content that is not valid JSON is replaced.
+    """
+    if append and path.exists() and path.stat().st_size:
+        if append_json_array(path, chunks):
+            return
+        try:
+            existing = json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            existing = []
+        if not isinstance(existing, list):
+            existing = [existing]
+        chunks = [json_array_items(json.dumps(existing, indent=2)), *chunks]
+
+    with atomic_write(path) as file:
+        file.write("[")
+        write_json_array(file, chunks)
+
+
+def append_lines(path: Path, lines: Iterable[str]) -> None:
+    """Append lines to a JSON Lines file, starting on a new line if the file does not end with one."""
+    with path.open("a+b") as binary_file:
+        if binary_file.seek(0, os.SEEK_END):
+            binary_file.seek(-1, os.SEEK_END)
+            needs_newline = binary_file.read(1) != b"\n"
+        else:
+            needs_newline = False
+        file = io.TextIOWrapper(binary_file, encoding="utf-8")
+        if needs_newline:
+            file.write("\n")
+        for line in lines:
+            file.write(line if line.endswith("\n") else line + "\n")
+        file.flush()
+        file.detach()
@@ -0,0 +1,179 @@
+"""Process-wide pool of SQLAlchemy engines, and a bounded, interruptible query runner.
+
+Creating an engine opens a new connection pool, and wrapping it in a ``SQLDatabase`` reflects the
+table names of the database, so both are kept per database URL and shared by every component. The
+least recently used engines are disposed once more than ``DEFAULT_ENGINE_CACHE_SIZE`` databases are in
+use.
+
+Queries stream their rows a chunk at a time up to a row limit, so a large SELECT does not load the
+whole result in memory, and are interrupted through the DBAPI connection when they run longer than
+their timeout.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+from cachetools import LRUCache
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import NullPool, StaticPool
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from langchain_community.utilities import SQLDatabase
+    from sqlalchemy.engine import Engine
+
+DEFAULT_ENGINE_CACHE_SIZE = 16
+DEFAULT_FETCH_CHUNK_SIZE = 1000
+
+
+class _EngineLRUCache(LRUCache):
+    def popitem(self):
+        key, (engine, _database) = super().popitem()
+        engine.dispose()
+        return key, (engine, _database)
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    return url.startswith("sqlite") and (url.rstrip("/") in {"sqlite:", "sqlite+pysqlite:"} or ":memory:" in url)
+
+
+class SQLEnginePool:
+    """Engines and ``SQLDatabase`` wrappers keyed by database URL."""
+
+    def __init__(self, maxsize: int = DEFAULT_ENGINE_CACHE_SIZE) -> None:
+        self._entries: _EngineLRUCache = _EngineLRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def _get_entry(self, url: str) -> list[Any]:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                if _is_memory_sqlite(url):
+                    # Queries run in worker threads, which must all see the same in-memory database
+                    engine = create_engine(url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+                elif url.startswith("sqlite"):
+                    # Opening a SQLite file is cheap, and pooled connections would keep using a file
+                    # that was deleted or replaced
+                    engine = create_engine(url, poolclass=NullPool)
+                else:
+                    engine = create_engine(url, pool_pre_ping=True)
+                entry = [engine, None]
+                self._entries[url] = entry
+            return entry
+
+    def get_engine(self, url: str) -> Engine:
+        return self._get_entry(url)[0]
+
+    def get_database(self, url: str) -> SQLDatabase:
+        """Return the ``SQLDatabase`` of the pooled engine of ``url``, reflecting it on first use."""
+        from langchain_community.utilities import SQLDatabase
+
+        entry = self._get_entry(url)
+        if entry[1] is None:
+            entry[1] = SQLDatabase(entry[0])
+        return entry[1]
+
+    def dispose(self, url: str) -> None:
+        """Close the connections of ``url`` and forget its engine."""
+        with self._lock:
+            entry = self._entries.pop(url, None)
+        if entry is not None:
+            entry[0].dispose()
+
+    def clear(self) -> None:
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for engine, _database in entries:
+            engine.dispose()
+
+
+def _interrupt(dbapi_connection: Any) -> None:
+    """Abort the statement running on a DBAPI connection, if the driver supports it."""
+    for method in ("interrupt", "cancel"):
+        # sqlite3 connections have interrupt(), psycopg connections have cancel()
+        abort = getattr(dbapi_connection, method, None)
+        if callable(abort):
+            try:
+                abort()
+            except Exception as e:  # noqa: BLE001
+                logger.debug(f"Could not interrupt the SQL query: {e}")
+            return
+    logger.warning("The database driver cannot interrupt queries, the query timeout is not enforced.")
+
+
+def run_query(
+    engine: Engine,
+    query: str,
+    *,
+    max_rows: int = 0,
+    timeout: float = 0,
+    chunk_size: int = DEFAULT_FETCH_CHUNK_SIZE,
+) -> tuple[pd.DataFrame, bool]:
+    """Run ``query`` and return its rows, fetched ``chunk_size`` at a time.
+
+    Args:
+        engine: The engine to run the query on.
+        query: The SQL statement.
+        max_rows: Maximum number of rows to fetch, 0 for no limit.
+        timeout: Seconds after which the query is interrupted, 0 for no timeout.
+        chunk_size: Number of rows fetched from the cursor at once.
+
+    Returns:
+        The rows, and whether more rows were left unread because of ``max_rows``.
+
+    Raises:
+        TimeoutError: If the query was interrupted after ``timeout`` seconds.
+    """
+    with engine.begin() as connection:
+        timer = None
+        timed_out = threading.Event()
+        if timeout > 0:
+            dbapi_connection = connection.connection.dbapi_connection
+
+            def on_timeout() -> None:
+                timed_out.set()
+                _interrupt(dbapi_connection)
+
+            timer = threading.Timer(timeout, on_timeout)
+            timer.daemon = True
+            timer.start()
+        try:
+            result = connection.execution_options(stream_results=True, max_row_buffer=chunk_size).execute(text(query))
+            if not result.returns_rows:
+                return pd.DataFrame(), False
+            columns = list(result.keys())
+            chunks: list[pd.DataFrame] = []
+            fetched = 0
+            truncated = False
+            while True:
+                size = chunk_size if max_rows <= 0 else min(chunk_size, max_rows - fetched)
+                if size <= 0:
+                    truncated = result.fetchone() is not None
+                    break
+                rows = result.fetchmany(size)
+                if not rows:
+                    break
+                chunks.append(pd.DataFrame.from_records(rows, columns=columns))
+                fetched += len(rows)
+            result.close()
+        except SQLAlchemyError as e:
+            if timed_out.is_set():
+                msg = f"The SQL query was interrupted after {timeout} seconds."
+                raise TimeoutError(msg) from e
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+    if not chunks:
+        return pd.DataFrame(columns=columns), truncated
+    frame = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+    return frame, truncated
+
+
+sql_engine_pool = SQLEnginePool()
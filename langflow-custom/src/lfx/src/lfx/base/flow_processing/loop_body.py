@@ -0,0 +1,205 @@
+"""Run the body of a Loop component for many items concurrently.
+
+The body of a loop is every vertex reachable from its item output. Each item runs through its own
+graph holding a copy of the body, so concurrent runs share no vertex or component state. Components
+feeding the body from outside the loop are reused when they already ran, the ones that did not run
+yet are built again with each item.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import copy
+from collections import defaultdict, deque
+from typing import TYPE_CHECKING, Any
+
+from lfx.graph.graph.base import Graph
+from lfx.graph.vertex.base import VertexStates
+from lfx.interface.initialize.loading import get_params
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from lfx.custom.custom_component.component import Component
+    from lfx.graph.edge.base import CycleEdge
+    from lfx.graph.vertex.base import Vertex
+
+
+class LoopBodyGraph(Graph):
+    """Graph of a single loop item.
+
+    Components are instantiated from the classes of the flow they were copied from instead of
+    evaluating their code again for every item.
+    """
+
+    def __init__(self, component_classes: dict[str, type[Component]], **kwargs) -> None:
+        self._component_classes = component_classes
+        super().__init__(**kwargs)
+
+    def _instantiate_components_in_vertices(self) -> None:
+        for vertex in self.vertices:
+            component_class = self._component_classes.get(vertex.id)
+            if component_class is None or vertex.custom_component:
+                vertex.instantiate_component(self.user_id)
+                continue
+            custom_params = get_params(vertex.params)
+            custom_params.pop("code", None)
+            vertex.custom_component = component_class(
+                _user_id=self.user_id,
+                _parameters=custom_params,
+                _vertex=vertex,
+                _tracing_service=None,
+                _id=vertex.id,
+            )
+
+
+class LoopBody:
+    """The vertices run by a loop for each item, in the order they are built."""
+
+    def __init__(self, graph: Graph, loop_id: str, item_output: str = "item") -> None:
+        self.graph = graph
+        self.loop_id = loop_id
+        self.item_output = item_output
+
+        outgoing: dict[str, list[CycleEdge]] = defaultdict(list)
+        incoming: dict[str, list[CycleEdge]] = defaultdict(list)
+        for edge in graph.edges:
+            outgoing[edge.source_id].append(edge)
+            incoming[edge.target_id].append(edge)
+
+        self.entry_params = [
+            (edge.target_id, edge.target_param)
+            for edge in outgoing[loop_id]
+            if edge.source_handle.name == item_output and edge.target_id != loop_id
+        ]
+        body_ids: set[str] = set()
+        pending = [target_id for target_id, _ in self.entry_params]
+        while pending:
+            vertex_id = pending.pop()
+            if vertex_id == loop_id or vertex_id in body_ids:
+                continue
+            body_ids.add(vertex_id)
+            pending.extend(edge.target_id for edge in outgoing[vertex_id])
+        self.body_ids = body_ids
+
+        self.feedback_edge = next(
+            (edge for edge in incoming[loop_id] if edge.target_param == item_output and edge.source_id in body_ids),
+            None,
+        )
+
+        # Components outside the loop the body reads from
+        to_build = set(body_ids)
+        self.prebuilt_ids: set[str] = set()
+        pending = list(body_ids)
+        while pending:
+            vertex_id = pending.pop()
+            for edge in incoming[vertex_id]:
+                source_id = edge.source_id
+                if source_id == loop_id:
+                    if edge.source_handle.name != item_output:
+                        msg = (
+                            f"{graph.get_vertex(vertex_id).display_name} uses the '{edge.source_handle.name}' "
+                            "output of the Loop and cannot run once per item."
+                        )
+                        raise ValueError(msg)
+                    continue
+                if source_id in to_build or source_id in self.prebuilt_ids:
+                    continue
+                if graph.get_vertex(source_id).built:
+                    self.prebuilt_ids.add(source_id)
+                else:
+                    to_build.add(source_id)
+                    pending.append(source_id)
+
+        self.build_order = self._sort(to_build, incoming)
+        vertex_ids = to_build | self.prebuilt_ids
+        self._nodes = [graph.get_vertex(vertex_id).to_data() for vertex_id in vertex_ids]
+        self._edges = [
+            edge.to_data() for edge in graph.edges if edge.source_id in vertex_ids and edge.target_id in vertex_ids
+        ]
+        self._component_classes = {
+            vertex_id: type(vertex.custom_component)
+            for vertex_id in vertex_ids
+            if (vertex := graph.get_vertex(vertex_id)).custom_component is not None
+        }
+
+    def _sort(self, vertex_ids: set[str], incoming: dict[str, list[CycleEdge]]) -> list[str]:
+        in_degree = dict.fromkeys(vertex_ids, 0)
+        successors: dict[str, list[str]] = defaultdict(list)
+        for vertex_id in vertex_ids:
+            for source_id in {edge.source_id for edge in incoming[vertex_id]}:
+                if source_id in vertex_ids:
+                    in_degree[vertex_id] += 1
+                    successors[source_id].append(vertex_id)
+        queue = deque(sorted(vertex_id for vertex_id, degree in in_degree.items() if degree == 0))
+        order = []
+        while queue:
+            vertex_id = queue.popleft()
+            order.append(vertex_id)
+            for successor_id in successors[vertex_id]:
+                in_degree[successor_id] -= 1
+                if in_degree[successor_id] == 0:
+                    queue.append(successor_id)
+        if len(order) != len(vertex_ids):
+            msg = "The loop body contains a cycle and cannot run in parallel."
+            raise ValueError(msg)
+        return order
+
+    def _build_item_graph(self, item: Any) -> Graph:
+        graph = LoopBodyGraph(
+            self._component_classes,
+            flow_id=self.graph.flow_id,
+            flow_name=self.graph.flow_name,
+            user_id=self.graph.user_id,
+            context=dict(self.graph.context),
+        )
+        graph.session_id = self.graph.session_id
+        with contextlib.suppress(ValueError):
+            graph.set_run_id(self.graph.run_id)
+        graph.add_nodes_and_edges(copy.deepcopy(self._nodes), copy.deepcopy(self._edges))
+
+        for vertex_id in self.prebuilt_ids:
+            source: Vertex = self.graph.get_vertex(vertex_id)
+            vertex = graph.get_vertex(vertex_id)
+            vertex.built = True
+            vertex.built_object = source.built_object
+            vertex.built_result = source.built_result
+            vertex.results = source.results
+            vertex.artifacts = source.artifacts
+        for vertex_id, param in self.entry_params:
+            graph.get_vertex(vertex_id).update_raw_params({param: item}, overwrite=True)
+        return graph
+
+    async def run(self, item: Any, *, fallback_to_env_vars: bool = False) -> Any:
+        """Run the body for one item and return the value it sends back to the loop."""
+        graph = self._build_item_graph(item)
+        for vertex_id in self.build_order:
+            vertex = graph.get_vertex(vertex_id)
+            if vertex.state == VertexStates.INACTIVE or vertex_id in graph.conditionally_excluded_vertices:
+                continue
+            await vertex.build(user_id=graph.user_id, fallback_to_env_vars=fallback_to_env_vars)
+
+        if self.feedback_edge is None:
+            return None
+        vertex = graph.get_vertex(self.feedback_edge.source_id)
+        if not vertex.built or vertex.state == VertexStates.INACTIVE:
+            return None
+        return vertex.results.get(self.feedback_edge.source_handle.name)
+
+    async def map(self, items: Sequence[Any], *, max_concurrency: int, fallback_to_env_vars: bool = False) -> list:
+        """Run the body for every item, at most ``max_concurrency`` at a time, keeping the order of the items."""
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_item(item: Any) -> Any:
+            async with semaphore:
+                return await self.run(item, fallback_to_env_vars=fallback_to_env_vars)
+
+        tasks = [asyncio.create_task(run_item(item)) for item in items]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
@@ -0,0 +1,121 @@
+"""Process-wide cache of the vector stores and embedders used to search knowledge bases.
+
+Building an embedder can load a model in memory and opening a Chroma store reads the collection from
+disk, so both are kept between retrievals. Stores are keyed by the knowledge base path, the collection
+and the embedding configuration, stamped with the modification time of the embedding metadata file: a
+knowledge base deleted and created again under the same name gets a new store.
+
+Searches run in a bounded thread pool so they neither block the event loop nor pile up threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from cachetools import LRUCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+T = TypeVar("T")
+
+DEFAULT_STORE_CACHE_SIZE = 16
+DEFAULT_MAX_WORKERS = 4
+
+EmbeddingKey = tuple[Any, ...]
+
+
+def embedding_cache_key(metadata: dict[str, Any], api_key: str | None) -> EmbeddingKey:
+    """Return the key of the embedder described by the embedding metadata of a knowledge base."""
+    api_key_hash = hashlib.sha256(api_key.encode()).hexdigest() if api_key else None
+    return (
+        metadata.get("embedding_provider"),
+        metadata.get("embedding_model"),
+        metadata.get("chunk_size"),
+        api_key_hash,
+    )
+
+
+class KnowledgeBaseStoreCache:
+    """LRU caches of embedders and Chroma stores, with the executor searches run in."""
+
+    def __init__(self, maxsize: int = DEFAULT_STORE_CACHE_SIZE) -> None:
+        self._embedders: LRUCache[EmbeddingKey, Any] = LRUCache(maxsize=maxsize)
+        self._stores: LRUCache[tuple[Any, ...], Any] = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        # Serializes building entries, which is slow, without holding the cache lock
+        self._build_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _get_or_build(self, cache: LRUCache, key: Any, factory: Callable[[], T]) -> T:
+        with self._lock:
+            value = cache.get(key)
+        if value is not None:
+            return value
+        with self._build_lock:
+            with self._lock:
+                value = cache.get(key)
+            if value is None:
+                value = factory()
+                with self._lock:
+                    cache[key] = value
+        return value
+
+    def get_embedder(self, key: EmbeddingKey, factory: Callable[[], T]) -> T:
+        return self._get_or_build(self._embedders, key, factory)
+
+    def get_store(
+        self,
+        kb_path: Path,
+        collection_name: str,
+        embedding_key: EmbeddingKey,
+        factory: Callable[[], T],
+    ) -> T:
+        """Return the store of a knowledge base, opening it with ``factory`` on a miss."""
+        metadata_file = kb_path / "embedding_metadata.json"
+        try:
+            version = metadata_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            version = None
+        key = (str(kb_path), collection_name, version, embedding_key)
+        return self._get_or_build(self._stores, key, factory)
+
+    def evict(self, kb_path: Path) -> None:
+        """Forget the stores of a knowledge base, e.g. after a search failed on a stale store."""
+        with self._lock:
+            for key in [key for key in self._stores if key[0] == str(kb_path)]:
+                del self._stores[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._embedders.clear()
+            self._stores.clear()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                from lfx.services.deps import get_settings_service
+
+                settings_service = get_settings_service()
+                max_workers = (
+                    getattr(settings_service.settings, "knowledge_retrieval_max_workers", DEFAULT_MAX_WORKERS)
+                    if settings_service is not None
+                    else DEFAULT_MAX_WORKERS
+                )
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, max_workers), thread_name_prefix="knowledge-retrieval"
+                )
+            return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking store operation in the bounded executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), func, *args)
+
+
+knowledge_base_store_cache = KnowledgeBaseStoreCache()
@@ -16,7 +16,7 @@ import httpx
 from anyio import ClosedResourceError
 from httpx import codes as httpx_codes
 from langchain_core.tools import StructuredTool
-from mcp import ClientSession
+from mcp import ClientSession, types
 from mcp.shared.exceptions import McpError
 from pydantic import BaseModel
 
@@ -63,6 +63,22 @@ def get_session_cleanup_interval() -> int:
     return _get_mcp_setting("mcp_session_cleanup_interval")
 
 
+def get_session_probe_idle_threshold() -> int:
+    """Get how long a session can go without a successful call before it is probed on reuse."""
+    return _get_mcp_setting("mcp_session_probe_idle_threshold", 60)
+
+
+def get_tool_list_cache_ttl() -> int:
+    """Get how long the tools of a server that does not notify tool list changes are cached."""
+    return _get_mcp_setting("mcp_tool_list_cache_ttl", 5)
+
+
+def _notifies_tool_list_changes(session: ClientSession) -> bool:
+    """Whether the server told the session at initialization that it notifies tool list changes."""
+    capabilities = session.get_server_capabilities()
+    return bool(capabilities and capabilities.tools and capabilities.tools.listChanged)
+
+
 # RFC 7230 compliant header name pattern: token = 1*tchar
 # tchar = "!" / "#" / "$" / "%" / "&" / "'" / "*" / "+" / "-" / "." /
 #         "^" / "_" / "`" / "|" / "~" / DIGIT / ALPHA
@@ -465,6 +481,9 @@ class MCPSessionManager:
     3. Idle timeout for automatic session cleanup
     4. Periodic cleanup of stale sessions
     5. Transport preference caching to avoid retrying failed transports
+    6. Passive liveness tracking, so only sessions idle for a while are probed on reuse
+    7. Tool lists cached per server until the server notifies that they changed, or for a few
+       seconds for servers that do not advertise these notifications
     """
 
     def __init__(self):
@@ -478,6 +497,13 @@ class MCPSessionManager:
         # Cache which transport works for each server to avoid retrying failed transports
         # server_key -> "streamable_http" | "sse"
         self._transport_preference: dict[str, str] = {}
+        # Tools of each server, shared by its sessions until notifications/tools/list_changed
+        # server_key -> (list of mcp.types.Tool, expiry time or None for servers sending the notification)
+        self._tool_lists: dict[str, tuple[list[types.Tool], float | None]] = {}
+        # Bumped on every invalidation so a listing that raced with a change is not cached
+        self._tool_list_versions: dict[str, int] = {}
+        # server_key -> counters of created and reused sessions, probes and tool list cache hits
+        self._server_metrics: dict[str, dict[str, int]] = {}
         self._cleanup_task = None
         self._start_cleanup_task()
 
@@ -547,12 +573,103 @@ class MCPSessionManager:
         # Fallback to a generic key
         return f"{transport_type}_{hash(str(connection_params))}"
 
+    def _record_metric(self, server_key: str, name: str) -> None:
+        counters = self._server_metrics.setdefault(server_key, {})
+        counters[name] = counters.get(name, 0) + 1
+
+    def get_metrics(self) -> dict[str, dict[str, float]]:
+        """Return the counters of each server with the share of session requests served by a reused session."""
+        metrics: dict[str, dict[str, float]] = {}
+        for server_key, counters in self._server_metrics.items():
+            created = counters.get("sessions_created", 0)
+            reused = counters.get("sessions_reused", 0)
+            metrics[server_key] = {**counters, "reuse_rate": reused / (created + reused) if created + reused else 0.0}
+        return metrics
+
+    def _get_session_info(self, server_key: str, session_id: str) -> dict | None:
+        return self.sessions_by_server.get(server_key, {}).get("sessions", {}).get(session_id)
+
+    def record_success(self, context_id: str) -> None:
+        """Mark the session used by *context_id* as alive after a successful call."""
+        mapping = self._context_to_session.get(context_id)
+        if not mapping:
+            return
+        session_info = self._get_session_info(*mapping)
+        if session_info is not None:
+            session_info["last_success"] = asyncio.get_event_loop().time()
+
+    def invalidate_tool_list(self, server_key: str) -> None:
+        """Forget the cached tools of a server."""
+        self._tool_lists.pop(server_key, None)
+        self._tool_list_versions[server_key] = self._tool_list_versions.get(server_key, 0) + 1
+
+    async def list_tools(self, context_id: str, session: ClientSession) -> list[types.Tool]:
+        """Return the tools of the server behind the session of *context_id*, listing them only once per server.
+
+        Servers that advertise the ``tools.listChanged`` capability keep their tools cached until they
+        notify a change. The tools of other servers are cached for ``mcp_tool_list_cache_ttl`` seconds.
+        """
+        mapping = self._context_to_session.get(context_id)
+        if not mapping:
+            return (await session.list_tools()).tools
+
+        server_key = mapping[0]
+        cached = self._tool_lists.get(server_key)
+        if cached is not None:
+            tools, expires_at = cached
+            if expires_at is None or asyncio.get_event_loop().time() < expires_at:
+                self._record_metric(server_key, "tool_list_hits")
+                return list(tools)
+            del self._tool_lists[server_key]
+
+        self._record_metric(server_key, "tool_list_misses")
+        version = self._tool_list_versions.get(server_key, 0)
+        tools = (await session.list_tools()).tools
+        self.record_success(context_id)
+        expires_at = None
+        if not _notifies_tool_list_changes(session):
+            ttl = get_tool_list_cache_ttl()
+            if ttl <= 0:
+                return list(tools)
+            expires_at = asyncio.get_event_loop().time() + ttl
+        # Keep the list only if no change was notified while listing and the server still has a session
+        # to receive the next notification on
+        if self._tool_list_versions.get(server_key, 0) == version and self._get_session_info(*mapping) is not None:
+            self._tool_lists[server_key] = (tools, expires_at)
+        return list(tools)
+
+    def _make_message_handler(self, server_key: str, session_id: str):
+        """Return the handler of the messages a session receives outside of its requests."""
+
+        async def message_handler(message) -> None:
+            if isinstance(message, Exception):
+                # The transport failed to read a message. The session is probed before its next reuse.
+                await logger.adebug(f"Transport error on session {session_id}: {message}")
+                self._record_metric(server_key, "transport_errors")
+                session_info = self._get_session_info(server_key, session_id)
+                if session_info is not None:
+                    session_info["last_success"] = None
+            elif isinstance(message, types.ServerNotification) and isinstance(
+                message.root, types.ToolListChangedNotification
+            ):
+                await logger.adebug(f"Tools of server {server_key} changed, invalidating the cached tool list")
+                self._record_metric(server_key, "tool_list_invalidations")
+                self.invalidate_tool_list(server_key)
+
+        return message_handler
+
     async def _validate_session_connectivity(self, session) -> bool:
-        """Validate that the session is actually usable by testing a simple operation."""
+        """Validate that the session is actually usable with a ping, which servers answer without doing any work."""
         try:
-            # Try to list tools as a connectivity test (this is a lightweight operation)
-            # Use a shorter timeout for the connectivity test to fail fast
-            response = await asyncio.wait_for(session.list_tools(), timeout=3.0)
+            # Use a short timeout for the connectivity test to fail fast
+            await asyncio.wait_for(session.send_ping(), timeout=3.0)
+        except McpError as e:
+            if e.error.code == types.CONNECTION_CLOSED:
+                await logger.adebug(f"Session connectivity test failed (connection closed): {e}")
+                return False
+            # Any error response still proves that the server is reachable
+            await logger.adebug(f"Session connectivity test passed with an error response: {e}")
+            return True
         except (asyncio.TimeoutError, ConnectionError, OSError, ValueError) as e:
             await logger.adebug(f"Session connectivity test failed (standard error): {e}")
             return False
@@ -573,22 +690,8 @@ class MCPSessionManager:
             await logger.awarning(f"Unexpected error in connectivity test: {e}")
             raise
         else:
-            # Validate that we got a meaningful response
-            if response is None:
-                await logger.adebug("Session connectivity test failed: received None response")
-                return False
-            try:
-                # Check if we can access the tools list (even if empty)
-                tools = getattr(response, "tools", None)
-                if tools is None:
-                    await logger.adebug("Session connectivity test failed: no tools attribute in response")
-                    return False
-            except (AttributeError, TypeError) as e:
-                await logger.adebug(f"Session connectivity test failed while validating response: {e}")
-                return False
-            else:
-                await logger.adebug(f"Session connectivity test passed: found {len(tools)} tools")
-                return True
+            await logger.adebug("Session connectivity test passed")
+            return True
 
     async def get_session(self, context_id: str, connection_params, transport_type: str):
         """Get or create a session with improved reuse strategy.
@@ -612,25 +715,35 @@ class MCPSessionManager:
             task = session_info["task"]
 
             # Check if session is still alive
-            if not task.done():
-                # Update last used time
-                session_info["last_used"] = asyncio.get_event_loop().time()
-
-                # Quick health check
-                if await self._validate_session_connectivity(session):
-                    await logger.adebug(f"Reusing existing session {session_id} for server {server_key}")
-                    # record mapping & bump ref-count for backwards compatibility
-                    self._context_to_session[context_id] = (server_key, session_id)
-                    self._session_refcount[(server_key, session_id)] = (
-                        self._session_refcount.get((server_key, session_id), 0) + 1
-                    )
-                    return session
-                await logger.ainfo(f"Session {session_id} for server {server_key} failed health check, cleaning up")
-                await self._cleanup_session_by_id(server_key, session_id)
-            else:
-                # Task is done, clean up
+            if task.done():
                 await logger.ainfo(f"Session {session_id} for server {server_key} task is done, cleaning up")
                 await self._cleanup_session_by_id(server_key, session_id)
+                continue
+
+            # Update last used time
+            now = asyncio.get_event_loop().time()
+            session_info["last_used"] = now
+
+            # A session that answered recently is alive, only idle sessions and sessions
+            # with transport errors are probed
+            last_success = session_info.get("last_success")
+            if last_success is None or now - last_success >= get_session_probe_idle_threshold():
+                self._record_metric(server_key, "probes")
+                if not await self._validate_session_connectivity(session):
+                    self._record_metric(server_key, "probe_failures")
+                    await logger.ainfo(f"Session {session_id} for server {server_key} failed health check, cleaning up")
+                    await self._cleanup_session_by_id(server_key, session_id)
+                    continue
+                session_info["last_success"] = asyncio.get_event_loop().time()
+
+            await logger.adebug(f"Reusing existing session {session_id} for server {server_key}")
+            self._record_metric(server_key, "sessions_reused")
+            # record mapping & bump ref-count for backwards compatibility
+            self._context_to_session[context_id] = (server_key, session_id)
+            self._session_refcount[(server_key, session_id)] = (
+                self._session_refcount.get((server_key, session_id), 0) + 1
+            )
+            return session
 
         # Check if we've reached the maximum number of sessions for this server
         if len(sessions) >= get_max_sessions_per_server():
@@ -645,14 +758,17 @@ class MCPSessionManager:
         session_id = f"{server_key}_{len(sessions)}"
         await logger.ainfo(f"Creating new session {session_id} for server {server_key}")
 
+        message_handler = self._make_message_handler(server_key, session_id)
         if transport_type == "stdio":
-            session, task = await self._create_stdio_session(session_id, connection_params)
+            session, task = await self._create_stdio_session(
+                session_id, connection_params, message_handler=message_handler
+            )
             actual_transport = "stdio"
         elif transport_type == "streamable_http":
             # Pass the cached transport preference if available
             preferred_transport = self._transport_preference.get(server_key)
             session, task, actual_transport = await self._create_streamable_http_session(
-                session_id, connection_params, preferred_transport
+                session_id, connection_params, preferred_transport, message_handler=message_handler
             )
             # Cache the transport that worked for future connections
             self._transport_preference[server_key] = actual_transport
@@ -661,12 +777,16 @@ class MCPSessionManager:
             raise ValueError(msg)
 
         # Store session info with the actual transport used
+        now = asyncio.get_event_loop().time()
         sessions[session_id] = {
             "session": session,
             "task": task,
             "type": actual_transport,
-            "last_used": asyncio.get_event_loop().time(),
+            "last_used": now,
+            # The session has just been initialized
+            "last_success": now,
         }
+        self._record_metric(server_key, "sessions_created")
 
         # register mapping & initial ref-count for the new session
         self._context_to_session[context_id] = (server_key, session_id)
@@ -674,7 +794,7 @@ class MCPSessionManager:
 
         return session
 
-    async def _create_stdio_session(self, session_id: str, connection_params):
+    async def _create_stdio_session(self, session_id: str, connection_params, message_handler=None):
         """Create a new stdio session as a background task to avoid context issues."""
         import asyncio
 
@@ -687,7 +807,7 @@ class MCPSessionManager:
             """Background task that keeps the session alive."""
             try:
                 async with stdio_client(connection_params) as (read, write):
-                    session = ClientSession(read, write)
+                    session = ClientSession(read, write, message_handler=message_handler)
                     async with session:
                         await session.initialize()
                         # Signal that session is ready
@@ -729,7 +849,7 @@ class MCPSessionManager:
         return session, task
 
     async def _create_streamable_http_session(
-        self, session_id: str, connection_params, preferred_transport: str | None = None
+        self, session_id: str, connection_params, preferred_transport: str | None = None, message_handler=None
     ):
         """Create a new Streamable HTTP session with SSE fallback as a background task to avoid context issues.
 
@@ -737,6 +857,7 @@ class MCPSessionManager:
             session_id: Unique identifier for this session
             connection_params: Connection parameters including URL, headers, timeouts, verify_ssl
             preferred_transport: If set to "sse", skip Streamable HTTP and go directly to SSE
+            message_handler: Handler of the notifications and transport errors received by the session
 
         Returns:
             tuple: (session, task, transport_used) where transport_used is "streamable_http" or "sse"
@@ -780,7 +901,7 @@ class MCPSessionManager:
                         timeout=connection_params["timeout_seconds"],
                         httpx_client_factory=custom_httpx_factory,
                     ) as (read, write, _):
-                        session = ClientSession(read, write)
+                        session = ClientSession(read, write, message_handler=message_handler)
                         async with session:
                             # Initialize with a timeout to fail fast
                             await asyncio.wait_for(session.initialize(), timeout=2.0)
@@ -821,7 +942,7 @@ class MCPSessionManager:
                         sse_read_timeout,
                         httpx_client_factory=custom_httpx_factory,
                     ) as (read, write):
-                        session = ClientSession(read, write)
+                        session = ClientSession(read, write, message_handler=message_handler)
                         async with session:
                             await session.initialize()
                             used_transport.append("sse")
@@ -952,6 +1073,9 @@ class MCPSessionManager:
         finally:
             # Remove from sessions dict
             del sessions[session_id]
+            # Tool list changes are only notified to open sessions
+            if not sessions:
+                self.invalidate_tool_list(server_key)
 
     async def cleanup_all(self):
         """Clean up all sessions."""
@@ -980,6 +1104,7 @@ class MCPSessionManager:
         # Clear compatibility maps
         self._context_to_session.clear()
         self._session_refcount.clear()
+        self._tool_lists.clear()
 
         # Clear all background tasks
         for task in list(self._background_tasks):
@@ -1062,9 +1187,9 @@ class MCPStdioClient:
 
         # Get or create a persistent session
         session = await self._get_or_create_session()
-        response = await session.list_tools()
+        tools = await self._get_session_manager().list_tools(self._session_context, session)
         self._connected = True
-        return response.tools
+        return tools
 
     async def connect_to_server(self, command_str: str, env: dict[str, str] | None = None) -> list[StructuredTool]:
         """Connect to MCP server using stdio transport (SDK style)."""
@@ -1201,6 +1326,7 @@ class MCPStdioClient:
                 raise
             else:
                 await logger.adebug(f"Tool '{tool_name}' completed successfully")
+                self._get_session_manager().record_success(self._session_context)
                 return result
 
         # This should never be reached due to the exception handling above
@@ -1311,9 +1437,9 @@ class MCPStreamableHttpClient:
 
         # Get or create a persistent session (will try Streamable HTTP, then SSE fallback)
         session = await self._get_or_create_session()
-        response = await session.list_tools()
+        tools = await self._get_session_manager().list_tools(self._session_context, session)
         self._connected = True
-        return response.tools
+        return tools
 
     async def connect_to_server(
         self,
@@ -1476,6 +1602,7 @@ class MCPStreamableHttpClient:
                 raise
             else:
                 await logger.adebug(f"Tool '{tool_name}' completed successfully")
+                self._get_session_manager().record_success(self._session_context)
                 return result
 
         # This should never be reached due to the exception handling above
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import hashlib
+import threading
+import time
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+import httpx
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
@@ -268,78 +275,182 @@ def get_api_key_for_provider(user_id: UUID | str | None, provider: str, api_key:
     return run_until_complete(_get_variable())
 
 
-def validate_model_provider_key(variable_name: str, api_key: str) -> None:
-    """Validate a model provider API key by making a minimal test call.
+# Variable names of the provider keys that are validated, mapped to their provider
+MODEL_PROVIDER_KEY_VARIABLES = {
+    "OPENAI_API_KEY": "OpenAI",
+    "ANTHROPIC_API_KEY": "Anthropic",
+    "GOOGLE_API_KEY": "Google Generative AI",
+    "WATSONX_APIKEY": "IBM WatsonX",
+    "OLLAMA_BASE_URL": "Ollama",
+}
+DEFAULT_KEY_VALIDATION_TTL = 3600
+DEFAULT_MODEL_OPTIONS_CACHE_TTL = 30
+KEY_VALIDATION_TIMEOUT = 10
+_MAX_CACHED_KEY_VALIDATIONS = 1024
+_MAX_CACHED_MODEL_OPTIONS = 1024
+
+# (provider, key fingerprint) -> (error message or None if the key is valid, expiry time)
+_key_validation_cache: dict[tuple[str, str], tuple[str | None, float]] = {}
+_key_validation_lock = threading.Lock()
+_pending_key_validations: dict[tuple[str, str], asyncio.Task[str | None]] = {}
+
+
+def _get_setting(name: str, default: Any) -> Any:
+    from lfx.services.deps import get_settings_service
+
+    settings_service = get_settings_service()
+    if settings_service is None:
+        return default
+    return getattr(settings_service.settings, name, default)
+
+
+def _key_fingerprint(api_key: str) -> str:
+    # Only a fingerprint of the key is kept in the cache
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def _get_cached_key_validation(cache_key: tuple[str, str]) -> tuple[bool, str | None]:
+    with _key_validation_lock:
+        cached = _key_validation_cache.get(cache_key)
+        if cached is None:
+            return False, None
+        error, expires_at = cached
+        if expires_at <= time.monotonic():
+            del _key_validation_cache[cache_key]
+            return False, None
+        return True, error
+
+
+def _set_cached_key_validation(cache_key: tuple[str, str], error: str | None) -> None:
+    ttl = _get_setting("model_provider_key_validation_ttl", DEFAULT_KEY_VALIDATION_TTL)
+    if ttl <= 0:
+        return
+    with _key_validation_lock:
+        _key_validation_cache.pop(cache_key, None)
+        _key_validation_cache[cache_key] = (error, time.monotonic() + ttl)
+        while len(_key_validation_cache) > _MAX_CACHED_KEY_VALIDATIONS:
+            del _key_validation_cache[next(iter(_key_validation_cache))]
+
+
+def clear_key_validation_cache() -> None:
+    """Forget the results of previous provider key validations."""
+    with _key_validation_lock:
+        _key_validation_cache.clear()
+
+
+def _build_key_validation_request(provider: str, api_key: str) -> tuple[str, dict[str, str]] | None:
+    """Return the URL and headers of a request that only succeeds with a valid key.
+
+    Listing the models of a provider is free and does not need a model name, unlike a completion.
+    """
+    if provider == "OpenAI":
+        return "https://api.openai.com/v1/models", {"Authorization": f"Bearer {api_key}"}
+    if provider == "Anthropic":
+        return "https://api.anthropic.com/v1/models", {"x-api-key": api_key, "anthropic-version": "2023-06-01"}
+    if provider == "Google Generative AI":
+        return "https://generativelanguage.googleapis.com/v1beta/models", {"x-goog-api-key": api_key}
+    if provider == "Ollama":
+        # Ollama is local, just verify the URL is accessible
+        return f"{api_key.rstrip('/')}/api/tags", {}
+    # WatsonX validation would require additional parameters (project_id, url, etc.)
+    return None
+
+
+def _key_validation_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(timeout=KEY_VALIDATION_TIMEOUT)
+
+
+async def _request_key_validation(provider: str, api_key: str) -> tuple[bool, str | None]:
+    """Call the provider and return whether the result is definitive, and the error if the key is invalid."""
+    request = _build_key_validation_request(provider, api_key)
+    if request is None:
+        return False, None
+    url, headers = request
+    try:
+        async with _key_validation_client() as client:
+            response = await client.get(url, headers=headers)
+    except httpx.HTTPError as e:
+        if provider == "Ollama":
+            return False, None
+        # We'll allow the key to be saved on network issues, but not remember the result
+        logger.debug(f"Could not validate the API key for {provider}: {e}")
+        return False, None
+
+    if response.is_success:
+        return True, None
+    if provider == "Ollama":
+        return True, "Invalid Ollama base URL"
+    if response.status_code == httpx.codes.FORBIDDEN:
+        # The key was accepted but lacks a permission, like OpenAI project keys restricted from listing models
+        return True, None
+    if response.status_code == httpx.codes.UNAUTHORIZED or (
+        # Google answers 400 with API_KEY_INVALID for unknown keys
+        response.status_code == httpx.codes.BAD_REQUEST and "api key" in response.text.lower()
+    ):
+        return True, f"Invalid API key for {provider}"
+    # For other errors (rate limits, outages, ...) we'll allow the key to be saved
+    return False, None
+
+
+async def _validate_and_cache_key(provider: str, api_key: str, cache_key: tuple[str, str]) -> str | None:
+    definitive, error = await _request_key_validation(provider, api_key)
+    if definitive:
+        _set_cached_key_validation(cache_key, error)
+    return error
+
+
+def _forget_pending_key_validation(cache_key: tuple[str, str], task: asyncio.Task[str | None]) -> None:
+    if _pending_key_validations.get(cache_key) is task:
+        del _pending_key_validations[cache_key]
+
+
+async def avalidate_model_provider_key(variable_name: str, api_key: str) -> None:
+    """Validate a model provider API key with a single non-blocking request to the provider.
+
+    Results are cached per provider and key fingerprint for ``model_provider_key_validation_ttl``
+    seconds and shared by every component and user, and concurrent validations of the same key
+    wait for a single request.
 
     Args:
         variable_name: The variable name (e.g., OPENAI_API_KEY)
         api_key: The API key to validate
 
     Raises:
-        HTTPException: If the API key is invalid
+        ValueError: If the API key is invalid
     """
-    # Map variable names to providers
-    provider_map = {
-        "OPENAI_API_KEY": "OpenAI",
-        "ANTHROPIC_API_KEY": "Anthropic",
-        "GOOGLE_API_KEY": "Google Generative AI",
-        "WATSONX_APIKEY": "IBM WatsonX",
-        "OLLAMA_BASE_URL": "Ollama",
-    }
-
-    provider = provider_map.get(variable_name)
-    if not provider:
+    provider = MODEL_PROVIDER_KEY_VARIABLES.get(variable_name)
+    if not provider or not api_key:
         return  # Not a model provider key we validate
 
-    # Get the first available model for this provider
-    try:
-        models = get_unified_models_detailed(providers=[provider])
-        if not models or not models[0].get("models"):
-            return  # No models available, skip validation
+    cache_key = (provider, _key_fingerprint(api_key))
+    found, error = _get_cached_key_validation(cache_key)
+    if not found:
+        loop = asyncio.get_running_loop()
+        task = _pending_key_validations.get(cache_key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(_validate_and_cache_key(provider, api_key, cache_key))
+            _pending_key_validations[cache_key] = task
+            task.add_done_callback(lambda done: _forget_pending_key_validation(cache_key, done))
+        # A cancelled caller must not cancel the request other callers are waiting for
+        error = await asyncio.shield(task)
 
-        first_model = models[0]["models"][0]["model_name"]
-    except Exception:  # noqa: BLE001
-        return  # Can't get models, skip validation
+    if error:
+        raise ValueError(error)
 
-    # Test the API key based on provider
-    try:
-        if provider == "OpenAI":
-            from langchain_openai import ChatOpenAI
-
-            llm = ChatOpenAI(api_key=api_key, model_name=first_model, max_tokens=1)
-            llm.invoke("test")
-        elif provider == "Anthropic":
-            from langchain_anthropic import ChatAnthropic
-
-            llm = ChatAnthropic(anthropic_api_key=api_key, model=first_model, max_tokens=1)
-            llm.invoke("test")
-        elif provider == "Google Generative AI":
-            from langchain_google_genai import ChatGoogleGenerativeAI
-
-            llm = ChatGoogleGenerativeAI(google_api_key=api_key, model=first_model, max_tokens=1)
-            llm.invoke("test")
-        elif provider == "IBM WatsonX":
-            # WatsonX validation would require additional parameters
-            # Skip for now as it needs project_id, url, etc.
-            return
-        elif provider == "Ollama":
-            # Ollama is local, just verify the URL is accessible
-            import requests
-
-            response = requests.get(f"{api_key}/api/tags", timeout=5)
-            if response.status_code != requests.codes.ok:
-                msg = "Invalid Ollama base URL"
-                raise ValueError(msg)
-    except ValueError:
-        # Re-raise ValueError (validation failed)
-        raise
-    except Exception as e:
-        error_msg = str(e)
-        if "401" in error_msg or "authentication" in error_msg.lower() or "api key" in error_msg.lower():
-            msg = f"Invalid API key for {provider}"
-            raise ValueError(msg) from e
-        # For other errors, we'll allow the key to be saved (might be network issues, etc.)
-        return
+
+def validate_model_provider_key(variable_name: str, api_key: str) -> None:
+    """Validate a model provider API key by making a minimal test call.
+
+    Synchronous wrapper of :func:`avalidate_model_provider_key`.
+
+    Args:
+        variable_name: The variable name (e.g., OPENAI_API_KEY)
+        api_key: The API key to validate
+
+    Raises:
+        ValueError: If the API key is invalid
+    """
+    run_until_complete(avalidate_model_provider_key(variable_name, api_key))
 
 
 def get_language_model_options(
@@ -969,6 +1080,76 @@ def get_llm(
         raise
 
 
+# (cache key prefix, options function, user id) -> (options, expiry time)
+_model_options_cache: dict[tuple[str, Callable, str], tuple[list[dict[str, Any]], float]] = {}
+_model_options_lock = threading.Lock()
+_model_options_fetch_locks: dict[tuple[str, Callable, str], threading.Lock] = {}
+
+
+def clear_model_options_cache(user_id: UUID | str | None = None) -> None:
+    """Forget the cached model options of a user, or of every user if ``user_id`` is None."""
+    with _model_options_lock:
+        if user_id is None:
+            _model_options_cache.clear()
+            return
+        for cache_key in [key for key in _model_options_cache if key[2] == str(user_id)]:
+            del _model_options_cache[cache_key]
+
+
+def get_cached_model_options(
+    cache_key_prefix: str,
+    get_options_func: Callable,
+    user_id: UUID | str | None,
+    *,
+    force_refresh: bool = False,
+) -> list[dict[str, Any]]:
+    """Return the model options of a user from the process-wide cache, fetching them on a miss.
+
+    Concurrent misses for the same user wait for a single fetch. Options are kept for
+    ``model_options_cache_ttl`` seconds, for at most ``_MAX_CACHED_MODEL_OPTIONS`` users and kinds of options.
+    The returned list is shared and must not be modified.
+    """
+    cache_key = (cache_key_prefix, get_options_func, str(user_id))
+    ttl = _get_setting("model_options_cache_ttl", DEFAULT_MODEL_OPTIONS_CACHE_TTL)
+
+    def lookup() -> list[dict[str, Any]] | None:
+        with _model_options_lock:
+            cached = _model_options_cache.get(cache_key)
+            if cached is None:
+                return None
+            if cached[1] <= time.monotonic():
+                del _model_options_cache[cache_key]
+                return None
+            return cached[0]
+
+    if not force_refresh and (options := lookup()) is not None:
+        return options
+
+    with _model_options_lock:
+        fetch_lock = _model_options_fetch_locks.setdefault(cache_key, threading.Lock())
+    with fetch_lock:
+        # Another caller may have fetched the options while we were waiting
+        if not force_refresh and (options := lookup()) is not None:
+            return options
+        options = get_options_func(user_id=user_id)
+        if ttl > 0:
+            _set_cached_model_options(cache_key, options, ttl)
+        return options
+
+
+def _set_cached_model_options(cache_key: tuple[str, Callable, str], options: list[dict[str, Any]], ttl: float) -> None:
+    with _model_options_lock:
+        _model_options_cache.pop(cache_key, None)
+        _model_options_cache[cache_key] = (options, time.monotonic() + ttl)
+        while len(_model_options_cache) > _MAX_CACHED_MODEL_OPTIONS:
+            del _model_options_cache[next(iter(_model_options_cache))]
+        if len(_model_options_fetch_locks) > _MAX_CACHED_MODEL_OPTIONS:
+            # Only keep the fetch locks of cached options and of fetches in progress
+            for key in [key for key, lock in _model_options_fetch_locks.items() if not lock.locked()]:
+                if key not in _model_options_cache:
+                    del _model_options_fetch_locks[key]
+
+
 def update_model_options_in_build_config(
     component: Any,
     build_config: dict,
@@ -979,15 +1160,15 @@ def update_model_options_in_build_config(
 ) -> dict:
     """Helper function to update build config with cached model options.
 
-    Uses instance-level caching to avoid expensive database calls on every field change.
-    Cache is refreshed when:
+    Options are cached process-wide per user and kind of options, so every component of a flow shares a
+    single fetch instead of querying the database on every field change. Cache is refreshed when:
     - api_key changes (may enable/disable providers)
-    - Initial load (field_name is None)
-    - Cache is empty or expired
     - Model field is being refreshed (field_name == "model")
+    - Cache is empty or older than ``model_options_cache_ttl`` seconds
+    - The user's variables change (see :func:`clear_model_options_cache`)
 
     Args:
-        component: Component instance with cache, user_id, and log attributes
+        component: Component instance with user_id and log attributes
         build_config: The build configuration dict to update
         cache_key_prefix: Prefix for the cache key (e.g., "language_model_options" or "embedding_model_options")
         get_options_func: Function to call to get model options (e.g., get_language_model_options)
@@ -997,115 +1178,84 @@ def update_model_options_in_build_config(
     Returns:
         Updated build_config dict with model options and providers set
     """
-    import time
-
-    # Cache key based on user_id
-    cache_key = f"{cache_key_prefix}_{component.user_id}"
-    cache_timestamp_key = f"{cache_key}_timestamp"
-    cache_ttl = 30  # 30 seconds TTL to catch global variable changes faster
-
-    # Check if cache is expired
-    cache_expired = False
-    if cache_timestamp_key in component.cache:
-        time_since_cache = time.time() - component.cache[cache_timestamp_key]
-        cache_expired = time_since_cache > cache_ttl
-
-    # Check if we need to refresh
-    should_refresh = (
-        field_name == "api_key"  # API key changed
-        or field_name is None  # Initial load
-        or field_name == "model"  # Model field refresh button clicked
-        or cache_key not in component.cache  # Cache miss
-        or cache_expired  # Cache expired
-    )
-
-    if should_refresh:
-        # Fetch options based on user's enabled models
-        try:
-            options = get_options_func(user_id=component.user_id)
-            # Cache the results with timestamp
-            component.cache[cache_key] = {"options": options}
-            component.cache[cache_timestamp_key] = time.time()
-        except KeyError as exc:
-            # If we can't get user-specific options, fall back to empty
-            component.log("Failed to fetch user-specific model options: %s", exc)
-            component.cache[cache_key] = {"options": []}
-            component.cache[cache_timestamp_key] = time.time()
-
-    # Use cached results
-    cached = component.cache.get(cache_key, {"options": []})
-    build_config["model"]["options"] = cached["options"]
+    force_refresh = field_name in {"api_key", "model"}
+    try:
+        # The cached options are shared by every component of the user, so the build config gets its own copy
+        options = copy.deepcopy(
+            get_cached_model_options(cache_key_prefix, get_options_func, component.user_id, force_refresh=force_refresh)
+        )
+    except KeyError as exc:
+        # If we can't get user-specific options, fall back to empty
+        component.log("Failed to fetch user-specific model options: %s", exc)
+        options = []
+    build_config["model"]["options"] = options
 
     # Set default value on initial load when field is empty
     # Fetch from user's default model setting in the database
-    if not field_value or field_value == "":
-        options = cached.get("options", [])
-        if options:
-            # Determine model type based on cache_key_prefix
-            model_type = "embeddings" if cache_key_prefix == "embedding_model_options" else "language"
-
-            # Try to get user's default model from the variable service
-            default_model_name = None
-            default_model_provider = None
-            try:
-
-                async def _get_default_model():
-                    async with session_scope() as session:
-                        variable_service = get_variable_service()
-                        if variable_service is None:
-                            return None, None
-                        from langflow.services.variable.service import DatabaseVariableService
-
-                        if not isinstance(variable_service, DatabaseVariableService):
-                            return None, None
-
-                        # Variable names match those in the API
-                        var_name = (
-                            "__default_embedding_model__"
-                            if model_type == "embeddings"
-                            else "__default_language_model__"
-                        )
+    if (not field_value or field_value == "") and options:
+        # Determine model type based on cache_key_prefix
+        model_type = "embeddings" if cache_key_prefix == "embedding_model_options" else "language"
 
-                        try:
-                            var = await variable_service.get_variable_object(
-                                user_id=UUID(component.user_id)
-                                if isinstance(component.user_id, str)
-                                else component.user_id,
-                                name=var_name,
-                                session=session,
-                            )
-                            if var and var.value:
-                                import json
-
-                                parsed_value = json.loads(var.value)
-                                if isinstance(parsed_value, dict):
-                                    return parsed_value.get("model_name"), parsed_value.get("provider")
-                        except (ValueError, json.JSONDecodeError, TypeError):
-                            # Variable not found or invalid format
-                            logger.info("Variable not found or invalid format", exc_info=True)
+        # Try to get user's default model from the variable service
+        default_model_name = None
+        default_model_provider = None
+        try:
+
+            async def _get_default_model():
+                async with session_scope() as session:
+                    variable_service = get_variable_service()
+                    if variable_service is None:
                         return None, None
+                    from langflow.services.variable.service import DatabaseVariableService
 
-                default_model_name, default_model_provider = run_until_complete(_get_default_model())
-            except Exception:  # noqa: BLE001
-                # If we can't get default model, continue without it
-                logger.info("Failed to get default model, continue without it", exc_info=True)
-
-            # Find the default model in options
-            default_model = None
-            if default_model_name and default_model_provider:
-                # Look for the user's preferred default model
-                for opt in options:
-                    if opt.get("name") == default_model_name and opt.get("provider") == default_model_provider:
-                        default_model = opt
-                        break
-
-            # If user's default not found, fallback to first option
-            if not default_model and options:
-                default_model = options[0]
-
-            # Set the value
-            if default_model:
-                build_config["model"]["value"] = [default_model]
+                    if not isinstance(variable_service, DatabaseVariableService):
+                        return None, None
+
+                    # Variable names match those in the API
+                    var_name = (
+                        "__default_embedding_model__" if model_type == "embeddings" else "__default_language_model__"
+                    )
+
+                    try:
+                        var = await variable_service.get_variable_object(
+                            user_id=UUID(component.user_id)
+                            if isinstance(component.user_id, str)
+                            else component.user_id,
+                            name=var_name,
+                            session=session,
+                        )
+                        if var and var.value:
+                            import json
+
+                            parsed_value = json.loads(var.value)
+                            if isinstance(parsed_value, dict):
+                                return parsed_value.get("model_name"), parsed_value.get("provider")
+                    except (ValueError, json.JSONDecodeError, TypeError):
+                        # Variable not found or invalid format
+                        logger.info("Variable not found or invalid format", exc_info=True)
+                    return None, None
+
+            default_model_name, default_model_provider = run_until_complete(_get_default_model())
+        except Exception:  # noqa: BLE001
+            # If we can't get default model, continue without it
+            logger.info("Failed to get default model, continue without it", exc_info=True)
+
+        # Find the default model in options
+        default_model = None
+        if default_model_name and default_model_provider:
+            # Look for the user's preferred default model
+            for opt in options:
+                if opt.get("name") == default_model_name and opt.get("provider") == default_model_provider:
+                    default_model = opt
+                    break
+
+        # If user's default not found, fallback to first option
+        if not default_model and options:
+            default_model = options[0]
+
+        # Set the value
+        if default_model:
+            build_config["model"]["value"] = [default_model]
 
     # Handle visibility logic:
     # - Show handle ONLY when field_value is "connect_other_models"
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import re
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
+from cachetools import LRUCache
 from langchain_core.tools import BaseTool, ToolException
 from langchain_core.tools.structured import StructuredTool
 
@@ -17,6 +19,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
     from langchain_core.callbacks import Callbacks
+    from pydantic import BaseModel
 
     from lfx.custom.custom_component.component import Component
     from lfx.events.event_manager import EventManager
@@ -25,6 +28,12 @@ if TYPE_CHECKING:
     from lfx.schema.dotdict import dotdict
 
 TOOL_TYPES_SET = {"Tool", "BaseTool", "StructuredTool"}
+INPUT_SCHEMA_CACHE_SIZE = 1024
+
+# Tool schemas are pydantic models created at runtime, so they are shared by every
+# toolkit whose inputs would produce the same schema instead of being rebuilt each run.
+_input_schema_cache: LRUCache[tuple, type[BaseModel]] = LRUCache(maxsize=INPUT_SCHEMA_CACHE_SIZE)
+_input_schema_cache_lock = threading.Lock()
 
 
 def _get_input_type(input_: InputTypes):
@@ -138,6 +147,73 @@ def _add_commands_to_tool_description(tool_description: str, commands: str):
     return f"very_time you see one of those commands {commands} run the tool. tool description is {tool_description}"
 
 
+def _freeze(value: Any) -> Any:
+    """Convert a value into a hashable cache key part.
+
+    Raises:
+        TypeError: If the value is neither hashable nor a list, tuple or dict of hashable values.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list | tuple):
+        return (type(value), tuple(_freeze(item) for item in value))
+    hash(value)
+    # Keep the type so that 1, 1.0 and True are not treated as the same default
+    return (type(value), value)
+
+
+def _input_schema_key(inputs: list, type_attribute: str) -> tuple:
+    """Build a cache key from every input attribute that the generated schema depends on."""
+    return tuple(
+        (
+            getattr(input_, type_attribute, None),
+            _freeze(getattr(input_, "options", None)),
+            bool(getattr(input_, "is_list", False)),
+            getattr(input_, "name", None),
+            getattr(input_, "display_name", None),
+            getattr(input_, "info", None),
+            getattr(input_, "required", None),
+            _freeze(input_.value) if getattr(input_, "required", None) is False else None,
+        )
+        for input_ in inputs
+    )
+
+
+def get_input_schema(
+    inputs: list[InputTypes] | list[dotdict], *, from_dict: bool = False, param_key: str | None = None
+) -> type[BaseModel]:
+    """Return the args schema for the given inputs, creating the pydantic model only once per distinct schema.
+
+    Args:
+        inputs: The inputs exposed as tool arguments.
+        from_dict: Whether the inputs are flow tweak dictionaries rather than input instances.
+        param_key: Key the arguments are nested under, only used with `from_dict`.
+    """
+    from lfx.io.schema import create_input_schema, create_input_schema_from_dict
+
+    try:
+        key: tuple | None = (from_dict, param_key, _input_schema_key(inputs, "type" if from_dict else "field_type"))
+    except TypeError:
+        # A default value that cannot be compared reliably, build the schema without caching it
+        key = None
+
+    if key is not None:
+        with _input_schema_cache_lock:
+            args_schema = _input_schema_cache.get(key)
+        if args_schema is not None:
+            return args_schema
+
+    if from_dict:
+        args_schema = create_input_schema_from_dict(inputs=inputs, param_key=param_key)
+    else:
+        args_schema = create_input_schema(inputs)
+
+    if key is not None:
+        with _input_schema_cache_lock:
+            _input_schema_cache[key] = args_schema
+    return args_schema
+
+
 class ComponentToolkit:
     def __init__(self, component: Component, metadata: pd.DataFrame | None = None):
         self.component = component
@@ -168,9 +244,8 @@ class ComponentToolkit:
         callbacks: Callbacks | None = None,
         flow_mode_inputs: list[dotdict] | None = None,
     ) -> list[BaseTool]:
-        from lfx.io.schema import create_input_schema, create_input_schema_from_dict
-
         tools = []
+        tool_mode_inputs = [_input for _input in self.component.inputs if getattr(_input, "tool_mode", False)]
         for output in self.component.outputs:
             if self._should_skip_output(output):
                 continue
@@ -181,14 +256,10 @@ class ComponentToolkit:
 
             output_method: Callable = getattr(self.component, output.method)
             args_schema = None
-            tool_mode_inputs = [_input for _input in self.component.inputs if getattr(_input, "tool_mode", False)]
             if flow_mode_inputs:
-                args_schema = create_input_schema_from_dict(
-                    inputs=flow_mode_inputs,
-                    param_key="flow_tweak_data",
-                )
+                args_schema = get_input_schema(flow_mode_inputs, from_dict=True, param_key="flow_tweak_data")
             elif tool_mode_inputs:
-                args_schema = create_input_schema(tool_mode_inputs)
+                args_schema = get_input_schema(tool_mode_inputs)
             elif output.required_inputs:
                 inputs = [
                     self.component.get_underscore_inputs()[input_name]
@@ -212,10 +283,10 @@ class ComponentToolkit:
                         "Please ensure all required inputs are set to tool mode."
                     )
                     raise ValueError(msg)
-                args_schema = create_input_schema(inputs)
+                args_schema = get_input_schema(inputs)
 
             else:
-                args_schema = create_input_schema(self.component.inputs)
+                args_schema = get_input_schema(self.component.inputs)
 
             name = f"{output.method}".strip(".")
             formatted_name = _format_tool_name(name)
@@ -7,6 +7,7 @@ from langflow.helpers.flow import get_flow_by_id_or_name
 from langflow.processing.process import process_tweaks_on_graph
 
 from lfx.base.tools.constants import TOOL_OUTPUT_NAME
+from lfx.base.tools.subflow_cache import subflow_graph_cache
 from lfx.custom.custom_component.component import Component, get_component_toolkit
 from lfx.field_typing import Tool
 from lfx.graph.graph.base import Graph
@@ -138,11 +139,20 @@ class RunFlowBaseComponent(Component):
         if not (flow_name_selected or flow_id_selected):
             msg = "Flow name or id is required"
             raise ValueError(msg)
+        if (
+            flow_id_selected
+            and self.user_id
+            and (prepared := subflow_graph_cache.get(self.user_id, flow_id_selected))
+            and self._is_cached_flow_up_to_date(prepared, updated_at)
+        ):
+            # every caller gets its own graph, so tool calls can run the flow concurrently
+            return prepared.build_graph(user_id=self.user_id)
         if flow_id_selected and (flow := self._flow_cache_call("get", flow_id=flow_id_selected)):
             if self._is_cached_flow_up_to_date(flow, updated_at):
                 return flow
             self._flow_cache_call("delete", flow_id=flow_id_selected)  # stale, delete it
 
+        generation = subflow_graph_cache.generation
         # TODO: use flow id only
         flow = await self.get_flow(flow_name_selected=flow_name_selected, flow_id_selected=flow_id_selected)
         if not flow:
@@ -153,11 +163,24 @@ class RunFlowBaseComponent(Component):
             payload=flow.data.get("data", {}),
             flow_id=flow_id_selected,
             flow_name=flow_name_selected,
+            user_id=self.user_id,
         )
         graph.description = flow.data.get("description", None)
         graph.updated_at = flow.data.get("updated_at", None)
+        if hasattr(graph.updated_at, "isoformat"):
+            graph.updated_at = graph.updated_at.isoformat()
 
         self._flow_cache_call("set", flow=graph)
+        if (flow_id := flow.data.get("id") or flow_id_selected) and self.user_id:
+            subflow_graph_cache.set(
+                self.user_id,
+                flow_id,
+                data=flow.data.get("data") or {},
+                flow_name=flow_name_selected,
+                description=graph.description,
+                updated_at=graph.updated_at,
+                generation=generation,
+            )
 
         return graph
 
@@ -325,12 +348,23 @@ class RunFlowBaseComponent(Component):
         Returns:
             The resolved output.
         """
-        run_outputs = await self._get_cached_run_outputs(
-            user_id=self.user_id,
-            tweaks=self.flow_tweak_data,
-            inputs=None,
-            output_type="any",
-        )
+        # Tool calls set their arguments right before calling this method, read them before any await
+        if tool_call_values := self._pop_tool_call_values():
+            # each tool call runs the flow with its own arguments and never reuses another call's outputs
+            tweaks = self._merge_tweaks(self.flow_tweak_data, self._extract_tweaks_from_keyed_values(tool_call_values))
+            run_outputs = await self._run_flow_with_cached_graph(
+                user_id=self.user_id,
+                tweaks=tweaks,
+                inputs=self._build_inputs_from_tweaks(tweaks) or None,
+                output_type="any",
+            )
+        else:
+            run_outputs = await self._get_cached_run_outputs(
+                user_id=self.user_id,
+                tweaks=self.flow_tweak_data,
+                inputs=None,
+                output_type="any",
+            )
 
         if not run_outputs:
             return None
@@ -508,18 +542,22 @@ class RunFlowBaseComponent(Component):
             flow_id_selected=self.flow_id_selected,
             updated_at=self._cached_flow_updated_at,
         )
+        if self._cached_flow_updated_at is None:
+            # run the same version of the flow for the rest of this run and serve it from the cache
+            self._cached_flow_updated_at = graph.updated_at
         if tweaks:
             graph = process_tweaks_on_graph(graph, tweaks)
 
-        return await run_flow(
-            inputs=inputs,
-            flow_id=self.flow_id_selected,
-            flow_name=self.flow_name_selected,
-            user_id=user_id,
-            session_id=self.session_id,
-            output_type=output_type,
-            graph=graph,
-        )
+        async with subflow_graph_cache.run_slot(self.flow_id_selected or self.flow_name_selected):
+            return await run_flow(
+                inputs=inputs,
+                flow_id=self.flow_id_selected,
+                flow_name=self.flow_name_selected,
+                user_id=user_id,
+                session_id=self.session_id,
+                output_type=output_type,
+                graph=graph,
+            )
 
     ################################################################
     # Flow cache utils
@@ -657,6 +695,26 @@ class RunFlowBaseComponent(Component):
             tweaks.setdefault(node_id, {})[param_name] = field_value
         return tweaks
 
+    def _pop_tool_call_values(self) -> dict[str, Any] | None:
+        """Return and clear the keyed input values set by a tool call, if any."""
+        values = self._attributes.get("flow_tweak_data")
+        if not values:
+            return None
+        self._attributes["flow_tweak_data"] = {}
+        if hasattr(values, "model_dump"):
+            values = values.model_dump()
+        return values if isinstance(values, dict) else None
+
+    @staticmethod
+    def _merge_tweaks(
+        base: dict[str, dict[str, Any]] | None,
+        overrides: dict[str, dict[str, Any]],
+    ) -> dict[str, dict[str, Any]]:
+        merged = {vertex_id: dict(params) for vertex_id, params in (base or {}).items()}
+        for vertex_id, params in overrides.items():
+            merged.setdefault(vertex_id, {}).update(params)
+        return merged
+
     def _build_inputs_from_tweaks(
         self,
         tweaks: dict[str, dict[str, Any]],
@@ -0,0 +1,124 @@
+"""Process-wide cache of the flows run by Run Flow components and flow tools.
+
+An agent calling a flow as a tool in a loop would otherwise fetch the flow from the database and
+rebuild its graph on every call. The cache keeps the serialized graph data of each flow together with
+its ``updated_at`` timestamp, and every call gets its own ``Graph`` built from a private copy, so
+concurrent runs never share vertices or component state. Langflow drops a flow from the cache when it
+is saved or deleted.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import orjson
+from cachetools import LRUCache
+
+if TYPE_CHECKING:
+    from lfx.graph.graph.base import Graph
+
+DEFAULT_SUBFLOW_CACHE_SIZE = 128
+DEFAULT_SUBFLOW_MAX_CONCURRENCY = 4
+
+
+class PreparedSubflow(NamedTuple):
+    flow_id: str
+    flow_name: str | None
+    description: str | None
+    updated_at: str | None
+    payload: bytes
+
+    def build_graph(self, user_id: str | None = None) -> Graph:
+        """Return a new graph that shares no state with other runs of the flow."""
+        from lfx.graph.graph.base import Graph
+
+        graph = Graph.from_payload(
+            payload=orjson.loads(self.payload),
+            flow_id=self.flow_id,
+            flow_name=self.flow_name,
+            user_id=user_id,
+        )
+        graph.description = self.description
+        graph.updated_at = self.updated_at
+        return graph
+
+
+class SubflowGraphCache:
+    """LRU cache of flow graph data keyed by user and flow id, stamped with the flow's ``updated_at``."""
+
+    def __init__(self, maxsize: int = DEFAULT_SUBFLOW_CACHE_SIZE) -> None:
+        self._entries: LRUCache[tuple[str, str], PreparedSubflow] = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        # Bumped on every invalidation so a flow fetched before a change is not cached
+        self._generation = 0
+        # Least recently run flows are forgotten, only their waiting runs could then exceed the limit
+        self._semaphores: LRUCache[str, tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = LRUCache(maxsize=maxsize)
+
+    @property
+    def generation(self) -> int:
+        """Return the state to pass to ``set`` after fetching a flow."""
+        with self._lock:
+            return self._generation
+
+    def get(self, user_id: str, flow_id: str) -> PreparedSubflow | None:
+        """Return the last cached version of a flow. Callers check that it is recent enough."""
+        with self._lock:
+            return self._entries.get((str(user_id), str(flow_id)))
+
+    def set(
+        self,
+        user_id: str,
+        flow_id: str,
+        *,
+        data: dict[str, Any],
+        flow_name: str | None = None,
+        description: str | None = None,
+        updated_at: str | None = None,
+        generation: int | None = None,
+    ) -> PreparedSubflow:
+        """Cache a flow, unless a flow was invalidated since ``generation`` was taken."""
+        prepared = PreparedSubflow(str(flow_id), flow_name, description, updated_at, orjson.dumps(data))
+        with self._lock:
+            if generation is None or generation == self._generation:
+                self._entries[(str(user_id), str(flow_id))] = prepared
+        return prepared
+
+    def delete(self, flow_id: str) -> None:
+        """Forget a flow for every user."""
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if key[1] == str(flow_id)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def run_slot(self, flow_id: str) -> asyncio.Semaphore:
+        """Return the semaphore bounding the concurrent runs of a flow in the running event loop.
+
+        Callers hold it for the whole run of the flow, so at most ``subflow_max_concurrency`` runs of a
+        flow execute at once and further tool calls wait for one of them to finish.
+        """
+        from lfx.services.deps import get_settings_service
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            cached = self._semaphores.get(str(flow_id))
+            if cached is not None and cached[0] is loop:
+                return cached[1]
+            settings_service = get_settings_service()
+            limit = (
+                getattr(settings_service.settings, "subflow_max_concurrency", DEFAULT_SUBFLOW_MAX_CONCURRENCY)
+                if settings_service is not None
+                else DEFAULT_SUBFLOW_MAX_CONCURRENCY
+            )
+            semaphore = asyncio.Semaphore(max(1, limit))
+            self._semaphores[str(flow_id)] = (loop, semaphore)
+            return semaphore
+
+
+subflow_graph_cache = SubflowGraphCache()
@@ -308,6 +308,8 @@ async def execute_graph_with_capture(graph, input_value: str | None):
     """
     # Create input request
     inputs = InputValueRequest(input_value=input_value) if input_value else None
+    # Results are returned as JSON, nothing displays the artifacts of the components
+    graph.headless = True
 
     # Capture output during execution
     captured_stdout = StringIO()
@@ -1,19 +1,20 @@
-from typing import TYPE_CHECKING, Any
+import asyncio
+from typing import TYPE_CHECKING
 
-from langchain_community.utilities import SQLDatabase
 from sqlalchemy.exc import SQLAlchemyError
 
-from lfx.custom.custom_component.component_with_cache import ComponentWithCache
-from lfx.io import BoolInput, MessageTextInput, MultilineInput, Output
+from lfx.base.data.sql_engines import run_query, sql_engine_pool
+from lfx.custom.custom_component.component import Component
+from lfx.io import BoolInput, IntInput, MessageTextInput, MultilineInput, Output
+from lfx.log.logger import logger
 from lfx.schema.dataframe import DataFrame
 from lfx.schema.message import Message
-from lfx.services.cache.utils import CacheMiss
 
 if TYPE_CHECKING:
-    from sqlalchemy.engine import Result
+    from langchain_community.utilities import SQLDatabase
 
 
-class SQLComponent(ComponentWithCache):
+class SQLComponent(Component):
     """A sql component."""
 
     display_name = "SQL Database"
@@ -29,19 +30,12 @@ class SQLComponent(ComponentWithCache):
 
     def maybe_create_db(self):
         if self.database_url != "":
-            if self._shared_component_cache:
-                cached_db = self._shared_component_cache.get(self.database_url)
-                if not isinstance(cached_db, CacheMiss):
-                    self.db = cached_db
-                    return
-                self.log("Connecting to database")
+            # Databases are shared by every component connecting to the same URL
             try:
-                self.db = SQLDatabase.from_uri(self.database_url)
+                self.db = sql_engine_pool.get_database(self.database_url)
             except Exception as e:
                 msg = f"An error occurred while connecting to the database: {e}"
                 raise ValueError(msg) from e
-            if self._shared_component_cache:
-                self._shared_component_cache.set(self.database_url, self.db)
 
     inputs = [
         MessageTextInput(name="database_url", display_name="Database URL", required=True),
@@ -55,6 +49,21 @@ class SQLComponent(ComponentWithCache):
             info="If True, the error will be added to the result",
             advanced=True,
         ),
+        IntInput(
+            name="max_rows",
+            display_name="Max Rows",
+            value=0,
+            info="Maximum number of rows returned by the query, the rest are left out with a warning. "
+            "Set to 0 to return every row.",
+            advanced=True,
+        ),
+        IntInput(
+            name="query_timeout",
+            display_name="Query Timeout",
+            value=60,
+            info="Seconds after which the query is interrupted. Set to 0 to disable the timeout.",
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -84,18 +93,27 @@ class SQLComponent(ComponentWithCache):
 
         return Message(text=result)
 
-    def __execute_query(self) -> list[dict[str, Any]]:
-        self.maybe_create_db()
+    async def run_sql_query(self) -> DataFrame:
         try:
-            cursor: Result[Any] = self.db.run(self.query, fetch="cursor")
-            return [x._asdict() for x in cursor.fetchall()]
+            engine = sql_engine_pool.get_engine(self.database_url)
+        except Exception as e:
+            msg = f"An error occurred while connecting to the database: {e}"
+            raise ValueError(msg) from e
+        max_rows = self.max_rows or 0
+        try:
+            # Rows are fetched in chunks in a worker thread, the event loop keeps serving other flows
+            result, truncated = await asyncio.to_thread(
+                run_query, engine, self.query, max_rows=max_rows, timeout=self.query_timeout or 0
+            )
         except SQLAlchemyError as e:
             msg = f"An error occurred while running the SQL Query: {e}"
             self.log(msg)
             raise ValueError(msg) from e
-
-    def run_sql_query(self) -> DataFrame:
-        result = self.__execute_query()
         df_result = DataFrame(result)
         self.status = df_result
+        if truncated:
+            msg = f"The query returned more than {max_rows} rows, only the first {max_rows} are kept."
+            self.log(msg)
+            await logger.awarning(msg)
+            self.status = msg
         return df_result
@@ -1,9 +1,8 @@
-import queue
-import threading
-import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 from lfx.base.data import BaseFileComponent
-from lfx.base.data.docling_utils import _serialize_pydantic_model, docling_worker
+from lfx.base.data.docling_pool import docling_conversion_pool
+from lfx.base.data.docling_utils import _serialize_pydantic_model
 from lfx.inputs import BoolInput, DropdownInput, HandleInput, StrInput
 from lfx.schema import Data
 
@@ -92,58 +91,6 @@ class DoclingInlineComponent(BaseFileComponent):
         *BaseFileComponent.get_base_outputs(),
     ]
 
-    def _wait_for_result_with_thread_monitoring(
-        self, result_queue: queue.Queue, thread: threading.Thread, timeout: int = 300
-    ):
-        """Wait for result from queue while monitoring thread health.
-
-        Handles cases where thread crashes without sending result.
-        """
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            # Check if thread is still alive
-            if not thread.is_alive():
-                # Thread finished, try to get any result it might have sent
-                try:
-                    result = result_queue.get_nowait()
-                except queue.Empty:
-                    # Thread finished without sending result
-                    msg = "Worker thread crashed unexpectedly without producing result."
-                    raise RuntimeError(msg) from None
-                else:
-                    self.log("Thread completed and result retrieved")
-                    return result
-
-            # Poll the queue instead of blocking
-            try:
-                result = result_queue.get(timeout=1)
-            except queue.Empty:
-                # No result yet, continue monitoring
-                continue
-            else:
-                self.log("Result received from worker thread")
-                return result
-
-        # Overall timeout reached
-        msg = f"Thread timed out after {timeout} seconds"
-        raise TimeoutError(msg)
-
-    def _stop_thread_gracefully(self, thread: threading.Thread, timeout: int = 10):
-        """Wait for thread to complete gracefully.
-
-        Note: Python threads cannot be forcefully killed, so we just wait.
-        The thread should respond to shutdown signals via the queue.
-        """
-        if not thread.is_alive():
-            return
-
-        self.log("Waiting for thread to complete gracefully")
-        thread.join(timeout=timeout)
-
-        if thread.is_alive():
-            self.log("Warning: Thread still alive after timeout")
-
     def process_files(self, file_list: list[BaseFileComponent.BaseFile]) -> list[BaseFileComponent.BaseFile]:
         try:
             from docling.document_converter import DocumentConverter  # noqa: F401
@@ -164,37 +111,46 @@ class DoclingInlineComponent(BaseFileComponent):
         if self.pic_desc_llm is not None:
             pic_desc_config = _serialize_pydantic_model(self.pic_desc_llm)
 
-        # Use threading instead of multiprocessing for memory sharing
-        # This enables the global DocumentConverter cache to work across runs
-        result_queue: queue.Queue = queue.Queue()
-        thread = threading.Thread(
-            target=docling_worker,
-            kwargs={
-                "file_paths": file_paths,
-                "queue": result_queue,
-                "pipeline": self.pipeline,
-                "ocr_engine": self.ocr_engine,
-                "do_picture_classification": self.do_picture_classification,
-                "pic_desc_config": pic_desc_config,
-                "pic_desc_prompt": self.pic_desc_prompt,
-            },
-            daemon=False,  # Allow thread to complete even if main thread exits
-        )
-
-        result = None
-        thread.start()
-
-        try:
-            result = self._wait_for_result_with_thread_monitoring(result_queue, thread, timeout=300)
-        except KeyboardInterrupt:
-            self.log("Docling thread cancelled by user")
-            result = []
-        except Exception as e:
-            self.log(f"Error during processing: {e}")
-            raise
-        finally:
-            # Wait for thread to complete gracefully
-            self._stop_thread_gracefully(thread)
+        options = {
+            "pipeline": self.pipeline,
+            "ocr_engine": self.ocr_engine,
+            "do_picture_classification": self.do_picture_classification,
+            "pic_desc_config": pic_desc_config,
+            "pic_desc_prompt": self.pic_desc_prompt,
+        }
+
+        # Files converted before with the same options are served from the cache
+        cache_keys = {str(path): docling_conversion_pool.cache_key(path, **options) for path in file_paths}
+        cached = []
+        pending_paths = []
+        for path in file_paths:
+            document = docling_conversion_pool.get_cached(cache_keys[str(path)])
+            if document is None:
+                pending_paths.append(str(path))
+            else:
+                cached.append({"document": document, "file_path": str(path)})
+        if cached:
+            self.log(f"Reusing {len(cached)} converted documents from the cache")
+
+        result = []
+        if pending_paths:
+            # Conversions run in a bounded pool shared by every component, which keeps the
+            # DocumentConverter cache of the worker and rejects conversions when it is full
+            job = docling_conversion_pool.submit(pending_paths, **options)
+            timeout = docling_conversion_pool.conversion_timeout
+            try:
+                result = job.result(timeout=timeout)
+            except FutureTimeoutError:
+                job.cancel()
+                msg = f"Docling conversion timed out after {timeout} seconds"
+                raise TimeoutError(msg) from None
+            except KeyboardInterrupt:
+                job.cancel()
+                self.log("Docling conversion cancelled by user")
+                result = []
+            except Exception as e:
+                self.log(f"Error during processing: {e}")
+                raise
 
         # Enhanced error checking with dependency-specific handling
         if isinstance(result, dict) and "error" in result:
@@ -224,5 +180,11 @@ class DoclingInlineComponent(BaseFileComponent):
             else:
                 raise RuntimeError(error_msg)
 
-        processed_data = [Data(data={"doc": r["document"], "file_path": r["file_path"]}) if r else None for r in result]
+        for r in result:
+            if r and r["file_path"] in cache_keys:
+                docling_conversion_pool.cache_result(cache_keys[r["file_path"]], r["document"])
+
+        processed_data = [
+            Data(data={"doc": r["document"], "file_path": r["file_path"]}) if r else None for r in [*cached, *result]
+        ]
         return self.rollup_data(file_list, processed_data)
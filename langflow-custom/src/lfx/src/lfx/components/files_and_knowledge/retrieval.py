@@ -4,13 +4,15 @@ from typing import Any
 
 from cryptography.fernet import InvalidToken
 from langchain_chroma import Chroma
+from langchain_core.documents import Document
 from langflow.services.auth.utils import decrypt_api_key
 from langflow.services.database.models.user.crud import get_user_by_id
 from pydantic import SecretStr
 
 from lfx.base.knowledge_bases.knowledge_base_utils import get_knowledge_bases
+from lfx.base.knowledge_bases.store_cache import embedding_cache_key, knowledge_base_store_cache
 from lfx.custom import Component
-from lfx.io import BoolInput, DropdownInput, IntInput, MessageTextInput, Output, SecretStrInput
+from lfx.io import BoolInput, DictInput, DropdownInput, IntInput, MessageTextInput, Output, SecretStrInput
 from lfx.log.logger import logger
 from lfx.schema.data import Data
 from lfx.schema.dataframe import DataFrame
@@ -87,6 +89,13 @@ class KnowledgeRetrievalComponent(Component):
             value=False,
             advanced=True,
         ),
+        DictInput(
+            name="search_filter",
+            display_name="Metadata Filter",
+            info="Only return documents whose metadata matches every key-value pair.",
+            advanced=True,
+            is_list=True,
+        ),
     ]
 
     outputs = [
@@ -206,40 +215,98 @@ class KnowledgeRetrievalComponent(Component):
             kb_user = current_user.username
         kb_path = _get_knowledge_bases_root_path() / kb_user / self.knowledge_base
 
+        search_query = self.search_query
+        results, id_to_embedding = await knowledge_base_store_cache.run(
+            self._search_knowledge_base, kb_path, search_query
+        )
+
+        # Build output data based on include_metadata setting
+        data_list = []
+        for doc, score in results:
+            kwargs = {
+                "content": doc.page_content,
+            }
+            if search_query:
+                kwargs["_score"] = -1 * score
+            if self.include_metadata:
+                # Include all metadata, embeddings, and content
+                kwargs.update(doc.metadata)
+            if self.include_embeddings:
+                kwargs["_embeddings"] = id_to_embedding.get(doc.metadata.get("_id"))
+
+            data_list.append(Data(**kwargs))
+
+        # Return the DataFrame containing the data
+        return DataFrame(data=data_list)
+
+    def _build_search_filter(self) -> dict | None:
+        """Translate the metadata filter into a Chroma ``where`` clause."""
+        search_filter = self.search_filter or {}
+        conditions = [{key: value} for key, value in search_filter.items() if key and value is not None and value != ""]
+        if not conditions:
+            return None
+        return conditions[0] if len(conditions) == 1 else {"$and": conditions}
+
+    def _get_store(self, kb_path: Path) -> Chroma:
+        """Return the cached vector store of the knowledge base, opening it on first use."""
         metadata = self._get_kb_metadata(kb_path)
         if not metadata:
             msg = f"Metadata not found for knowledge base: {self.knowledge_base}. Ensure it has been indexed."
             raise ValueError(msg)
 
-        # Build the embedder for the knowledge base
-        embedding_function = self._build_embeddings(metadata)
-
-        # Load vector store
-        chroma = Chroma(
-            persist_directory=str(kb_path),
-            embedding_function=embedding_function,
-            collection_name=self.knowledge_base,
+        runtime_api_key = self.api_key.get_secret_value() if isinstance(self.api_key, SecretStr) else self.api_key
+        embedding_key = embedding_cache_key(metadata, runtime_api_key or metadata.get("api_key"))
+        embedding_function = knowledge_base_store_cache.get_embedder(
+            embedding_key, lambda: self._build_embeddings(metadata)
+        )
+        return knowledge_base_store_cache.get_store(
+            kb_path,
+            self.knowledge_base,
+            embedding_key,
+            lambda: Chroma(
+                persist_directory=str(kb_path),
+                embedding_function=embedding_function,
+                collection_name=self.knowledge_base,
+            ),
         )
 
-        # If a search query is provided, perform a similarity search
-        if self.search_query:
-            # Use the search query to perform a similarity search
-            logger.info(f"Performing similarity search with query: {self.search_query}")
-            results = chroma.similarity_search_with_score(
-                query=self.search_query or "",
-                k=self.top_k,
-            )
-        else:
-            results = chroma.similarity_search(
-                query=self.search_query or "",
-                k=self.top_k,
+    def _search_knowledge_base(
+        self, kb_path: Path, search_query: str | None
+    ) -> tuple[list[tuple[Document, float]], dict]:
+        """Search the knowledge base. Blocking, runs in the knowledge base executor."""
+        chroma = self._get_store(kb_path)
+        search_filter = self._build_search_filter()
+        try:
+            return self._query_store(chroma, search_query, search_filter)
+        except Exception:
+            # The store may be stale, e.g. if the knowledge base was deleted
+            knowledge_base_store_cache.evict(kb_path)
+            raise
+
+    def _query_store(
+        self, chroma: Chroma, search_query: str | None, search_filter: dict | None
+    ) -> tuple[list[tuple[Document, float]], dict]:
+        id_to_embedding: dict = {}
+
+        if not search_query:
+            # Without a query there is nothing to rank by, so read the documents without embedding a query
+            include = (
+                ["documents", "metadatas", "embeddings"] if self.include_embeddings else ["documents", "metadatas"]
             )
-
-            # For each result, make it a tuple to match the expected output format
-            results = [(doc, 0) for doc in results]  # Assign a dummy score of 0
+            stored = chroma.get(where=search_filter, limit=self.top_k, include=include)
+            results = []
+            for i, content in enumerate(stored.get("documents") or []):
+                doc_metadata = (stored.get("metadatas") or [])[i] or {}
+                results.append((Document(page_content=content, metadata=doc_metadata), 0))
+                if self.include_embeddings and "_id" in doc_metadata:
+                    id_to_embedding[doc_metadata["_id"]] = stored["embeddings"][i]
+            return results, id_to_embedding
+
+        # Use the search query to perform a similarity search
+        logger.info(f"Performing similarity search with query: {search_query}")
+        results = chroma.similarity_search_with_score(query=search_query, k=self.top_k, filter=search_filter)
 
         # If include_embeddings is enabled, get embeddings for the results
-        id_to_embedding = {}
         if self.include_embeddings and results:
             doc_ids = [doc[0].metadata.get("_id") for doc in results if doc[0].metadata.get("_id")]
 
@@ -254,21 +321,4 @@ class KnowledgeRetrievalComponent(Component):
                     if metadata and "_id" in metadata:
                         id_to_embedding[metadata["_id"]] = embeddings_result["embeddings"][i]
 
-        # Build output data based on include_metadata setting
-        data_list = []
-        for doc in results:
-            kwargs = {
-                "content": doc[0].page_content,
-            }
-            if self.search_query:
-                kwargs["_score"] = -1 * doc[1]
-            if self.include_metadata:
-                # Include all metadata, embeddings, and content
-                kwargs.update(doc[0].metadata)
-            if self.include_embeddings:
-                kwargs["_embeddings"] = id_to_embedding.get(doc[0].metadata.get("_id"))
-
-            data_list.append(Data(**kwargs))
-
-        # Return the DataFrame containing the data
-        return DataFrame(data=data_list)
+        return results, id_to_embedding
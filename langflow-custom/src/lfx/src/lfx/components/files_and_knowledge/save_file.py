@@ -1,5 +1,5 @@
 import json
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -8,6 +8,7 @@ import pandas as pd
 from fastapi import UploadFile
 from fastapi.encoders import jsonable_encoder
 
+from lfx.base.data.file_writers import append_lines, atomic_write, json_array_items, write_json_records
 from lfx.custom import Component
 from lfx.inputs import SortableListInput
 from lfx.io import BoolInput, DropdownInput, HandleInput, SecretStrInput, StrInput
@@ -33,8 +34,10 @@ class SaveToFileComponent(Component):
     name = "SaveToFile"
 
     # File format options for different storage types
-    LOCAL_DATA_FORMAT_CHOICES = ["csv", "excel", "json", "markdown"]
-    LOCAL_MESSAGE_FORMAT_CHOICES = ["txt", "json", "markdown"]
+    LOCAL_DATA_FORMAT_CHOICES = ["csv", "excel", "json", "jsonl", "markdown"]
+    LOCAL_MESSAGE_FORMAT_CHOICES = ["txt", "json", "jsonl", "markdown"]
+    # Rows serialized at once when writing a DataFrame to JSON, so large frames are streamed to the file
+    WRITE_CHUNK_ROWS = 10_000
     AWS_FORMAT_CHOICES = [
         "txt",
         "json",
@@ -346,101 +349,89 @@ class SaveToFileComponent(Component):
                     append=False,
                 )
 
+    def _iter_dataframe_chunks(self, dataframe: DataFrame, *, lines: bool = False) -> Iterator[str]:
+        """Serialize a DataFrame to JSON records a chunk of rows at a time."""
+        for start in range(0, len(dataframe), self.WRITE_CHUNK_ROWS):
+            chunk = dataframe.iloc[start : start + self.WRITE_CHUNK_ROWS]
+            if lines:
+                yield chunk.to_json(orient="records", lines=True)
+            else:
+                yield json_array_items(chunk.to_json(orient="records", indent=2))
+
     def _save_dataframe(self, dataframe: DataFrame, path: Path, fmt: str) -> str:
         """Save a DataFrame to the specified file format."""
         append_mode = getattr(self, "append_mode", False)
         should_append = append_mode and path.exists() and self._is_plain_text_format(fmt)
 
         if fmt == "csv":
-            dataframe.to_csv(path, index=False, mode="a" if should_append else "w", header=not should_append)
-        elif fmt == "excel":
-            dataframe.to_excel(path, index=False, engine="openpyxl")
-        elif fmt == "json":
             if should_append:
-                # Read and parse existing JSON
-                existing_data = []
-                try:
-                    existing_content = path.read_text(encoding="utf-8").strip()
-                    if existing_content:
-                        parsed = json.loads(existing_content)
-                        # Handle case where existing content is a single object
-                        if isinstance(parsed, dict):
-                            existing_data = [parsed]
-                        elif isinstance(parsed, list):
-                            existing_data = parsed
-                except (json.JSONDecodeError, FileNotFoundError):
-                    # Treat parse errors or missing file as empty array
-                    existing_data = []
-
-                # Append new data
-                new_records = json.loads(dataframe.to_json(orient="records"))
-                existing_data.extend(new_records)
-
-                # Write back as a single JSON array
-                path.write_text(json.dumps(existing_data, indent=2), encoding="utf-8")
+                dataframe.to_csv(path, index=False, mode="a", header=False)
             else:
-                dataframe.to_json(path, orient="records", indent=2)
+                with atomic_write(path) as file:
+                    dataframe.to_csv(file, index=False)
+        elif fmt == "excel":
+            with atomic_write(path, mode="wb") as file:
+                dataframe.to_excel(file, index=False, engine="openpyxl")
+        elif fmt == "json":
+            write_json_records(path, self._iter_dataframe_chunks(dataframe), append=should_append)
+        elif fmt == "jsonl":
+            self._write_lines(path, self._iter_dataframe_chunks(dataframe, lines=True), append=should_append)
         elif fmt == "markdown":
             content = dataframe.to_markdown(index=False)
-            if should_append:
-                path.write_text(path.read_text(encoding="utf-8") + "\n\n" + content, encoding="utf-8")
-            else:
-                path.write_text(content, encoding="utf-8")
+            self._write_text(path, content, separator="\n\n", append=should_append)
         else:
             msg = f"Unsupported DataFrame format: {fmt}"
             raise ValueError(msg)
         action = "appended to" if should_append else "saved successfully as"
         return f"DataFrame {action} '{path}'"
 
+    def _write_text(self, path: Path, content: str, *, separator: str, append: bool) -> None:
+        """Write text to a file, or add it after ``separator`` at the end of the file."""
+        if append:
+            with path.open("a", encoding="utf-8") as file:
+                file.write(separator + content)
+        else:
+            with atomic_write(path) as file:
+                file.write(content)
+
+    def _write_lines(self, path: Path, lines: Iterable[str], *, append: bool) -> None:
+        """Write JSON Lines to a file, or add them at the end of the file."""
+        if append:
+            append_lines(path, lines)
+        else:
+            with atomic_write(path) as file:
+                for line in lines:
+                    file.write(line if line.endswith("\n") else line + "\n")
+
     def _save_data(self, data: Data, path: Path, fmt: str) -> str:
         """Save a Data object to the specified file format."""
         append_mode = getattr(self, "append_mode", False)
         should_append = append_mode and path.exists() and self._is_plain_text_format(fmt)
 
         if fmt == "csv":
-            pd.DataFrame(data.data).to_csv(
-                path,
-                index=False,
-                mode="a" if should_append else "w",
-                header=not should_append,
-            )
+            if should_append:
+                pd.DataFrame(data.data).to_csv(path, index=False, mode="a", header=False)
+            else:
+                with atomic_write(path) as file:
+                    pd.DataFrame(data.data).to_csv(file, index=False)
         elif fmt == "excel":
-            pd.DataFrame(data.data).to_excel(path, index=False, engine="openpyxl")
+            with atomic_write(path, mode="wb") as file:
+                pd.DataFrame(data.data).to_excel(file, index=False, engine="openpyxl")
         elif fmt == "json":
             new_data = jsonable_encoder(data.data)
             if should_append:
-                # Read and parse existing JSON
-                existing_data = []
-                try:
-                    existing_content = path.read_text(encoding="utf-8").strip()
-                    if existing_content:
-                        parsed = json.loads(existing_content)
-                        # Handle case where existing content is a single object
-                        if isinstance(parsed, dict):
-                            existing_data = [parsed]
-                        elif isinstance(parsed, list):
-                            existing_data = parsed
-                except (json.JSONDecodeError, FileNotFoundError):
-                    # Treat parse errors or missing file as empty array
-                    existing_data = []
-
-                # Append new data
-                if isinstance(new_data, list):
-                    existing_data.extend(new_data)
-                else:
-                    existing_data.append(new_data)
-
-                # Write back as a single JSON array
-                path.write_text(json.dumps(existing_data, indent=2), encoding="utf-8")
+                records = new_data if isinstance(new_data, list) else [new_data]
+                write_json_records(path, [json_array_items(json.dumps(records, indent=2))], append=True)
             else:
-                content = orjson.dumps(new_data, option=orjson.OPT_INDENT_2).decode("utf-8")
-                path.write_text(content, encoding="utf-8")
+                with atomic_write(path, mode="wb") as file:
+                    file.write(orjson.dumps(new_data, option=orjson.OPT_INDENT_2))
+        elif fmt == "jsonl":
+            new_data = jsonable_encoder(data.data)
+            records = new_data if isinstance(new_data, list) else [new_data]
+            self._write_lines(path, [json.dumps(record) for record in records], append=should_append)
         elif fmt == "markdown":
             content = pd.DataFrame(data.data).to_markdown(index=False)
-            if should_append:
-                path.write_text(path.read_text(encoding="utf-8") + "\n\n" + content, encoding="utf-8")
-            else:
-                path.write_text(content, encoding="utf-8")
+            self._write_text(path, content, separator="\n\n", append=should_append)
         else:
             msg = f"Unsupported Data format: {fmt}"
             raise ValueError(msg)
@@ -465,41 +456,18 @@ class SaveToFileComponent(Component):
         should_append = append_mode and path.exists() and self._is_plain_text_format(fmt)
 
         if fmt == "txt":
-            if should_append:
-                path.write_text(path.read_text(encoding="utf-8") + "\n" + content, encoding="utf-8")
-            else:
-                path.write_text(content, encoding="utf-8")
+            self._write_text(path, content, separator="\n", append=should_append)
         elif fmt == "json":
             new_message = {"message": content}
             if should_append:
-                # Read and parse existing JSON
-                existing_data = []
-                try:
-                    existing_content = path.read_text(encoding="utf-8").strip()
-                    if existing_content:
-                        parsed = json.loads(existing_content)
-                        # Handle case where existing content is a single object
-                        if isinstance(parsed, dict):
-                            existing_data = [parsed]
-                        elif isinstance(parsed, list):
-                            existing_data = parsed
-                except (json.JSONDecodeError, FileNotFoundError):
-                    # Treat parse errors or missing file as empty array
-                    existing_data = []
-
-                # Append new message
-                existing_data.append(new_message)
-
-                # Write back as a single JSON array
-                path.write_text(json.dumps(existing_data, indent=2), encoding="utf-8")
+                write_json_records(path, [json_array_items(json.dumps([new_message], indent=2))], append=True)
             else:
-                path.write_text(json.dumps(new_message, indent=2), encoding="utf-8")
+                with atomic_write(path) as file:
+                    file.write(json.dumps(new_message, indent=2))
+        elif fmt == "jsonl":
+            self._write_lines(path, [json.dumps({"message": content})], append=should_append)
         elif fmt == "markdown":
-            md_content = f"**Message:**\n\n{content}"
-            if should_append:
-                path.write_text(path.read_text(encoding="utf-8") + "\n\n" + md_content, encoding="utf-8")
-            else:
-                path.write_text(md_content, encoding="utf-8")
+            self._write_text(path, f"**Message:**\n\n{content}", separator="\n\n", append=should_append)
         else:
             msg = f"Unsupported Message format: {fmt}"
             raise ValueError(msg)
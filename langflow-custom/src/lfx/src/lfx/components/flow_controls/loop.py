@@ -1,11 +1,16 @@
+from lfx.base.flow_processing.loop_body import LoopBody
 from lfx.components.processing.converter import convert_to_data
 from lfx.custom.custom_component.component import Component
-from lfx.inputs.inputs import HandleInput
+from lfx.inputs.inputs import DropdownInput, HandleInput, IntInput
 from lfx.schema.data import Data
 from lfx.schema.dataframe import DataFrame
 from lfx.schema.message import Message
+from lfx.services.deps import get_settings_service
 from lfx.template.field.base import Output
 
+SEQUENTIAL_MODE = "Sequential"
+MAP_MODE = "Parallel Map"
+
 
 class LoopComponent(Component):
     display_name = "Loop"
@@ -24,6 +29,24 @@ class LoopComponent(Component):
             info="The initial DataFrame to iterate over.",
             input_types=["DataFrame"],
         ),
+        DropdownInput(
+            name="execution_mode",
+            display_name="Execution Mode",
+            options=[SEQUENTIAL_MODE, MAP_MODE],
+            value=SEQUENTIAL_MODE,
+            info=(
+                "Sequential runs the loop body for one item at a time. Parallel Map runs it for several items "
+                "at once, each in its own copy of the body, and keeps the results in the order of the inputs."
+            ),
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            value=4,
+            info="Maximum number of items processed at the same time in Parallel Map mode.",
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -90,6 +113,11 @@ class LoopComponent(Component):
 
     def item_output(self) -> Data:
         """Output the next item in the list or stop if done."""
+        if self.execution_mode == MAP_MODE:
+            # The loop body runs inside done_output, the item branch is never followed
+            self.stop("item")
+            return Data(text="")
+
         self.initialize_data()
         current_item = Data(text="")
 
@@ -120,8 +148,11 @@ class LoopComponent(Component):
             if self._id not in self.graph.run_manager.run_map[item_dependency_id]:
                 self.graph.run_manager.run_map[item_dependency_id].append(self._id)
 
-    def done_output(self) -> DataFrame:
+    async def done_output(self) -> DataFrame:
         """Trigger the done output when iteration is complete."""
+        if self.execution_mode == MAP_MODE:
+            return await self.map_output()
+
         self.initialize_data()
 
         if self.evaluate_stop_loop():
@@ -134,6 +165,30 @@ class LoopComponent(Component):
         self.stop("done")
         return DataFrame([])
 
+    async def map_output(self) -> DataFrame:
+        """Run the loop body for every item concurrently and aggregate the results in order."""
+        if self._vertex is None:
+            msg = "Parallel Map mode requires the Loop to run in a flow."
+            raise ValueError(msg)
+
+        data_list = self._validate_data(self.data)
+        body = LoopBody(self.graph, self._id)
+        settings_service = get_settings_service()
+        fallback_to_env_vars = settings_service.settings.fallback_to_env_var if settings_service else False
+        results = await body.map(
+            data_list, max_concurrency=self.max_concurrency, fallback_to_env_vars=fallback_to_env_vars
+        )
+
+        aggregated = []
+        for result in results:
+            if result is None or isinstance(result, str):
+                continue
+            aggregated.append(self._convert_message_to_data(result) if isinstance(result, Message) else result)
+
+        self.stop("item")
+        self.start("done")
+        return DataFrame(aggregated)
+
     def loop_variables(self):
         """Retrieve loop variables from context."""
         return (
@@ -525,14 +525,15 @@ class Component(CustomComponent):
                     msg = f"Invalid output: {e}"
                     raise ValueError(msg) from e
         else:
-            outputs = self.outputs
+            # Outputs defined on the class are shared by every instance; copy them so that each
+            # instance can modify its own. Fields are only reassigned when an output is built, so a
+            # shallow copy is enough except for the types list, which add_types extends in place.
+            outputs = [output.model_copy(update={"types": list(output.types)}) for output in self.outputs]
         for output in outputs:
             if output.name is None:
                 msg = "Output name cannot be None."
                 raise ValueError(msg)
-            # Deepcopy is required to avoid modifying the original component;
-            # allows each instance of each component to modify its own output
-            self._outputs_map[output.name] = deepcopy(output)
+            self._outputs_map[output.name] = output
 
     def map_inputs(self, inputs: list[InputTypes]) -> None:
         """Maps the given inputs to the component.
@@ -1206,7 +1207,9 @@ class Component(CustomComponent):
 
         # First process outputs in the order defined by self.outputs
         for output in self.outputs:
-            output_obj = self._outputs_map.get(output.name, deepcopy(output))
+            output_obj = self._outputs_map.get(output.name)
+            if output_obj is None:
+                output_obj = deepcopy(output)
             if self._should_process_output(output_obj):
                 result.append(output_obj)
                 processed_names.add(output_obj.name)
@@ -1270,20 +1273,30 @@ class Component(CustomComponent):
             return output.value
         return await self._get_output_result(output)
 
+    @property
+    def headless(self) -> bool:
+        """Whether the component runs in a graph whose results are not displayed in the UI."""
+        return self._vertex is not None and getattr(self._vertex.graph, "headless", False) is True
+
     def _build_artifact(self, result):
         """Builds an artifact dictionary containing a string representation, raw data, and type for a result.
 
         The artifact includes a human-readable representation, the processed raw result, and its determined type.
+        The representation is left out in headless runs, where nothing displays it.
         """
-        custom_repr = self.custom_repr()
-        if custom_repr is None and isinstance(result, dict | Data | str):
-            custom_repr = result
-        if not isinstance(custom_repr, str):
-            custom_repr = str(custom_repr)
+        custom_repr = None
+        if not self.headless:
+            custom_repr = self.custom_repr()
+            if custom_repr is None and isinstance(result, dict | Data | str):
+                custom_repr = result
+            if not isinstance(custom_repr, str):
+                custom_repr = str(custom_repr)
 
         raw = self._process_raw_result(result)
         artifact_type = get_artifact_type(self.status or raw, result)
         raw, artifact_type = post_process_raw(raw, artifact_type)
+        if custom_repr is None:
+            return {"raw": raw, "type": artifact_type}
         return {"repr": custom_repr, "raw": raw, "type": artifact_type}
 
     def _process_raw_result(self, result):
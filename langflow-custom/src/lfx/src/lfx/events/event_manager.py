@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import inspect
-import json
 import time
 import uuid
 from functools import partial
@@ -11,6 +10,7 @@ from fastapi.encoders import jsonable_encoder
 from typing_extensions import Protocol
 
 from lfx.log.logger import logger
+from lfx.serialization.serialization import serialize_json
 
 if TYPE_CHECKING:
     # Lightweight type stub for log types
@@ -25,6 +25,18 @@ class PartialEventCallback(Protocol):
     def __call__(self, *, data: LoggableType): ...
 
 
+def _is_plain_json(data) -> bool:
+    """Whether ``data`` only holds JSON values, which jsonable_encoder would return unchanged."""
+    data_type = type(data)
+    if data_type is str or data_type is int or data_type is float or data_type is bool or data is None:
+        return True
+    if data_type is dict:
+        return all(type(key) is str and _is_plain_json(value) for key, value in data.items())
+    if data_type is list:
+        return all(_is_plain_json(item) for item in data)
+    return False
+
+
 class EventManager:
     def __init__(self, queue):
         self.queue = queue
@@ -71,13 +83,14 @@ class EventManager:
                 pass
         except Exception:  # noqa: BLE001
             logger.debug(f"Error processing event: {event_type}")
-        jsonable_data = jsonable_encoder(data)
+        # Build results are mostly plain JSON already, only other payloads go through jsonable_encoder
+        jsonable_data = data if _is_plain_json(data) else jsonable_encoder(data)
         json_data = {"event": event_type, "data": jsonable_data}
         event_id = f"{event_type}-{uuid.uuid4()}"
-        str_data = json.dumps(json_data) + "\n\n"
+        event_data = serialize_json(json_data) + b"\n\n"
         if self.queue:
             try:
-                self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
+                self.queue.put_nowait((event_id, event_data, time.time()))
             except Exception:  # noqa: BLE001
                 logger.debug("Queue not available for event")
 
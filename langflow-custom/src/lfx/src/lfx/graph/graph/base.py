@@ -34,6 +34,7 @@ from lfx.graph.utils import log_vertex_build
 from lfx.graph.vertex.base import Vertex, VertexStates
 from lfx.graph.vertex.schema import NodeData, NodeTypeEnum
 from lfx.graph.vertex.vertex_types import ComponentVertex, InterfaceVertex, StateVertex
+from lfx.interface.llm_cache import set_llm_cache_flow
 from lfx.log.logger import LogConfig, configure, logger
 from lfx.schema.dotdict import dotdict
 from lfx.schema.schema import INPUT_FIELD_NAME, InputType, OutputValue
@@ -42,7 +43,7 @@ from lfx.services.deps import get_chat_service, get_tracing_service
 from lfx.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator, Iterable
+    from collections.abc import Callable, Generator, Iterable, Iterator
     from typing import Any
 
     from lfx.custom.custom_component.component import Component
@@ -105,7 +106,8 @@ class Graph:
         # Conditional routing system (separate from ACTIVE/INACTIVE cycle management)
         self.conditionally_excluded_vertices: set = set()  # Vertices excluded by conditional routing
         self.conditional_exclusion_sources: dict[str, set[str]] = {}  # Maps source vertex -> excluded vertices
-        self.edges: list[CycleEdge] = []
+        # Setting the edges also builds the per-vertex edge lookups, see _index_edges
+        self.edges = []
         self.vertices: list[Vertex] = []
         self.run_manager = RunnableVerticesManager()
         self._vertices: list[NodeData] = []
@@ -127,6 +129,9 @@ class Graph:
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
         self._end_trace_tasks: set[asyncio.Task] = set()
+        # Only lfx run and lfx serve mark their graphs headless, so their components skip the artifact
+        # reprs. Backend API runs must keep it off, their responses include the artifacts.
+        self.headless = False
 
         if context and not isinstance(context, dict):
             msg = "Context must be a dictionary"
@@ -642,6 +647,7 @@ class Graph:
     async def initialize_run(self) -> None:
         if not self._run_id:
             self.set_run_id()
+        set_llm_cache_flow(self.flow_id, self.flow_name)
         if self.tracing_service:
             run_name = f"{self.flow_name} - {self.flow_id}"
             await self.tracing_service.start_tracers(
@@ -649,6 +655,8 @@ class Graph:
                 run_name=run_name,
                 user_id=self.user_id,
                 session_id=self.session_id,
+                flow_id=self.flow_id,
+                flow_name=self.flow_name,
             )
 
     def _end_all_traces_async(self, outputs: dict[str, Any] | None = None, error: Exception | None = None) -> None:
@@ -1024,10 +1032,7 @@ class Graph:
 
     def get_edge(self, source_id: str, target_id: str) -> CycleEdge | None:
         """Returns the edge between two vertices."""
-        for edge in self.edges:
-            if edge.source_id == source_id and edge.target_id == target_id:
-                return edge
-        return None
+        return self._edge_map.get((source_id, target_id))
 
     def build_parent_child_map(self, vertices: list[Vertex]):
         parent_child_map = defaultdict(list)
@@ -1114,7 +1119,9 @@ class Graph:
             state["run_manager"] = run_manager
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
+        edges = state.pop("edges")
         self.__dict__.update(state)
+        self.edges = edges
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
         # Tracing service will be lazily initialized via property when needed
         self.set_run_id(self._run_id)
@@ -1171,13 +1178,9 @@ class Graph:
 
     def update_edges_from_vertex(self, other_vertex: Vertex) -> None:
         """Updates the edges of a vertex in the Graph."""
-        new_edges = []
-        for edge in self.edges:
-            if other_vertex.id in {edge.source_id, edge.target_id}:
-                continue
-            new_edges.append(edge)
-        new_edges += other_vertex.edges
-        self.edges = new_edges
+        self._remove_edges_of_vertex(other_vertex.id)
+        for edge in other_vertex.edges:
+            self._append_edge(edge)
 
     def vertex_data_is_identical(self, vertex: Vertex, other_vertex: Vertex) -> bool:
         data_is_equivalent = vertex == other_vertex
@@ -1286,8 +1289,12 @@ class Graph:
         """Updates the edges of a vertex."""
         # Vertex has edges, so we need to update the edges
         for edge in vertex.edges:
-            if edge not in self.edges and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
-                self.edges.append(edge)
+            if (
+                edge.source_id in self.vertex_map
+                and edge.target_id in self.vertex_map
+                and edge not in self._outgoing_edges.get(edge.source_id, ())
+            ):
+                self._append_edge(edge)
 
     def _build_graph(self) -> None:
         """Builds the graph from the vertices and edges."""
@@ -1349,7 +1356,7 @@ class Graph:
             return
         self.vertices.remove(vertex)
         self.vertex_map.pop(vertex_id)
-        self.edges = [edge for edge in self.edges if vertex_id not in {edge.source_id, edge.target_id}]
+        self._remove_edges_of_vertex(vertex_id)
 
     def _build_vertex_params(self) -> None:
         """Identifies and handles the LLM vertex within the graph."""
@@ -1601,23 +1608,15 @@ class Graph:
         """Returns a list of edges for a given vertex."""
         # The idea here is to return the edges that have the vertex_id as source or target
         # or both
-        return [
-            edge
-            for edge in self.edges
-            if (edge.source_id == vertex_id and is_source is not False)
-            or (edge.target_id == vertex_id and is_target is not False)
-        ]
+        if is_source is False:
+            return [] if is_target is False else list(self._incoming_edges.get(vertex_id, ()))
+        if is_target is False:
+            return list(self._outgoing_edges.get(vertex_id, ()))
+        return list(self._vertex_edges.get(vertex_id, ()))
 
     def get_vertices_with_target(self, vertex_id: str) -> list[Vertex]:
         """Returns the vertices connected to a vertex."""
-        vertices: list[Vertex] = []
-        for edge in self.edges:
-            if edge.target_id == vertex_id:
-                vertex = self.get_vertex(edge.source_id)
-                if vertex is None:
-                    continue
-                vertices.append(vertex)
-        return vertices
+        return [self.get_vertex(edge.source_id) for edge in self._incoming_edges.get(vertex_id, ())]
 
     async def process(
         self,
@@ -1842,23 +1841,32 @@ class Graph:
         state = dict.fromkeys(self.vertices, 0)
         sorted_vertices = []
 
-        def dfs(vertex) -> None:
-            if state[vertex] == 1:
-                # We have a cycle
-                msg = "Graph contains a cycle, cannot perform topological sort"
-                raise ValueError(msg)
-            if state[vertex] == 0:
-                state[vertex] = 1
-                for edge in vertex.edges:
-                    if edge.source_id == vertex.id:
-                        dfs(self.get_vertex(edge.target_id))
-                state[vertex] = 2
-                sorted_vertices.append(vertex)
-
-        # Visit each vertex
-        for vertex in self.vertices:
-            if state[vertex] == 0:
-                dfs(vertex)
+        def targets(vertex) -> Iterator[Vertex]:
+            for edge in vertex.edges:
+                if edge.source_id == vertex.id:
+                    yield self.get_vertex(edge.target_id)
+
+        # Depth-first search with an explicit stack, so long chains do not hit the recursion limit
+        for root in self.vertices:
+            if state[root] != 0:
+                continue
+            state[root] = 1
+            stack = [(root, targets(root))]
+            while stack:
+                vertex, children = stack[-1]
+                for child in children:
+                    if state[child] == 1:
+                        # We have a cycle
+                        msg = "Graph contains a cycle, cannot perform topological sort"
+                        raise ValueError(msg)
+                    if state[child] == 0:
+                        state[child] = 1
+                        stack.append((child, targets(child)))
+                        break
+                else:
+                    stack.pop()
+                    state[vertex] = 2
+                    sorted_vertices.append(vertex)
 
         return list(reversed(sorted_vertices))
 
@@ -1933,14 +1941,18 @@ class Graph:
         If `recursive` is True, returns both direct and indirect predecessors by
         traversing the graph recursively. If False, returns only the immediate predecessors.
         """
-        _predecessors = self.predecessor_map.get(vertex.id, [])
-        predecessors = [self.get_vertex(v_id) for v_id in _predecessors]
+        predecessor_ids = list(dict.fromkeys(self.predecessor_map.get(vertex.id, [])))
         if recursive:
-            for predecessor in _predecessors:
-                predecessors.extend(self.get_all_predecessors(self.get_vertex(predecessor), recursive=recursive))
-        else:
-            predecessors.extend([self.get_vertex(predecessor) for predecessor in _predecessors])
-        return predecessors
+            # Breadth-first, so each predecessor is listed once even with shared ancestors or cycles
+            visited = set(predecessor_ids)
+            queue = deque(predecessor_ids)
+            while queue:
+                for predecessor_id in self.predecessor_map.get(queue.popleft(), []):
+                    if predecessor_id not in visited:
+                        visited.add(predecessor_id)
+                        predecessor_ids.append(predecessor_id)
+                        queue.append(predecessor_id)
+        return [self.get_vertex(predecessor_id) for predecessor_id in predecessor_ids]
 
     def get_vertex_neighbors(self, vertex: Vertex) -> dict[Vertex, int]:
         """Returns a dictionary mapping each direct neighbor of a vertex to the count of connecting edges.
@@ -1949,7 +1961,7 @@ class Graph:
         The count reflects the number of edges between the input vertex and each neighbor.
         """
         neighbors: dict[Vertex, int] = {}
-        for edge in self.edges:
+        for edge in self._vertex_edges.get(vertex.id, ()):
             if edge.source_id == vertex.id:
                 neighbor = self.get_vertex(edge.target_id)
                 if neighbor is None:
@@ -1984,6 +1996,62 @@ class Graph:
             self._cycle_vertices = set(find_cycle_vertices(edges))
         return self._cycle_vertices
 
+    @property
+    def edges(self) -> list[CycleEdge]:
+        return self._edge_list
+
+    @edges.setter
+    def edges(self, edges: list[CycleEdge]) -> None:
+        self._edge_list = edges
+        self._index_edges()
+
+    def _index_edges(self) -> None:
+        """Builds the incoming and outgoing edges of each vertex and the edge of each (source, target) pair.
+
+        ``self.edges`` is only changed through the setter, ``_append_edge`` and ``_remove_edges_of_vertex``,
+        which keep these lookups in sync.
+        """
+        self._incoming_edges: dict[str, list[CycleEdge]] = defaultdict(list)
+        self._outgoing_edges: dict[str, list[CycleEdge]] = defaultdict(list)
+        # Incoming and outgoing edges of each vertex, in the order of self.edges
+        self._vertex_edges: dict[str, list[CycleEdge]] = defaultdict(list)
+        self._edge_map: dict[tuple[str, str], CycleEdge] = {}
+        for edge in self._edge_list:
+            self._index_edge(edge)
+
+    def _index_edge(self, edge: CycleEdge) -> None:
+        self._outgoing_edges[edge.source_id].append(edge)
+        self._incoming_edges[edge.target_id].append(edge)
+        self._vertex_edges[edge.source_id].append(edge)
+        if edge.target_id != edge.source_id:
+            self._vertex_edges[edge.target_id].append(edge)
+        # get_edge returns the first edge between two vertices
+        self._edge_map.setdefault((edge.source_id, edge.target_id), edge)
+
+    def _append_edge(self, edge: CycleEdge) -> None:
+        self._edge_list.append(edge)
+        self._index_edge(edge)
+
+    def _remove_edges_of_vertex(self, vertex_id: str) -> None:
+        """Removes the edges that have the vertex as source or target."""
+        removed = self._vertex_edges.pop(vertex_id, None)
+        if not removed:
+            return
+        self._incoming_edges.pop(vertex_id, None)
+        self._outgoing_edges.pop(vertex_id, None)
+        neighbor_ids = set()
+        for edge in removed:
+            self._edge_map.pop((edge.source_id, edge.target_id), None)
+            neighbor_ids.update((edge.source_id, edge.target_id))
+        neighbor_ids.discard(vertex_id)
+        for neighbor_id in neighbor_ids:
+            for index in (self._incoming_edges, self._outgoing_edges, self._vertex_edges):
+                if neighbor_id in index:
+                    index[neighbor_id] = [
+                        edge for edge in index[neighbor_id] if vertex_id not in {edge.source_id, edge.target_id}
+                    ]
+        self._edge_list = [edge for edge in self._edge_list if vertex_id not in {edge.source_id, edge.target_id}]
+
     def _build_edges(self) -> list[CycleEdge]:
         """Builds the edges of the graph."""
         # Edge takes two vertices as arguments, so we need to build the vertices first
@@ -2145,7 +2213,6 @@ class Graph:
             cycle_vertices=self.cycle_vertices,
             stop_component_id=stop_component_id,
             start_component_id=start_component_id,
-            graph_dict=self.__to_dict(),
             in_degree_map=self.in_degree_map,
             successor_map=self.successor_map,
             predecessor_map=self.predecessor_map,
@@ -2286,13 +2353,3 @@ class Graph:
             predecessor_map[edge.target_id].append(edge.source_id)
             successor_map[edge.source_id].append(edge.target_id)
         return predecessor_map, successor_map
-
-    def __to_dict(self) -> dict[str, dict[str, list[str]]]:
-        """Converts the graph to a dictionary."""
-        result: dict = {}
-        for vertex in self.vertices:
-            vertex_id = vertex.id
-            sucessors = [i.id for i in self.get_all_successors(vertex)]
-            predecessors = [i.id for i in self.get_predecessors(vertex)]
-            result |= {vertex_id: {"successors": sucessors, "predecessors": predecessors}}
-        return result
@@ -1,6 +1,6 @@
 import copy
-from collections import defaultdict, deque
-from collections.abc import Callable
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
 import networkx as nx
@@ -300,6 +300,8 @@ def sort_up_to_vertex(
         stop_or_start_vertex = graph[vertex_id]
 
     visited, excluded = set(), set()
+    # Vertices whose successors were all added, so their descendants are never walked twice
+    expanded: set[str] = set()
     stack = [vertex_id]
     stop_predecessors = set(stop_or_start_vertex["predecessors"])
 
@@ -314,20 +316,58 @@ def sort_up_to_vertex(
         stack.extend(current_vertex["predecessors"])
 
         if current_id == vertex_id or (current_id not in stop_predecessors and is_start):
-            for successor_id in current_vertex["successors"]:
+            # Add every descendant of the current vertex
+            descendants = list(current_vertex["successors"])
+            while descendants:
+                successor_id = descendants.pop()
+                if successor_id in expanded:
+                    continue
+                expanded.add(successor_id)
                 if is_start:
                     stack.append(successor_id)
                 else:
                     excluded.add(successor_id)
-                for succ_id in get_successors(graph, successor_id):
-                    if is_start:
-                        stack.append(succ_id)
-                    else:
-                        excluded.add(succ_id)
+                descendants.extend(graph[successor_id]["successors"])
 
     return list(visited)
 
 
+def _iter_back_edges(adjacency: dict[str, list[str]], roots: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Yields the edges closing a cycle, in the order a depth-first search from ``roots`` meets them.
+
+    The search is iterative, so long chains of vertices do not hit the recursion limit, and vertices
+    are only visited once across all roots.
+    """
+    visited: set[str] = set()
+    on_path: set[str] = set()
+    for root in roots:
+        if root in visited:
+            continue
+        visited.add(root)
+        on_path.add(root)
+        stack = [(root, iter(adjacency.get(root, ())))]
+        while stack:
+            vertex, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    on_path.add(neighbor)
+                    stack.append((neighbor, iter(adjacency.get(neighbor, ()))))
+                    break
+                if neighbor in on_path:
+                    yield (vertex, neighbor)
+            else:
+                stack.pop()
+                on_path.discard(vertex)
+
+
+def _build_adjacency(edges: list[tuple[str, str]]) -> dict[str, list[str]]:
+    graph: dict[str, list[str]] = defaultdict(list)
+    for u, v in edges:
+        graph[u].append(v)
+    return graph
+
+
 def has_cycle(vertex_ids: list[str], edges: list[tuple[str, str]]) -> bool:
     """Determines whether a directed graph represented by a list of vertices and edges contains a cycle.
 
@@ -338,30 +378,7 @@ def has_cycle(vertex_ids: list[str], edges: list[tuple[str, str]]) -> bool:
     Returns:
         bool: True if the graph contains a cycle, False otherwise.
     """
-    # Build the graph as an adjacency list
-    graph = defaultdict(list)
-    for u, v in edges:
-        graph[u].append(v)
-
-    # Utility function to perform DFS
-    def dfs(v, visited, rec_stack) -> bool:
-        visited.add(v)
-        rec_stack.add(v)
-
-        for neighbor in graph[v]:
-            if neighbor not in visited:
-                if dfs(neighbor, visited, rec_stack):
-                    return True
-            elif neighbor in rec_stack:
-                return True
-
-        rec_stack.remove(v)
-        return False
-
-    visited: set[str] = set()
-    rec_stack: set[str] = set()
-
-    return any(vertex not in visited and dfs(vertex, visited, rec_stack) for vertex in vertex_ids)
+    return next(_iter_back_edges(_build_adjacency(edges), vertex_ids), None) is not None
 
 
 def find_cycle_edge(entry_point: str, edges: list[tuple[str, str]]) -> tuple[str, str]:
@@ -374,31 +391,7 @@ def find_cycle_edge(entry_point: str, edges: list[tuple[str, str]]) -> tuple[str
     Returns:
         tuple[str, str]: A tuple representing the edge that causes a cycle, or None if no cycle is found.
     """
-    # Build the graph as an adjacency list
-    graph = defaultdict(list)
-    for u, v in edges:
-        graph[u].append(v)
-
-    # Utility function to perform DFS
-    def dfs(v, visited, rec_stack):
-        visited.add(v)
-        rec_stack.add(v)
-
-        for neighbor in graph[v]:
-            if neighbor not in visited:
-                result = dfs(neighbor, visited, rec_stack)
-                if result:
-                    return result
-            elif neighbor in rec_stack:
-                return (v, neighbor)  # This edge causes the cycle
-
-        rec_stack.remove(v)
-        return None
-
-    visited: set[str] = set()
-    rec_stack: set[str] = set()
-
-    return dfs(entry_point, visited, rec_stack)
+    return next(_iter_back_edges(_build_adjacency(edges), [entry_point]), None)
 
 
 def find_all_cycle_edges(entry_point: str, edges: list[tuple[str, str]]) -> list[tuple[str, str]]:
@@ -411,31 +404,7 @@ def find_all_cycle_edges(entry_point: str, edges: list[tuple[str, str]]) -> list
     Returns:
         list[tuple[str, str]]: A list of tuples representing edges that cause cycles.
     """
-    # Build the graph as an adjacency list
-    graph = defaultdict(list)
-    for u, v in edges:
-        graph[u].append(v)
-
-    # Utility function to perform DFS
-    def dfs(v, visited, rec_stack, cycle_edges):
-        visited.add(v)
-        rec_stack.add(v)
-
-        for neighbor in graph[v]:
-            if neighbor not in visited:
-                dfs(neighbor, visited, rec_stack, cycle_edges)
-            elif neighbor in rec_stack:
-                cycle_edges.append((v, neighbor))  # This edge causes a cycle
-
-        rec_stack.remove(v)
-
-    visited: set[str] = set()
-    rec_stack: set[str] = set()
-    cycle_edges: list[tuple[str, str]] = []
-
-    dfs(entry_point, visited, rec_stack, cycle_edges)
-
-    return cycle_edges
+    return list(_iter_back_edges(_build_adjacency(edges), [entry_point]))
 
 
 def should_continue(yielded_counts: dict[str, int], max_iterations: int | None) -> bool:
@@ -516,6 +485,8 @@ def layered_topological_sort(
             # or (is_input_vertex and is_input_vertex(vertex_id))
         )
 
+    # How many times each vertex is in the queue, to check membership without scanning it
+    queued = Counter(queue)
     layers: list[list[str]] = []
     visited = set()
     cycle_counts = dict.fromkeys(vertices_ids, 0)
@@ -528,6 +499,7 @@ def layered_topological_sort(
         layer_size = len(queue)
         for _ in range(layer_size):
             vertex_id = queue.popleft()
+            queued[vertex_id] -= 1
             if vertex_id not in first_layer_vertices:
                 first_layer_vertices.add(vertex_id)
                 visited.add(vertex_id)
@@ -545,17 +517,19 @@ def layered_topological_sort(
                 in_degree_map[neighbor] -= 1  # 'remove' edge
                 if in_degree_map[neighbor] == 0:
                     queue.append(neighbor)
+                    queued[neighbor] += 1
 
                 # if > 0 it might mean not all predecessors have added to the queue
                 # so we should process the neighbors predecessors
                 elif in_degree_map[neighbor] > 0:
                     for predecessor in predecessor_map[neighbor]:
                         if (
-                            predecessor not in queue
+                            not queued[predecessor]
                             and predecessor not in first_layer_vertices
                             and (in_degree_map[predecessor] == 0 or predecessor in cycle_vertices)
                         ):
                             queue.append(predecessor)
+                            queued[predecessor] += 1
 
         current_layer += 1  # Next layer
 
@@ -565,6 +539,7 @@ def layered_topological_sort(
         layer_size = len(queue)
         for _ in range(layer_size):
             vertex_id = queue.popleft()
+            queued[vertex_id] -= 1
             if vertex_id not in visited or (is_cyclic and cycle_counts[vertex_id] < MAX_CYCLE_APPEARANCES):
                 if vertex_id not in visited:
                     visited.add(vertex_id)
@@ -582,6 +557,7 @@ def layered_topological_sort(
                 in_degree_map[neighbor] -= 1  # 'remove' edge
                 if in_degree_map[neighbor] == 0 and neighbor not in visited:
                     queue.append(neighbor)
+                    queued[neighbor] += 1
                     # # If this is a cycle vertex, reset its in_degree to allow it to appear again
                     # if neighbor in cycle_vertices and neighbor in visited:
                     #     in_degree_map[neighbor] = len(predecessor_map[neighbor])
@@ -590,11 +566,12 @@ def layered_topological_sort(
                 # so we should process the neighbors predecessors
                 elif in_degree_map[neighbor] > 0:
                     for predecessor in predecessor_map[neighbor]:
-                        if predecessor not in queue and (
+                        if not queued[predecessor] and (
                             predecessor not in visited
                             or (is_cyclic and cycle_counts[predecessor] < MAX_CYCLE_APPEARANCES)
                         ):
                             queue.append(predecessor)
+                            queued[predecessor] += 1
 
         current_layer += 1  # Next layer
 
@@ -689,15 +666,30 @@ def _sort_single_layer_by_dependency(
     dependency_cache: dict[str, int] = {}
 
     def max_dependency_index(vertex: str) -> int:
+        """Highest index among the vertex and the vertices of the layer it reaches, walked depth first."""
         if vertex in dependency_cache:
             return dependency_cache[vertex]
-        max_index = index_map[vertex]
-        for successor in get_vertex_successors(vertex):
-            if successor in index_map:
-                max_index = max(max_index, max_dependency_index(successor))
-
-        dependency_cache[vertex] = max_index
-        return max_index
+        # Vertices of a cycle in the same layer, such as a loop and its body, reach themselves again
+        # and get the index known so far
+        dependency_cache[vertex] = index_map[vertex]
+        stack = [[vertex, index_map[vertex], iter(get_vertex_successors(vertex))]]
+        while stack:
+            frame = stack[-1]
+            for successor in frame[2]:
+                if successor not in index_map:
+                    continue
+                if successor in dependency_cache:
+                    frame[1] = max(frame[1], dependency_cache[successor])
+                    continue
+                dependency_cache[successor] = index_map[successor]
+                stack.append([successor, index_map[successor], iter(get_vertex_successors(successor))])
+                break
+            else:
+                stack.pop()
+                dependency_cache[frame[0]] = frame[1]
+                if stack:
+                    stack[-1][1] = max(stack[-1][1], frame[1])
+        return dependency_cache[vertex]
 
     return sorted(layer, key=max_dependency_index, reverse=True)
 
@@ -862,18 +854,14 @@ def get_sorted_vertices(
             get_vertex_successors=get_vertex_successors,
             graph_dict=graph_dict,
         )
-        # Then get all vertices that can reach any reachable vertex
-        connected_vertices = set()
-        for vertex in reachable_vertices:
-            connected_vertices.update(
-                filter_vertices_up_to_vertex(
-                    vertices_ids,
-                    vertex,
-                    get_vertex_predecessors=get_vertex_predecessors,
-                    get_vertex_successors=get_vertex_successors,
-                    graph_dict=graph_dict,
-                )
-            )
+        # Then get all vertices that can reach any reachable vertex, in a single walk
+        connected_vertices = _filter_vertices_up_to_vertices(
+            vertices_ids,
+            reachable_vertices,
+            get_vertex_predecessors=get_vertex_predecessors,
+            get_vertex_successors=get_vertex_successors,
+            graph_dict=graph_dict,
+        )
         vertices_ids = list(connected_vertices)
 
     # Get the layers
@@ -933,8 +921,26 @@ def filter_vertices_up_to_vertex(
     Returns:
         Set of vertex IDs that are predecessors of the given vertex
     """
+    return _filter_vertices_up_to_vertices(
+        vertices_ids,
+        [vertex_id],
+        get_vertex_predecessors=get_vertex_predecessors,
+        get_vertex_successors=get_vertex_successors,
+        graph_dict=graph_dict,
+    )
+
+
+def _filter_vertices_up_to_vertices(
+    vertices_ids: list[str],
+    targets: Iterable[str],
+    get_vertex_predecessors: Callable[[str], list[str]] | None = None,
+    get_vertex_successors: Callable[[str], list[str]] | None = None,
+    graph_dict: dict[str, Any] | None = None,
+) -> set[str]:
+    """Same as ``filter_vertices_up_to_vertex`` for several vertices, walking each predecessor once."""
     vertices_set = set(vertices_ids)
-    if vertex_id not in vertices_set:
+    targets = [target for target in targets if target in vertices_set]
+    if not targets:
         return set()
 
     # Build predecessor map if not provided
@@ -954,9 +960,9 @@ def filter_vertices_up_to_vertex(
         def get_vertex_successors(v):
             return graph_dict[v]["successors"]
 
-    # Start with the target vertex
-    filtered_vertices = {vertex_id}
-    queue = deque([vertex_id])
+    # Start with the target vertices
+    filtered_vertices = set(targets)
+    queue = deque(filtered_vertices)
 
     # Process vertices in breadth-first order
     while queue:
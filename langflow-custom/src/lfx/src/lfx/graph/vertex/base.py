@@ -320,7 +320,7 @@ class Vertex:
 
                 else:
                     params[param_key] = self.graph.get_vertex(edge.source_id)
-        elif param_key in self.output_names:
+        elif param_key in self.output_names and edge.target_id == self.id:
             #  if the loop is run the param_key item will be set over here
             # validate the edge
             params[param_key] = self.graph.get_vertex(edge.source_id)
@@ -3,13 +3,16 @@ import hashlib
 import importlib
 import inspect
 import json
+import mmap
 import os
 import pkgutil
+import sys
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
 import orjson
+from filelock import FileLock
 
 from lfx.constants import BASE_COMPONENTS_PATH
 from lfx.custom.utils import abuild_custom_components, create_component_template
@@ -20,6 +23,9 @@ if TYPE_CHECKING:
 
 MIN_MODULE_PARTS = 2
 EXPECTED_RESULT_LENGTH = 2  # Expected length of the tuple returned by _process_single_module
+TYPES_CACHE_PREFIX = "component_types-"
+TYPES_CACHE_LOCK_TIMEOUT = 600  # Seconds a worker waits for another one to build the shared types cache
+TYPES_CACHE_STALE_AFTER = 7 * 24 * 3600  # Seconds before caches of other installations are removed
 
 
 # Create a class to manage component cache instead of using globals
@@ -210,6 +216,140 @@ def _save_generated_index(modules_dict: dict) -> None:
         logger.debug(f"Failed to save generated index to cache: {e}")
 
 
+def _hash_components_path(hasher: "hashlib._Hash", path: str) -> None:
+    """Hash the files under a components path by their relative path and content.
+
+    Bundles are extracted to a new temporary directory on every start, so the absolute
+    path is left out and only the files decide whether the cache is still valid.
+    """
+    root = Path(path)
+    hasher.update(b"\x00base\x00" if path == BASE_COMPONENTS_PATH else b"\x00custom\x00")
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if name != "__pycache__")
+        for filename in sorted(filenames):
+            if filename.endswith(".pyc"):
+                continue
+            file_path = Path(dirpath) / filename
+            hasher.update(file_path.relative_to(root).as_posix().encode())
+            hasher.update(file_path.read_bytes())
+
+
+def _get_types_cache_path(settings_service: "SettingsService") -> Path | None:
+    """Get the shared component types cache file for the current installation.
+
+    The file name is a hash of the lfx and langflow versions, the installed distributions,
+    the component index and the contents of every components path, so workers started from
+    the same installation share one file and any change produces a new one.
+
+    Returns:
+        The cache path, or None when the cache is disabled or dev mode rebuilds components on every start
+    """
+    settings = settings_service.settings
+    if not settings.component_types_cache or _parse_dev_mode()[0]:
+        return None
+
+    from importlib.metadata import PackageNotFoundError, version
+
+    import lfx
+
+    hasher = hashlib.sha256()
+    for package in ("lfx", "langflow"):
+        try:
+            hasher.update(f"{package}=={version(package)}".encode())
+        except PackageNotFoundError:
+            hasher.update(f"{package}==".encode())
+    # Components whose optional dependencies are missing are skipped, so installing a package must invalidate the cache
+    for entry in sys.path:
+        if Path(entry).is_dir():
+            dist_infos = sorted(path.name for path in Path(entry).glob("*.dist-info"))
+            hasher.update(",".join(dist_infos).encode())
+    hasher.update(f"lazy_load_components={settings.lazy_load_components}".encode())
+
+    index_path = settings.components_index_path
+    if index_path:
+        hasher.update(index_path.encode())
+    else:
+        index_path = str(Path(inspect.getfile(lfx)).parent / "_assets" / "component_index.json")
+    if not index_path.startswith(("http://", "https://")) and Path(index_path).is_file():
+        hasher.update(Path(index_path).read_bytes())
+
+    for path in settings.components_path:
+        _hash_components_path(hasher, path)
+
+    cache_dir = Path(settings.component_types_cache_dir or _get_cache_path().parent)
+    return cache_dir / f"{TYPES_CACHE_PREFIX}{hasher.hexdigest()[:32]}.json"
+
+
+def _read_types_cache(cache_path: Path) -> dict | None:
+    """Read the shared component types cache through a read-only memory map.
+
+    The file is parsed straight from the page cache shared by all workers instead of being
+    copied into each worker's heap first.
+    """
+    try:
+        with cache_path.open("rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug(f"Failed to read component types cache {cache_path}: {e}")
+        return None
+
+
+def _write_types_cache(cache_path: Path, all_types_dict: dict) -> None:
+    """Atomically write the shared component types cache and remove old caches of other installations."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(orjson.dumps(all_types_dict, option=orjson.OPT_NON_STR_KEYS))
+        tmp_path.replace(cache_path)
+        logger.debug(f"Saved component types cache: {cache_path}")
+
+        stale_before = time.time() - TYPES_CACHE_STALE_AFTER
+        for stale_path in cache_path.parent.glob(f"{TYPES_CACHE_PREFIX}*.json"):
+            if stale_path != cache_path and stale_path.stat().st_mtime < stale_before:
+                stale_path.unlink(missing_ok=True)
+    except (OSError, TypeError) as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.debug(f"Failed to save component types cache: {e}")
+
+
+async def _load_or_build_types_cache(cache_path: Path, build) -> tuple[dict[str, Any], bool]:
+    """Load the component types from the shared cache, building and saving them on a miss.
+
+    A file lock makes a single worker build the templates while the others wait and then
+    read the file it wrote.
+
+    Returns:
+        Tuple of (all_types_dict, loaded_from_cache)
+    """
+    all_types_dict = await asyncio.to_thread(_read_types_cache, cache_path)
+    if all_types_dict is not None:
+        return all_types_dict, True
+
+    try:
+        await asyncio.to_thread(cache_path.parent.mkdir, parents=True, exist_ok=True)
+        lock = FileLock(cache_path.with_suffix(".lock"), thread_local=False)
+        await asyncio.to_thread(lock.acquire, timeout=TYPES_CACHE_LOCK_TIMEOUT)
+    except (OSError, TimeoutError) as e:
+        await logger.awarning(f"Could not lock component types cache, building components without it: {e}")
+        return await build(), False
+
+    try:
+        # Another worker may have built the cache while this one waited for the lock
+        all_types_dict = await asyncio.to_thread(_read_types_cache, cache_path)
+        if all_types_dict is not None:
+            return all_types_dict, True
+        all_types_dict = await build()
+        await asyncio.to_thread(_write_types_cache, cache_path, all_types_dict)
+        return all_types_dict, False
+    finally:
+        lock.release()
+
+
 async def _send_telemetry(
     telemetry_service: Any,
     index_source: str,
@@ -596,24 +736,43 @@ async def get_and_cache_all_types_dict(
         telemetry_service: Optional telemetry service for tracking component loading metrics
     """
     if component_cache.all_types_dict is None:
-        await logger.adebug("Building components cache")
-
-        langflow_components = await import_langflow_components(settings_service, telemetry_service)
-        custom_components_dict = await _determine_loading_strategy(settings_service)
-
-        # Flatten custom dict if it has a "components" wrapper
-        custom_flat = custom_components_dict.get("components", custom_components_dict) or {}
-
-        # Merge built-in and custom components (no wrapper at cache level)
-        component_cache.all_types_dict = {
-            **langflow_components["components"],
-            **custom_flat,
-        }
+        start_time_ms: int = int(time.time() * 1000)
+        cache_path = await asyncio.to_thread(_get_types_cache_path, settings_service)
+        if cache_path is None:
+            component_cache.all_types_dict = await _build_all_types_dict(settings_service, telemetry_service)
+        else:
+            all_types_dict, from_cache = await _load_or_build_types_cache(
+                cache_path, lambda: _build_all_types_dict(settings_service, telemetry_service)
+            )
+            component_cache.all_types_dict = all_types_dict
+            if from_cache:
+                await logger.adebug(f"Loaded components from shared cache {cache_path}")
+                await _send_telemetry(telemetry_service, "shared_cache", all_types_dict, False, None, start_time_ms)  # noqa: FBT003
         component_count = sum(len(comps) for comps in component_cache.all_types_dict.values())
         await logger.adebug(f"Loaded {component_count} components")
     return component_cache.all_types_dict
 
 
+async def _build_all_types_dict(
+    settings_service: "SettingsService",
+    telemetry_service: Any | None = None,
+) -> dict[str, Any]:
+    """Build the component types by loading built-in components and the configured custom components."""
+    await logger.adebug("Building components cache")
+
+    langflow_components = await import_langflow_components(settings_service, telemetry_service)
+    custom_components_dict = await _determine_loading_strategy(settings_service)
+
+    # Flatten custom dict if it has a "components" wrapper
+    custom_flat = custom_components_dict.get("components", custom_components_dict) or {}
+
+    # Merge built-in and custom components (no wrapper at cache level)
+    return {
+        **langflow_components["components"],
+        **custom_flat,
+    }
+
+
 async def aget_all_types_dict(components_paths: list[str]):
     """Get all types dictionary with full component loading."""
     return await abuild_custom_components(components_paths=components_paths)
@@ -0,0 +1,260 @@
+"""Bounded LLM response cache used as the default LangChain cache."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+ALL_FLOWS = "*"
+
+llm_cache_flow_var: ContextVar[tuple[str | None, str | None] | None] = ContextVar("llm_cache_flow", default=None)
+
+
+def set_llm_cache_flow(flow_id: str | None, flow_name: str | None = None) -> None:
+    """Mark the current context as running the given flow.
+
+    The bounded LLM cache only serves flows that opted in, so the graph sets this
+    before building vertices and the value propagates to the tasks it creates.
+    """
+    llm_cache_flow_var.set((flow_id, flow_name))
+
+
+class _CacheEntry(NamedTuple):
+    value: RETURN_VAL_TYPE
+    size: int
+    expires_at: float
+
+
+class BoundedLLMCache(BaseCache):
+    """LLM cache with an LRU in-memory tier and an optional SQLite tier.
+
+    Entries are keyed by a hash of the prompt and the ``llm_string``, which LangChain
+    builds from the model class and its invocation parameters (model name,
+    temperature, stop tokens, ...), so the same prompt sent with different
+    parameters never shares an entry.
+
+    The in-memory tier is bounded by ``max_entries`` and ``max_bytes`` and evicts the
+    least recently used entries. When ``database_path`` is set, entries are also
+    written to a SQLite database that every worker on the host can read, so a
+    response produced by one worker is served from disk by the others and survives
+    restarts. Both tiers drop entries older than ``ttl`` seconds.
+
+    Only flows listed in ``flows`` are served; ``"*"`` enables the cache for every
+    flow and for LLM calls made outside a flow.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1000,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = 3600,
+        database_path: str | Path | None = None,
+        max_disk_entries: int = 10_000,
+        flows: Iterable[str] = (ALL_FLOWS,),
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_disk_entries = max_disk_entries
+        self.flows = frozenset(flows)
+
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._metrics = {
+            "hits": 0,
+            "misses": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "bytes_served": 0,
+            "bytes_written": 0,
+        }
+
+        self._db: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        self.database_path = Path(database_path) if database_path else None
+        if self.database_path is not None:
+            self._db = self._connect(self.database_path)
+
+    @staticmethod
+    def _connect(database_path: Path) -> sqlite3.Connection:
+        database_path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(database_path, check_same_thread=False, timeout=5, isolation_level=None)
+        # WAL lets workers read while another one writes
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "expires_at REAL NOT NULL, created_at REAL NOT NULL)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS llm_cache_created_at ON llm_cache (created_at)")
+        return db
+
+    @staticmethod
+    def _make_key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode()).hexdigest()
+
+    def is_enabled_for_current_flow(self) -> bool:
+        if ALL_FLOWS in self.flows:
+            return True
+        current_flow = llm_cache_flow_var.get()
+        if current_flow is None:
+            return False
+        flow_id, flow_name = current_flow
+        return (flow_id is not None and str(flow_id) in self.flows) or (
+            flow_name is not None and flow_name in self.flows
+        )
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """Counters plus the current size of the in-memory tier."""
+        with self._lock:
+            return {**self._metrics, "entries": len(self._entries), "bytes": self._bytes}
+
+    def _lookup_memory(self, key: str) -> RETURN_VAL_TYPE | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.time():
+                self._remove(key)
+                self._metrics["expirations"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._metrics["hits"] += 1
+            self._metrics["memory_hits"] += 1
+            self._metrics["bytes_served"] += entry.size
+            return entry.value
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _store_memory(self, key: str, value: RETURN_VAL_TYPE, size: int, expires_at: float) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _CacheEntry(value, size, expires_at)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._metrics["evictions"] += 1
+
+    def _lookup_disk(self, key: str) -> RETURN_VAL_TYPE | None:
+        if self._db is None:
+            return None
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT value, size, expires_at FROM llm_cache WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logger.debug(f"LLM cache disk lookup failed: {exc}")
+            return None
+        if row is None:
+            return None
+        serialized, size, expires_at = row
+        try:
+            value = loads(serialized)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"Could not deserialize cached LLM response: {exc}")
+            return None
+        self._store_memory(key, value, size, expires_at)
+        with self._lock:
+            self._metrics["hits"] += 1
+            self._metrics["disk_hits"] += 1
+            self._metrics["bytes_served"] += size
+        return value
+
+    def _store_disk(self, key: str, serialized: str, size: int, expires_at: float) -> None:
+        if self._db is None:
+            return
+        now = time.time()
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, size, expires_at, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, serialized, size, expires_at, now),
+                )
+                self._db.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+                self._db.execute(
+                    "DELETE FROM llm_cache WHERE key IN ("
+                    "SELECT key FROM llm_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_disk_entries,),
+                )
+        except sqlite3.Error as exc:
+            logger.debug(f"LLM cache disk write failed: {exc}")
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        if not self.is_enabled_for_current_flow():
+            return None
+        key = self._make_key(prompt, llm_string)
+        value = self._lookup_memory(key)
+        if value is None:
+            value = self._lookup_disk(key)
+        if value is None:
+            with self._lock:
+                self._metrics["misses"] += 1
+        return value
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        if not self.is_enabled_for_current_flow():
+            return
+        try:
+            serialized = dumps(return_val)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"Could not serialize LLM response for caching: {exc}")
+            return
+        key = self._make_key(prompt, llm_string)
+        size = len(serialized.encode())
+        expires_at = time.time() + self.ttl
+        self._store_memory(key, return_val, size, expires_at)
+        self._store_disk(key, serialized, size, expires_at)
+        with self._lock:
+            self._metrics["bytes_written"] += size
+
+    async def alookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        if self._db is None:
+            # Memory only lookups never block, so skip the executor hop
+            return self.lookup(prompt, llm_string)
+        return await super().alookup(prompt, llm_string)
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        if self._db is None:
+            self.update(prompt, llm_string, return_val)
+            return
+        await super().aupdate(prompt, llm_string, return_val)
+
+    def clear(self, **kwargs: Any) -> None:  # noqa: ARG002
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM llm_cache")
+
+    async def aclear(self, **kwargs: Any) -> None:
+        self.clear(**kwargs)
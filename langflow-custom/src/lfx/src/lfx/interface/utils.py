@@ -98,9 +98,27 @@ def set_langchain_cache(settings) -> None:
     from langchain.globals import set_llm_cache
     from langflow.interface.importing.utils import import_class
 
-    if cache_type := os.getenv("LANGFLOW_LANGCHAIN_CACHE"):
+    cache_type = os.getenv("LANGFLOW_LANGCHAIN_CACHE") or settings.langchain_cache
+    if cache_type == "BoundedLLMCache":
+        if not settings.llm_cache_flows:
+            logger.debug("No flow opted in to LLM caching.")
+            return
+        from lfx.interface.llm_cache import BoundedLLMCache
+
+        set_llm_cache(
+            BoundedLLMCache(
+                max_entries=settings.llm_cache_max_entries,
+                max_bytes=settings.llm_cache_max_bytes,
+                ttl=settings.llm_cache_ttl,
+                database_path=settings.llm_cache_database_path,
+                max_disk_entries=settings.llm_cache_max_disk_entries,
+                flows=settings.llm_cache_flows,
+            )
+        )
+        logger.info(f"LLM caching setup with BoundedLLMCache for flows: {', '.join(settings.llm_cache_flows)}")
+    elif cache_type:
         try:
-            cache_class = import_class(f"langchain_community.cache.{cache_type or settings.LANGCHAIN_CACHE}")
+            cache_class = import_class(f"langchain_community.cache.{cache_type}")
 
             logger.debug(f"Setting up LLM caching with {cache_class.__name__}")
             set_llm_cache(cache_class())
@@ -1,15 +1,16 @@
 """Logging configuration for Langflow using structlog."""
 
-import json
+import asyncio
+import contextlib
 import logging
 import logging.handlers
 import os
 import sys
-from collections import deque
+from bisect import bisect_left
 from datetime import datetime
 from pathlib import Path
 from threading import Lock, Semaphore
-from typing import Any, TypedDict
+from typing import Any, NamedTuple, TypedDict
 
 import orjson
 import structlog
@@ -30,8 +31,24 @@ LOG_LEVEL_MAP = {
 }
 
 
+class LogEntry(NamedTuple):
+    """A log buffer entry: epoch milliseconds, message and the pre-encoded SSE frame."""
+
+    timestamp: int
+    message: str
+    frame: bytes
+
+
 class SizedLogBuffer:
-    """A buffer for storing log messages for the log retrieval API."""
+    """A ring buffer for storing log messages for the log retrieval API.
+
+    Every entry gets a monotonically increasing sequence number, so readers can tail the buffer with a cursor
+    instead of rescanning it. Entries keep a pre-encoded frame ready to be streamed, and async readers waiting
+    for new entries are woken by the writer instead of polling.
+    """
+
+    # Evicted slots are only compacted once this many have accumulated, keeping eviction amortized O(1)
+    _COMPACT_THRESHOLD = 1024
 
     def __init__(
         self,
@@ -42,21 +59,37 @@ class SizedLogBuffer:
         The buffer can be overwritten by an env variable LANGFLOW_LOG_RETRIEVER_BUFFER_SIZE
         because the logger is initialized before the settings_service are loaded.
         """
-        self.buffer: deque = deque()
+        # Live entries are self._entries[self._head:]; the entry at self._head has sequence number self._first_seq
+        self._entries: list[LogEntry | None] = []
+        self._head = 0
+        self._first_seq = 0
+        self._notifiers: dict[asyncio.AbstractEventLoop, asyncio.Event] = {}
 
         self._max_readers = max_readers
         self._wlock = Lock()
         self._rsemaphore = Semaphore(max_readers)
         self._max = 0
 
+    @property
+    def buffer(self) -> list[LogEntry]:
+        """Snapshot of the buffered entries, oldest first."""
+        with self._wlock:
+            return self._entries[self._head :]  # type: ignore[return-value]
+
     def get_write_lock(self) -> Lock:
         """Get the write lock."""
         return self._wlock
 
-    def write(self, message: str) -> None:
-        """Write a message to the buffer."""
-        record = json.loads(message)
-        log_entry = record.get("event", record.get("msg", record.get("text", "")))
+    def write(self, message: str | bytes, record: dict[str, Any] | None = None) -> None:
+        """Write a message to the buffer.
+
+        Args:
+            message: The JSON encoded log record.
+            record: The already decoded log record. When given, ``message`` is not parsed again.
+        """
+        if record is None:
+            record = orjson.loads(message)
+        log_entry = record.get("event", record.get("msg", record.get("text", record.get("message", ""))))
 
         # Extract timestamp - support both direct timestamp and nested record.time.timestamp
         timestamp = record.get("timestamp", 0)
@@ -72,66 +105,122 @@ class SizedLogBuffer:
         else:
             epoch = int(timestamp * 1000)
 
+        self.append(epoch, log_entry if isinstance(log_entry, str) else str(log_entry))
+
+    def append(self, timestamp: int, message: str) -> int:
+        """Append an entry and wake up waiting readers.
+
+        Returns:
+            The sequence number assigned to the entry.
+        """
+        entry = LogEntry(
+            timestamp, message, orjson.dumps({timestamp: message}, option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
+        )
         with self._wlock:
-            if len(self.buffer) >= self.max:
-                for _ in range(len(self.buffer) - self.max + 1):
-                    self.buffer.popleft()
-            self.buffer.append((epoch, log_entry))
+            for _ in range(min(len(self) - self.max + 1, len(self))):
+                self._entries[self._head] = None
+                self._head += 1
+                self._first_seq += 1
+            if self._head >= self._COMPACT_THRESHOLD and self._head * 2 >= len(self._entries):
+                del self._entries[: self._head]
+                self._head = 0
+            self._entries.append(entry)
+            seq = self._first_seq + len(self._entries) - self._head - 1
+            notifiers = self._notifiers
+            if notifiers:
+                self._notifiers = {}
+
+        # Only the first write after a reader started waiting pays for the wake-up
+        for loop, event in notifiers.items():
+            with contextlib.suppress(RuntimeError):  # the reader's loop is already closed
+                loop.call_soon_threadsafe(event.set)
+        return seq
 
     def __len__(self) -> int:
         """Get the length of the buffer."""
-        return len(self.buffer)
+        return len(self._entries) - self._head
+
+    def cursor(self) -> int:
+        """Get the sequence number the next written entry will receive."""
+        with self._wlock:
+            return self._first_seq + len(self)
+
+    def read_from(self, cursor: int, limit: int | None = None) -> tuple[list[bytes], int]:
+        """Get the encoded frames of the entries with a sequence number >= cursor.
+
+        If the entries at the cursor were already evicted, reading resumes at the oldest entry still buffered.
+
+        Returns:
+            The frames and the cursor to use for the next read.
+        """
+        with self._wlock:
+            start = self._head + max(cursor - self._first_seq, 0)
+            stop = len(self._entries) if limit is None else min(start + limit, len(self._entries))
+            frames = [entry.frame for entry in self._entries[start:stop]]  # type: ignore[union-attr]
+            return frames, self._first_seq + stop - self._head
+
+    async def wait_for_entries(self, cursor: int, timeout: float | None = None) -> bool:
+        """Wait until an entry with a sequence number >= cursor is written.
+
+        Returns:
+            True if there are entries to read, False if the timeout expired first.
+        """
+        loop = asyncio.get_running_loop()
+        with self._wlock:
+            if self._first_seq + len(self) > cursor:
+                return True
+            event = self._notifiers.get(loop)
+            if event is None:
+                event = self._notifiers[loop] = asyncio.Event()
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def _bisect_timestamp(self, timestamp: int) -> int:
+        """Index in self._entries of the first entry with a timestamp >= timestamp (entries are time ordered)."""
+        return bisect_left(self._entries, timestamp, lo=self._head, key=lambda entry: entry.timestamp)  # type: ignore[union-attr]
 
     def get_after_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
         """Get log entries after a timestamp."""
-        rc = {}
-
         self._rsemaphore.acquire()
         try:
             with self._wlock:
-                for ts, msg in self.buffer:
-                    if lines == 0:
-                        break
-                    if ts >= timestamp and lines > 0:
-                        rc[ts] = msg
-                        lines -= 1
+                start = self._bisect_timestamp(timestamp)
+                entries = self._entries[start : start + max(lines, 0)]
         finally:
             self._rsemaphore.release()
 
-        return rc
+        return {entry.timestamp: entry.message for entry in entries}  # type: ignore[union-attr]
 
     def get_before_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
         """Get log entries before a timestamp."""
         self._rsemaphore.acquire()
         try:
             with self._wlock:
-                as_list = list(self.buffer)
-            max_index = -1
-            for i, (ts, _) in enumerate(as_list):
-                if ts >= timestamp:
-                    max_index = i
-                    break
-            if max_index == -1:
-                return self.get_last_n(lines)
-            rc = {}
-            start_from = max(max_index - lines, 0)
-            for i, (ts, msg) in enumerate(as_list):
-                if start_from <= i < max_index:
-                    rc[ts] = msg
-            return rc
+                max_index = self._bisect_timestamp(timestamp)
+                if max_index == len(self._entries):
+                    entries = None
+                else:
+                    entries = self._entries[max(max_index - lines, self._head) : max_index]
         finally:
             self._rsemaphore.release()
 
+        if entries is None:
+            return self.get_last_n(lines)
+        return {entry.timestamp: entry.message for entry in entries}  # type: ignore[union-attr]
+
     def get_last_n(self, last_idx: int) -> dict[int, str]:
         """Get the last n log entries."""
         self._rsemaphore.acquire()
         try:
-            with self._wlock:
-                as_list = list(self.buffer)
-            return dict(as_list[-last_idx:])
+            entries = self.buffer[-last_idx:]
         finally:
             self._rsemaphore.release()
 
+        return {entry.timestamp: entry.message for entry in entries}
+
     @property
     def max(self) -> int:
         """Get the maximum buffer size."""
@@ -185,10 +274,9 @@ def remove_exception_in_production(_logger: Any, _method_name: str, event_dict:
 def buffer_writer(_logger: Any, _method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
     """Write to log buffer if enabled."""
     if log_buffer.enabled() and "serialized" in event_dict:
-        # Use the already-serialized version prepared by add_serialized()
-        # This avoids duplicate serialization and ensures consistency
-        serialized_bytes = event_dict["serialized"]
-        log_buffer.write(serialized_bytes.decode("utf-8"))
+        # Use the already-serialized version prepared by add_serialized() and hand over the
+        # event_dict it was built from, so the buffer doesn't have to decode it again
+        log_buffer.write(event_dict["serialized"], record=event_dict)
     return event_dict
 
 
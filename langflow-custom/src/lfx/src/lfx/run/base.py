@@ -317,6 +317,8 @@ async def run_flow(
         raise RunError(error_msg, e) from e
 
     logger.info("Executing graph...")
+    # Only the results are returned, nothing displays the artifacts of the components
+    graph.headless = True
     execution_start_time = time.time() if timing else None
     if verbose:
         logger.debug("Setting up execution environment")
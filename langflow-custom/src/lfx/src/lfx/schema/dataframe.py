@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, cast
 import pandas as pd
 from langchain_core.documents import Document
 from pandas import DataFrame as pandas_DataFrame
+from pandas.core.generic import NDFrame
 
 from lfx.schema.data import Data
 
@@ -10,6 +11,32 @@ if TYPE_CHECKING:
     from lfx.schema.message import Message
 
 
+_EMPTY_MANAGER = pandas_DataFrame()._mgr  # noqa: SLF001
+
+# Buffered appends hook the block manager attribute of pandas 2 frames, other versions concatenate
+# on every append
+_BUFFERED_APPENDS = pd.__version__.split(".")[0] == "2"
+
+
+class _RowBuffer:
+    """Rows appended to a frame, shared by the frames returned by successive appends.
+
+    Each frame built on the buffer sees the base frame followed by the first ``count`` rows.
+    """
+
+    __slots__ = ("base", "rows")
+
+    def __init__(self, base: pd.DataFrame) -> None:
+        self.base = base
+        self.rows: list[dict] = []
+
+    def materialize(self, count: int) -> pd.DataFrame:
+        new_rows = pd.DataFrame(self.rows[:count])
+        if self.base.empty and self.base.columns.empty:
+            return new_rows
+        return pd.concat([self.base, new_rows], ignore_index=True)
+
+
 class DataFrame(pandas_DataFrame):
     """A pandas DataFrame subclass specialized for handling collections of Data objects.
 
@@ -97,6 +124,10 @@ class DataFrame(pandas_DataFrame):
     def add_row(self, data: dict | Data) -> "DataFrame":
         """Adds a single row to the dataset.
 
+        Appending to the frame returned by the previous append is O(1): rows are buffered and
+        only turned into a frame the first time the result is read, so building a frame one row
+        at a time in a loop does not copy it on every call.
+
         Args:
             data: Either a Data object or a dictionary to add as a new row
 
@@ -109,8 +140,7 @@ class DataFrame(pandas_DataFrame):
         """
         if isinstance(data, Data):
             data = data.data
-        new_df = self._constructor([data])
-        return cast("DataFrame", pd.concat([self, new_df], ignore_index=True))
+        return self._append_rows([data])
 
     def add_rows(self, data: list[dict | Data]) -> "DataFrame":
         """Adds multiple rows to the dataset.
@@ -121,14 +151,47 @@ class DataFrame(pandas_DataFrame):
         Returns:
             DataFrame: A new DataFrame with the added rows
         """
-        processed_data = []
-        for item in data:
-            if isinstance(item, Data):
-                processed_data.append(item.data)
-            else:
-                processed_data.append(item)
-        new_df = self._constructor(processed_data)
-        return cast("DataFrame", pd.concat([self, new_df], ignore_index=True))
+        return self._append_rows([item.data if isinstance(item, Data) else item for item in data])
+
+    def _append_rows(self, rows: list[dict]) -> "DataFrame":
+        """Return a frame with ``rows`` appended, deferring the concatenation until it is read."""
+        if not _BUFFERED_APPENDS:
+            result = cast("DataFrame", pd.concat([self, self._constructor(rows)], ignore_index=True))
+            object.__setattr__(result, "_text_key", self._text_key)
+            object.__setattr__(result, "_default_value", self._default_value)
+            return result
+        pending = self.__dict__.get("_pending_rows")
+        if pending is not None and pending[1] == len(pending[0].rows):
+            # Nothing was appended after this frame: the new frame extends the same buffer
+            buffer, count = pending
+        else:
+            buffer, count = _RowBuffer(pd.DataFrame(self, copy=True)), 0
+        buffer.rows.extend(rows)
+        # Building an empty frame through the constructor costs more than the append itself, the
+        # result starts on a copy of an empty manager that is replaced before anything reads it
+        result = DataFrame.__new__(DataFrame)
+        NDFrame.__init__(result, _EMPTY_MANAGER.copy(deep=False))
+        object.__setattr__(result, "_text_key", self._text_key)
+        object.__setattr__(result, "_default_value", self._default_value)
+        object.__setattr__(result, "_pending_rows", (buffer, count + len(rows)))
+        return result
+
+    def _flush_rows(self) -> None:
+        """Concatenate the buffered rows of the frame into it."""
+        if "_pending_rows" in self.__dict__:
+            buffer, count = self.__dict__.pop("_pending_rows")
+            self._update_inplace(buffer.materialize(count))
+
+    @property
+    def _mgr(self):
+        # Every read of the frame goes through its block manager, copies and pickling included,
+        # so buffered rows are concatenated into the frame on first access
+        self._flush_rows()
+        return self.__dict__["_mgr"]
+
+    @_mgr.setter
+    def _mgr(self, value) -> None:
+        self.__dict__["_mgr"] = value
 
     @property
     def _constructor(self):
@@ -5,6 +5,7 @@ from typing import Any, cast
 from uuid import UUID
 
 import numpy as np
+import orjson
 import pandas as pd
 from langchain_core.documents import Document
 from pydantic import BaseModel
@@ -89,7 +90,7 @@ def _serialize_iterator(_: AsyncIterator | Generator | Iterator, *__) -> str:
 def _serialize_pydantic(obj: BaseModel, max_length: int | None, max_items: int | None) -> Any:
     """Handle modern Pydantic models."""
     serialized = obj.model_dump()
-    return {k: serialize(v, max_length, max_items) for k, v in serialized.items()}
+    return {k: _serialize_fast(v, max_length, max_items) for k, v in serialized.items()}
 
 
 def _serialize_pydantic_v1(obj: BaseModelV1, max_length: int | None, max_items: int | None) -> Any:
@@ -101,7 +102,7 @@ def _serialize_pydantic_v1(obj: BaseModelV1, max_length: int | None, max_items:
 
 def _serialize_dict(obj: dict, max_length: int | None, max_items: int | None) -> dict:
     """Recursively process dictionary values."""
-    return {k: serialize(v, max_length, max_items) for k, v in obj.items()}
+    return {k: _serialize_fast(v, max_length, max_items) for k, v in obj.items()}
 
 
 def _serialize_list_tuple(obj: list | tuple, max_length: int | None, max_items: int | None) -> list:
@@ -110,7 +111,7 @@ def _serialize_list_tuple(obj: list | tuple, max_length: int | None, max_items:
         truncated = list(obj)[:max_items]
         truncated.append(f"... [truncated {len(obj) - max_items} items]")
         obj = truncated
-    return [serialize(item, max_length, max_items) for item in obj]
+    return [_serialize_fast(item, max_length, max_items) for item in obj]
 
 
 def _serialize_primitive(obj: Any, *_) -> Any:
@@ -139,9 +140,21 @@ def _serialize_dataframe(obj: pd.DataFrame, max_length: int | None, max_items: i
     if max_items is not None and len(obj) > max_items:
         obj = obj.head(max_items)
 
-    data = obj.to_dict(orient="records")
+    dtypes = list(obj.dtypes)
+    if not dtypes or not all(isinstance(dtype, np.dtype) for dtype in dtypes):
+        # Extension dtypes box their missing values differently
+        return _serialize_list_tuple(obj.to_dict(orient="records"), max_length, max_items)
 
-    return serialize(data, max_length, max_items)
+    # Converting column by column gives the same values as to_dict(orient="records"). Only the values
+    # of object and datetime columns need serializing, numeric and boolean columns are already native.
+    values = []
+    for index, dtype in enumerate(dtypes):
+        column_values = obj.iloc[:, index].tolist()
+        if dtype.kind not in "biufc":
+            column_values = [_serialize_fast(value, max_length, max_items) for value in column_values]
+        values.append(column_values)
+    columns = list(obj.columns)
+    return [dict(zip(columns, row, strict=True)) for row in zip(*values, strict=True)]
 
 
 def _serialize_series(obj: pd.Series, max_length: int | None, max_items: int | None) -> dict:
@@ -245,6 +258,27 @@ def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | Non
             return UNSERIALIZABLE_SENTINEL
 
 
+def _serialize_fast(obj: Any, max_length: int | None, max_items: int | None) -> Any:
+    """Serialize plain JSON values and containers without going through the dispatcher.
+
+    Vertex results are mostly strings, numbers and nested dicts and lists of them. Exact type checks
+    handle those inline, strings and lists are only copied when they need truncating, and anything
+    else goes through ``serialize``.
+    """
+    obj_type = type(obj)
+    if obj_type is str:
+        if max_length is None or len(obj) <= max_length:
+            return obj
+        return obj[:max_length] + "..."
+    if obj is None or obj_type is int or obj_type is float or obj_type is bool:
+        return obj
+    if obj_type is dict:
+        return {k: _serialize_fast(v, max_length, max_items) for k, v in obj.items()}
+    if obj_type is list or obj_type is tuple:
+        return _serialize_list_tuple(obj, max_length, max_items)
+    return serialize(obj, max_length, max_items)
+
+
 def serialize(
     obj: Any,
     max_length: int | None = None,
@@ -265,6 +299,9 @@ def serialize(
     """
     if obj is None:
         return None
+    obj_type = type(obj)
+    if obj_type is str or obj_type is dict or obj_type is list:
+        return _serialize_fast(obj, max_length, max_items)
     try:
         # First try type-specific serialization
         result = _serialize_dispatcher(obj, max_length, max_items)
@@ -312,3 +349,25 @@ def serialize_or_str(
         max_items: Maximum items in list-like structures, None for no truncation
     """
     return serialize(obj, max_length, max_items, to_str=True)
+
+
+def serialize_json(
+    obj: Any,
+    max_length: int | None = None,
+    max_items: int | None = None,
+) -> bytes:
+    """Serialize an object and encode it as JSON bytes with orjson.
+
+    Values that serialize() leaves as is, such as numpy arrays or unknown objects, are encoded by
+    orjson directly or converted to strings. NaN and infinite floats are encoded as null.
+
+    Args:
+        obj: Object to serialize
+        max_length: Maximum length for string values, None for no truncation
+        max_items: Maximum items in list-like structures, None for no truncation
+    """
+    return orjson.dumps(
+        serialize(obj, max_length, max_items),
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
@@ -68,6 +68,20 @@ class Settings(BaseSettings):
 
     knowledge_bases_dir: str | None = "~/.langflow/knowledge_bases"
     """The directory to store knowledge bases."""
+    knowledge_retrieval_max_workers: int = 4
+    """Maximum number of knowledge base searches running at once, off the event loop."""
+
+    docling_max_workers: int = 1
+    """Maximum number of Docling conversions running at once in the process."""
+    docling_max_queued_jobs: int = 8
+    """Maximum number of Docling conversions waiting for a worker. Further conversions are rejected."""
+    docling_use_processes: bool = False
+    """If True, Docling conversions run in worker processes instead of threads. Each worker process loads
+    its own Docling models."""
+    docling_conversion_timeout: int = 300
+    """Seconds to wait for a Docling conversion before cancelling it."""
+    docling_result_cache_size: int = 32
+    """Number of converted documents kept in memory, keyed by file content and pipeline options."""
 
     dev: bool = False
     """If True, Langflow will run in development mode."""
@@ -112,6 +126,15 @@ class Settings(BaseSettings):
     """Frequency (in seconds) at which the background cleanup task wakes up to
     reap idle sessions."""
 
+    mcp_session_probe_idle_threshold: int = 60  # seconds
+    """How long (in seconds) an MCP session can go without a successful call before
+    it is pinged on reuse. Sessions used more recently are reused without a probe."""
+
+    mcp_tool_list_cache_ttl: int = 5  # seconds
+    """How long (in seconds) the tools of an MCP server that does not advertise tool list
+    change notifications are cached. Tools of servers that do are cached until they notify a
+    change. Set to 0 to list the tools of such servers on every use."""
+
     # sqlite configuration
     sqlite_pragmas: dict | None = {"synchronous": "NORMAL", "journal_mode": "WAL", "busy_timeout": 30000}
     """SQLite pragmas to use when connecting to the database."""
@@ -169,7 +192,36 @@ class Settings(BaseSettings):
     Set to a file path (e.g., '/path/to/index.json') or URL (e.g., 'https://example.com/index.json')
     to use a custom index.
     """
-    langchain_cache: str = "InMemoryCache"
+    component_types_cache: bool = True
+    """If set to True, the component templates built at startup are written to a file shared by all workers
+    on the host and reused until lfx, the component index or the components paths change."""
+    component_types_cache_dir: str | None = None
+    """Directory of the shared component templates cache. Defaults to the user cache directory."""
+    langchain_cache: str = "BoundedLLMCache"
+    """LLM cache to install. `BoundedLLMCache` is Langflow's size and TTL bounded cache;
+    any other value is the name of a class in `langchain_community.cache`."""
+    llm_cache_max_entries: int = 1000
+    """Maximum number of responses kept in the in-memory tier of the bounded LLM cache."""
+    llm_cache_max_bytes: int = 64 * 1024 * 1024
+    """Maximum serialized size in bytes of the responses kept in memory by the bounded LLM cache."""
+    llm_cache_ttl: int = 3600
+    """Time in seconds a response stays in the bounded LLM cache."""
+    llm_cache_database_path: str | None = None
+    """Path of a SQLite database shared by all local workers as a second tier of the bounded LLM cache.
+    If not set, responses are only cached in memory."""
+    llm_cache_max_disk_entries: int = 10_000
+    """Maximum number of responses kept in the SQLite tier of the bounded LLM cache."""
+    llm_cache_flows: list[str] = []
+    """Flow ids or names that use the bounded LLM cache. Use `*` to enable it for every flow.
+    The cache is not used by any flow by default."""
+    model_provider_key_validation_ttl: int = 3600
+    """Time in seconds the result of validating a model provider API key is reused by every component and user.
+    Set to 0 to validate keys on every request."""
+    model_options_cache_ttl: int = 30
+    """Time in seconds the model options of a user are shared by every model component of the process."""
+    subflow_max_concurrency: int = 4
+    """Maximum number of concurrent runs of the same flow started by Run Flow components and flow tools,
+    such as parallel tool calls of an agent. Further runs wait for a free slot."""
     load_flows_path: str | None = None
     bundle_urls: list[str] = []
 
@@ -272,12 +324,28 @@ class Settings(BaseSettings):
     """The maximum file size for the upload in MB."""
     deactivate_tracing: bool = False
     """If set to True, tracing will be deactivated."""
+    tracing_sample_rate: float = 1.0
+    """Fraction of flow runs (0.0 to 1.0) that are traced when a tracer is configured."""
+    tracing_sample_rates: dict[str, float] = {}
+    """Per flow sampling rates keyed by flow id or flow name. Overrides tracing_sample_rate for those flows."""
+    tracing_endpoint_sample_rates: dict[str, float] = {}
+    """Per endpoint sampling rates keyed by request path prefix, such as /api/v1/run. Per flow rates take precedence."""
     max_transactions_to_keep: int = 3000
     """The maximum number of transactions to keep in the database."""
     max_vertex_builds_to_keep: int = 3000
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    background_task_max_concurrency: int = 10
+    """The maximum number of background tasks of one kind, such as vertex build logging, running at once."""
+    background_task_concurrency_limits: dict[str, int] = {}
+    """Per kind overrides of background_task_max_concurrency, keyed by the name of the task function."""
+    background_task_queue_size: int = 1000
+    """The maximum number of background tasks of one kind waiting or running."""
+    background_task_overflow_policy: Literal["drop", "block"] = "drop"
+    """What to do with a background task when its kind is at background_task_queue_size: drop it, or wait for room."""
+    background_task_drain_timeout: float = 10.0
+    """Seconds to wait on shutdown for pending background tasks, after which they are cancelled."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
     fs_flows_polling_interval: int = 10000
@@ -298,6 +366,9 @@ class Settings(BaseSettings):
     """If set to False, Langflow will not enable the MCP server."""
     mcp_server_enable_progress_notifications: bool = False
     """If set to False, Langflow will not send progress notifications in the MCP server."""
+    mcp_project_tools_cache_ttl: int = 300
+    """Seconds a project's MCP tool list is cached. Changes to the project's flows invalidate it right away in the
+    worker that made them, other workers pick them up once the entry expires. Set to 0 to disable the cache."""
 
     # Add projects to MCP servers automatically on creation
     add_projects_to_mcp_servers: bool = True
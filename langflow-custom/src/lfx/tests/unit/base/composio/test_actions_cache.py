@@ -0,0 +1,64 @@
+from unittest.mock import patch
+
+from lfx.base.composio.actions_cache import ComposioActionsCache
+
+ACTIONS_DATA = {
+    "GMAIL_SEND_EMAIL": {
+        "display_name": "Send Email",
+        "action_fields": ["recipient_email", "is_html", "attachment"],
+        "file_upload_fields": {"attachment"},
+        "version": "1",
+        "available_versions": ["1"],
+    }
+}
+ACTION_SCHEMAS = {"GMAIL_SEND_EMAIL": {"slug": "GMAIL_SEND_EMAIL", "input_parameters": {"properties": {}}}}
+
+
+class TestComposioActionsCache:
+    def test_entries_are_shared_without_copies(self, tmp_path):
+        cache = ComposioActionsCache(tmp_path)
+        stored = cache.set("gmail", ACTIONS_DATA, ACTION_SCHEMAS, {"is_html"})
+
+        entry = cache.get("gmail")
+        assert entry is stored
+        assert entry.actions_data is ACTIONS_DATA
+        assert cache.get("slack") is None
+
+    def test_entries_are_shared_across_processes(self, tmp_path):
+        ComposioActionsCache(tmp_path).set("gmail", ACTIONS_DATA, ACTION_SCHEMAS, {"is_html"})
+
+        # A new process starts with an empty in-memory cache
+        entry = ComposioActionsCache(tmp_path).get("gmail")
+        assert entry is not None
+        assert entry.actions_data == ACTIONS_DATA
+        assert entry.actions_data["GMAIL_SEND_EMAIL"]["file_upload_fields"] == {"attachment"}
+        assert entry.action_schemas == ACTION_SCHEMAS
+        assert entry.bool_variables == {"is_html"}
+
+    def test_expired_entries_are_refetched(self, tmp_path):
+        cache = ComposioActionsCache(tmp_path, ttl=60)
+        with patch("lfx.base.composio.actions_cache.time.time", return_value=1000.0):
+            cache.set("gmail", ACTIONS_DATA, ACTION_SCHEMAS, set())
+        with patch("lfx.base.composio.actions_cache.time.time", return_value=1059.0):
+            assert cache.get("gmail") is not None
+            assert ComposioActionsCache(tmp_path, ttl=60).get("gmail") is not None
+        with patch("lfx.base.composio.actions_cache.time.time", return_value=1061.0):
+            assert cache.get("gmail") is None
+            assert ComposioActionsCache(tmp_path, ttl=60).get("gmail") is None
+
+    def test_cache_is_versioned_by_sdk_version(self, tmp_path):
+        with patch("lfx.base.composio.actions_cache._get_composio_version", return_value="1.0.0"):
+            ComposioActionsCache(tmp_path).set("gmail", ACTIONS_DATA, ACTION_SCHEMAS, set())
+        with patch("lfx.base.composio.actions_cache._get_composio_version", return_value="2.0.0"):
+            assert ComposioActionsCache(tmp_path).get("gmail") is None
+
+    def test_corrupted_and_unserializable_entries_are_ignored(self, tmp_path):
+        cache = ComposioActionsCache(tmp_path)
+        cache.cache_dir.mkdir(parents=True)
+        (cache.cache_dir / "gmail.json").write_text("{")
+        assert cache.get("gmail") is None
+
+        cache.set("slack", ACTIONS_DATA, {"SLACK_POST": {"client": object()}}, set())
+        # Still served from memory, but nothing was written for other processes
+        assert cache.get("slack") is not None
+        assert ComposioActionsCache(tmp_path).get("slack") is None
@@ -0,0 +1,95 @@
+"""Tests for base/data/docling_pool.py - the bounded pool running Docling conversions."""
+
+import threading
+
+import pytest
+from lfx.base.data import docling_pool
+from lfx.base.data.docling_pool import DoclingConversionPool
+
+OPTIONS = {
+    "pipeline": "standard",
+    "ocr_engine": "None",
+    "do_picture_classification": False,
+    "pic_desc_config": None,
+    "pic_desc_prompt": "Describe the image.",
+}
+
+
+@pytest.fixture
+def release():
+    return threading.Event()
+
+
+@pytest.fixture
+def pool(monkeypatch, release):
+    """Pool with one worker and one queued job, running a fake worker that waits for ``release``."""
+    settings = {"docling_max_workers": 1, "docling_max_queued_jobs": 1}
+    monkeypatch.setattr(docling_pool, "_get_setting", settings.get)
+
+    def fake_job(*, file_paths, cancel_event, **_options):
+        while not release.wait(0.01):
+            if cancel_event.is_set():
+                return {"error": "Worker shutdown requested", "shutdown": True}
+        return [{"document": f"doc of {path}", "file_path": path, "status": "SUCCESS"} for path in file_paths]
+
+    monkeypatch.setattr(docling_pool, "run_docling_job", fake_job)
+    pool = DoclingConversionPool(cache_size=2)
+    yield pool
+    release.set()
+    pool.shutdown()
+
+
+def test_submit_returns_the_worker_result(pool, release):
+    release.set()
+    job = pool.submit(["a.pdf", "b.pdf"], **OPTIONS)
+
+    assert [r["document"] for r in job.result(timeout=5)] == ["doc of a.pdf", "doc of b.pdf"]
+
+
+def test_submit_rejects_jobs_beyond_the_queue(pool, release):
+    running = pool.submit(["a.pdf"], **OPTIONS)
+    queued = pool.submit(["b.pdf"], **OPTIONS)
+
+    with pytest.raises(RuntimeError, match="Too many Docling conversions"):
+        pool.submit(["c.pdf"], **OPTIONS)
+
+    release.set()
+    running.result(timeout=5)
+    queued.result(timeout=5)
+    # Finished jobs free their slot
+    assert pool.submit(["c.pdf"], **OPTIONS).result(timeout=5)[0]["file_path"] == "c.pdf"
+
+
+def test_cancel_drops_queued_jobs_and_stops_running_ones(pool):
+    running = pool.submit(["a.pdf"], **OPTIONS)
+    queued = pool.submit(["b.pdf"], **OPTIONS)
+
+    queued.cancel()
+    running.cancel()
+
+    assert queued.future.cancelled()
+    assert running.result(timeout=5)["shutdown"] is True
+
+
+def test_cache_key_depends_on_content_and_options(tmp_path):
+    first = tmp_path / "first.txt"
+    copy = tmp_path / "copy.txt"
+    other = tmp_path / "other.txt"
+    first.write_text("same content")
+    copy.write_text("same content")
+    other.write_text("other content")
+
+    key = DoclingConversionPool.cache_key(first, **OPTIONS)
+
+    assert DoclingConversionPool.cache_key(copy, **OPTIONS) == key
+    assert DoclingConversionPool.cache_key(other, **OPTIONS) != key
+    assert DoclingConversionPool.cache_key(first, **{**OPTIONS, "ocr_engine": "easyocr"}) != key
+    assert DoclingConversionPool.cache_key(first, **{**OPTIONS, "pic_desc_config": {"model": "m"}}) != key
+
+
+def test_result_cache_is_bounded(pool):
+    for key in ("a", "b", "c"):
+        pool.cache_result((key,), f"doc {key}")
+
+    assert pool.get_cached(("a",)) is None
+    assert pool.get_cached(("c",)) == "doc c"
@@ -0,0 +1,97 @@
+"""Tests for base/data/file_writers.py - atomic and append-friendly file writes."""
+
+import json
+
+import pytest
+from lfx.base.data.file_writers import append_lines, atomic_write, json_array_items, write_json_records
+
+
+def items(records):
+    return json_array_items(json.dumps(records, indent=2))
+
+
+class TestAtomicWrite:
+    def test_replaces_the_file(self, tmp_path):
+        path = tmp_path / "out.txt"
+        path.write_text("old")
+
+        with atomic_write(path) as file:
+            file.write("new")
+
+        assert path.read_text() == "new"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_keeps_the_file_when_writing_fails(self, tmp_path):
+        path = tmp_path / "out.txt"
+        path.write_text("old")
+
+        def write_and_crash():
+            with atomic_write(path) as file:
+                file.write("partial")
+                msg = "crash"
+                raise RuntimeError(msg)
+
+        with pytest.raises(RuntimeError, match="crash"):
+            write_and_crash()
+
+        assert path.read_text() == "old"
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestWriteJsonRecords:
+    def test_writes_chunks_as_one_array(self, tmp_path):
+        path = tmp_path / "out.json"
+
+        write_json_records(path, [items([{"a": 1}]), items([]), items([{"a": 2}, {"a": 3}])])
+
+        assert json.loads(path.read_text()) == [{"a": 1}, {"a": 2}, {"a": 3}]
+
+    def test_writes_an_empty_array(self, tmp_path):
+        path = tmp_path / "out.json"
+
+        write_json_records(path, [])
+
+        assert json.loads(path.read_text()) == []
+
+    def test_appends_to_the_array_in_place(self, tmp_path):
+        path = tmp_path / "out.json"
+        path.write_text(json.dumps([{"a": 1}], indent=2) + "\n\n")
+
+        write_json_records(path, [items([{"a": 2}])], append=True)
+        write_json_records(path, [items([{"a": 3}])], append=True)
+
+        assert json.loads(path.read_text()) == [{"a": 1}, {"a": 2}, {"a": 3}]
+        assert path.read_text() == json.dumps([{"a": 1}, {"a": 2}, {"a": 3}], indent=2)
+
+    def test_appends_to_an_empty_array(self, tmp_path):
+        path = tmp_path / "out.json"
+        path.write_text("[ ]")
+
+        write_json_records(path, [items([{"a": 1}])], append=True)
+
+        assert json.loads(path.read_text()) == [{"a": 1}]
+
+    def test_wraps_a_single_object_into_an_array(self, tmp_path):
+        path = tmp_path / "out.json"
+        path.write_text(json.dumps({"a": 1}))
+
+        write_json_records(path, [items([{"a": 2}])], append=True)
+
+        assert json.loads(path.read_text()) == [{"a": 1}, {"a": 2}]
+
+    def test_replaces_invalid_content(self, tmp_path):
+        path = tmp_path / "out.json"
+        path.write_text("not json")
+
+        write_json_records(path, [items([{"a": 1}])], append=True)
+
+        assert json.loads(path.read_text()) == [{"a": 1}]
+
+
+def test_append_lines_starts_on_a_new_line(tmp_path):
+    path = tmp_path / "out.jsonl"
+    path.write_text('{"a": 1}')
+
+    append_lines(path, ['{"a": 2}', '{"a": 3}\n'])
+
+    assert path.read_text().splitlines() == ['{"a": 1}', '{"a": 2}', '{"a": 3}']
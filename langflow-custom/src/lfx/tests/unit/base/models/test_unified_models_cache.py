@@ -0,0 +1,172 @@
+import asyncio
+import functools
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from lfx.base.models import unified_models
+from lfx.base.models.unified_models import (
+    avalidate_model_provider_key,
+    clear_key_validation_cache,
+    clear_model_options_cache,
+    get_cached_model_options,
+    update_model_options_in_build_config,
+)
+
+OPTIONS = [{"name": "gpt-4o", "provider": "OpenAI"}]
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    clear_key_validation_cache()
+    clear_model_options_cache()
+    yield
+    clear_key_validation_cache()
+    clear_model_options_cache()
+
+
+def mock_provider(status_code, text=""):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(status_code, text=text)
+
+    return patch_client(handler), requests
+
+
+def patch_client(handler):
+    client = functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+    return patch.object(unified_models, "_key_validation_client", client)
+
+
+class TestProviderKeyValidation:
+    async def test_concurrent_validations_make_one_request_per_provider(self):
+        async def request_key_validation(provider, api_key):  # noqa: ARG001
+            await asyncio.sleep(0.01)
+            return True, None
+
+        request = AsyncMock(side_effect=request_key_validation)
+        with patch.object(unified_models, "_request_key_validation", request):
+            # A flow with 10 model components of two providers
+            await asyncio.gather(
+                *(avalidate_model_provider_key("OPENAI_API_KEY", "sk-openai") for _ in range(5)),
+                *(avalidate_model_provider_key("ANTHROPIC_API_KEY", "sk-anthropic") for _ in range(5)),
+            )
+            await avalidate_model_provider_key("OPENAI_API_KEY", "sk-openai")
+
+        assert sorted(call.args[0] for call in request.await_args_list) == ["Anthropic", "OpenAI"]
+
+    async def test_invalid_key_is_cached(self):
+        provider, requests = mock_provider(401)
+        with provider:
+            for _ in range(3):
+                with pytest.raises(ValueError, match="Invalid API key for OpenAI"):
+                    await avalidate_model_provider_key("OPENAI_API_KEY", "sk-invalid")
+
+        assert len(requests) == 1
+        assert requests[0].headers["Authorization"] == "Bearer sk-invalid"
+
+    async def test_restricted_key_is_valid(self):
+        provider, requests = mock_provider(403, '{"error": {"message": "Missing scopes: api.model.read"}}')
+        with provider:
+            await avalidate_model_provider_key("OPENAI_API_KEY", "sk-proj-restricted")
+            await avalidate_model_provider_key("OPENAI_API_KEY", "sk-proj-restricted")
+
+        assert len(requests) == 1
+
+    async def test_keys_are_cached_separately(self):
+        provider, requests = mock_provider(200)
+        with provider:
+            await avalidate_model_provider_key("OPENAI_API_KEY", "sk-first")
+            await avalidate_model_provider_key("OPENAI_API_KEY", "sk-second")
+
+        assert len(requests) == 2
+        assert all("sk-" not in str(key) for key in unified_models._key_validation_cache)
+
+    async def test_inconclusive_results_are_not_cached(self):
+        provider, requests = mock_provider(503)
+        with provider:
+            await avalidate_model_provider_key("OPENAI_API_KEY", "sk-test")
+            await avalidate_model_provider_key("OPENAI_API_KEY", "sk-test")
+
+        assert len(requests) == 2
+
+    async def test_google_invalid_key(self):
+        provider, _ = mock_provider(400, '{"error": {"message": "API key not valid."}}')
+        with provider, pytest.raises(ValueError, match="Invalid API key for Google Generative AI"):
+            await avalidate_model_provider_key("GOOGLE_API_KEY", "invalid")
+
+    async def test_unreachable_ollama_is_allowed(self):
+        def handler(request):
+            msg = "refused"
+            raise httpx.ConnectError(msg, request=request)
+
+        with patch_client(handler):
+            await avalidate_model_provider_key("OLLAMA_BASE_URL", "http://localhost:11434")
+
+    async def test_other_variables_are_not_validated(self):
+        request = AsyncMock()
+        with patch.object(unified_models, "_request_key_validation", request):
+            await avalidate_model_provider_key("MY_VARIABLE", "value")
+
+        request.assert_not_awaited()
+
+
+class TestModelOptionsCache:
+    def test_components_share_the_options(self):
+        get_options = MagicMock(return_value=OPTIONS)
+        build_configs = [{"model": {"options": [], "value": ""}} for _ in range(10)]
+        components = [SimpleNamespace(user_id="user", log=MagicMock()) for _ in build_configs]
+
+        with patch.object(unified_models, "run_until_complete", return_value=(None, None)):
+            for component, build_config in zip(components, build_configs, strict=True):
+                update_model_options_in_build_config(component, build_config, "language_model_options", get_options)
+
+        get_options.assert_called_once_with(user_id="user")
+        assert all(build_config["model"]["value"] == OPTIONS for build_config in build_configs)
+
+    def test_refresh_and_invalidation(self):
+        get_options = MagicMock(return_value=OPTIONS)
+
+        get_cached_model_options("language_model_options", get_options, "user")
+        get_cached_model_options("language_model_options", get_options, "other user")
+        get_cached_model_options("embedding_model_options", get_options, "user")
+        assert get_options.call_count == 3
+
+        get_cached_model_options("language_model_options", get_options, "user", force_refresh=True)
+        assert get_options.call_count == 4
+
+        clear_model_options_cache("user")
+        get_cached_model_options("language_model_options", get_options, "user")
+        get_cached_model_options("language_model_options", get_options, "other user")
+        assert get_options.call_count == 5
+
+    def test_build_configs_get_their_own_copy(self):
+        get_options = MagicMock(return_value=[{"name": "gpt-4o", "provider": "OpenAI", "metadata": {"tags": []}}])
+        build_config = {"model": {"options": [], "value": ""}}
+        component = SimpleNamespace(user_id="user", log=MagicMock())
+
+        with patch.object(unified_models, "run_until_complete", return_value=(None, None)):
+            update_model_options_in_build_config(component, build_config, "language_model_options", get_options)
+        build_config["model"]["options"][0]["metadata"]["tags"].append("edited")
+        build_config["model"]["value"][0]["name"] = "edited"
+
+        cached = get_cached_model_options("language_model_options", get_options, "user")
+        assert cached == [{"name": "gpt-4o", "provider": "OpenAI", "metadata": {"tags": []}}]
+        get_options.assert_called_once()
+
+    def test_cache_is_bounded_and_expires(self, monkeypatch):
+        monkeypatch.setattr(unified_models, "_MAX_CACHED_MODEL_OPTIONS", 3)
+        get_options = MagicMock(return_value=OPTIONS)
+        for user in range(10):
+            get_cached_model_options("language_model_options", get_options, f"user-{user}")
+
+        assert [key[2] for key in unified_models._model_options_cache] == ["user-7", "user-8", "user-9"]
+        assert len(unified_models._model_options_fetch_locks) <= 4
+
+        now = unified_models.time.monotonic()
+        monkeypatch.setattr(unified_models.time, "monotonic", lambda: now + 3600)
+        get_cached_model_options("language_model_options", get_options, "user-9")
+        assert get_options.call_count == 11
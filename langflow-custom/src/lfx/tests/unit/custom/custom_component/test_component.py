@@ -1,14 +1,22 @@
+import itertools
+import time
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
+import yaml
 from lfx.components.input_output import ChatInput, ChatOutput
 from lfx.custom.custom_component.component import Component
 from lfx.custom.custom_component.custom_component import CustomComponent
 from lfx.custom.utils import update_component_build_config
+from lfx.graph.graph.base import Graph
+from lfx.graph.schema import ResultData
+from lfx.io import HandleInput
+from lfx.schema.data import Data
 from lfx.schema.dotdict import dotdict
 from lfx.schema.message import Message
 from lfx.template import Output
+from lfx.template.field.base import UNDEFINED
 
 crewai_available = False
 try:
@@ -168,3 +176,86 @@ async def test_agent_component_send_message_events(monkeypatch):  # noqa: ARG001
     assert result.sender_name == "Test"
     # The focus is on testing the message handling logic, not the database persistence layer
     assert event_manager.on_message.called
+
+
+class StatusStep(Component):
+    display_name = "Status Step"
+    inputs = [HandleInput(name="data", display_name="Data", input_types=["Data"], required=False)]
+    outputs = [Output(display_name="Data", name="out", method="build_out")]
+
+    def build_out(self) -> Data:
+        payload = {"rows": [{"id": i, "text": f"row {i}"} for i in range(50)], "step": self._id}
+        self.status = payload
+        return Data(data=payload)
+
+
+def _status_flow(size: int, *, headless: bool = False) -> Graph:
+    steps = [StatusStep(_id=f"step{i}") for i in range(size)]
+    for previous, step in itertools.pairwise(steps):
+        step.set(data=previous.build_out)
+    graph = Graph(steps[0], steps[-1])
+    graph.headless = headless
+    return graph
+
+
+def test_instances_do_not_modify_class_outputs():
+    first = StatusStep()
+    second = StatusStep()
+
+    first._outputs_map["out"].add_types(["Message"])
+    first._outputs_map["out"].value = "built"
+
+    assert StatusStep.outputs[0].types == []
+    assert second._outputs_map["out"].types == ["Data"]
+    assert second._outputs_map["out"].value == UNDEFINED
+
+
+@pytest.mark.asyncio
+async def test_artifact_repr_is_formatted_from_the_status():
+    graph = _status_flow(2)
+
+    results = [result async for result in graph.async_start()]
+
+    expected_repr = yaml.dump({"rows": [{"id": i, "text": f"row {i}"} for i in range(50)], "step": "step0"})
+    artifact = results[0].vertex.artifacts["out"]
+    assert artifact["type"] == "object"
+    assert artifact["repr"] == expected_repr
+    # The API responses dump the result data, which must keep the repr displayed by the UI
+    assert results[0].vertex.result.model_dump()["artifacts"]["out"]["repr"] == expected_repr
+    outputs = ResultData(artifacts=results[0].vertex.artifacts, outputs={}).model_dump()["outputs"]
+    assert outputs["out"]["message"]["repr"] == expected_repr
+
+
+@pytest.mark.asyncio
+async def test_headless_graph_skips_the_artifact_repr():
+    graph = _status_flow(2, headless=True)
+
+    results = [result async for result in graph.async_start()]
+
+    artifact = results[0].vertex.artifacts["out"]
+    assert "repr" not in artifact
+    assert artifact["type"] == "object"
+    assert artifact["raw"]["step"] == "step0"
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_component_build_overhead_benchmark():
+    """Per-vertex build time of a 20-component flow, with and without the artifact reprs."""
+    size = 20
+    iterations = 10
+
+    async def per_vertex(*, headless: bool) -> float:
+        elapsed = 0.0
+        for _ in range(iterations):
+            graph = _status_flow(size, headless=headless)
+            start = time.perf_counter()
+            async for _result in graph.async_start():
+                pass
+            elapsed += time.perf_counter() - start
+        return elapsed / iterations / size
+
+    with_repr = await per_vertex(headless=False)
+    headless = await per_vertex(headless=True)
+    print(f"with repr: {with_repr * 1e6:.0f}us, headless: {headless * 1e6:.0f}us")  # noqa: T201
+    assert headless < with_repr
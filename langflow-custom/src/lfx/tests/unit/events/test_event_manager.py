@@ -2,14 +2,20 @@
 
 import asyncio
 import json
+from datetime import datetime
 from unittest.mock import MagicMock
+from uuid import UUID
 
 import pytest
+from fastapi.encoders import jsonable_encoder
 from lfx.events.event_manager import (
     EventManager,
     create_default_event_manager,
     create_stream_tokens_event_manager,
 )
+from lfx.schema.artifact import ArtifactType
+from lfx.schema.data import Data
+from lfx.schema.message import Message
 
 
 class TestEventManager:
@@ -211,6 +217,38 @@ class TestEventManager:
 
         assert parsed_data["data"] == complex_data
 
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"build_data": {"id": "vertex-1", "valid": True, "data": {"results": {"text": "héllo"}}, "params": None}},
+            Message(text="hello", sender="User", sender_name="User", session_id="session").model_dump(),
+            {
+                "id": UUID("12345678-1234-5678-1234-567812345678"),
+                "timestamp": datetime(2024, 1, 2, 3, 4, 5),  # noqa: DTZ001
+                "tags": {"a"},
+                "kind": ArtifactType.TEXT,
+                "record": Data(data={"a": 1}),
+                "rows": (1, 2.5),
+            },
+            ["token", 1],
+            "text",
+            None,
+        ],
+        ids=["plain", "message", "objects", "list", "str", "none"],
+    )
+    def test_event_bytes_match_the_jsonable_encoder(self, data):
+        """Events are encoded with orjson, and give the JSON the jsonable_encoder and json.dumps gave."""
+        queue = MagicMock()
+        manager = EventManager(queue)
+
+        manager.send_event(event_type="end_vertex", data=data)
+
+        _, data_bytes, _ = queue.put_nowait.call_args[0][0]
+        expected = json.dumps(
+            {"event": "end_vertex", "data": jsonable_encoder(data)}, separators=(",", ":"), ensure_ascii=False
+        )
+        assert data_bytes == expected.encode("utf-8") + b"\n\n"
+
 
 class TestEventManagerFactories:
     """Test cases for EventManager factory functions."""
@@ -1,7 +1,8 @@
+import time
 from collections import deque
 
 import pytest
-from lfx.components.input_output import ChatInput, ChatOutput, TextOutputComponent
+from lfx.components.input_output import ChatInput, ChatOutput, TextInputComponent, TextOutputComponent
 from lfx.graph import Graph
 from lfx.graph.graph.constants import Finish
 
@@ -102,6 +103,109 @@ def test_graph_functional_start_end():
     assert results[-1] == Finish()
 
 
+def fan_out_graph(size: int, chain: int = 0) -> Graph:
+    """A text input feeding ``size`` text outputs, the last ``chain`` of them also feeding each other in a row."""
+    graph = Graph()
+    root_id = graph.add_component(TextInputComponent(_id="root"))
+    for i in range(size):
+        vertex_id = graph.add_component(TextOutputComponent(_id=f"leaf_{i}"))
+        graph.add_component_edge(root_id, ("text", "input_value"), vertex_id)
+        if i >= size - chain and i > 0:
+            graph.add_component_edge(f"leaf_{i - 1}", ("text", "input_value"), vertex_id)
+    graph.prepare()
+    return graph
+
+
+def assert_edge_lookups_match_the_edges(graph: Graph) -> None:
+    for vertex in graph.vertices:
+        incident = [edge for edge in graph.edges if vertex.id in {edge.source_id, edge.target_id}]
+        incoming = [edge for edge in graph.edges if edge.target_id == vertex.id]
+        outgoing = [edge for edge in graph.edges if edge.source_id == vertex.id]
+        assert graph.get_vertex_edges(vertex.id) == incident
+        assert graph.get_vertex_edges(vertex.id, is_source=False) == incoming
+        assert graph.get_vertex_edges(vertex.id, is_target=False) == outgoing
+        assert graph.get_vertices_with_target(vertex.id) == [graph.get_vertex(edge.source_id) for edge in incoming]
+        for edge in outgoing:
+            assert graph.get_edge(edge.source_id, edge.target_id) is next(
+                e for e in graph.edges if (e.source_id, e.target_id) == (edge.source_id, edge.target_id)
+            )
+
+
+def test_graph_edge_lookups_follow_the_edges():
+    graph = fan_out_graph(5, chain=3)
+    assert_edge_lookups_match_the_edges(graph)
+    assert graph.get_vertex_neighbors(graph.get_vertex("leaf_3")) == {
+        graph.get_vertex("root"): 1,
+        graph.get_vertex("leaf_2"): 1,
+        graph.get_vertex("leaf_4"): 1,
+    }
+    assert graph.get_edge("leaf_4", "leaf_3") is None
+
+    graph.remove_vertex("leaf_3")
+
+    assert_edge_lookups_match_the_edges(graph)
+    assert graph.get_edge("leaf_2", "leaf_3") is None
+    assert graph.get_vertex_edges("leaf_3") == []
+    assert all("leaf_3" not in {edge.source_id, edge.target_id} for edge in graph.edges)
+
+
+def test_graph_update_edges_from_vertex_replaces_the_edges_of_the_vertex():
+    graph = fan_out_graph(3, chain=3)
+    other = fan_out_graph(3, chain=3)
+
+    graph.update_edges_from_vertex(other.get_vertex("leaf_1"))
+
+    assert_edge_lookups_match_the_edges(graph)
+    assert graph.get_edge("leaf_0", "leaf_1") is other.get_edge("leaf_0", "leaf_1")
+    assert graph.get_edge("leaf_1", "leaf_2") is other.get_edge("leaf_1", "leaf_2")
+    assert len(graph.edges) == len(other.edges)
+
+
+def test_graph_get_all_predecessors_lists_each_predecessor_once():
+    graph = fan_out_graph(4, chain=4)
+
+    predecessors = graph.get_all_predecessors(graph.get_vertex("leaf_3"))
+
+    assert sorted(vertex.id for vertex in predecessors) == ["leaf_0", "leaf_1", "leaf_2", "root"]
+    direct_predecessors = graph.get_all_predecessors(graph.get_vertex("leaf_3"), recursive=False)
+    assert sorted(vertex.id for vertex in direct_predecessors) == ["leaf_2", "root"]
+
+
+@pytest.mark.benchmark
+def test_graph_scheduling_lookups_benchmark():
+    """Edge lookups made while scheduling a 1k vertex graph, which scanned every edge for each call."""
+    graph = fan_out_graph(1000, chain=100)
+
+    timings = {}
+    start = time.perf_counter()
+    assert len(graph.get_all_predecessors(graph.get_vertex("leaf_999"))) == 101
+    timings["get_all_predecessors"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    graph.exclude_branch_conditionally("root", output_name="text")
+    timings["exclude_branch_conditionally"] = time.perf_counter() - start
+    assert len(graph.conditionally_excluded_vertices) == 1000
+
+    start = time.perf_counter()
+    graph.mark_branch("root", "INACTIVE", output_name="text")
+    timings["mark_branch"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for vertex in graph.vertices:
+        assert vertex.edges
+        graph.get_vertices_with_target(vertex.id)
+        graph.get_vertex_neighbors(vertex)
+    timings["vertex edges and neighbors"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    graph.sort_vertices()
+    timings["sort_vertices"] = time.perf_counter() - start
+
+    for name, elapsed in timings.items():
+        print(f"{name} on 1001 vertices: {elapsed * 1e3:.1f}ms")  # noqa: T201
+        assert elapsed < 10
+
+
 # TODO: Move to Langflow tests
 @pytest.mark.skip(reason="Temporarily disabled")
 def test_graph_set_with_valid_component():
@@ -0,0 +1,283 @@
+"""The iterative graph sorts of graph/graph/utils.py, checked against the recursive versions they replaced."""
+
+import time
+from collections import defaultdict, deque
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from lfx.components.input_output import TextInputComponent, TextOutputComponent
+from lfx.graph import Graph
+from lfx.graph.graph import utils
+
+MAX_VERTICES = 12
+
+vertex_ids = st.integers(min_value=0, max_value=MAX_VERTICES - 1).map(lambda i: f"v{i}")
+edge_lists = st.lists(st.tuples(vertex_ids, vertex_ids), max_size=30)
+
+
+@st.composite
+def dags(draw):
+    """Edges of a directed acyclic graph, as pairs going from a lower to a higher vertex number."""
+    size = draw(st.integers(min_value=1, max_value=MAX_VERTICES))
+    pairs = draw(st.lists(st.tuples(st.integers(0, size - 1), st.integers(0, size - 1)), max_size=30))
+    edges = list(dict.fromkeys((f"v{min(a, b)}", f"v{max(a, b)}") for a, b in pairs if a != b))
+    return [f"v{i}" for i in range(size)], edges
+
+
+def to_graph_dict(vertices, edges):
+    graph = {vertex: {"successors": [], "predecessors": []} for vertex in vertices}
+    for source, target in dict.fromkeys(edges):
+        graph.setdefault(source, {"successors": [], "predecessors": []})["successors"].append(target)
+        graph.setdefault(target, {"successors": [], "predecessors": []})["predecessors"].append(source)
+    return graph
+
+
+def reference_cycle_edges(roots, edges, *, first_only=False):
+    """The recursive depth-first search has_cycle, find_cycle_edge and find_all_cycle_edges used."""
+    graph = defaultdict(list)
+    for u, v in edges:
+        graph[u].append(v)
+    visited, rec_stack, cycle_edges = set(), set(), []
+
+    def dfs(v):
+        visited.add(v)
+        rec_stack.add(v)
+        for neighbor in graph[v]:
+            if neighbor not in visited:
+                if dfs(neighbor) and first_only:
+                    return True
+            elif neighbor in rec_stack:
+                cycle_edges.append((v, neighbor))
+                if first_only:
+                    return True
+        rec_stack.remove(v)
+        return False
+
+    for root in roots:
+        if root not in visited and dfs(root) and first_only:
+            break
+    return cycle_edges
+
+
+def reference_sort_up_to_vertex(graph, vertex_id, *, is_start=False):
+    visited, excluded = set(), set()
+    stack = [vertex_id]
+    stop_predecessors = set(graph[vertex_id]["predecessors"])
+    while stack:
+        current_id = stack.pop()
+        if current_id in visited or current_id in excluded:
+            continue
+        visited.add(current_id)
+        stack.extend(graph[current_id]["predecessors"])
+        if current_id == vertex_id or (current_id not in stop_predecessors and is_start):
+            for successor_id in graph[current_id]["successors"]:
+                for succ_id in [successor_id, *utils.get_successors(graph, successor_id)]:
+                    if is_start:
+                        stack.append(succ_id)
+                    else:
+                        excluded.add(succ_id)
+    return visited
+
+
+def reference_sort_single_layer(layer, get_vertex_successors):
+    index_map = {vertex: index for index, vertex in enumerate(layer)}
+    dependency_cache = {}
+
+    def max_dependency_index(vertex):
+        if vertex in dependency_cache:
+            return dependency_cache[vertex]
+        max_index = index_map[vertex]
+        dependency_cache[vertex] = max_index
+        for successor in get_vertex_successors(vertex):
+            if successor in index_map:
+                max_index = max(max_index, max_dependency_index(successor))
+        dependency_cache[vertex] = max_index
+        return max_index
+
+    return sorted(layer, key=max_dependency_index, reverse=True)
+
+
+def reference_layered_topological_sort(vertices_ids, in_degree_map, successor_map, predecessor_map):
+    """The acyclic path of layered_topological_sort, checking queue membership by scanning the queue."""
+    in_degree_map = in_degree_map.copy()
+    queue = deque(vertex_id for vertex_id in vertices_ids if in_degree_map[vertex_id] == 0)
+    layers, visited, first_layer_vertices = [], set(), set()
+    if queue:
+        layers.append([])
+        for _ in range(len(queue)):
+            vertex_id = queue.popleft()
+            if vertex_id not in first_layer_vertices:
+                first_layer_vertices.add(vertex_id)
+                visited.add(vertex_id)
+                layers[-1].append(vertex_id)
+            for neighbor in successor_map[vertex_id]:
+                if neighbor not in vertices_ids:
+                    continue
+                in_degree_map[neighbor] -= 1
+                if in_degree_map[neighbor] == 0:
+                    queue.append(neighbor)
+                elif in_degree_map[neighbor] > 0:
+                    for predecessor in predecessor_map[neighbor]:
+                        if (
+                            predecessor not in queue
+                            and predecessor not in first_layer_vertices
+                            and in_degree_map[predecessor] == 0
+                        ):
+                            queue.append(predecessor)
+    while queue:
+        layers.append([])
+        for _ in range(len(queue)):
+            vertex_id = queue.popleft()
+            if vertex_id not in visited:
+                visited.add(vertex_id)
+                layers[-1].append(vertex_id)
+            for neighbor in successor_map[vertex_id]:
+                if neighbor not in vertices_ids:
+                    continue
+                in_degree_map[neighbor] -= 1
+                if in_degree_map[neighbor] == 0 and neighbor not in visited:
+                    queue.append(neighbor)
+                elif in_degree_map[neighbor] > 0:
+                    for predecessor in predecessor_map[neighbor]:
+                        if predecessor not in queue and predecessor not in visited:
+                            queue.append(predecessor)
+    return [layer for layer in layers if layer]
+
+
+def sort_maps(vertices, edges):
+    graph = to_graph_dict(vertices, edges)
+    in_degree_map = {vertex: len(value["predecessors"]) for vertex, value in graph.items()}
+    successor_map = {vertex: value["successors"] for vertex, value in graph.items()}
+    predecessor_map = {vertex: value["predecessors"] for vertex, value in graph.items()}
+    return graph, in_degree_map, successor_map, predecessor_map
+
+
+@given(edges=edge_lists, root=vertex_ids)
+def test_cycle_edges_match_the_recursive_search(edges, root):
+    vertices = sorted({vertex for edge in edges for vertex in edge} | {root})
+
+    assert utils.find_all_cycle_edges(root, edges) == reference_cycle_edges([root], edges)
+    first = reference_cycle_edges([root], edges, first_only=True)
+    assert utils.find_cycle_edge(root, edges) == (first[0] if first else None)
+    assert utils.has_cycle(vertices, edges) is bool(reference_cycle_edges(vertices, edges, first_only=True))
+
+
+@given(edges=edge_lists, vertex=vertex_ids, is_start=st.booleans())
+def test_sort_up_to_vertex_matches_the_previous_walk(edges, vertex, is_start):
+    graph = to_graph_dict([vertex], edges)
+
+    result = utils.sort_up_to_vertex(graph, vertex, is_start=is_start)
+
+    assert set(result) == reference_sort_up_to_vertex(graph, vertex, is_start=is_start)
+    assert len(result) == len(set(result))
+
+
+@given(edges=edge_lists, layer=st.lists(vertex_ids, unique=True, max_size=MAX_VERTICES))
+def test_sort_layer_by_dependency_matches_the_recursive_sort(edges, layer):
+    graph = to_graph_dict(layer, edges)
+
+    def get_vertex_successors(vertex):
+        return graph.get(vertex, {"successors": []})["successors"]
+
+    assert utils.sort_layer_by_dependency([layer], get_vertex_successors) == [
+        reference_sort_single_layer(layer, get_vertex_successors)
+    ]
+
+
+@given(dag=dags())
+def test_layered_topological_sort_matches_the_queue_scan(dag):
+    vertices, edges = dag
+    _, in_degree_map, successor_map, predecessor_map = sort_maps(vertices, edges)
+
+    result = utils.layered_topological_sort(set(vertices), in_degree_map, successor_map, predecessor_map)
+
+    assert result == reference_layered_topological_sort(set(vertices), in_degree_map, successor_map, predecessor_map)
+
+
+@given(dag=dags(), data=st.data())
+@settings(max_examples=50)
+def test_get_sorted_vertices_from_start_keeps_the_connected_vertices(dag, data):
+    vertices, edges = dag
+    start = data.draw(st.sampled_from(vertices))
+    graph, in_degree_map, successor_map, predecessor_map = sort_maps(vertices, edges)
+
+    first_layer, remaining_layers = utils.get_sorted_vertices(
+        vertices_ids=vertices,
+        cycle_vertices=set(),
+        start_component_id=start,
+        in_degree_map=in_degree_map,
+        successor_map=successor_map,
+        predecessor_map=predecessor_map,
+        get_vertex_predecessors=lambda vertex: graph[vertex]["predecessors"],
+        get_vertex_successors=lambda vertex: graph[vertex]["successors"],
+    )
+
+    reachable = utils.filter_vertices_from_vertex(vertices, start, graph_dict=graph)
+    expected = set().union(*(utils.filter_vertices_up_to_vertex(vertices, v, graph_dict=graph) for v in reachable))
+    sorted_vertices = [vertex for layer in [first_layer, *remaining_layers] for vertex in layer]
+    assert set(sorted_vertices) == expected
+    assert len(sorted_vertices) == len(expected)
+
+
+def test_graph_topological_sort_handles_long_chains():
+    graph = Graph()
+    previous_id = graph.add_component(TextInputComponent(_id="text_input"))
+    for i in range(1200):
+        vertex_id = graph.add_component(TextOutputComponent(_id=f"text_{i}"))
+        graph.add_component_edge(previous_id, ("text", "input_value"), vertex_id)
+        previous_id = vertex_id
+    graph.prepare()
+
+    assert [vertex.id for vertex in graph.topological_sort()] == ["text_input", *(f"text_{i}" for i in range(1200))]
+    assert graph.first_layer == ["text_input"]
+
+
+def synthetic_graph(size):
+    """A chain of ``size`` vertices, each also linked to the vertex ten steps ahead."""
+    vertices = [f"v{i}" for i in range(size)]
+    edges = [(vertices[i], vertices[i + 1]) for i in range(size - 1)]
+    edges += [(vertices[i], vertices[i + 10]) for i in range(0, size - 10, 3)]
+    return vertices, edges
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", [1_000, 10_000])
+def test_graph_sorts_benchmark(size):
+    """Each sort on a deep graph, which the recursive versions could not walk past a thousand vertices."""
+    vertices, edges = synthetic_graph(size)
+    graph, in_degree_map, successor_map, predecessor_map = sort_maps(vertices, edges)
+    cyclic_edges = [*edges, (vertices[-1], vertices[0])]
+
+    timings = {}
+    start = time.perf_counter()
+    assert utils.find_all_cycle_edges(vertices[0], cyclic_edges) == [(vertices[-1], vertices[0])]
+    assert utils.has_cycle(vertices, edges) is False
+    timings["cycle detection"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert len(utils.sort_up_to_vertex(graph, vertices[size // 2], is_start=True)) == size
+    timings["sort_up_to_vertex"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    first_layer, remaining_layers = utils.get_sorted_vertices(
+        vertices_ids=vertices,
+        cycle_vertices=set(),
+        start_component_id=vertices[size // 2],
+        in_degree_map=in_degree_map,
+        successor_map=successor_map,
+        predecessor_map=predecessor_map,
+        get_vertex_predecessors=lambda vertex: graph[vertex]["predecessors"],
+        get_vertex_successors=lambda vertex: graph[vertex]["successors"],
+    )
+    timings["get_sorted_vertices"] = time.perf_counter() - start
+    assert first_layer == [vertices[0]]
+    assert sum(len(layer) for layer in remaining_layers) == size - 1
+
+    start = time.perf_counter()
+    utils.sort_layer_by_dependency([list(reversed(vertices))], lambda vertex: graph[vertex]["successors"])
+    timings["sort_layer_by_dependency"] = time.perf_counter() - start
+
+    for name, elapsed in timings.items():
+        print(f"{name} on {size} vertices: {elapsed * 1e3:.1f}ms")  # noqa: T201
+        assert elapsed < 10
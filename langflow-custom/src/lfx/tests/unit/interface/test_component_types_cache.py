@@ -0,0 +1,116 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from lfx.interface import components
+from lfx.interface.components import (
+    _get_types_cache_path,
+    _read_types_cache,
+    component_cache,
+    get_and_cache_all_types_dict,
+)
+
+TYPES = {"category": {"Component": {"display_name": "Component", "template": {"code": {"value": "x"}}}}}
+
+
+@pytest.fixture(autouse=True)
+def clear_component_cache(monkeypatch):
+    monkeypatch.delenv("LFX_DEV", raising=False)
+    component_cache.all_types_dict = None
+    yield
+    component_cache.all_types_dict = None
+
+
+def make_settings_service(cache_dir, components_path=(), **overrides):
+    values = {
+        "component_types_cache": True,
+        "component_types_cache_dir": str(cache_dir),
+        "components_index_path": None,
+        "components_path": list(components_path),
+        "lazy_load_components": False,
+    }
+    values.update(overrides)
+    return SimpleNamespace(settings=SimpleNamespace(**values))
+
+
+def write_component(root, content):
+    (root / "category").mkdir(parents=True, exist_ok=True)
+    (root / "category" / "component.py").write_text(content)
+
+
+class TestTypesCachePath:
+    def test_same_contents_in_different_directories_share_the_cache(self, tmp_path):
+        # Bundles are extracted to a new temporary directory on every start
+        write_component(tmp_path / "first", "class A: ...")
+        write_component(tmp_path / "second", "class A: ...")
+
+        first = _get_types_cache_path(make_settings_service(tmp_path, [str(tmp_path / "first")]))
+        second = _get_types_cache_path(make_settings_service(tmp_path, [str(tmp_path / "second")]))
+
+        assert first == second
+        assert first.parent == tmp_path
+
+    def test_changed_components_path_invalidates_the_cache(self, tmp_path):
+        write_component(tmp_path / "custom", "class A: ...")
+        settings_service = make_settings_service(tmp_path, [str(tmp_path / "custom")])
+        before = _get_types_cache_path(settings_service)
+
+        write_component(tmp_path / "custom", "class B: ...")
+
+        assert _get_types_cache_path(settings_service) != before
+
+    def test_settings_are_part_of_the_key(self, tmp_path):
+        default = _get_types_cache_path(make_settings_service(tmp_path))
+        lazy = _get_types_cache_path(make_settings_service(tmp_path, lazy_load_components=True))
+
+        assert default != lazy
+
+    def test_disabled_and_dev_mode(self, tmp_path, monkeypatch):
+        assert _get_types_cache_path(make_settings_service(tmp_path, component_types_cache=False)) is None
+
+        monkeypatch.setenv("LFX_DEV", "1")
+        assert _get_types_cache_path(make_settings_service(tmp_path)) is None
+
+    def test_corrupted_cache_is_ignored(self, tmp_path):
+        cache_path = tmp_path / "component_types-broken.json"
+        cache_path.write_text('{"category": ')
+        assert _read_types_cache(cache_path) is None
+
+        cache_path.write_bytes(b"")
+        assert _read_types_cache(cache_path) is None
+
+
+class TestSharedTypesCache:
+    async def test_workers_share_the_built_types(self, tmp_path):
+        settings_service = make_settings_service(tmp_path)
+        build = AsyncMock(return_value=TYPES)
+
+        with patch.object(components, "_build_all_types_dict", build):
+            assert await get_and_cache_all_types_dict(settings_service) == TYPES
+            # A new worker starts with an empty in-process cache
+            component_cache.all_types_dict = None
+            assert await get_and_cache_all_types_dict(settings_service) == TYPES
+
+        build.assert_awaited_once()
+        assert len(list(tmp_path.glob("component_types-*.json"))) == 1
+
+    async def test_disabled_cache_always_builds(self, tmp_path):
+        settings_service = make_settings_service(tmp_path, component_types_cache=False)
+        build = AsyncMock(return_value=TYPES)
+
+        with patch.object(components, "_build_all_types_dict", build):
+            await get_and_cache_all_types_dict(settings_service)
+            component_cache.all_types_dict = None
+            await get_and_cache_all_types_dict(settings_service)
+
+        assert build.await_count == 2
+        assert not list(tmp_path.glob("component_types-*.json"))
+
+    async def test_unserializable_types_are_not_cached(self, tmp_path):
+        settings_service = make_settings_service(tmp_path)
+        types = {"category": {"Component": {"value": object()}}}
+
+        with patch.object(components, "_build_all_types_dict", AsyncMock(return_value=types)):
+            assert await get_and_cache_all_types_dict(settings_service) is types
+
+        assert not list(tmp_path.glob("component_types-*.json*"))
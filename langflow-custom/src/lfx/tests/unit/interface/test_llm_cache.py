@@ -0,0 +1,157 @@
+from contextvars import copy_context
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from langchain_core.language_models.fake import FakeListLLM
+from langchain_core.outputs import Generation
+from lfx.interface.llm_cache import BoundedLLMCache, llm_cache_flow_var, set_llm_cache_flow
+from lfx.interface.utils import set_langchain_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_flow_context():
+    token = llm_cache_flow_var.set(None)
+    yield
+    llm_cache_flow_var.reset(token)
+
+
+def generations(text: str) -> list[Generation]:
+    return [Generation(text=text)]
+
+
+class TestBoundedLLMCache:
+    def test_hit_and_miss_metrics(self):
+        cache = BoundedLLMCache()
+        assert cache.lookup("prompt", "llm") is None
+        cache.update("prompt", "llm", generations("answer"))
+
+        assert cache.lookup("prompt", "llm") == generations("answer")
+        metrics = cache.metrics
+        assert metrics["hits"] == 1
+        assert metrics["memory_hits"] == 1
+        assert metrics["misses"] == 1
+        assert metrics["entries"] == 1
+        assert metrics["bytes"] > 0
+        assert metrics["bytes_served"] == metrics["bytes"]
+
+    def test_key_includes_llm_string(self):
+        cache = BoundedLLMCache()
+        cache.update("prompt", "model=a,temperature=0.0", generations("cold"))
+
+        assert cache.lookup("prompt", "model=a,temperature=0.7") is None
+        assert cache.lookup("prompt", "model=a,temperature=0.0") == generations("cold")
+
+    def test_lru_eviction_by_entries(self):
+        cache = BoundedLLMCache(max_entries=2)
+        cache.update("a", "llm", generations("a"))
+        cache.update("b", "llm", generations("b"))
+        # Touch "a" so "b" becomes the least recently used entry
+        cache.lookup("a", "llm")
+        cache.update("c", "llm", generations("c"))
+
+        assert cache.lookup("b", "llm") is None
+        assert cache.lookup("a", "llm") is not None
+        assert cache.lookup("c", "llm") is not None
+        assert cache.metrics["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        cache = BoundedLLMCache(max_bytes=1000)
+        for i in range(20):
+            cache.update(f"prompt {i}", "llm", generations("x" * 100))
+
+        assert cache.metrics["bytes"] <= 1000
+        assert cache.metrics["entries"] < 20
+        assert cache.lookup("prompt 19", "llm") is not None
+        assert cache.lookup("prompt 0", "llm") is None
+
+    def test_ttl_expiration(self):
+        cache = BoundedLLMCache(ttl=10)
+        with patch("lfx.interface.llm_cache.time.time", return_value=1000.0):
+            cache.update("prompt", "llm", generations("answer"))
+            assert cache.lookup("prompt", "llm") is not None
+        with patch("lfx.interface.llm_cache.time.time", return_value=1011.0):
+            assert cache.lookup("prompt", "llm") is None
+        assert cache.metrics["expirations"] == 1
+        assert cache.metrics["entries"] == 0
+
+    def test_per_flow_opt_in(self):
+        cache = BoundedLLMCache(flows=["flow-a", "Named Flow"])
+        cache.update("prompt", "llm", generations("outside"))
+        assert cache.metrics["entries"] == 0
+
+        def run_in_flow(flow_id, flow_name=None):
+            set_llm_cache_flow(flow_id, flow_name)
+            cache.update("prompt", "llm", generations(flow_id))
+            return cache.lookup("prompt", "llm")
+
+        assert copy_context().run(run_in_flow, "flow-b") is None
+        assert copy_context().run(run_in_flow, "flow-a") == generations("flow-a")
+        assert copy_context().run(run_in_flow, "flow-c", "Named Flow") == generations("flow-c")
+
+    def test_sqlite_tier_is_shared_and_persistent(self, tmp_path):
+        database_path = tmp_path / "llm_cache.db"
+        worker_a = BoundedLLMCache(database_path=database_path)
+        worker_b = BoundedLLMCache(database_path=database_path)
+
+        worker_a.update("prompt", "llm", generations("answer"))
+        assert worker_b.lookup("prompt", "llm") == generations("answer")
+        assert worker_b.metrics["disk_hits"] == 1
+        # The disk hit is promoted to the in-memory tier
+        assert worker_b.lookup("prompt", "llm") == generations("answer")
+        assert worker_b.metrics["memory_hits"] == 1
+
+        restarted = BoundedLLMCache(database_path=database_path)
+        assert restarted.lookup("prompt", "llm") == generations("answer")
+
+        restarted.clear()
+        assert BoundedLLMCache(database_path=database_path).lookup("prompt", "llm") is None
+
+    def test_sqlite_tier_is_bounded(self, tmp_path):
+        cache = BoundedLLMCache(database_path=tmp_path / "llm_cache.db", max_disk_entries=5)
+        for i in range(10):
+            cache.update(f"prompt {i}", "llm", generations(str(i)))
+
+        (count,) = cache._db.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+        assert count == 5
+
+    async def test_model_responses_are_served_from_cache(self, tmp_path):
+        cache = BoundedLLMCache(database_path=tmp_path / "llm_cache.db")
+        llm = FakeListLLM(responses=["first", "second"], cache=cache)
+
+        assert await llm.ainvoke("hello") == "first"
+        assert await llm.ainvoke("hello") == "first"
+        assert cache.metrics["hits"] == 1
+        assert llm.invoke("hello") == "first"
+        assert llm.invoke("bye") == "second"
+
+
+class TestSetLangchainCache:
+    @staticmethod
+    def settings(**overrides):
+        values = {
+            "langchain_cache": "BoundedLLMCache",
+            "llm_cache_max_entries": 10,
+            "llm_cache_max_bytes": 1024,
+            "llm_cache_ttl": 60,
+            "llm_cache_database_path": None,
+            "llm_cache_max_disk_entries": 100,
+            "llm_cache_flows": [],
+        }
+        values.update(overrides)
+        return SimpleNamespace(**values)
+
+    def test_no_cache_without_opted_in_flows(self, monkeypatch):
+        monkeypatch.delenv("LANGFLOW_LANGCHAIN_CACHE", raising=False)
+        with patch("langchain.globals.set_llm_cache") as set_llm_cache:
+            set_langchain_cache(self.settings())
+        set_llm_cache.assert_not_called()
+
+    def test_installs_bounded_cache(self, monkeypatch):
+        monkeypatch.delenv("LANGFLOW_LANGCHAIN_CACHE", raising=False)
+        with patch("langchain.globals.set_llm_cache") as set_llm_cache:
+            set_langchain_cache(self.settings(llm_cache_flows=["flow-a"]))
+        cache = set_llm_cache.call_args.args[0]
+        assert isinstance(cache, BoundedLLMCache)
+        assert cache.max_entries == 10
+        assert cache.flows == {"flow-a"}
@@ -1,6 +1,11 @@
+import copy
+import pickle
+import time
+
 import pandas as pd
 import pytest
 from langchain_core.documents import Document
+from lfx.schema import dataframe as dataframe_module
 from lfx.schema.data import Data
 from lfx.schema.dataframe import DataFrame
 
@@ -71,3 +76,76 @@ class TestDataFrameSchema:
 
         non_empty_df = DataFrame({"name": ["John"], "text": ["name is John"]})
         assert bool(non_empty_df)
+
+    def test_add_row_chain_keeps_earlier_frames(self, sample_dataframe):
+        """Appends are buffered, but every returned frame keeps its own rows."""
+        data_frame = DataFrame(sample_dataframe, text_key="name")
+        first = data_frame.add_row({"name": "Bob", "text": "name is Bob"})
+        second = first.add_row({"name": "Alice", "text": "name is Alice"})
+        # Appending to a frame that was already appended to starts a new buffer
+        branch = first.add_rows([{"name": "Eve", "text": "name is Eve"}])
+
+        assert data_frame["name"].tolist() == ["John", "Jane"]
+        assert first["name"].tolist() == ["John", "Jane", "Bob"]
+        assert second["name"].tolist() == ["John", "Jane", "Bob", "Alice"]
+        assert branch["name"].tolist() == ["John", "Jane", "Bob", "Eve"]
+        assert isinstance(second, DataFrame)
+        assert second.text_key == "name"
+
+    def test_add_row_to_empty_dataframe(self):
+        data_frame = DataFrame()
+        for index in range(3):
+            data_frame = data_frame.add_row(Data(data={"index": index}))
+
+        assert data_frame["index"].tolist() == [0, 1, 2]
+        assert data_frame["index"].dtype == "int64"
+
+    @pytest.mark.parametrize(
+        "clone",
+        [
+            lambda frame: frame.copy(),
+            lambda frame: frame.copy(deep=False),
+            copy.copy,
+            copy.deepcopy,
+            lambda frame: pickle.loads(pickle.dumps(frame)),  # noqa: S301
+        ],
+        ids=["copy", "shallow_copy", "copy.copy", "copy.deepcopy", "pickle"],
+    )
+    def test_clones_of_a_frame_with_buffered_rows_keep_them(self, sample_dataframe, clone):
+        data_frame = DataFrame(sample_dataframe).add_row({"name": "Bob", "text": "name is Bob"})
+        appended = data_frame.add_row({"name": "Alice", "text": "name is Alice"})
+
+        cloned = clone(data_frame)
+
+        assert isinstance(cloned, DataFrame)
+        assert cloned["name"].tolist() == ["John", "Jane", "Bob"]
+        assert appended["name"].tolist() == ["John", "Jane", "Bob", "Alice"]
+        assert data_frame["name"].tolist() == ["John", "Jane", "Bob"]
+
+    def test_add_row_without_buffering(self, sample_dataframe, monkeypatch):
+        """Pandas versions whose internals the buffer does not support concatenate on every append."""
+        monkeypatch.setattr(dataframe_module, "_BUFFERED_APPENDS", False)
+        data_frame = DataFrame(sample_dataframe, text_key="name")
+
+        appended = data_frame.add_row({"name": "Bob", "text": "name is Bob"}).add_rows([{"name": "Eve"}])
+
+        assert "_pending_rows" not in appended.__dict__
+        assert isinstance(appended, DataFrame)
+        assert appended["name"].tolist() == ["John", "Jane", "Bob", "Eve"]
+        assert appended.text_key == "name"
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("rows", [10_000, 100_000])
+    def test_add_row_benchmark(self, rows):
+        """Append rows one at a time, the way loops build their results."""
+        start = time.perf_counter()
+        data_frame = DataFrame()
+        for index in range(rows):
+            data_frame = data_frame.add_row({"index": index, "text": f"row {index}"})
+        appended = time.perf_counter() - start
+        assert len(data_frame) == rows
+        total = time.perf_counter() - start
+
+        print(  # noqa: T201
+            f"\n{rows} single-row appends: {appended * 1000:.0f}ms appending, {total * 1000:.0f}ms with the first read"
+        )
@@ -0,0 +1,123 @@
+"""Tests for serialization/serialization.py - the fast paths of serialize() and serialize_json()."""
+
+import math
+import time
+
+import numpy as np
+import orjson
+import pandas as pd
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from lfx.schema.data import Data
+from lfx.schema.dataframe import DataFrame
+from lfx.schema.message import Message
+from lfx.serialization import serialize, serialize_json
+
+MAX_LENGTH = 20
+MAX_ITEMS = 5
+
+nested_strategy = st.recursive(
+    st.one_of(st.none(), st.booleans(), st.integers(), st.floats(allow_nan=False), st.text(max_size=50)),
+    lambda children: (
+        st.lists(children, max_size=10)
+        | st.tuples(children, children)
+        | st.dictionaries(st.text(max_size=10), children, max_size=10)
+    ),
+    max_leaves=30,
+)
+
+
+def reference(obj, max_length, max_items):
+    """What serialize() returns for plain values, written without any fast path."""
+    if isinstance(obj, str):
+        return obj if max_length is None or len(obj) <= max_length else obj[:max_length] + "..."
+    if isinstance(obj, dict):
+        return {k: reference(v, max_length, max_items) for k, v in obj.items()}
+    if isinstance(obj, list | tuple):
+        items = list(obj)
+        if max_items is not None and len(items) > max_items:
+            items = [*items[:max_items], f"... [truncated {len(obj) - max_items} items]"]
+        return [reference(item, max_length, max_items) for item in items]
+    return obj
+
+
+@settings(max_examples=200)
+@given(value=nested_strategy)
+def test_plain_values_match_the_reference(value):
+    assert serialize(value, MAX_LENGTH, MAX_ITEMS) == reference(value, MAX_LENGTH, MAX_ITEMS)
+    assert serialize(value) == reference(value, None, None)
+
+
+def test_plain_values_are_not_copied_without_truncation():
+    value = {"text": "short", "items": [1, 2, 3]}
+
+    result = serialize(value)
+
+    assert result == value
+    assert result["text"] is value["text"]
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        pd.DataFrame({"id": [1, 2], "score": [0.5, np.nan], "ok": [True, False], "text": ["a" * 30, None]}),
+        pd.DataFrame({"when": pd.to_datetime(["2024-01-01", None]), "obj": [np.int64(3), {"k": "v" * 30}]}),
+        pd.DataFrame({"nullable": pd.array([1, None], dtype="Int64"), "text": ["x", "y"]}),
+        pd.DataFrame({"id": range(10)}),
+        pd.DataFrame(index=range(2)),
+        pd.DataFrame(),
+    ],
+)
+def test_dataframe_matches_its_records(frame):
+    records = frame.head(MAX_ITEMS).to_dict(orient="records")
+
+    # repr() compares NaN values as equal
+    assert repr(serialize(frame, MAX_LENGTH, MAX_ITEMS)) == repr(serialize(records, MAX_LENGTH, MAX_ITEMS))
+
+
+def test_schema_types_are_serialized_recursively():
+    data = Data(data={"text": "t" * 30, "items": list(range(10))})
+
+    result = serialize(data, MAX_LENGTH, MAX_ITEMS)["data"]
+
+    assert result["text"] == "t" * MAX_LENGTH + "..."
+    assert result["items"] == [0, 1, 2, 3, 4, "... [truncated 5 ite..."]
+
+
+def test_serialize_json_encodes_what_serialize_returns():
+    value = {"text": "t" * 30, "frame": pd.DataFrame({"a": [1.5, np.nan]}), "array": np.arange(3), 1: "int key"}
+
+    decoded = orjson.loads(serialize_json(value, MAX_LENGTH, MAX_ITEMS))
+
+    assert decoded["text"] == "t" * MAX_LENGTH + "..."
+    assert decoded["frame"] == [{"a": 1.5}, {"a": None}]
+    assert decoded["array"] == [0, 1, 2]
+    assert decoded["1"] == "int key"
+
+
+def test_serialize_json_converts_unknown_objects_to_strings():
+    class Opaque:
+        def __str__(self):
+            return "opaque"
+
+    assert orjson.loads(serialize_json({"value": Opaque(), "nan": math.nan})) == {"value": "opaque", "nan": None}
+
+
+@pytest.mark.benchmark
+def test_serialize_vertex_outputs_benchmark():
+    """Serialize throughput on payloads shaped like vertex results."""
+    payloads = {
+        "message": Message(text="hello " * 200, sender="AI", sender_name="AI", session_id="session"),
+        "data": Data(data={"text": "x" * 500, "meta": {"a": 1, "b": [1, 2, 3]}, "scores": list(range(50))}),
+        "dataframe": DataFrame([{"id": i, "text": f"row {i}", "score": i * 0.5} for i in range(1000)]),
+        "primitives": {"results": [{"id": i, "text": f"row {i}", "ok": True, "value": None} for i in range(200)]},
+    }
+    for name, payload in payloads.items():
+        iterations = 100
+        start = time.perf_counter()
+        for _ in range(iterations):
+            serialize(payload, 20000, 1000)
+        elapsed = (time.perf_counter() - start) / iterations
+        print(f"serialize {name}: {elapsed * 1e6:.0f}us per call")  # noqa: T201
+        assert elapsed < 1